@@ -1,2 +1,6 @@
 from . import exceptions
-from .ptsuite_1time_lintingchecker import Ptsuite1TimeLintingChecker
\ No newline at end of file
+from .ptsuite_1time_lintingchecker import Ptsuite1TimeLintingChecker
+from .ptsuite_batch_lintingchecker import PtsuiteBatchLintingChecker
+from .ptsuite_lintingserver import PtsuiteLintingServer
+from .project_astroid_model import ProjectAstroidModel
+from .lintserver_request import request_lint_server
\ No newline at end of file
@@ -0,0 +1,35 @@
+
+# ============== OS Utilities ============== #
+from os import environ as os_getenv
+# ========================================== #
+# =========== ArgParse Utilities =========== #
+from argparse import (
+	ArgumentParser,
+	Namespace as ArgumentsList
+)
+# ========================================== #
+
+from . import ProjectAstroidModel
+
+
+
+if __name__ == "__main__":
+	arg_parser: ArgumentParser = ArgumentParser(
+		description="Focal project Astroid Model Builder for GenTestsAI",
+		usage="python exec_astroid_model.py <model_path>"
+	)
+
+	arg_parser.add_argument(
+		"model_path",
+		help="Astroid model file path (inside the container) in which the focal project model is saved"
+	)
+
+	script_args: ArgumentsList = arg_parser.parse_args()
+
+	full_root: str = os_getenv["FULL_ROOT"]
+
+	project_model: ProjectAstroidModel = ProjectAstroidModel(full_root)
+	modules_num: int = project_model.build()
+	project_model.save(script_args.model_path)
+
+	print(f"Astroid model of {modules_num} modules saved in: {script_args.model_path}")
\ No newline at end of file
@@ -0,0 +1,94 @@
+from typing import List
+
+# ============== OS Utilities ============== #
+from os import environ as os_getenv
+# ========================================== #
+# ============ Path Utilities ============ #
+from os.path import split as path_split
+# ======================================== #
+# =========== ArgParse Utilities =========== #
+from argparse import (
+	ArgumentParser,
+	Namespace as ArgumentsList,
+	ONE_OR_MORE,
+)
+ARGP_1_PLUS = ONE_OR_MORE
+# ========================================== #
+
+from . import (
+	PtsuiteBatchLintingChecker,
+	ProjectAstroidModel
+)
+
+
+
+if __name__ == "__main__":
+	arg_parser: ArgumentParser = ArgumentParser(
+		description="Partial test-suites Batch Linting Checker for GenTestsAI",
+		usage="python exec_linting_batch.py <result_relpath> <ptsuite_relpath> [<ptsuite_relpath> ...] [--jobs ...] [--all_errors] [--fail_fast] [--errors_only] [--pyl_args ...]"
+	)
+	
+	arg_parser.add_argument(
+		"result_relpath",
+		help="Linting results JSON file path (relative to the container path prefix)"
+	)
+	arg_parser.add_argument(
+		"ptsuites_relpaths",
+		help="Partial test-suites files paths (relative to the container path prefix)",
+		nargs=ARGP_1_PLUS
+	)
+	
+	arg_parser.add_argument(
+		"--jobs",
+		help="Optional. Number of PyLint parallel processes (0 means all the available cores)",
+		type=int, required=False,
+		default=0
+	)
+	arg_parser.add_argument(
+		"--all_errors",
+		help="Optional. Serialize all the errors of each partial test-suite instead of only the first one",
+		action="store_true"
+	)
+	arg_parser.add_argument(
+		"--fail_fast",
+		help="Optional. Stop the check of each partial test-suite at the first error found (only the first error is collected)",
+		action="store_true"
+	)
+	arg_parser.add_argument(
+		"--errors_only",
+		help="Optional. Run only the PyLint checks that emit error or fatal messages",
+		action="store_true"
+	)
+	arg_parser.add_argument(
+		"--pyl_args",
+		help='Optional. PyLint extra arguments (without any space between each flag and its value). Must not contain "--source", "--jobs" and "--output-format" flags',
+		nargs=ARGP_1_PLUS, required=False,
+		default=[]
+	)
+	
+	script_args: ArgumentsList = arg_parser.parse_args()
+	
+	pyl_args: List[str] = script_args.pyl_args
+	
+	full_root: str = os_getenv["FULL_ROOT"]
+	path_prefix: str = path_split(full_root)[0]
+	
+	ptsuites_paths: List[str] = [
+		f"{path_prefix}/{ptsuite_relpath}"
+		for ptsuite_relpath in script_args.ptsuites_relpaths
+	]
+	result_path: str = f"{path_prefix}/{script_args.result_relpath}"
+	
+	ptsuites_checker: PtsuiteBatchLintingChecker = PtsuiteBatchLintingChecker(
+		full_root,
+		ptsuites_paths,
+		result_path
+	)
+	
+	ProjectAstroidModel.load_from_env()
+	ptsuites_checker.check_lintically(
+		pyl_args, script_args.jobs,
+		script_args.fail_fast, script_args.errors_only
+	)
+	
+	ptsuites_checker.serialize_result(script_args.all_errors)
@@ -24,7 +24,7 @@ from . import Ptsuite1TimeLintingChecker
 if __name__ == "__main__":
 	arg_parser: ArgumentParser = ArgumentParser(
 		description="Partial test-suite Linting Checker for GenTestsAI",
-		usage="python exec_linting_check.py <ptsuite_relpath> <result_relpath> [--pyl_args ...]"
+		usage="python exec_linting_check.py <ptsuite_relpath> <result_relpath> [--all_errors] [--fail_fast] [--errors_only] [--pyl_args ...]"
 	)
 	
 	arg_parser.add_argument(
@@ -36,6 +36,21 @@ if __name__ == "__main__":
 		help="Linting result JSON file path (relative to the container path prefix)"
 	)
 
+	arg_parser.add_argument(
+		"--all_errors",
+		help="Optional. Serialize all the distinct errors of the partial test-suite instead of only the first one",
+		action="store_true"
+	)
+	arg_parser.add_argument(
+		"--fail_fast",
+		help="Optional. Stop the check at the first error found (only the first error is collected)",
+		action="store_true"
+	)
+	arg_parser.add_argument(
+		"--errors_only",
+		help="Optional. Run only the PyLint checks that emit error or fatal messages",
+		action="store_true"
+	)
 	arg_parser.add_argument(
 		"--pyl_args",
 		help='Optional. PyLint extra arguments (without any space between each flag and its value). Must not contain "--source" and "--output-format" flags',
@@ -61,6 +76,9 @@ if __name__ == "__main__":
 		result_path
 	)
 	
-	ptsuite_checker.check_lintically(script_args.pyl_args)
+	ptsuite_checker.check_lintically(
+		script_args.pyl_args,
+		script_args.fail_fast, script_args.errors_only
+	)
 	
-	ptsuite_checker.serialize_result()
\ No newline at end of file
+	ptsuite_checker.serialize_result(script_args.all_errors)
\ No newline at end of file
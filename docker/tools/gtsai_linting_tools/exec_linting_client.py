@@ -0,0 +1,96 @@
+from typing import List, Dict, Union
+
+# ============== OS Utilities ============== #
+from os import environ as os_getenv
+# ========================================== #
+# ============ Path Utilities ============ #
+from os.path import split as path_split
+# ======================================== #
+# ============== JSON Utilities ============== #
+from json import JSONEncoder
+# ============================================ #
+# =========== ArgParse Utilities =========== #
+from argparse import (
+	ArgumentParser,
+	Namespace as ArgumentsList,
+	ONE_OR_MORE,
+)
+ARGP_1_PLUS = ONE_OR_MORE
+# ========================================== #
+
+from . import (
+	Ptsuite1TimeLintingChecker,
+	request_lint_server
+)
+
+
+
+if __name__ == "__main__":
+	arg_parser: ArgumentParser = ArgumentParser(
+		description="Partial test-suite Linting Client for GenTestsAI",
+		usage="python exec_linting_client.py <ptsuite_relpath> <socket_path> [--connect_timeout ...] [--all_errors] [--fail_fast] [--errors_only] [--pyl_args ...]"
+	)
+	
+	arg_parser.add_argument(
+		"ptsuite_relpath",
+		help="Partial test-suite file path (relative to the container path prefix)"
+	)
+	arg_parser.add_argument(
+		"socket_path",
+		help="Unix socket path (inside the container) of the linting server"
+	)
+	
+	arg_parser.add_argument(
+		"--connect_timeout",
+		help="Optional. Seconds to wait for the linting server to be listening",
+		type=float, required=False,
+		default=60.0
+	)
+	arg_parser.add_argument(
+		"--all_errors",
+		help="Optional. Print all the distinct errors of the partial test-suite instead of only the first one",
+		action="store_true"
+	)
+	arg_parser.add_argument(
+		"--fail_fast",
+		help="Optional. Stop the check at the first error found (only the first error is collected)",
+		action="store_true"
+	)
+	arg_parser.add_argument(
+		"--errors_only",
+		help="Optional. Run only the PyLint checks that emit error or fatal messages",
+		action="store_true"
+	)
+	arg_parser.add_argument(
+		"--pyl_args",
+		help='Optional. PyLint extra arguments, used only if the linting server is unreachable',
+		nargs=ARGP_1_PLUS, required=False,
+		default=[]
+	)
+	
+	script_args: ArgumentsList = arg_parser.parse_args()
+	
+	pyl_args: List[str] = script_args.pyl_args
+	full_root: str = os_getenv["FULL_ROOT"]
+	path_prefix: str = path_split(full_root)[0]
+	
+	ptsuite_path: str = f"{path_prefix}/{script_args.ptsuite_relpath}"
+	
+	result: Union[Dict[str, str], List[Dict[str, str]]] = request_lint_server(
+		script_args.socket_path, ptsuite_path, script_args.connect_timeout,
+		script_args.all_errors, script_args.fail_fast, script_args.errors_only
+	)
+	# Se il server non è disponibile la verifica viene eseguita da questo processo
+	if result is None:
+		ptsuite_checker: Ptsuite1TimeLintingChecker = Ptsuite1TimeLintingChecker(
+			full_root,
+			ptsuite_path,
+			None
+		)
+		ptsuite_checker.check_lintically(pyl_args, script_args.fail_fast, script_args.errors_only)
+		result = (
+			ptsuite_checker.get_all_results() if script_args.all_errors
+			else ptsuite_checker.get_result()
+		)
+	
+	print(JSONEncoder().encode(result))
@@ -0,0 +1,54 @@
+from typing import List
+
+# ============== OS Utilities ============== #
+from os import environ as os_getenv
+# ========================================== #
+# =========== ArgParse Utilities =========== #
+from argparse import (
+	ArgumentParser,
+	Namespace as ArgumentsList,
+	ONE_OR_MORE,
+)
+ARGP_1_PLUS = ONE_OR_MORE
+# ========================================== #
+
+from . import (
+	PtsuiteLintingServer,
+	ProjectAstroidModel
+)
+
+
+
+if __name__ == "__main__":
+	arg_parser: ArgumentParser = ArgumentParser(
+		description="Partial test-suites Linting Server for GenTestsAI",
+		usage="python exec_linting_server.py <socket_path> [--pyl_args ...]"
+	)
+	
+	arg_parser.add_argument(
+		"socket_path",
+		help="Unix socket path (inside the container) on which the linting requests are received"
+	)
+	
+	arg_parser.add_argument(
+		"--pyl_args",
+		help='Optional. PyLint extra arguments (without any space between each flag and its value). Must not contain "--source" and "--output-format" flags',
+		nargs=ARGP_1_PLUS, required=False,
+		default=[]
+	)
+	
+	script_args: ArgumentsList = arg_parser.parse_args()
+	
+	pyl_args: List[str] = script_args.pyl_args
+	full_root: str = os_getenv["FULL_ROOT"]
+	
+	lint_server: PtsuiteLintingServer = PtsuiteLintingServer(
+		full_root,
+		script_args.socket_path,
+		pyl_args
+	)
+	
+	# Il modello dei moduli del progetto focale rimane in memoria per tutte le verifiche
+	ProjectAstroidModel.load_from_env()
+	
+	lint_server.serve_forever()
@@ -0,0 +1,122 @@
+from typing import List, Dict, Union
+
+import sys
+# ============== OS Utilities ============== #
+from os import (
+	environ as os_getenv,
+	remove as os_remove,
+	fdopen as os_fdopen
+)
+from tempfile import mkstemp as os_mktempfile
+# ========================================== #
+# ============ Path Utilities ============ #
+from os.path import split as path_split
+# ======================================== #
+# ============== JSON Utilities ============== #
+from json import JSONEncoder
+# ============================================ #
+# =========== ArgParse Utilities =========== #
+from argparse import (
+	ArgumentParser,
+	Namespace as ArgumentsList,
+	ONE_OR_MORE,
+)
+ARGP_1_PLUS = ONE_OR_MORE
+# ========================================== #
+
+from . import (
+	Ptsuite1TimeLintingChecker,
+	request_lint_server
+)
+
+
+
+if __name__ == "__main__":
+	arg_parser: ArgumentParser = ArgumentParser(
+		description="Partial test-suite Streamed Linting Checker for GenTestsAI",
+		usage="python exec_linting_stream.py <input_reldir> [--socket_path ...] [--connect_timeout ...] [--all_errors] [--fail_fast] [--errors_only] [--pyl_args ...] < ptsuite_code"
+	)
+	
+	arg_parser.add_argument(
+		"input_reldir",
+		help="Directory (relative to the container path prefix) in which the partial test-suite, read from stdin, is temporarily written"
+	)
+	
+	arg_parser.add_argument(
+		"--socket_path",
+		help="Optional. Unix socket path (inside the container) of the linting server to use",
+		required=False,
+		default=None
+	)
+	arg_parser.add_argument(
+		"--connect_timeout",
+		help="Optional. Seconds to wait for the linting server to be listening",
+		type=float, required=False,
+		default=60.0
+	)
+	arg_parser.add_argument(
+		"--all_errors",
+		help="Optional. Print all the distinct errors of the partial test-suite instead of only the first one",
+		action="store_true"
+	)
+	arg_parser.add_argument(
+		"--fail_fast",
+		help="Optional. Stop the check at the first error found (only the first error is collected)",
+		action="store_true"
+	)
+	arg_parser.add_argument(
+		"--errors_only",
+		help="Optional. Run only the PyLint checks that emit error or fatal messages",
+		action="store_true"
+	)
+	arg_parser.add_argument(
+		"--pyl_args",
+		help='Optional. PyLint extra arguments (without any space between each flag and its value). Must not contain "--source" and "--output-format" flags',
+		nargs=ARGP_1_PLUS, required=False,
+		default=[]
+	)
+	
+	script_args: ArgumentsList = arg_parser.parse_args()
+	
+	pyl_args: List[str] = script_args.pyl_args
+	full_root: str = os_getenv["FULL_ROOT"]
+	path_prefix: str = path_split(full_root)[0]
+	
+	ptsuite_code: str = sys.stdin.buffer.read().decode("utf-8")
+	
+	# Ogni richiesta utilizza un file univoco, in modo che più verifiche possano essere
+	# eseguite contemporaneamente nello stesso container
+	ptsuite_fd: int
+	ptsuite_path: str
+	ptsuite_fd, ptsuite_path = os_mktempfile(
+		suffix=".py", prefix="temp_ptsuite_",
+		dir=f"{path_prefix}/{script_args.input_reldir}"
+	)
+	
+	result: Union[Dict[str, str], List[Dict[str, str]]] = None
+	try:
+		with os_fdopen(ptsuite_fd, "w", encoding="utf-8") as fptsuite:
+			fptsuite.write(ptsuite_code)
+			fptsuite.flush()
+		
+		if script_args.socket_path is not None:
+			result = request_lint_server(
+				script_args.socket_path, ptsuite_path, script_args.connect_timeout,
+				script_args.all_errors, script_args.fail_fast, script_args.errors_only
+			)
+		# Se il server non è disponibile (o non è stato richiesto) la verifica viene eseguita da questo processo
+		if result is None:
+			ptsuite_checker: Ptsuite1TimeLintingChecker = Ptsuite1TimeLintingChecker(
+				full_root,
+				ptsuite_path,
+				None
+			)
+			ptsuite_checker.check_lintically(pyl_args, script_args.fail_fast, script_args.errors_only)
+			result = (
+				ptsuite_checker.get_all_results() if script_args.all_errors
+				else ptsuite_checker.get_result()
+			)
+	finally:
+		os_remove(ptsuite_path)
+	
+	print(JSONEncoder().encode(result))
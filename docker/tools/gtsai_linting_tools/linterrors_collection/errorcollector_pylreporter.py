@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Set, Tuple
 
 from pylint.reporters import BaseReporter
 from pylint.message.message import (
@@ -9,7 +9,8 @@ from .lintingrelated_problem import LintingRelatedProblem
 
 from .execeptions import (
 	LintingNotExecutedError,
-	ErrorCollectorNotInitializedError
+	ErrorCollectorNotInitializedError,
+	FailFastInterruptError
 )
 
 
@@ -23,12 +24,23 @@ class ErrorCollectorPylReporter(BaseReporter):
 		Come tutti i reporters di PyLint è da utilizzarsi instanziandone un
 		oggetto, e passando quest' ultimo come argomento al Callable `pylint.lint.Run(...)`
 		(precisamente all' argomento `reporter`).
+		
+		In modalità "fail-fast" la `pylint.lint.Run(...)` viene interrotta, sollevando un
+		`FailFastInterruptError`, appena viene registrato il primo errore.
+		
+		Attributi di Classe Pubblici:
+			- `CAPTURED_MESSAGES` (frozenset) : Le categorie dei messaggi di PyLint registrati come errori
+			- `CAPTURED_ONLY_ARGS` (List[str]) : Gli argomenti di PyLint che limitano i controlli eseguiti a quelli che producono messaggi delle categorie registrate
 	"""
 
 	CAPTURED_MESSAGES = frozenset([
 		"error",
 		"fatal"
 	])
+	CAPTURED_ONLY_ARGS = [
+		"--disable=all",
+		"--enable=E,F"
+	]
 
 	def __init__(self):
 		"""
@@ -44,6 +56,7 @@ class ErrorCollectorPylReporter(BaseReporter):
 		self._idle: bool = False
 		self._runned: bool = False
 		self._has_found_errors: bool = False
+		self._fail_fast: bool = False
 
 
 	# ======================== Hooks per PyLint ================================
@@ -60,9 +73,16 @@ class ErrorCollectorPylReporter(BaseReporter):
 					msg.symbol,
 					msg.msg,
 					msg.line,
-					msg.column
+					msg.column,
+					msg.abspath
 				)
 			)
+			
+			if self._fail_fast:
+				# La Run(...) interrotta non esegue `.display_messages(...)`
+				self._idle = False
+				self._runned = True
+				raise FailFastInterruptError()
 
 	def display_messages(self, layout):
 		# Deve essere implementato
@@ -82,13 +102,20 @@ class ErrorCollectorPylReporter(BaseReporter):
 	# ==========================================================================
 
 
-	def init_reporter(self):
+	def init_reporter(self, fail_fast: bool = False):
 		"""
 			Inizializza questo ErrorCollectorPylReporter per utilizzarlo in una nuova
 			`pylint.lint.Run(...)`
+			
+			Parameters
+			----------
+				fail_fast: bool
+					Opzionale. Default = `False`. Un booleano che indica se interrompere la
+					`pylint.lint.Run(...)` al primo errore trovato (sollevando un `FailFastInterruptError`)
 		"""
 		self._captured_errors.clear()
 		self._has_found_errors = False
+		self._fail_fast = fail_fast
 
 		self._idle = True
 		self._runned = False
@@ -126,4 +153,32 @@ class ErrorCollectorPylReporter(BaseReporter):
 					Una lista di oggetti `LintingRelatedProblem` relativi all' esecuzione della fase di linting
 					da parte di `pylint.lint.Run(...)`
 		"""
-		return self._captured_errors
\ No newline at end of file
+		return self._captured_errors
+
+
+	def get_distinct_problems(self) -> List[LintingRelatedProblem]:
+		"""
+			Restituisce le problematiche (errori) di linting distinte trovate nella precedente esecuzione
+			da parte di `pylint.lint.Run(...)`.
+			
+			Due problematiche sono uguali se appartengono allo stesso file ed hanno lo stesso nome
+			e lo stesso messaggio (ad esempio uno stesso import fallito in più punti del codice);
+			di ognuna viene mantenuta la prima occorrenza
+
+			Returns
+			-------
+				List[LintingRelatedProblem]
+					Una lista di oggetti `LintingRelatedProblem`, nell' ordine in cui sono stati trovati,
+					relativi all' esecuzione della fase di linting da parte di `pylint.lint.Run(...)`
+		"""
+		seen_problems: Set[Tuple[str, str, str]] = set()
+		distinct_problems: List[LintingRelatedProblem] = list()
+		for problem in self._captured_errors:
+			problem_key: Tuple[str, str, str] = (
+				problem.get_file_path(), problem.get_short_name(), problem.get_message()
+			)
+			if problem_key not in seen_problems:
+				seen_problems.add(problem_key)
+				distinct_problems.append(problem)
+		
+		return distinct_problems
\ No newline at end of file
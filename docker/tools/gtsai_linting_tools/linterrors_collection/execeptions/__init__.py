@@ -1,2 +1,3 @@
 from .lintingnotexec_error import LintingNotExecutedError
-from .errorcollnotinited_error import ErrorCollectorNotInitializedError
\ No newline at end of file
+from .errorcollnotinited_error import ErrorCollectorNotInitializedError
+from .failfastinterr_error import FailFastInterruptError
\ No newline at end of file
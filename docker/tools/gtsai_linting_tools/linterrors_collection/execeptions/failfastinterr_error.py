@@ -0,0 +1,9 @@
+class FailFastInterruptError(BaseException):
+	"""
+		Rappresenta un' eccezione che viene sollevata da un `ErrorCollectorPylReporter`, in modalità "fail-fast",
+		al primo errore trovato per interrompere la `pylint.lint.Run(...)` in corso.
+		
+		Deriva da `BaseException` in modo da non essere intercettata dalla gestione degli errori
+		dei singoli moduli effettuata da PyLint
+	"""
+	pass
\ No newline at end of file
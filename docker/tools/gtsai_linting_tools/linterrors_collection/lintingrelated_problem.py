@@ -15,6 +15,7 @@ class LintingRelatedProblem:
 			message: str,
 			line_num: int,
 			col_num: int,
+			file_path: str = None,
 	):
 		"""
 			Crea un nuovo LintingRelatedProblem
@@ -32,11 +33,15 @@ class LintingRelatedProblem:
 
 				col_num: int
 					Il numero della colonna in cui si è verificato l' errore
+					
+				file_path: str
+					Opzionale. Default = `None`. La path assoluta del file in cui si è verificato l' errore
 		"""
 		self._short_name: str = short_name
 		self._message: str = message
 		self._line_num: int = line_num
 		self._col_num: int = col_num
+		self._file_path: str = file_path
 
 
 	def get_short_name(self) -> str:
@@ -76,4 +81,18 @@ class LintingRelatedProblem:
 					- [0]: Il numero di riga in cui si è verificato l' errore
 					- [1]: Il numero di colonna in cui si è verificato l' errore
 		"""
-		return (self._line_num, self._col_num)
\ No newline at end of file
+		return (self._line_num, self._col_num)
+
+
+	def get_file_path(self) -> str:
+		"""
+			Restituisce la path assoluta del file in cui si è verificato l' errore
+			di linting rappresentato
+
+			Returns
+			-------
+				str
+					Una stringa contenente la path assoluta del file, oppure `None`
+					se non è nota
+		"""
+		return self._file_path
\ No newline at end of file
@@ -0,0 +1,100 @@
+from typing import List, Dict, Union
+
+# ============ Socket Utilities ============ #
+from socket import (
+	socket as Socket,
+	AF_UNIX, SOCK_STREAM
+)
+# ========================================== #
+# ============== JSON Utilities ============== #
+from json import (
+	JSONEncoder,
+	JSONDecoder
+)
+# ============================================ #
+from time import (
+	sleep as time_sleep,
+	monotonic as time_monotonic
+)
+
+
+
+def request_lint_server(
+		socket_path: str,
+		ptsuite_path: str,
+		connect_timeout: float,
+		all_errors: bool = False,
+		fail_fast: bool = False,
+		errors_only: bool = False
+) -> Union[Dict[str, str], List[Dict[str, str]]]:
+	"""
+		Richiede al server di linting (un `PtsuiteLintingServer`) la verifica della test-suite parziale fornita,
+		attendendo che il server sia in ascolto
+		
+		Parameters
+		----------
+			socket_path: str
+				Una stringa contenente la path, nel container, del socket Unix del server di linting
+				
+			ptsuite_path: str
+				Una stringa contenente la path, nel container, del file della test-suite parziale da verificare
+				
+			connect_timeout: float
+				Un float indicante il tempo massimo, in secondi, di attesa del server di linting
+				
+			all_errors: bool
+				Opzionale. Default = `False`. Un booleano che indica se richiedere tutti gli errori
+				distinti trovati, invece del solo primo errore
+				
+			fail_fast: bool
+				Opzionale. Default = `False`. Un booleano che indica se richiedere l' interruzione
+				della verifica al primo errore trovato
+				
+			errors_only: bool
+				Opzionale. Default = `False`. Un booleano che indica se richiedere l' esecuzione dei soli
+				controlli di PyLint che producono errori
+				
+		Returns
+		-------
+			Union[Dict[str, str], List[Dict[str, str]]]
+				Un dizionario di stringhe, indicizzato da stringhe, contenente il risultato della verifica
+				(una lista di tali dizionari se sono stati richiesti tutti gli errori), oppure `None` se il
+				server non è raggiungibile o la verifica nel server è fallita
+	"""
+	json_enc: JSONEncoder = JSONEncoder()
+	json_dec: JSONDecoder = JSONDecoder()
+	start_time: float = time_monotonic()
+	
+	client_sock: Socket = None
+	while client_sock is None:
+		client_sock = Socket(AF_UNIX, SOCK_STREAM)
+		try:
+			client_sock.connect(socket_path)
+		except OSError:
+			client_sock.close()
+			client_sock = None
+			# Il server potrebbe essere ancora in avvio
+			if (time_monotonic() - start_time) > connect_timeout:
+				return None
+			time_sleep(0.1)
+	
+	with client_sock:
+		client_sock.sendall((json_enc.encode({
+			"ptsuite_path": ptsuite_path,
+			"all_errors": all_errors,
+			"fail_fast": fail_fast,
+			"errors_only": errors_only
+		}) + "\n").encode("utf-8"))
+		
+		response: bytes = b""
+		chunk: bytes = client_sock.recv(65536)
+		while chunk != b"":
+			response += chunk
+			chunk = client_sock.recv(65536)
+	
+	if response.strip() == b"":
+		return None
+	result: Union[Dict[str, str], List[Dict[str, str]]] = json_dec.decode(response.decode("utf-8"))
+	if isinstance(result, dict) and ("server_error" in result):
+		return None
+	return result
\ No newline at end of file
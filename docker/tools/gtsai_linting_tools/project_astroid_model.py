@@ -0,0 +1,352 @@
+from typing import List, Dict, Set, Tuple, Any
+
+import sys
+from io import BytesIO
+from threading import (
+	Thread,
+	stack_size as thread_stack_size
+)
+# ============== OS Utilities ============== #
+from os import (
+	walk as os_walk,
+	replace as os_replace,
+	environ as os_getenv
+)
+from os.path import exists as os_fdexists
+# ========================================== #
+# ============ Path Utilities ============ #
+from os.path import (
+	join as path_join,
+	relpath as path_relative,
+	splitext as path_splitext,
+	abspath as path_absolute,
+	sep as path_sep
+)
+# ======================================== #
+# ============ Pickle Utilities ============ #
+from pickle import (
+	Pickler,
+	Unpickler,
+	HIGHEST_PROTOCOL
+)
+from marshal import (
+	dumps as marshal_dumps,
+	loads as marshal_loads
+)
+from importlib import import_module
+from types import (
+	FunctionType,
+	CellType
+)
+# ========================================== #
+
+from astroid import MANAGER as AstroidManager
+from astroid.nodes import (
+	NodeNG,
+	Module as AstroidModule
+)
+
+
+
+class ProjectAstroidModel:
+	"""
+		Rappresenta il modello di "astroid" (gli alberi dei moduli utilizzati da PyLint) dei moduli
+		di uno specifico progetto focale, pre-calcolabile e memorizzabile su file durante la costruzione
+		dell' immagine dell' ambiente focale.
+
+		Caricare il modello nella cache di "astroid", all' avvio di un tool di verifica, evita di ri-analizzare
+		i moduli del progetto focale ad ogni verifica: vengono analizzati solo la test-suite parziale e
+		i moduli esterni al progetto che essa importa.
+
+		I nodi di moduli esterni al progetto focale (ad esempio "builtins") non vengono memorizzati nel modello,
+		ma solo riferiti (tramite il nome del modulo e la posizione del nodo nel suo albero), e vengono ricostruiti
+		al caricamento. Le funzioni locali associate ai nodi dalle trasformazioni di "astroid" vengono memorizzate
+		tramite il loro bytecode, quindi il modello è valido solo per l' interprete e le versioni di "astroid"
+		con cui è stato creato.
+
+		Ogni istanza è pensata per essere utilizzata SOLO all' interno di un container docker pre-configurato come
+		ambiente adatto (in dipendenze e configurazione) per ospitare il progetto focale
+
+		Attributi di Classe Pubblici:
+			- `MODEL_ENVVAR` (str) : Il nome della variabile d' ambiente che contiene la path del modello nell' ambiente focale
+	"""
+
+	MODEL_ENVVAR: str = "ASTROID_MODEL"
+
+	# Dimensione dello stack, e limite di ricorsione, del thread che (de)serializza il modello
+	# (gli alberi di "astroid" vengono visitati ricorsivamente)
+	_STACK_SIZE: int = 512 * 1024 * 1024
+	_RECURSION_LIMIT: int = 200000
+
+	def __init__(self, full_root: str):
+		"""
+			Costruisce un nuovo ProjectAstroidModel associandolo al progetto focale fornito
+
+			Parameters
+			----------
+				full_root: str
+					Una stringa contenente la Full Project Root Path (nel container) del progetto focale
+		"""
+		self._full_root: str = path_absolute(full_root)
+		self._modules: Dict[str, AstroidModule] = dict()
+
+
+	def build(self) -> int:
+		"""
+			Costruisce il modello analizzando, tramite "astroid", ogni modulo Python del progetto focale
+			(i moduli che non è possibile analizzare vengono ignorati).
+
+			Il nome di ogni modulo è relativo alla Full Project Root Path, come per le verifiche di PyLint
+			(argomento `--source-roots`)
+
+			Returns
+			-------
+				int
+					Un intero indicante il numero di moduli presenti nel modello
+		"""
+		for dir_path, dir_names, file_names in os_walk(self._full_root):
+			# Le directories nascoste non contengono moduli del progetto focale
+			dir_names[:] = [dir_name for dir_name in dir_names if not dir_name.startswith(".")]
+
+			for file_name in file_names:
+				if path_splitext(file_name)[1] != ".py":
+					continue
+
+				file_path: str = path_join(dir_path, file_name)
+				mod_name: str = self._module_name(file_path)
+				try:
+					AstroidManager.ast_from_file(file_path, mod_name, source=True)
+				except Exception:
+					continue
+
+		self._modules = {
+			mod_name: module
+			for mod_name, module in AstroidManager.astroid_cache.items()
+			if self._is_project_module(module)
+		}
+		return len(self._modules)
+
+
+	def save(self, model_path: str):
+		"""
+			Memorizza il modello costruito nel file fornito (sostituito solo a memorizzazione completata)
+
+			Parameters
+			----------
+				model_path: str
+					Una stringa contenente la path, nel container, del file del modello
+		"""
+		model_stream: BytesIO = BytesIO()
+		saved_roots: Set[int] = {id(module) for module in self._modules.values()}
+
+		self._run_deep(
+			lambda: _ModelPickler(model_stream, saved_roots).dump(self._modules)
+		)
+
+		with open(f"{model_path}.tmp", "wb") as fmodel:
+			fmodel.write(model_stream.getvalue())
+			fmodel.flush()
+		os_replace(f"{model_path}.tmp", model_path)
+
+
+	@classmethod
+	def load(cls, model_path: str) -> int:
+		"""
+			Carica il modello memorizzato nel file fornito nella cache di "astroid"
+			(i moduli già presenti nella cache non vengono sostituiti)
+
+			Parameters
+			----------
+				model_path: str
+					Una stringa contenente la path, nel container, del file del modello
+
+			Returns
+			-------
+				int
+					Un intero indicante il numero di moduli caricati nella cache
+		"""
+		with open(model_path, "rb") as fmodel:
+			model_stream: BytesIO = BytesIO(fmodel.read())
+
+		loaded: List[Dict[str, AstroidModule]] = list()
+		cls._run_deep(
+			lambda: loaded.append(_ModelUnpickler(model_stream).load())
+		)
+
+		loaded_num: int = 0
+		for mod_name, module in loaded[0].items():
+			if mod_name not in AstroidManager.astroid_cache:
+				AstroidManager.astroid_cache[mod_name] = module
+				loaded_num += 1
+		return loaded_num
+
+
+	@classmethod
+	def load_from_env(cls) -> int:
+		"""
+			Carica nella cache di "astroid" l' eventuale modello del progetto focale presente nell' ambiente
+			focale (la cui path è contenuta nella variabile d' ambiente `MODEL_ENVVAR`).
+
+			Un modello assente o non caricabile viene ignorato, in modo che le verifiche vengano
+			comunque effettuate
+
+			Returns
+			-------
+				int
+					Un intero indicante il numero di moduli caricati nella cache
+		"""
+		model_path: str = os_getenv.get(cls.MODEL_ENVVAR, None)
+		if (model_path is None) or (not os_fdexists(model_path)):
+			return 0
+
+		try:
+			return cls.load(model_path)
+		except Exception:
+			return 0
+
+
+	##	============================================================
+	##						PRIVATE METHODS
+	##	============================================================
+
+
+	def _module_name(self, file_path: str) -> str:
+		"""
+			Restituisce il nome del modulo, relativo alla Full Project Root Path, del file fornito
+		"""
+		mod_parts: List[str] = path_splitext(
+			path_relative(file_path, start=self._full_root)
+		)[0].split(path_sep)
+		if (len(mod_parts) > 1) and (mod_parts[-1] == "__init__"):
+			mod_parts = mod_parts[:-1]
+		return ".".join(mod_parts)
+
+
+	def _is_project_module(self, module: AstroidModule) -> bool:
+		"""
+			Verifica se il modulo fornito è stato costruito a partire da un file del progetto focale
+		"""
+		mod_file: str = getattr(module, "file", None)
+		if mod_file is None:
+			return False
+		return path_absolute(mod_file).startswith(f"{self._full_root}{path_sep}")
+
+
+	@classmethod
+	def _run_deep(cls, func):
+		"""
+			Esegue la funzione fornita in un thread con uno stack (e un limite di ricorsione)
+			sufficiente a visitare ricorsivamente gli alberi di "astroid", rilanciandone l' eventuale eccezione
+		"""
+		errors: List[BaseException] = list()
+
+		def deep_target():
+			try:
+				func()
+			except BaseException as error:
+				errors.append(error)
+
+		old_limit: int = sys.getrecursionlimit()
+		old_stack: int = thread_stack_size(cls._STACK_SIZE)
+		sys.setrecursionlimit(max(old_limit, cls._RECURSION_LIMIT))
+		try:
+			deep_thread: Thread = Thread(target=deep_target)
+			deep_thread.start()
+			deep_thread.join()
+		finally:
+			thread_stack_size(old_stack)
+			sys.setrecursionlimit(old_limit)
+
+		if len(errors) > 0:
+			raise errors[0]
+
+
+
+def _make_function(
+		code_b: bytes,
+		mod_name: str,
+		func_name: str,
+		defaults: Tuple[Any, ...],
+		kwdefaults: Dict[str, Any],
+		cells: List[Any]
+) -> FunctionType:
+	"""
+		Ricostruisce una funzione locale memorizzata da un `_ModelPickler`
+	"""
+	func: FunctionType = FunctionType(
+		marshal_loads(code_b),
+		import_module(mod_name).__dict__,
+		func_name,
+		defaults,
+		tuple(CellType(cell) for cell in cells) if cells is not None else None
+	)
+	func.__kwdefaults__ = kwdefaults
+	return func
+
+
+
+class _ModelPickler(Pickler):
+	"""
+		Rappresenta il serializzatore di un `ProjectAstroidModel`: i nodi dei moduli esterni al modello
+		vengono solo riferiti, mentre le funzioni locali vengono serializzate tramite il loro bytecode
+	"""
+
+	def __init__(self, model_stream: BytesIO, saved_roots: Set[int]):
+		super().__init__(model_stream, protocol=HIGHEST_PROTOCOL)
+		self._saved_roots: Set[int] = saved_roots
+
+
+	def persistent_id(self, obj: Any) -> Any:
+		if not isinstance(obj, NodeNG):
+			return None
+
+		node_root: NodeNG = obj.root()
+		if (not isinstance(node_root, AstroidModule)) or (id(node_root) in self._saved_roots):
+			return None
+		# I moduli sintetizzati da "astroid" (non presenti nella sua cache) vengono memorizzati
+		if AstroidManager.astroid_cache.get(node_root.name, None) is not node_root:
+			return None
+
+		# Posizione del nodo nell' albero del suo modulo (indici dei figli dalla radice)
+		node_path: List[int] = list()
+		node: NodeNG = obj
+		while node.parent is not None:
+			siblings: List[NodeNG] = list(node.parent.get_children())
+			node_idx: int = next(
+				(idx for idx, sibling in enumerate(siblings) if sibling is node), None
+			)
+			# I nodi sintetizzati dalle trasformazioni non sono figli del loro genitore
+			if node_idx is None:
+				return None
+			node_path.append(node_idx)
+			node = node.parent
+
+		return (node_root.name, tuple(reversed(node_path)))
+
+
+	def reducer_override(self, obj: Any) -> Any:
+		if isinstance(obj, FunctionType) and ("<locals>" in obj.__qualname__):
+			return (
+				_make_function,
+				(
+					marshal_dumps(obj.__code__), obj.__module__, obj.__name__,
+					obj.__defaults__, obj.__kwdefaults__,
+					[cell.cell_contents for cell in obj.__closure__] if obj.__closure__ is not None else None
+				)
+			)
+		return NotImplemented
+
+
+
+class _ModelUnpickler(Unpickler):
+	"""
+		Rappresenta il de-serializzatore di un `ProjectAstroidModel`, che ricostruisce i nodi riferiti
+		dei moduli esterni al modello tramite "astroid"
+	"""
+
+	def persistent_load(self, pid: Any) -> Any:
+		mod_name, node_path = pid
+		node: NodeNG = AstroidManager.ast_from_module_name(mod_name)
+		for node_idx in node_path:
+			node = list(node.get_children())[node_idx]
+		return node
@@ -1,4 +1,4 @@
-from typing import List, Dict, Tuple
+from typing import List, Dict, Tuple, Union
 
 from pylint.lint import Run as PylRunner
 from json import JSONEncoder
@@ -8,7 +8,10 @@ from .linterrors_collection import (
 	LintingRelatedProblem
 )
 
-from .linterrors_collection.execeptions import LintingNotExecutedError
+from .linterrors_collection.execeptions import (
+	LintingNotExecutedError,
+	FailFastInterruptError
+)
 from .exceptions import LintingCheckerAlreadyUsedError
 
 
@@ -51,17 +54,21 @@ class Ptsuite1TimeLintingChecker:
 		
 		self._pyl_reporter: ErrorCollectorPylReporter = ErrorCollectorPylReporter()
 		self._error_found: LintingRelatedProblem = None
+		# Tutti gli errori distinti trovati (il primo è `self._error_found`)
+		self._errors_found: List[LintingRelatedProblem] = list()
 		
 		self._object_used: bool = False
 
 
 	def check_lintically(
 			self,
-			pyl_args: List[str]=None
+			pyl_args: List[str]=None,
+			fail_fast: bool = False,
+			errors_only: bool = False
 	):
 		"""
 			Esegue la verifica a livello di linting della test-suite parziale associata
-			raccogliendo il primo errore che si è verificato.
+			raccogliendo gli errori che si sono verificati.
 			
 			Parameters
 			----------
@@ -69,6 +76,16 @@ class Ptsuite1TimeLintingChecker:
 					Opzionale. Default = `None`. Una lista di stringhe che contine gli argomenti aggiuntivi
 					da fornire al comando di `pylint` per effettuare la verifica a livello di linting
 					
+				fail_fast: bool
+					Opzionale. Default = `False`. Un booleano che indica se interrompere la verifica al primo
+					errore trovato (che è lo stesso primo errore della verifica completa). In tal caso viene
+					raccolto solo il primo errore
+					
+				errors_only: bool
+					Opzionale. Default = `False`. Un booleano che indica se eseguire solo i controlli di PyLint
+					che producono errori (gli unici raccolti), saltando quelli di convenzioni, refactoring
+					e warnings
+					
 			Raises
 			------
 				LintingCheckerAlreadyUsedError
@@ -81,29 +98,34 @@ class Ptsuite1TimeLintingChecker:
 		if pyl_args is None:
 			pyl_args = []
 		
-		self._pyl_reporter.init_reporter()
+		self._pyl_reporter.init_reporter(fail_fast)
 		
 		pyl_allargs: List[str] = (
 			[f"--source-roots={self._full_root}"] +
+			(ErrorCollectorPylReporter.CAPTURED_ONLY_ARGS if errors_only else []) +
 			pyl_args +
 			[self._ptsuite_path]
 		)
 		
-		PylRunner(
-			pyl_allargs,
-			reporter=self._pyl_reporter,
-			exit=False
-		)
+		try:
+			PylRunner(
+				pyl_allargs,
+				reporter=self._pyl_reporter,
+				exit=False
+			)
+		except FailFastInterruptError:
+			pass
 		
+		self._errors_found = self._pyl_reporter.get_distinct_problems()
 		if self._pyl_reporter.has_found_any_problem():
-			self._error_found = self._pyl_reporter.get_found_problems()[0]
+			self._error_found = self._errors_found[0]
 		else:
 			self._error_found = None
 			
 		self._object_used = True
 
 
-	def serialize_result(self):
+	def serialize_result(self, all_errors: bool = False):
 		"""
 			Serializza il primo errore trovato nella verifica a livello di linting effettuata.
 			
@@ -113,6 +135,15 @@ class Ptsuite1TimeLintingChecker:
 				- "except_name": Una stringa contenente il nome dell' eccezione
 				- "except_mess": Una stringa contenente il messaggio dell' eccezione
 				- "except_pos": Una stringa nel formato `"row;col"` contenente la posizione nel codice dell' errore
+				
+			Se richiesti tutti gli errori, il file JSON contiene invece una lista di dizionari con gli stessi campi
+			(come restituita da `.get_all_results()`)
+			
+			Parameters
+			----------
+				all_errors: bool
+					Opzionale. Default = `False`. Un booleano che indica se serializzare tutti gli errori
+					distinti trovati, invece del solo primo errore
 
 			Raises
 			------
@@ -124,15 +155,74 @@ class Ptsuite1TimeLintingChecker:
 			raise LintingNotExecutedError()
 		
 		json_enc: JSONEncoder = JSONEncoder()
-		result: Dict[str, str] = dict()
+		result: Union[Dict[str, str], List[Dict[str, str]]] = (
+			self.get_all_results() if all_errors else self.get_result()
+		)
+			
+		with open(self._result_path, "w") as fres:
+			fres.write(json_enc.encode(result))
+			fres.flush()
+	
+	
+	def get_result(self) -> Dict[str, str]:
+		"""
+			Restituisce il primo errore trovato nella verifica a livello di linting effettuata, come
+			dizionario con gli stessi campi del file JSON prodotto da `.serialize_result()`
+			
+			Returns
+			-------
+				Dict[str, str]
+					Un dizionario di stringhe, indicizzato da stringhe, vuoto se non si è verificato
+					alcun errore di linting
+			
+			Raises
+			------
+				LintingNotExecutedError
+					Si verifica se non è mai stata eseguita una verifica di linting prima di chiamare
+					quest' operazione
+		"""
+		if not self._object_used:
+			raise LintingNotExecutedError()
 		
+		result: Dict[str, str] = dict()
 		if self._error_found is not None:
 			result["except_name"] = self._error_found.get_short_name()
 			result["except_mess"] = self._error_found.get_message()
 			
 			error_position: Tuple[int, int] = self._error_found.get_code_position()
 			result["except_pos"] = f"{str(error_position[0])};{str(error_position[1])}"
+		
+		return result
+	
+	
+	def get_all_results(self) -> List[Dict[str, str]]:
+		"""
+			Restituisce tutti gli errori distinti trovati nella verifica a livello di linting effettuata,
+			nell' ordine in cui sono stati trovati (errori con lo stesso nome e lo stesso messaggio
+			vengono riportati una sola volta, alla loro prima posizione)
 			
-		with open(self._result_path, "w") as fres:
-			fres.write(json_enc.encode(result))
-			fres.flush()
\ No newline at end of file
+			Returns
+			-------
+				List[Dict[str, str]]
+					Una lista di dizionari, con gli stessi campi del risultato di `.get_result()`,
+					vuota se non si è verificato alcun errore di linting
+			
+			Raises
+			------
+				LintingNotExecutedError
+					Si verifica se non è mai stata eseguita una verifica di linting prima di chiamare
+					quest' operazione
+		"""
+		if not self._object_used:
+			raise LintingNotExecutedError()
+		
+		results: List[Dict[str, str]] = list()
+		for error in self._errors_found:
+			error_position: Tuple[int, int] = error.get_code_position()
+			results.append({
+				"except_name": error.get_short_name(),
+				"except_mess": error.get_message(),
+				"except_pos": f"{str(error_position[0])};{str(error_position[1])}"
+			})
+		
+		return results
\ No newline at end of file
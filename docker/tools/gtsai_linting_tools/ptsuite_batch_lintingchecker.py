@@ -0,0 +1,224 @@
+from typing import List, Dict, Tuple
+
+from pylint.lint import Run as PylRunner
+from json import JSONEncoder
+
+# ============ Path Utilities ============ #
+from os.path import abspath as path_absolute
+# ======================================== #
+
+from .linterrors_collection import (
+	ErrorCollectorPylReporter,
+	LintingRelatedProblem
+)
+
+from .linterrors_collection.execeptions import (
+	LintingNotExecutedError,
+	FailFastInterruptError
+)
+from .exceptions import LintingCheckerAlreadyUsedError
+
+
+
+class PtsuiteBatchLintingChecker:
+	"""
+		Rappresenta un verificatore di codice a livello di linting, da utilizzarsi una sola volta, per un
+		insieme di test-suites parziali appartenenti ad uno specifico progetto focale.
+		Tutte le test-suites parziali vengono verificate in un' unica esecuzione di PyLint, eventualmente
+		distribuita su più processi (argomento `--jobs`).
+		Ogni istanza è pensata per essere utilizzata SOLO all' interno di un container docker pre-configurato come
+		ambiente adatto (in dipendenze e configurazione) per ospitare il progetto focale
+	"""
+
+	def __init__(
+			self,
+			full_root: str,
+			ptsuites_paths: List[str],
+			result_path: str
+	):
+		"""
+			Costruisce un nuovo PtsuiteBatchLintingChecker associandolo alle test-suites parziali di cui effettuare
+			la verifica a livello di linting.
+			
+			Parameters
+			----------
+				full_root: str
+					Una stringa contenente la Full Project Root Path (nel container) del progetto
+					focale di cui si verificheranno le test-suites parziali
+			
+				ptsuites_paths: List[str]
+					Una lista di stringhe contenente le paths, nel container, dei files in cui è scritto
+					il codice delle test-suites parziali da verificare
+					
+				result_path: str
+					Una stringa contenente la path, nel container, del file JSON in cui verranno scritti
+					i risultati della verifica, a livello di linting, effettuata.
+		"""
+		self._full_root: str = full_root
+		self._ptsuites_paths: List[str] = ptsuites_paths
+		self._result_path: str = result_path
+		
+		self._pyl_reporter: ErrorCollectorPylReporter = ErrorCollectorPylReporter()
+		# Errori trovati per ogni test-suite parziale (nello stesso ordine delle paths fornite)
+		self._errors_found: List[List[LintingRelatedProblem]] = None
+		
+		self._object_used: bool = False
+
+
+	def check_lintically(
+			self,
+			pyl_args: List[str] = None,
+			jobs: int = 0,
+			fail_fast: bool = False,
+			errors_only: bool = False
+	):
+		"""
+			Esegue la verifica a livello di linting delle test-suites parziali associate
+			raccogliendo, per ognuna di esse, gli errori che si sono verificati.
+			
+			Parameters
+			----------
+				pyl_args: List[str]
+					Opzionale. Default = `None`. Una lista di stringhe che contine gli argomenti aggiuntivi
+					da fornire al comando di `pylint` per effettuare la verifica a livello di linting
+					
+				jobs: int
+					Opzionale. Default = `0`. Un intero indicante il numero di processi su cui PyLint
+					distribuisce la verifica (`0` indica tutti i cores disponibili)
+					
+				fail_fast: bool
+					Opzionale. Default = `False`. Un booleano che indica se interrompere la verifica di ogni
+					test-suite parziale al suo primo errore. In tal caso le test-suites parziali vengono verificate
+					una alla volta nello stesso processo (che mantiene i modelli di "astroid" dei moduli del progetto
+					focale già analizzati), ignorando il parametro `jobs`, e viene raccolto solo il primo errore
+					di ognuna
+					
+				errors_only: bool
+					Opzionale. Default = `False`. Un booleano che indica se eseguire solo i controlli di PyLint
+					che producono errori (gli unici raccolti), saltando quelli di convenzioni, refactoring
+					e warnings
+					
+			Raises
+			------
+				LintingCheckerAlreadyUsedError
+					Se questo PtsuiteBatchLintingChecker ha già eseguito una verifica
+					a livello di linting
+		"""
+		if self._object_used:
+			raise LintingCheckerAlreadyUsedError()
+		
+		if pyl_args is None:
+			pyl_args = []
+		
+		pyl_baseargs: List[str] = (
+			[f"--source-roots={self._full_root}"] +
+			(ErrorCollectorPylReporter.CAPTURED_ONLY_ARGS if errors_only else []) +
+			pyl_args
+		)
+		
+		problems_found: List[LintingRelatedProblem] = list()
+		if fail_fast:
+			for ptsuite_path in self._ptsuites_paths:
+				self._pyl_reporter.init_reporter(fail_fast=True)
+				try:
+					PylRunner(
+						pyl_baseargs + [ptsuite_path],
+						reporter=self._pyl_reporter,
+						exit=False
+					)
+				except FailFastInterruptError:
+					pass
+				problems_found.extend(self._pyl_reporter.get_found_problems())
+		else:
+			self._pyl_reporter.init_reporter()
+			PylRunner(
+				pyl_baseargs + [f"--jobs={jobs}"] + self._ptsuites_paths,
+				reporter=self._pyl_reporter,
+				exit=False
+			)
+			problems_found = self._pyl_reporter.get_distinct_problems()
+		
+		# Suddivisione degli errori trovati per test-suite parziale (ogni file è verificato da un
+		# unico processo, quindi gli errori di ogni test-suite parziale mantengono il loro ordine)
+		# senza gli errori ripetuti
+		ptsuites_idxs: Dict[str, int] = {
+			path_absolute(ptsuite_path): idx
+			for idx, ptsuite_path in enumerate(self._ptsuites_paths)
+		}
+		self._errors_found = [list() for _ in self._ptsuites_paths]
+		for error in problems_found:
+			error_idx: int = ptsuites_idxs.get(path_absolute(error.get_file_path()), None)
+			if error_idx is not None:
+				self._errors_found[error_idx].append(error)
+			
+		self._object_used = True
+
+
+	def get_results(self, all_errors: bool = False) -> List[List[Dict[str, str]]]:
+		"""
+			Restituisce gli errori trovati nella verifica a livello di linting effettuata, per ogni
+			test-suite parziale associata
+			
+			Parameters
+			----------
+				all_errors: bool
+					Opzionale. Default = `False`. Un booleano che indica se restituire tutti gli errori
+					distinti trovati per ogni test-suite parziale, invece del solo primo errore
+			
+			Returns
+			-------
+				List[List[Dict[str, str]]]
+					Una lista, nello stesso ordine delle test-suites parziali associate, contenente per ognuna
+					di esse la lista dei suoi errori (vuota se non si è verificato alcun errore). Ogni errore è
+					un dizionario con gli stessi campi del risultato di un `Ptsuite1TimeLintingChecker`
+			
+			Raises
+			------
+				LintingNotExecutedError
+					Si verifica se non è mai stata eseguita una verifica di linting prima di chiamare
+					quest' operazione
+		"""
+		if not self._object_used:
+			raise LintingNotExecutedError()
+		
+		results: List[List[Dict[str, str]]] = list()
+		for ptsuite_errors in self._errors_found:
+			if not all_errors:
+				ptsuite_errors = ptsuite_errors[:1]
+			
+			ptsuite_results: List[Dict[str, str]] = list()
+			for error in ptsuite_errors:
+				error_position: Tuple[int, int] = error.get_code_position()
+				ptsuite_results.append({
+					"except_name": error.get_short_name(),
+					"except_mess": error.get_message(),
+					"except_pos": f"{str(error_position[0])};{str(error_position[1])}"
+				})
+			results.append(ptsuite_results)
+		
+		return results
+
+
+	def serialize_result(self, all_errors: bool = False):
+		"""
+			Serializza, nel file JSON associato, gli errori trovati nella verifica a livello di linting
+			effettuata (come restituiti da `.get_results(...)`)
+			
+			Parameters
+			----------
+				all_errors: bool
+					Opzionale. Default = `False`. Un booleano che indica se serializzare tutti gli errori
+					trovati per ogni test-suite parziale, invece del solo primo errore
+			
+			Raises
+			------
+				LintingNotExecutedError
+					Si verifica se non è mai stata eseguita una verifica di linting prima di chiamare
+					quest' operazione
+		"""
+		json_enc: JSONEncoder = JSONEncoder()
+		results: List[List[Dict[str, str]]] = self.get_results(all_errors)
+		
+		with open(self._result_path, "w") as fres:
+			fres.write(json_enc.encode(results))
+			fres.flush()
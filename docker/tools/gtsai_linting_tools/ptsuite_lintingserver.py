@@ -0,0 +1,161 @@
+from typing import List, Dict, Any, Union
+
+# ============== OS Utilities ============== #
+from os import remove as os_remove
+from os.path import (
+	exists as os_fdexists,
+	abspath as path_absolute
+)
+# ========================================== #
+# ============ Socket Utilities ============ #
+from socket import (
+	socket as Socket,
+	AF_UNIX, SOCK_STREAM
+)
+# ========================================== #
+# ============== JSON Utilities ============== #
+from json import (
+	JSONEncoder,
+	JSONDecoder
+)
+# ============================================ #
+
+from astroid import MANAGER as AstroidManager
+
+from .ptsuite_1time_lintingchecker import Ptsuite1TimeLintingChecker
+
+
+
+class PtsuiteLintingServer:
+	"""
+		Rappresenta un server, di lunga durata, in grado di effettuare la verifica a livello di linting
+		di più test-suites parziali di uno specifico progetto focale, ricevute tramite un socket Unix.
+		
+		Rispetto all' esecuzione di un processo per ogni verifica, PyLint viene importato una sola volta
+		e il modello di "astroid" dei moduli del progetto focale rimane in memoria tra una verifica e l' altra
+		(viene rimosso solo il modello della test-suite parziale verificata).
+		
+		Ogni richiesta è una riga JSON contenente il campo "ptsuite_path" (la path, nel container, della
+		test-suite parziale da verificare) e, opzionalmente, i campi booleani "all_errors", "fail_fast" ed
+		"errors_only" (con lo stesso significato degli argomenti di `Ptsuite1TimeLintingChecker`); la risposta è una
+		riga JSON con il risultato di un `Ptsuite1TimeLintingChecker` (tutti gli errori distinti se richiesti),
+		oppure con il solo campo "server_error" se la verifica è fallita.
+		
+		Le richieste vengono servite una alla volta.
+		Ogni istanza è pensata per essere utilizzata SOLO all' interno di un container docker pre-configurato
+		come ambiente adatto (in dipendenze e configurazione) per ospitare il progetto focale
+	"""
+	
+	def __init__(
+			self,
+			full_root: str,
+			socket_path: str,
+			pyl_args: List[str] = None
+	):
+		"""
+			Costruisce un nuovo PtsuiteLintingServer
+			
+			Parameters
+			----------
+				full_root: str
+					Una stringa contenente la Full Project Root Path (nel container) del progetto
+					focale di cui si verificheranno le test-suites parziali
+					
+				socket_path: str
+					Una stringa contenente la path, nel container, del socket Unix su cui ricevere
+					le richieste di verifica
+					
+				pyl_args: List[str]
+					Opzionale. Default = `None`. Una lista di stringhe che contiene gli argomenti aggiuntivi
+					da fornire a `pylint` per ogni verifica a livello di linting
+		"""
+		self._full_root: str = full_root
+		self._socket_path: str = socket_path
+		self._pyl_args: List[str] = pyl_args if pyl_args is not None else []
+		
+		self._json_enc: JSONEncoder = JSONEncoder()
+		self._json_dec: JSONDecoder = JSONDecoder()
+	
+	
+	def serve_forever(self):
+		"""
+			Resta in ascolto sul socket Unix associato, servendo una richiesta di verifica alla volta
+		"""
+		if os_fdexists(self._socket_path):
+			os_remove(self._socket_path)
+		
+		server_sock: Socket = Socket(AF_UNIX, SOCK_STREAM)
+		server_sock.bind(self._socket_path)
+		server_sock.listen()
+		
+		while True:
+			client_sock, _ = server_sock.accept()
+			with client_sock:
+				self._serve_request(client_sock)
+	
+	
+	##	============================================================
+	##						PRIVATE METHODS
+	##	============================================================
+	
+	
+	def _serve_request(self, client_sock: Socket):
+		"""
+			Legge la richiesta di verifica dal socket del client fornito e vi scrive il risultato
+		"""
+		request: bytes = b""
+		chunk: bytes = client_sock.recv(65536)
+		while (chunk != b"") and (not request.endswith(b"\n")):
+			request += chunk
+			if not request.endswith(b"\n"):
+				chunk = client_sock.recv(65536)
+		
+		result: Union[Dict[str, str], List[Dict[str, str]]]
+		try:
+			request_obj: Dict[str, Any] = self._json_dec.decode(request.decode("utf-8"))
+			result = self._check_ptsuite(
+				request_obj["ptsuite_path"],
+				request_obj.get("all_errors", False),
+				request_obj.get("fail_fast", False),
+				request_obj.get("errors_only", False)
+			)
+		except Exception as error:
+			result = {"server_error": f"{type(error).__name__}: {str(error)}"}
+		
+		client_sock.sendall((self._json_enc.encode(result) + "\n").encode("utf-8"))
+	
+	
+	def _check_ptsuite(
+			self,
+			ptsuite_path: str,
+			all_errors: bool,
+			fail_fast: bool,
+			errors_only: bool
+	) -> Union[Dict[str, str], List[Dict[str, str]]]:
+		"""
+			Effettua la verifica a livello di linting della test-suite parziale fornita, rimuovendone
+			poi il modello dalla cache di "astroid" (il suo file verrà sovrascritto dalle verifiche successive)
+		"""
+		ptsuite_checker: Ptsuite1TimeLintingChecker = Ptsuite1TimeLintingChecker(
+			self._full_root,
+			ptsuite_path,
+			None
+		)
+		try:
+			ptsuite_checker.check_lintically(self._pyl_args, fail_fast, errors_only)
+		finally:
+			self._evict_ptsuite(ptsuite_path)
+		
+		return ptsuite_checker.get_all_results() if all_errors else ptsuite_checker.get_result()
+	
+	
+	@classmethod
+	def _evict_ptsuite(cls, ptsuite_path: str):
+		"""
+			Rimuove dalla cache di "astroid" i moduli relativi al file della test-suite parziale fornita
+		"""
+		ptsuite_abspath: str = path_absolute(ptsuite_path)
+		for mod_name, module in list(AstroidManager.astroid_cache.items()):
+			mod_file: str = getattr(module, "file", None)
+			if (mod_file is not None) and (path_absolute(mod_file) == ptsuite_abspath):
+				del AstroidManager.astroid_cache[mod_name]
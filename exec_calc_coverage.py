@@ -35,14 +35,17 @@ from logic.configuration.config_parser import (
 	ConfigParserFactory, EParserFiletype
 )
 
-from logic.focalproj_configuration.focal_container import FocalContainer
+from logic.focalproj_configuration.focal_container import (
+	FocalContainer,
+	FocalContainerPool
+)
 
 from logic.calc_coverage import CoverageRcWriter
 
 from main_execs import (
 	read_general_config, read_projs_config, read_projsenv_config, read_models_config, read_calccov_config,
 	normalize_llmname,
-	create_focal_images
+	create_focal_images, create_fenv_pool
 )
 from main_execs.calc_cov import (
 	read_arguments,
@@ -137,7 +140,8 @@ def calculate_coverage():
 		covtools_dir=projsenv_cfg["tools"]["coverage"],
 		path_prefix=path_prefix,
 		logger=console_logger,
-		pref_contman=projsenv_cfg.get("pref_contman", None)
+		pref_contman=projsenv_cfg.get("pref_contman", None),
+		astroid_model=projsenv_cfg["environ"].get("lint_astroid_model", False)
 	)
 	
 	console_logger.set_messages_sep("\n")
@@ -145,6 +149,8 @@ def calculate_coverage():
 
 	proj_fenv_img: DockerImage
 	proj_fenv: FocalContainer
+	# Eventuale pool dei containers degli ambienti focali
+	fenv_pool: FocalContainerPool = create_fenv_pool(projsenv_cfg["environ"])
 
 	full_root: str
 	eff_full_root: str
@@ -197,11 +203,17 @@ def calculate_coverage():
 		proj_fenv_img = focal_envs[proj_name]
 		
 		logger.process_start("Avvio dell' ambiente focale ...")
-		proj_fenv = FocalContainer(
-			proj_fenv_img, full_root,
-			projsenv_cfg["environ"]["path_prefix"],
-		)
-		proj_fenv.start_container()
+		if fenv_pool is not None:
+			proj_fenv = fenv_pool.acquire(
+				proj_fenv_img, full_root,
+				projsenv_cfg["environ"]["path_prefix"]
+			)
+		else:
+			proj_fenv = FocalContainer(
+				proj_fenv_img, full_root,
+				projsenv_cfg["environ"]["path_prefix"],
+			)
+			proj_fenv.start_container()
 		logger.process_end()
 		
 		glob_end: str
@@ -291,8 +303,13 @@ def calculate_coverage():
 		
 		console_logger.set_messages_sep("\n")
 		logger.process_start("Stop dell' ambiente focale ...")
-		proj_fenv.stop_container()
+		if fenv_pool is not None:
+			fenv_pool.release(proj_fenv)
+		else:
+			proj_fenv.stop_container()
 		logger.process_end()
+	
+	fenv_pool.close() if fenv_pool is not None else None
 		
 
 if __name__ == "__main__":
@@ -5,30 +5,21 @@ from argparse import Namespace as ArgumentsList
 # ========================================== #
 # ============ Path Utilities ============ #
 from os.path import (
-	sep as path_sep,
-	altsep as path_altsep,
-	normpath as os_normpath,
 	join as path_join,
-	split as path_split,
-	splitext as path_splitext,
+	normpath as os_normpath,
 	dirname as path_getdir,
-	commonpath as path_intersect,
-	abspath as path_absolute,
-	relpath as path_relative
+	abspath as path_absolute
 )
-_PATH_SEPS: str = f"{path_sep}{path_altsep if path_altsep is not None else ''}"
 # ======================================== #
 # ============== OS Utilities ============== #
 from sys import stdout as os_stdout
-from os import (
-	walk as os_walk,
-	makedirs as os_mkdirs
-)
-from os.path import (
-	exists as os_fdexists
-)
-from shutil import rmtree as os_dremove
 # ========================================== #
+# ============ Concurrency Utilities ============ #
+from concurrent.futures import (
+	ThreadPoolExecutor,
+	Future
+)
+# =============================================== #
 # ============== Docker SDK Utilities =============== #
 from docker.models.images import Image as DockerImage
 # =================================================== #
@@ -38,8 +29,8 @@ from logic.variability.combinatorial import EPlatformCombo
 
 from main_execs.gents import read_arguments
 from main_execs.gents.mbym import (
-	calculate_prompt_relpaths,
-	generate_correct_mbym
+	generate_correct_project,
+	EntityWorkersPool, create_entity_workers
 )
 
 from main_execs.gents.reading import read_templprompts, read_1model_templprompts
@@ -58,6 +49,11 @@ from logic.decls_extraction.moddecls_extractor import (
 	AMutableModuleDeclsExtractor,
 	MutableModuleDeclsExtractorFactory
 )
+from logic.decls_extraction.moddecls_cache import IModuleDeclsCache
+from logic.decls_extraction.entities_index import (
+	FocalEntitiesIndex,
+	FocalEntitiesIndexer
+)
 
 from main_execs.gents.reading import read_fb_hyperparams
 from logic.ptsuite_generation.llm_access.llm_hyperparam.id import ILlmHyperParamId
@@ -77,7 +73,7 @@ from logic.ptsuite_generation.llm_access.llm_chat import (
 )
 
 from main_execs.gents.ptsuite_gen import inst_apiaccsor
-from logic.ptsuite_generation.llm_access.llm_apiaccessor import ILlmApiAccessor
+from logic.ptsuite_generation.llm_access.llm_apiaccessor import ILlmApiAccessor, LlmApiAccessorFactory
 
 from logic.ptsuite_generation.core.generation import EntityPtsuiteGenerator
 from logic.ptsuite_generation.core.checking.synt_checker import (
@@ -85,16 +81,25 @@ from logic.ptsuite_generation.core.checking.synt_checker import (
 	SyntacticCheckerFactory, ESyntCheckerTool
 )
 from logic.ptsuite_generation.core.checking.lint_checker import LintingChecker
+from logic.ptsuite_generation.core.checking.lint_prechecker import (
+	ILintPreChecker, StaticLintPreChecker
+)
 from logic.ptsuite_generation.core.correction.synt_corrector import PtsuiteSyntacticCorrector
 from logic.ptsuite_generation.core.correction.lint_corrector import PtsuiteLintingCorrector
 
-from main_execs import create_focal_images
+from main_execs import create_focal_images, create_fenv_pool
+from logic.focalproj_configuration.focal_container import FocalContainerPool
 
-from main_execs.gents.ptsuite_gen import open_ptsuite_caches
+from main_execs.gents.ptsuite_gen import (
+	open_ptsuite_caches, open_llmresp_cache, open_lintverd_cache, open_moddecls_cache
+)
+from logic.ptsuite_generation.llm_access.llm_respcache import ILlmResponseCache
+from logic.ptsuite_generation.core.checking.lint_verdcache import ILintVerdictCache
 
 from logic.utils.logger import (
 	ATemporalFormattLogger, ConsoleTemporalFormattLogger
 )
+from logic.utils.pipeline_stage import PipelineStage
 from logic.utils.process_logger import ProcessLogger
 
 
@@ -102,6 +107,16 @@ SCRIPT_PATH: str = path_getdir(path_absolute(__file__))
 LOG_FORMAT: str = "{message} ({day}/{month}/{year} {hour}:{min}:{second})"
 
 
+def new_console_logger() -> ATemporalFormattLogger:
+	"""
+		Costruisce un nuovo logger su `stdout` con il formato dei messaggi di GenTestsAI
+	"""
+	console_logger: ATemporalFormattLogger = ConsoleTemporalFormattLogger(os_stdout)
+	console_logger.set_messages_sep("\n")
+	console_logger.set_format(LOG_FORMAT)
+	return console_logger
+
+
 
 if __name__ == "__main__":
 	gents_args: ArgumentsList = read_arguments(SCRIPT_PATH)
@@ -111,9 +126,7 @@ if __name__ == "__main__":
 	## =================================================
 	
 	## ===== Creazione del logger da utilizzare per la generazione delle test-suites =====
-	console_logger: ATemporalFormattLogger = ConsoleTemporalFormattLogger(os_stdout)
-	console_logger.set_messages_sep("\n")
-	console_logger.set_format(LOG_FORMAT)
+	console_logger: ATemporalFormattLogger = new_console_logger()
 	logger: ProcessLogger = ProcessLogger(console_logger, "\n")
 
 	console_logger.log('Software "exec_gents.py" avviato')
@@ -158,6 +171,42 @@ if __name__ == "__main__":
 		caches_config["cache_root"], caches_names,
 		logger
 	)
+	# Le entries nel formato precedente (senza chiavi indirizzate dal contenuto) non sono utilizzabili
+	for ptsuite_cache in (genf_cache, genm_cache, corrs_cache, corrl_cache):
+		legacy_spaces: Set[str] = ptsuite_cache.legacy_projspaces() if ptsuite_cache is not None else set()
+		if len(legacy_spaces) > 0:
+			console_logger.log(
+				f'ATTENZIONE: spazi di progetto nel formato precedente ignorati '
+				f'(le loro test-suites parziali non verranno riutilizzate): {", ".join(sorted(legacy_spaces))}'
+			)
+	
+	## ===== Creazione/Apertura dell' eventuale cache delle risposte dei LLMs =====
+	resp_cache: ILlmResponseCache = None
+	if caches_config.get("llm_resp_cache", None) is not None:
+		resp_cache = open_llmresp_cache(
+			caches_config["caches_type"],
+			caches_config["cache_root"], caches_config["llm_resp_cache"],
+			caches_config.get("llm_resp_cache_size", 1024),
+			logger
+		)
+	
+	## ===== Creazione/Apertura dell' eventuale cache dei risultati delle verifiche di linting =====
+	verd_cache: ILintVerdictCache = None
+	if caches_config.get("lint_verd_cache", None) is not None:
+		verd_cache = open_lintverd_cache(
+			caches_config["caches_type"],
+			caches_config["cache_root"], caches_config["lint_verd_cache"],
+			logger
+		)
+	
+	## ===== Creazione/Apertura dell' eventuale cache delle analisi dei module-files focali =====
+	decls_cache: IModuleDeclsCache = None
+	if caches_config.get("mod_decls_cache", None) is not None:
+		decls_cache = open_moddecls_cache(
+			caches_config["caches_type"],
+			caches_config["cache_root"], caches_config["mod_decls_cache"],
+			logger
+		)
 	
 	## ===== Creazione delle immagini per gli ambienti focali =====
 	console_logger.log('Preparazione delle immagini docker come ambienti focali ...')
@@ -166,6 +215,13 @@ if __name__ == "__main__":
 	projenv_config: Dict[str, str] = projsenv_config["project"]
 	tools_config: Dict[str, str] = projsenv_config["tools"]
 	environ_config: Dict[str, str] = projsenv_config["environ"]
+	# Eventuali scripts del server di linting persistente (e del suo client)
+	lint_server: Tuple[str, str] = (
+		(environ_config["lint_server"], environ_config["lint_client"])
+		if "lint_server" in environ_config else None
+	)
+	# Eventuale pool dei containers degli ambienti focali
+	fenv_pool: FocalContainerPool = create_fenv_pool(environ_config)
 	
 	focal_envs: Dict[str, DockerImage] = create_focal_images(
 		projs_config,
@@ -186,7 +242,8 @@ if __name__ == "__main__":
 		tools_config["coverage"],
 		environ_config["path_prefix"],
 		console_logger,
-		projsenv_config.get("pref_contman", None)
+		projsenv_config.get("pref_contman", None),
+		environ_config.get("lint_astroid_model", False)
 	)
 	
 	console_logger.set_messages_sep("\n")
@@ -212,6 +269,10 @@ if __name__ == "__main__":
 	# e quelli dei methodal template prompts
 	placehs["code"] = prompts_config["placeholders"]["code"]
 	placehs["class_name"] = prompts_config["placeholders"]["class_name"]
+	# Placeholders da spostare in coda ai prompts di generazione (prefissi comuni tra entità consecutive)
+	gen_tail_placehs: List[str] = None
+	if prompts_config.get("prefix_layout", False):
+		gen_tail_placehs = [placehs["entity"]]
 	
 	## ===== Lettura degli iperparametri (di fallback) =====
 	hparams: Dict[ILlmHyperParamId, ILlmHyperParam] = read_fb_hyperparams(
@@ -227,11 +288,18 @@ if __name__ == "__main__":
 	
 	# ===== Creazione dell' accessor per la piattaforma di inferenza =====
 	logger.process_start('Preparazione dell\' accessor alla piattaforma di inferenza ...')
+	# Calcolo dell' eventuale formato di terminazione anticipata delle risposte
+	stop_format: str = None
+	if general_config.get("early_stop", False):
+		stop_format = general_config.get("response_format", None)
+		stop_format = stop_format if stop_format is not None else EntityPtsuiteGenerator.GENCODE_PATT
 	# Creazione dell' oggetto accessor
 	platform: ILlmApiAccessor = inst_apiaccsor(
 		platf_config["platform"], platf_config["platform_options"],
-		console_logger
+		console_logger, stop_format
 	)
+	if resp_cache is not None:
+		platform = LlmApiAccessorFactory.cached(platform, resp_cache)
 	# Associazione dell' oggetto chat all' accessor
 	platform.set_chat(chat)
 	logger.process_end()
@@ -244,12 +312,63 @@ if __name__ == "__main__":
 		logger=console_logger
 	)
 	
+	## ===== Creazione degli eventuali stadi di pipeline (produttore LLM / consumatore di verifica) =====
+	entity_workers_num: int = general_config.get("entity_workers", 1)
+	project_workers_num: int = general_config.get("project_workers", 1)
+	stages_config: Dict[str, int] = general_config.get("pipeline_stages", None)
+	# Eventuale generazione a lotti delle entità "piccole" di ogni modulo
+	batching_config: Dict[str, int] = general_config.get("entity_batching", None)
+	entity_batching: Tuple[int, int] = None
+	if batching_config is not None:
+		entity_batching = (batching_config["max_entity_size"], batching_config["max_batch_size"])
+	
+	# Lo stadio produttore è unico per tutti i progetti focali, in modo da limitare globalmente
+	# il numero di richieste contemporanee alla piattaforma di inferenza
+	llm_stage: PipelineStage = None
+	if stages_config is not None:
+		if (entity_workers_num > 1) or (project_workers_num > 1):
+			llm_stage = PipelineStage(
+				"llm",
+				stages_config.get("llm_workers", 1),
+				stages_config.get("queue_size", 0)
+			)
+	elif project_workers_num > 1:
+		llm_stage = PipelineStage("llm", project_workers_num)
+	
+	pipeline_stages: Tuple[PipelineStage, PipelineStage] = None
+	if (entity_workers_num > 1) and (stages_config is not None):
+		pipeline_stages = (
+			llm_stage,
+			PipelineStage(
+				"check",
+				stages_config.get("check_workers", 1),
+				stages_config.get("queue_size", 0)
+			)
+		)
+	
 	## ===== Creazione dei verificatori di correttezza delle test-suites parziali =====
-	synt_chker: ISyntacticChecker = SyntacticCheckerFactory.create(ESyntCheckerTool.PYCOMPILE)
+	# Con "synt_all_errors" ogni verifica sintattica individua tutti gli errori della test-suite parziale
+	synt_tool: ESyntCheckerTool = (
+		ESyntCheckerTool.TREESITTER if general_config.get("synt_all_errors", False)
+		else ESyntCheckerTool.INMEMORY_COMPILE
+	)
+	synt_chker: ISyntacticChecker = SyntacticCheckerFactory.create(synt_tool)
+	# Eventuale pre-verificatore di linting (condiviso tra i verificatori di linting di ogni progetto focale)
+	lint_prechker: ILintPreChecker = (
+		StaticLintPreChecker() if environ_config.get("lint_prechecks", False) else None
+	)
 	lint_chker: LintingChecker = LintingChecker(
 		environ_config["path_prefix"],
 		environ_config["lint_executer"], environ_config["inputctr_dir"],
-		logger=None
+		logger=None,
+		check_stage=(pipeline_stages[1] if pipeline_stages is not None else None),
+		lint_server=lint_server,
+		verdict_cache=verd_cache,
+		batch_script_fname=environ_config.get("lint_batch_executer", None),
+		stream_script_fname=environ_config.get("lint_stream_executer", None),
+		fenv_pool=fenv_pool,
+		all_errors=environ_config.get("lint_all_errors", False),
+		pre_checker=lint_prechker
 	)
 	
 	## ===== Creazione dei correttori delle test-suites parziali =====
@@ -266,19 +385,134 @@ if __name__ == "__main__":
 		logger=console_logger
 	)
 	
+	## ===== Creazione degli eventuali workers per la generazione concorrente delle entità =====
+	entity_workers: EntityWorkersPool = None
+	if (entity_workers_num > 1) and (project_workers_num == 1):
+		logger.process_start('Preparazione dei workers per la generazione concorrente delle entità ...')
+		entity_workers = create_entity_workers(
+			general_config["entity_workers"],
+			platf_config["platform"], platf_config["platform_options"],
+			(general_config["max_gen_times"], general_config["max_corr_times"]),
+			lint_chker,
+			resp_format=general_config.get("resp_format", None),
+			logger_factory=new_console_logger,
+			stages=pipeline_stages,
+			stop_format=stop_format,
+			resp_cache=resp_cache,
+			synt_tool=synt_tool
+		)
+		logger.process_end()
+	
+	## ===== Creazione dei componenti dedicati ad ogni progetto focale (se elaborati in parallelo) =====
+	# Ogni progetto focale possiede: il proprio verificatore di linting (e quindi ambiente focale),
+	# i propri workers, i propri prompt builders e il proprio estrattore di dichiarazioni
+	projs_comps: Dict[str, Tuple[
+		LintingChecker, EntityWorkersPool,
+		Tuple[PromptBuilder, PromptBuilder, PromptBuilder],
+		AMutableModuleDeclsExtractor
+	]] = dict()
+	if project_workers_num > 1:
+		logger.process_start('Preparazione dei componenti per la generazione parallela dei progetti focali ...')
+		for project_name in projs_config.keys():
+			proj_check_stage: PipelineStage = None
+			if stages_config is not None:
+				proj_check_stage = PipelineStage(
+					f"check_{project_name}",
+					stages_config.get("check_workers", 1),
+					stages_config.get("queue_size", 0)
+				)
+			proj_lint_chker: LintingChecker = LintingChecker(
+				environ_config["path_prefix"],
+				environ_config["lint_executer"], environ_config["inputctr_dir"],
+				logger=None,
+				check_stage=proj_check_stage,
+				lint_server=lint_server,
+				verdict_cache=verd_cache,
+				batch_script_fname=environ_config.get("lint_batch_executer", None),
+				stream_script_fname=environ_config.get("lint_stream_executer", None),
+				fenv_pool=fenv_pool,
+				all_errors=environ_config.get("lint_all_errors", False),
+				pre_checker=lint_prechker
+			)
+			projs_comps[project_name] = (
+				proj_lint_chker,
+				create_entity_workers(
+					entity_workers_num,
+					platf_config["platform"], platf_config["platform_options"],
+					(general_config["max_gen_times"], general_config["max_corr_times"]),
+					proj_lint_chker,
+					resp_format=general_config.get("resp_format", None),
+					logger_factory=new_console_logger,
+					stages=(llm_stage, proj_check_stage),
+					stop_format=stop_format,
+					resp_cache=resp_cache,
+					synt_tool=synt_tool
+				),
+				(
+					PromptBuilder(init_del=start_del, end_del=end_del, tail_placehs=gen_tail_placehs),
+					PromptBuilder(init_del=start_del, end_del=end_del, tail_placehs=gen_tail_placehs),
+					PromptBuilder(init_del=start_del, end_del=end_del)
+				),
+				MutableModuleDeclsExtractorFactory().create(
+					ECodeParserTool.TREE_SITTER,
+					"pass",
+					decls_cache=decls_cache
+				)
+			)
+		logger.process_end()
+	
+	# Accessors di ogni worker a cui impostare modello e iperparametri
+	workers_accessors: List[ILlmApiAccessor] = list()
+	if entity_workers is not None:
+		workers_accessors.extend(entity_workers.accessors())
+	for proj_comps in projs_comps.values():
+		workers_accessors.extend(proj_comps[1].accessors())
+	
 	# Stabilimento della configurazione dei tests saltati
 	skipdtests_config: Dict[str, str] = general_config["skipped_tests"]
+	skipping: Tuple[str, Tuple[str, str, str, str]] = (
+		skipdtests_config["file_format"],
+		(skipdtests_config["funcs_gen"], skipdtests_config["funcs_corr"],
+		 skipdtests_config["meths_gen"], skipdtests_config["meths_corr"])
+	)
 		
 	## ========================================================================
 	## ===== Processo di "Generazione delle Test-suites per ogni modello" =====
 	## ========================================================================
 	project_names: List[str] = list(projs_config.keys())
 	
+	## ===== Eventuale pre-indicizzazione delle entità focali di tutti i progetti focali =====
+	# L' indice è calcolato una sola volta (è lo stesso per ogni modello) ed è utilizzato per conoscere
+	# in anticipo i moduli, e le entità, da elaborare per ogni progetto focale
+	entities_index: FocalEntitiesIndex = None
+	index_config: Dict[str, Any] = general_config.get("entities_index", None)
+	if index_config is not None:
+		logger.process_start("Pre-indicizzazione delle entità focali dei progetti focali ...")
+		entities_index = FocalEntitiesIndexer(index_config.get("workers", None)).index_projects(
+			{
+				project_name: (
+					os_normpath(path_join(
+						projs_config[project_name]["full_root"],
+						projs_config[project_name]["focal_root"]
+					)),
+					projs_config[project_name].get("focal_excluded", [])
+				)
+				for project_name in project_names
+			},
+			general_config["always_excluded"]
+		)
+		entities_index.save(index_config["index_path"])
+		logger.process_end()
+		for project_name in project_names:
+			console_logger.log(
+				f'Progetto "{project_name}": {len(entities_index.modules(project_name))} moduli, '
+				f'{entities_index.entities_count(project_name)} entità'
+			)
+	
 	curr_prompts: Dict[str, str]
-	func_bder: PromptBuilder = PromptBuilder(init_del=start_del, end_del=end_del)
-	meth_bder: PromptBuilder = PromptBuilder(init_del=start_del, end_del=end_del)
+	func_bder: PromptBuilder = PromptBuilder(init_del=start_del, end_del=end_del, tail_placehs=gen_tail_placehs)
+	meth_bder: PromptBuilder = PromptBuilder(init_del=start_del, end_del=end_del, tail_placehs=gen_tail_placehs)
 	corr_bder: PromptBuilder = PromptBuilder(init_del=start_del, end_del=end_del)
-	prompt_builders: Tuple[PromptBuilder, PromptBuilder, PromptBuilder]
 	
 	llmname_hashalg: str = general_config["model_names"]["hashing_alg"]
 	digest_len: int = general_config["model_names"]["digest_len"]
@@ -293,24 +527,14 @@ if __name__ == "__main__":
 	llmplat_combo: str
 	lst_id: int
 	
-	project_info: Dict[str, Any]
-	full_root: str
-	focal_root: str
-	tests_root: str
-	gentests_root: str
-	focal_excluded: List[str]
 	moddecl_extr: AMutableModuleDeclsExtractor = MutableModuleDeclsExtractorFactory().create(
 		ECodeParserTool.TREE_SITTER,
-		"pass"
+		"pass",
+		decls_cache=decls_cache
 	)
 	
-	is_py_file: bool
-	file_path: str
-	tsuite_dirpath: str
-	module_relpath: str
-	tsuite_relpath: str
-	
 	llmmodel_cname: str
+	projs_futures: List[Future]
 	
 	# ===== Scorrimento dei Large Language Models scelti =====
 	console_logger.log('Inizio del processo di "Generazione delle test-suites per ogni modello"')
@@ -333,6 +557,8 @@ if __name__ == "__main__":
 		)
 		# Impostazione dell' implementazione specifica nell' accessor della piattaforma
 		platform.select_model(llm_specimpl)
+		for worker_platform in workers_accessors:
+			worker_platform.select_model(llm_specimpl)
 		
 		# ===== Stabilimento della factory di iperparametri relativamente alla combo modello/piattaforma =====
 		llmplat_combo = f'{platf_config["platform"]};{llm_model}'
@@ -357,6 +583,13 @@ if __name__ == "__main__":
 		# ===== Impostazione di ogni iperparametro nell' accessor della piattaforma =====
 		for hparam in hparams.values():
 			platform.add_hyperparam(hparam)
+			for worker_platform in workers_accessors:
+				worker_platform.add_hyperparam(hparam)
+		# Valori effettivi degli iperparametri (parte delle chiavi dei tentativi nelle caches)
+		hparams_eff: Dict[str, Any] = {
+			hparam.param_id().id(): hparam.to_effvalue()
+			for hparam in hparams.values()
+		}
 				
 		# ===== Lettura degli eventuali prompt specifici del modello =====
 		model_prompts = read_1model_templprompts(
@@ -370,6 +603,10 @@ if __name__ == "__main__":
 		func_bder.set_template_prompt(curr_prompts["functional"])
 		meth_bder.set_template_prompt(curr_prompts["methodal"])
 		corr_bder.set_template_prompt(curr_prompts["correctional"])
+		for proj_comps in projs_comps.values():
+			proj_comps[2][0].set_template_prompt(curr_prompts["functional"])
+			proj_comps[2][1].set_template_prompt(curr_prompts["methodal"])
+			proj_comps[2][2].set_template_prompt(curr_prompts["correctional"])
 		
 		# ===== Calcolo nome della directory delle test-suites generate dal modello =====
 		# Normalizzazione del nome del LLM
@@ -380,133 +617,73 @@ if __name__ == "__main__":
 		##
 		## ===== Scorrimento dei progetti focali =====
 		##
-		for project_name in project_names:
-			console_logger.log(f'Inizio generazione per il progetto "{project_name}"')
-			console_logger.set_messages_sep("\n\t\t\t")
-			
-			# ===== Ottenimento delle informazioni del progetto focale =====
-			project_info = projs_config[project_name]
-			# Ottenimento della Full Project Root Path
-			full_root = project_info["full_root"].rstrip(_PATH_SEPS)
-			# Ottenimento della Focal Project Root Path
-			focal_root = project_info["focal_root"].rstrip(_PATH_SEPS)
-			focal_root = os_normpath(path_join(full_root, focal_root))
-			# Ottenimento della Tests Project Root Path
-			tests_root = project_info["tests_root"].rstrip(_PATH_SEPS)
-			tests_root = os_normpath(path_join(full_root, tests_root))
-			# Ottenimento della lista di paths/files esclusi dal codice focale
-			focal_excluded = project_info.get("focal_excluded", [])
-			for i, focal_excl in enumerate(focal_excluded):
-				focal_excluded[i] = os_normpath(path_join(focal_root, focal_excl))
-			
-			# Impostazione dell' immagine dell' ambiente focale nel verificatore di linting
-			lint_chker.set_focal_project(
-				project_name, full_root,
-				focal_envs[project_name],
-				environ_config["path_prefix"]
-			)
-			
-			# ===== Creazione degli spazi di memorizzazione per il progetto nelle caches =====
-			genf_cache.create_projspace(project_name)
-			genm_cache.create_projspace(project_name)
-			corrs_cache.create_projspace(project_name)
-			corrl_cache.create_projspace(project_name)
-			
-			# Calcolo della Gen-tests Project Root Path relativa al modello corrente
-			gentests_root = path_join(
-				path_split(focal_root)[0],
-				gentest_dirname
-			)
-			
-			# Azzeramento della Gen-Tests Project Root Path relativa al modello corrente
-			if os_fdexists(gentests_root):
-				os_dremove(gentests_root)
-			os_mkdirs(gentests_root)
-			
-			# ===== Processo di "Generazione delle Test-suites per progetto focale" =====
-			for curr_path, dirs, file_names in os_walk(focal_root):
-				# Se la directory non è esclusa dal codice focale
-				if curr_path not in focal_excluded:
-					curr_path = os_normpath(curr_path)
-					
-					for file_name in file_names:
-						is_py_file = file_name.endswith(".py")
-		
-						# Se il file non è escluso dal codice focale
-						# ed è un modulo Python (ha estensione ".py")
-						if (
-							(is_py_file) and
-							(file_name not in general_config["always_excluded"])
-						):
-							module_path = path_join(curr_path, file_name)
-							module_name = path_splitext(file_name)[0]
-							
-							# Calcolo della directory che conterrà la test-suite del modulo
-							common_path: str = path_intersect([curr_path, focal_root])
-							tsuite_dirpath = path_relative(curr_path, start=common_path)
-							tsuite_dirpath = path_join(
-								path_join(gentests_root, tsuite_dirpath),
-								f"mod__{path_splitext(file_name)[0]}"
-							)
-						
-							# Creazione/sovrascrittura della directory test-suite
-							if os_fdexists(tsuite_dirpath):
-								os_dremove(tsuite_dirpath)
-							os_mkdirs(tsuite_dirpath)
-						
-							# Calcolo delle paths relative (da utilizzare nei prompts)
-							module_relpath, tsuite_relpath  \
-								= calculate_prompt_relpaths(focal_root, tsuite_dirpath, module_path)
-							
-							prompt_builders = (func_bder, meth_bder, corr_bder)
-							for prompt_bder in prompt_builders:
-								prompt_bder.set_placeholder(placehs["project"], project_name)
-								prompt_bder.set_placeholder(placehs["module"], module_name)
-								prompt_bder.set_placeholder(placehs["module_path"], module_relpath)
-								prompt_bder.set_placeholder(placehs["tsuite_path"], tsuite_relpath)
-							
-							# Generazione della test-suite del module-file attuale
-							generate_correct_mbym(
-								project_name, llm_model,
-								focal_root, module_path, tsuite_dirpath,
-								moddecl_extr,
-								(ptsuite_gen, platform, chat),
-								(synt_corr, lint_corr),
-								(synt_chker, lint_chker),
-								(general_config["max_gen_times"], general_config["max_corr_times"]),
-								platf_config["response_timeout"],
-								(prompt_builders, placehs),
-								(genf_cache, genm_cache),
-								(corrs_cache, corrl_cache),
-								(
-									skipdtests_config["file_format"],
-									(skipdtests_config["funcs_gen"], skipdtests_config["funcs_corr"],
-									 skipdtests_config["meths_gen"], skipdtests_config["meths_corr"])
-								),
-								console_logger
-							)
-							
-							# Azzeramento dei prompts
-							func_bder.unset_placeholders()
-							meth_bder.unset_placeholders()
-							corr_bder.unset_placeholders()
-							
-							# Pulizia delle risorse utilizzate dai verificatori
-							synt_chker.clear_resources()
-							lint_chker.clear_resources()
-							
-							# Pulizia della chat
-							chat.clear()
-			
-			# Pulizia delle risorse del verificatore di correttezza a livello di linting
-			# con stop dell' ambiente focale
-			lint_chker.clear_resources(stop_fenv=True)
-			
-			console_logger.set_messages_sep("\n\t\t")
-			console_logger.log(f'Generazione per il progetto "{project_name}" terminata!')
+		if project_workers_num == 1:
+			for project_name in project_names:
+				generate_correct_project(
+					project_name, projs_config[project_name],
+					llm_model, gentest_dirname,
+					(focal_envs[project_name], environ_config["path_prefix"]),
+					general_config["always_excluded"],
+					moddecl_extr,
+					(ptsuite_gen, platform, chat),
+					(synt_corr, lint_corr),
+					(synt_chker, lint_chker),
+					(general_config["max_gen_times"], general_config["max_corr_times"]),
+					platf_config["response_timeout"],
+					((func_bder, meth_bder, corr_bder), placehs),
+					(genf_cache, genm_cache),
+					(corrs_cache, corrl_cache),
+					skipping,
+					console_logger,
+					workers=entity_workers,
+					context_slicing=general_config.get("context_slicing", False),
+					entity_batching=entity_batching,
+					entities_index=entities_index,
+					hparams=hparams_eff
+				)
+		else:
+			# I progetti focali vengono elaborati in parallelo, ognuno con i propri componenti
+			# (i componenti di generazione e correzione sono quelli dei workers di ogni progetto)
+			projs_futures = list()
+			with ThreadPoolExecutor(
+					max_workers=project_workers_num,
+					thread_name_prefix="gtsai_project"
+			) as projs_executor:
+				for project_name in project_names:
+					proj_lint_chker, proj_workers, proj_bders, proj_moddecl_extr = projs_comps[project_name]
+					projs_futures.append(projs_executor.submit(
+						generate_correct_project,
+						project_name, projs_config[project_name],
+						llm_model, gentest_dirname,
+						(focal_envs[project_name], environ_config["path_prefix"]),
+						general_config["always_excluded"],
+						proj_moddecl_extr,
+						(None, None, None),
+						(None, None),
+						(None, proj_lint_chker),
+						(general_config["max_gen_times"], general_config["max_corr_times"]),
+						platf_config["response_timeout"],
+						(proj_bders, placehs),
+						(genf_cache, genm_cache),
+						(corrs_cache, corrl_cache),
+						skipping,
+						console_logger,
+						workers=proj_workers,
+						context_slicing=general_config.get("context_slicing", False),
+						entity_batching=entity_batching,
+						entities_index=entities_index,
+						hparams=hparams_eff
+					))
+			# Propagazione dell' eventuale errore di uno dei progetti focali
+			for proj_future in projs_futures:
+				proj_future.result()
 		console_logger.set_messages_sep("\n\t")
 		console_logger.log(f'Generazione per il modello "{llm_model}" terminata!')
 	console_logger.set_messages_sep("\n")
+	if entity_workers is not None:
+		entity_workers.shutdown()
+	for proj_comps in projs_comps.values():
+		proj_comps[1].shutdown()
 	logger.process_start("Chiusura delle caches di test-suite parziali ...")
 	
 	genf_cache.close() if genf_cache else None
@@ -515,4 +692,20 @@ if __name__ == "__main__":
 	corrl_cache.close() if corrl_cache else None
 	
 	logger.process_end()
+	if resp_cache is not None:
+		console_logger.log(
+			f'Cache delle risposte dei LLMs: {resp_cache.hits()} hits, {resp_cache.misses()} misses'
+		)
+		resp_cache.close()
+	if verd_cache is not None:
+		console_logger.log(
+			f'Cache dei risultati delle verifiche di linting: {verd_cache.hits()} hits, {verd_cache.misses()} misses'
+		)
+		verd_cache.close()
+	if decls_cache is not None:
+		console_logger.log(
+			f'Cache delle analisi dei module-files focali: {decls_cache.hits()} hits, {decls_cache.misses()} misses'
+		)
+		decls_cache.close()
+	fenv_pool.close() if fenv_pool is not None else None
 	console_logger.log("Esecuzione di \"exec_gents.py\" terminata!")
\ No newline at end of file
@@ -1,4 +1,4 @@
-from typing import Dict, Any
+from typing import Dict, List, Any
 from .a_accessor_cfgvalidator import AAccessorConfigValidator
 
 # ============= URL Utilities ============== #
@@ -18,7 +18,8 @@ class OllamaAccessorConfigValidator(AAccessorConfigValidator):
 		
 			- In "platform_options":
 				
-				* "api_addr" (str): L' indirizzo (come coppia, separata da ":", con porta) del server Ollama da utilizzare
+				* "api_addr" (str | List[str]): L' indirizzo (come coppia, separata da ":", con porta) del server Ollama da utilizzare.
+				  Può essere fornita anche una lista non vuota di indirizzi, tra i quali verranno distribuite le richieste
 				* "userpass_pair" (str): La coppia, separata da ":", nome utente e password da utilizzare nel server Ollama
 				* "connect_timeout" (int): Il timeout di attesa massimo per la connessione al server Ollama (in millisecondi)
 	"""
@@ -53,7 +54,7 @@ class OllamaAccessorConfigValidator(AAccessorConfigValidator):
 		"""
 		super().__init__(config_dict)
 		
-		self._api_addr: str = None
+		self._api_addrs: List[str] = None
 		self._user_token: str = None
 		self._conn_tout: int = None
 	
@@ -67,13 +68,23 @@ class OllamaAccessorConfigValidator(AAccessorConfigValidator):
 			config_read: Dict[str, Any]
 	):
 		platf_options = config_read["platform_options"]
-		self._api_addr = platf_options["api_url"]
+		api_addr: Any = platf_options["api_url"]
 		self._user_token = platf_options["userpass_pair"]
 		self._conn_tout = platf_options["connect_timeout"]
 		
-		if not isinstance(self._api_addr, str):
+		if isinstance(api_addr, str):
+			self._api_addrs = [api_addr]
+		elif isinstance(api_addr, list) and (len(api_addr) > 0):
+			self._api_addrs = api_addr
+		else:
+			raise InvalidConfigValueError()
+		
+		for addr in self._api_addrs:
+			if not isinstance(addr, str):
+				raise InvalidConfigValueError()
+			self._assert_api_addr(addr)
+		if len(set(self._api_addrs)) != len(self._api_addrs):
 			raise InvalidConfigValueError()
-		self._assert_api_addr()
 		
 		if not isinstance(self._user_token, str):
 			raise InvalidConfigValueError()
@@ -89,16 +100,16 @@ class OllamaAccessorConfigValidator(AAccessorConfigValidator):
 	##	============================================================
 
 
-	def _assert_api_addr(self):
+	def _assert_api_addr(self, api_addr: str):
 		"""
-			Verifica che il campo "api_addr" sia corretto
+			Verifica che un indirizzo del campo "api_addr" sia corretto
 			
 			Raises
 			------
 				ConfigExtraFieldsError
 					Si verifica se non è rispettato il formato richiesto per il campo
 		"""
-		urltoparse_str: str = self._api_addr if "://" in self._api_addr else f"http://{self._api_addr}"
+		urltoparse_str: str = api_addr if "://" in api_addr else f"http://{api_addr}"
 		
 		try:
 			url_parse(urltoparse_str)
@@ -24,11 +24,17 @@ class CacheConfigValidator(_ABaseConfigValidator):
 			- "gen_meth_cache" (str): Se esiste nel file letto, il nome del file che contiene la cache legata al processo di "Generazione" (per i soli metodi)
 			- "corr_synt_cache" (str): Se esiste nel file letto, il nome del file che contiene la cache legata al processo di "Correzione Sintattica"
 			- "corr_lint_cache" (str): Se esiste nel file letto, il nome del file che contiene la cache legata al processo di "Correzione Linting"
+			- "llm_resp_cache" (str): Se esiste nel file letto, il nome del file che contiene la cache delle risposte dei LLMs
+			- "llm_resp_cache_size" (int): Se esiste nel file letto, la dimensione massima (in MB) della cache delle risposte dei LLMs (default = 1024)
+			- "lint_verd_cache" (str): Se esiste nel file letto, il nome del file che contiene la cache dei risultati delle verifiche di linting
+			- "mod_decls_cache" (str): Se esiste nel file letto, il nome del file che contiene la cache delle analisi delle dichiarazioni dei module-files focali
 	"""
 	_REQ_FIELDS: Set[str] = {"caches_type", "cache_root"}
 	_OPT_FIELDS: Set[str] = {
 		"gen_func_cache", "gen_meth_cache",
-		"corr_synt_cache", "corr_lint_cache"
+		"corr_synt_cache", "corr_lint_cache",
+		"llm_resp_cache", "llm_resp_cache_size",
+		"lint_verd_cache", "mod_decls_cache"
 	}
 	
 	_SYNT_ERROR: str = 'La path specificata dal parametro "{param}" è invalida'
@@ -97,6 +103,25 @@ class CacheConfigValidator(_ABaseConfigValidator):
 		if corrl_cache is not None:
 			if not isinstance(corrl_cache, str):
 				self._assert_path("corr_lint_cache", corrl_cache)
+		
+		resp_cache: str = config_read.get("llm_resp_cache", None)
+		if (resp_cache is not None) and (not isinstance(resp_cache, str)):
+			raise InvalidConfigValueError()
+		
+		resp_cache_size: int = config_read.get("llm_resp_cache_size", None)
+		if resp_cache_size is not None:
+			if (not isinstance(resp_cache_size, int)) or (isinstance(resp_cache_size, bool)):
+				raise InvalidConfigValueError()
+			if resp_cache_size <= 0:
+				raise InvalidConfigValueError()
+		
+		verd_cache: str = config_read.get("lint_verd_cache", None)
+		if (verd_cache is not None) and (not isinstance(verd_cache, str)):
+			raise InvalidConfigValueError()
+		
+		decls_cache: str = config_read.get("mod_decls_cache", None)
+		if (decls_cache is not None) and (not isinstance(decls_cache, str)):
+			raise InvalidConfigValueError()
 	
 	
 	def _ap__assert_purperrors(self, config_read: Dict[str, Any]):
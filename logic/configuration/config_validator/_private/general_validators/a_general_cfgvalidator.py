@@ -50,6 +50,26 @@ class AGeneralConfigValidator(_APlatSpecConfigValidator):
 		e può contenere opzionalmente:
 		
 			- "response_fmt" (str): Un pattern RegEx Python che identifica il formato della risposta. Deve contenere obbligatoriamente un named group chiamato "gen_code"
+			- "early_stop" (bool): Se interrompere ogni risposta dei LLMs non appena contiene una corrispondenza completa del formato della risposta (default = false)
+			- "context_slicing" (bool): Se fornire nei prompts di generazione, al posto dell' intero codice del modulo, soltanto il contesto dell' entità (imports, firme dei nomi referenziati e codice dell' entità o scheletro della sua classe) (default = false)
+			- "synt_all_errors" (bool): Se ogni verifica di correttezza sintattica deve individuare tutti gli errori sintattici della test-suite parziale (tramite il parser di "tree-sitter"), da correggere in un unico tentativo (default = false)
+			- "entity_workers" (int): Il numero di entità di cui generare e correggere la test-suite parziale contemporaneamente (default = 1)
+			- "project_workers" (int): Il numero di progetti focali elaborati in parallelo, ognuno con il proprio ambiente focale (default = 1)
+			- "pipeline_stages" (Dict[str, int]): Dizionario dei parametri degli stadi di pipeline (utilizzati solo se "entity_workers" > 1 o "project_workers" > 1). Contiene opzionalmente:
+			
+				* "llm_workers" (int): Il numero massimo di richieste contemporanee ai LLMs, globale a tutti i progetti focali (stadio produttore)
+				* "check_workers" (int): Il numero di verifiche di correttezza contemporanee di ogni progetto focale (stadio consumatore)
+				* "queue_size" (int): La dimensione massima delle code di ogni stadio (0 = pari al numero di workers dello stadio)
+				
+			- "entity_batching" (Dict[str, int]): Dizionario dei parametri della generazione a lotti delle entità "piccole" di ogni modulo (una sola richiesta di generazione per lotto). Contiene obbligatoriamente:
+			
+				* "max_entity_size" (int): La dimensione massima, in caratteri, del codice di un' entità affinchè possa essere raggruppata
+				* "max_batch_size" (int): Il numero massimo di entità di ogni lotto (almeno 2)
+				
+			- "entities_index" (Dict[str, Any]): Dizionario dei parametri della pre-indicizzazione delle entità focali di tutti i progetti focali (calcolata prima della generazione, i cui moduli sono quelli dell' indice). Contiene:
+			
+				* "index_path" (str): La path del file in cui memorizzare l' indice delle entità focali
+				* "workers" (int): Opzionale. Il numero di processi che estraggono le dichiarazioni dei moduli (default = numero di CPUs)
 			
 		La piattaforma di inferenza specifica è descritta dai discendenti di questa classe astratta
 	"""
@@ -63,7 +83,9 @@ class AGeneralConfigValidator(_APlatSpecConfigValidator):
 		"always_excluded"
 	}
 	_OPT_FIELDS: Set[str] = {
-		"response_format"
+		"response_format", "early_stop", "context_slicing", "synt_all_errors",
+		"entity_workers", "project_workers",
+		"pipeline_stages", "entity_batching", "entities_index"
 	}
 	_LLM_FIELDS: Set[str] = {
 		"temperature", "gen_seed",
@@ -74,6 +96,16 @@ class AGeneralConfigValidator(_APlatSpecConfigValidator):
 	_LLMNAME_FIELDS: Set[str] = {
 		"hashing_alg", "digest_len",
 	}
+	_STAGES_FIELDS: Set[str] = {
+		"llm_workers", "check_workers",
+		"queue_size"
+	}
+	_INDEX_FIELDS: Set[str] = {
+		"index_path", "workers"
+	}
+	_BATCHING_FIELDS: Set[str] = {
+		"max_entity_size", "max_batch_size"
+	}
 	_SKIPD_FIELDS: Set[str] = {
 		"file_format",
 		"funcs_gen", "meths_gen",
@@ -172,6 +204,69 @@ class AGeneralConfigValidator(_APlatSpecConfigValidator):
 			
 			if response_fmt.find("(?P<gen_code>") == -1:
 				raise InvalidConfigValueError()
+		
+		early_stop: bool = config_read.get("early_stop", None)
+		if (early_stop is not None) and (not isinstance(early_stop, bool)):
+			raise InvalidConfigValueError()
+		
+		context_slicing: bool = config_read.get("context_slicing", None)
+		if (context_slicing is not None) and (not isinstance(context_slicing, bool)):
+			raise InvalidConfigValueError()
+		
+		synt_all_errors: bool = config_read.get("synt_all_errors", None)
+		if (synt_all_errors is not None) and (not isinstance(synt_all_errors, bool)):
+			raise InvalidConfigValueError()
+		
+		for workers_field in ("entity_workers", "project_workers"):
+			workers_num: int = config_read.get(workers_field, None)
+			if workers_num is not None:
+				if (not isinstance(workers_num, int)) or (isinstance(workers_num, bool)):
+					raise InvalidConfigValueError()
+				if workers_num <= 0:
+					raise InvalidConfigValueError()
+		
+		stages: Dict[str, int] = config_read.get("pipeline_stages", None)
+		if stages is not None:
+			if not isinstance(stages, dict):
+				raise InvalidConfigValueError()
+			if not (set(stages.keys()) <= self._STAGES_FIELDS):
+				raise ConfigExtraFieldsError()
+			for key, value in stages.items():
+				if (not isinstance(value, int)) or (isinstance(value, bool)):
+					raise InvalidConfigValueError()
+				if (value < 0) or ((key != "queue_size") and (value == 0)):
+					raise InvalidConfigValueError()
+		
+		batching: Dict[str, int] = config_read.get("entity_batching", None)
+		if batching is not None:
+			if not isinstance(batching, dict):
+				raise InvalidConfigValueError()
+			if not (set(batching.keys()) <= self._BATCHING_FIELDS):
+				raise ConfigExtraFieldsError()
+			if set(batching.keys()) != self._BATCHING_FIELDS:
+				raise FieldDoesntExistsError()
+			for key, value in batching.items():
+				if (not isinstance(value, int)) or (isinstance(value, bool)):
+					raise InvalidConfigValueError()
+				if (value <= 0) or ((key == "max_batch_size") and (value < 2)):
+					raise InvalidConfigValueError()
+		
+		entities_index: Dict[str, Any] = config_read.get("entities_index", None)
+		if entities_index is not None:
+			if not isinstance(entities_index, dict):
+				raise InvalidConfigValueError()
+			if not (set(entities_index.keys()) <= self._INDEX_FIELDS):
+				raise ConfigExtraFieldsError()
+			if "index_path" not in entities_index:
+				raise FieldDoesntExistsError()
+			if (not isinstance(entities_index["index_path"], str)) or (entities_index["index_path"] == ""):
+				raise InvalidConfigValueError()
+			index_workers: int = entities_index.get("workers", None)
+			if index_workers is not None:
+				if (not isinstance(index_workers, int)) or (isinstance(index_workers, bool)):
+					raise InvalidConfigValueError()
+				if index_workers <= 0:
+					raise InvalidConfigValueError()
 	
 	
 	def _ap__assert_purperrors(self, config_read: Dict[str, Any]):
@@ -56,6 +56,24 @@ class ProjsEnvironConfigValidator(_ABaseConfigValidator):
 				* "lint_executer" (str): Il nome dello script che eseguirà la verifica di linting all' interno di ogni ambiente focale
 				* "inputctr_dir" (str): Il nome della directory, all' interno del "path_prefix", che verrà utilizzata per la condivisione dei files tra il progetto focale e il suo ambiente
 				
+				e può contenere opzionalmente (entrambi o nessuno):
+				
+				* "lint_server" (str): Il nome dello script che avvierà il server di linting persistente all' interno di ogni ambiente focale
+				* "lint_client" (str): Il nome dello script con cui richiedere ogni verifica al server di linting persistente
+				
+				ed eventualmente:
+				
+				* "lint_batch_executer" (str): Il nome dello script che eseguirà la verifica di linting di più test-suites parziali, in un' unica esecuzione, all' interno di ogni ambiente focale
+				* "lint_stream_executer" (str): Il nome dello script che eseguirà la verifica di linting della test-suite parziale ricevuta come standard input, all' interno di ogni ambiente focale
+				* "lint_all_errors" (bool): Se ogni verifica di linting deve raccogliere tutti gli errori distinti della test-suite parziale, da correggere in un unico tentativo (default = false)
+				* "lint_astroid_model" (bool): Se pre-calcolare, nell' immagine di ogni ambiente focale, il modello di "astroid" dei moduli del progetto focale, caricato dal server di linting e dalla verifica di più test-suites parziali al loro avvio (default = false)
+				* "lint_prechecks" (bool): Se pre-verificare ogni test-suite parziale, al di fuori dell' ambiente focale, scartando quelle con errori di linting evidenti (nomi mai definiti nella test-suite parziale) senza verificarle nell' ambiente focale (default = false)
+				* "fenv_pool" (Dict[str, Any]): Le impostazioni del pool di containers "caldi" degli ambienti focali. Contiene, opzionalmente:
+				
+					- "size" (int): Il numero massimo di containers mantenuti per ogni ambiente focale (default = 1)
+					- "max_uses" (int): Il numero di utilizzi dopo il quale ogni container viene sostituito (default = 0, nessun limite)
+					- "keep_alive" (bool): Se lasciare in esecuzione i containers inattivi per le esecuzioni successive (default = false)
+				
 			- "project" (Dict[str, str]): Dizionario che contiene i parametri relativi ad ogni progetto focale. Contiene:
 			
 				* "dockerfile" (str): Il nome del dockerfile, creato da GenTestsAI, che costruirà l' immagine dell' ambiente focale
@@ -90,6 +108,24 @@ class ProjsEnvironConfigValidator(_ABaseConfigValidator):
 		"lint_executer",
 		"inputctr_dir"
 	}
+	_OPT_ENVIRON_FIELDS: Set[str] = {
+		"lint_server",
+		"lint_client"
+	}
+	_OPT_SCRIPTS_FIELDS: Set[str] = {
+		"lint_batch_executer",
+		"lint_stream_executer"
+	}
+	_OPT_FLAGS_FIELDS: Set[str] = {
+		"lint_all_errors",
+		"lint_astroid_model",
+		"lint_prechecks"
+	}
+	_POOL_FIELDS: Set[str] = {
+		"size",
+		"max_uses",
+		"keep_alive"
+	}
 	_1PROJ_FIELDS: Set[str] = {
 		"dockerfile",
 		"pyversion_file",
@@ -181,9 +217,9 @@ class ProjsEnvironConfigValidator(_ABaseConfigValidator):
 			raise ConfigExtraFieldsError()
 		
 		environ_fields = set(environ.keys())
-		if environ_fields < self._ENVIRON_FIELDS:
+		if not (environ_fields >= self._ENVIRON_FIELDS):
 			raise FieldDoesntExistsError()
-		if environ_fields > self._ENVIRON_FIELDS:
+		if not (environ_fields <= (self._ENVIRON_FIELDS | self._OPT_ENVIRON_FIELDS | self._OPT_SCRIPTS_FIELDS | self._OPT_FLAGS_FIELDS | {"fenv_pool"})):
 			raise ConfigExtraFieldsError()
 		
 		if imgs_prefix == "":
@@ -213,6 +249,35 @@ class ProjsEnvironConfigValidator(_ABaseConfigValidator):
 	
 	def _ap__assert_optional(self, config_read: Dict[str, Any]):
 		pref_contman: str = config_read.get("pref_contman", None)
+		tools: Dict[str, str] = config_read["tools"]
+		environ: Dict[str, str] = config_read["environ"]
+		
+		linting_tools: str = path_join(tools["tools_root"], tools["linting"])
+		
+		for script_field in self._OPT_SCRIPTS_FIELDS:
+			lint_script: str = environ.get(script_field, None)
+			if lint_script is not None:
+				if not os_fdexists(path_join(linting_tools, lint_script)):
+					raise InvalidConfigValueError()
+		
+		lint_server_fields: Set[str] = set(environ.keys()) & self._OPT_ENVIRON_FIELDS
+		if len(lint_server_fields) > 0:
+			# Il server di linting e il suo client devono essere specificati insieme
+			if lint_server_fields != self._OPT_ENVIRON_FIELDS:
+				raise FieldDoesntExistsError()
+			
+			for lint_field in self._OPT_ENVIRON_FIELDS:
+				if not os_fdexists(path_join(linting_tools, environ[lint_field])):
+					raise InvalidConfigValueError()
+		
+		for flag_field in self._OPT_FLAGS_FIELDS:
+			flag_value: Any = environ.get(flag_field, None)
+			if (flag_value is not None) and (not isinstance(flag_value, bool)):
+				raise InvalidConfigValueError()
+		
+		fenv_pool: Dict[str, Any] = environ.get("fenv_pool", None)
+		if fenv_pool is not None:
+			self._assert_fenv_pool(fenv_pool)
 		
 		if pref_contman is not None:
 			try:
@@ -285,6 +350,43 @@ class ProjsEnvironConfigValidator(_ABaseConfigValidator):
 			raise InvalidConfigValueError()
 
 
+	def _assert_fenv_pool(self, fenv_pool: Dict[str, Any]):
+		"""
+			Verifica la validità delle impostazioni del pool di containers degli ambienti focali.
+			
+			Se la verifica ha successo quest' operazione è equivalente ad una no-op
+			
+			Parameters
+			----------
+				fenv_pool: Dict[str, Any]
+					Un dizionario variegato, indicizzato da stringhe, contenente le impostazioni del pool
+					
+			Raises
+			------
+				ConfigExtraFieldsError
+					Si verifica se sono presenti campi non previsti
+					
+				InvalidConfigValueError
+					Si verifica se almeno uno dei campi ha un tipo o un valore invalido
+		"""
+		if not isinstance(fenv_pool, dict):
+			raise InvalidConfigValueError()
+		if not (set(fenv_pool.keys()) <= self._POOL_FIELDS):
+			raise ConfigExtraFieldsError()
+		
+		for int_field, min_value in [("size", 1), ("max_uses", 0)]:
+			field_value: Any = fenv_pool.get(int_field, None)
+			if field_value is not None:
+				if (not isinstance(field_value, int)) or isinstance(field_value, bool):
+					raise InvalidConfigValueError()
+				if field_value < min_value:
+					raise InvalidConfigValueError()
+		
+		keep_alive: Any = fenv_pool.get("keep_alive", None)
+		if (keep_alive is not None) and (not isinstance(keep_alive, bool)):
+			raise InvalidConfigValueError()
+
+
 	def _assert_base_image_exists(
 			self,
 			registry: str,
@@ -58,6 +58,10 @@ class PromptsConfigValidator(_ABaseConfigValidator):
 					
 				* "code" (str): Il placeholder (senza delimitatori) per il codice focale nei functional e methodal template prompts utilizzati
 				* "class_name" (str): Il placeholder (senza delimitatori) per il nome della classe nei methodal template prompts utilizzati
+				
+		e può contenere opzionalmente:
+		
+			- "prefix_layout" (bool): Se spostare in coda ai functional e methodal prompts le sezioni che contengono il nome dell' entità, in modo che i prompts di entità consecutive dello stesso modulo condividano lo stesso prefisso (default = false)
 	"""
 	_PLACEH_PATT: str = r"[A-Za-z0-9_]+"
 	
@@ -65,6 +69,9 @@ class PromptsConfigValidator(_ABaseConfigValidator):
 		"base_path", "generic_dirname",
 		"file_names", "placeholders"
 	}
+	_OPT_FIELDS: Set[str] = {
+		"prefix_layout"
+	}
 	_FNAMES_FIELDS: Set[str] = {
 		"functional", "methodal", "correctional"
 	}
@@ -116,7 +123,7 @@ class PromptsConfigValidator(_ABaseConfigValidator):
 	
 	
 	def _ap__fields(self) -> Tuple[Set[str], Set[str]]:
-		return (self._OUTER_FIELDS, set())
+		return (self._OUTER_FIELDS, self._OPT_FIELDS)
 	
 	
 	def _ap__assert_mandatory(self, config_read: Dict[str, Any]):
@@ -145,7 +152,9 @@ class PromptsConfigValidator(_ABaseConfigValidator):
 	
 	
 	def _ap__assert_optional(self, config_read: Dict[str, Any]):
-		return
+		prefix_layout: bool = config_read.get("prefix_layout", None)
+		if (prefix_layout is not None) and (not isinstance(prefix_layout, bool)):
+			raise InvalidConfigValueError()
 	
 	
 	def _ap__assert_purperrors(self, config_read: Dict[str, Any]):
@@ -1,4 +1,6 @@
 from . import classdecls_extractor
 from . import moddecls_extractor
+from . import moddecls_cache
+from . import entities_index
 
 from ._private.e_parser_tool import ECodeParserTool
\ No newline at end of file
@@ -1,4 +1,5 @@
 from ._private.i_classdecls_extractor import IClassDeclsExtractor
 from ._private.treesitter_clsdeclsextr import TreeSitterClassDeclsExtractor
+from ._private.span_clsdeclsextr import SpanClassDeclsExtractor
 
 from ._factory.classdecls_extr_f import ClassDeclsExtractorFactory
\ No newline at end of file
@@ -0,0 +1,66 @@
+from typing import List, Dict, Any
+from .. import IClassDeclsExtractor
+
+
+
+class SpanClassDeclsExtractor(IClassDeclsExtractor):
+	"""
+		Rappresenta un `IClassDeclsExtractor` che è una vista su una classe di un module-file già analizzato:
+		il nome della classe e gli intervalli (in bytes) dei suoi metodi sono forniti dall' analisi del module-file,
+		quindi il codice della classe non viene analizzato nuovamente
+	"""
+
+	def __init__(
+			self,
+			module_source: bytes,
+			class_decls: Dict[str, Any]
+	):
+		"""
+			Costruisce un nuovo SpanClassDeclsExtractor
+
+			Parameters
+			----------
+				module_source: bytes
+					Una sequenza di bytes contenente il codice, codificato in UTF-8, del module-file
+					che definisce la classe
+
+				class_decls: Dict[str, Any]
+					Un dizionario, indicizzato da stringhe, contenente l' analisi della classe. Contiene:
+
+						- "name" (str): Il nome della classe
+						- "methods" (List[Dict[str, Any]]): L' analisi di ogni metodo della classe, con
+						  campi "name" (str) e "span" (List[int], intervallo in bytes del metodo nel module-file)
+
+			Raises
+			------
+				ValueError
+					Si verifica se almeno uno tra `module_source` e `class_decls` ha valore `None`
+		"""
+		if (module_source is None) or (class_decls is None):
+			raise ValueError()
+
+		self._module_source: bytes = module_source
+		self._class_decls: Dict[str, Any] = class_decls
+
+
+	def class_name(self) -> str:
+		return self._class_decls["name"]
+
+
+	def method_names(self) -> List[str]:
+		return [
+			meth_decls["name"]
+			for meth_decls in self._class_decls["methods"]
+		]
+
+
+	def methods(self) -> List[str]:
+		return [
+			self._module_source[meth_decls["span"][0]:meth_decls["span"][1]].decode("utf-8")
+			for meth_decls in self._class_decls["methods"]
+		]
+
+
+	##	============================================================
+	##						PRIVATE METHODS
+	##	============================================================
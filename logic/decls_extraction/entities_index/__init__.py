@@ -0,0 +1,2 @@
+from ._private.focal_entities_index import FocalEntitiesIndex
+from ._private.focal_entities_indexer import FocalEntitiesIndexer
\ No newline at end of file
@@ -0,0 +1,252 @@
+from typing import List, Dict, Any
+
+# ============== JSON Utilities ============== #
+from json import dump as json_dump
+# ============================================ #
+
+
+
+class FocalEntitiesIndex:
+	"""
+		Rappresenta l' indice delle entità focali (funzioni e metodi) dei progetti focali: per ogni progetto focale
+		contiene i suoi moduli, nell' ordine di visita della Focal Project Root Path, e per ogni modulo le sue entità
+		con il relativo intervallo nel codice e l' hash del loro codice.
+
+		L' indice è memorizzato in un file JSON compatto, in cui ogni entità è una lista
+		[classe, nome, inizio, fine, hash]
+	"""
+
+	# Versione del formato del file dell' indice
+	_INDEX_FORMAT: int = 1
+
+	def __init__(self):
+		"""
+			Costruisce un nuovo FocalEntitiesIndex vuoto
+		"""
+		# Per ogni progetto focale: la Focal Project Root Path e i moduli (nell' ordine di visita)
+		self._projects: Dict[str, Dict[str, Any]] = dict()
+
+
+	def add_project(self, project_name: str, focal_root: str):
+		"""
+			Aggiunge all' indice il progetto focale fornito, senza moduli
+			(sostituendo l' eventuale progetto focale con lo stesso nome)
+
+			Parameters
+			----------
+				project_name: str
+					Una stringa contenente il nome del progetto focale
+
+				focal_root: str
+					Una stringa contenente la Focal Project Root Path del progetto focale
+
+			Raises
+			------
+				ValueError
+					Si verifica se almeno uno tra `project_name` e `focal_root` ha valore `None`
+					o è una stringa vuota
+		"""
+		if (project_name is None) or (project_name == ""):
+			raise ValueError()
+		if (focal_root is None) or (focal_root == ""):
+			raise ValueError()
+
+		self._projects[project_name] = {
+			"focal_root": focal_root,
+			"modules": list()
+		}
+
+
+	def add_module(
+			self,
+			project_name: str,
+			module_relpath: str,
+			module_hash: str,
+			entities: List[Dict[str, Any]]
+	):
+		"""
+			Aggiunge, in coda, un modulo di un progetto focale dell' indice
+
+			Parameters
+			----------
+				project_name: str
+					Una stringa contenente il nome del progetto focale a cui appartiene il modulo
+
+				module_relpath: str
+					Una stringa contenente la path del modulo relativa alla Focal Project Root Path
+					(con separatori "/")
+
+				module_hash: str
+					Una stringa contenente l' hash SHA-256 del contenuto del modulo, oppure `None`
+					se il modulo non è leggibile
+
+				entities: List[Dict[str, Any]]
+					Una lista delle entità del modulo (nel formato di `entities(...)`), oppure `None`
+					se il modulo non è leggibile o il suo codice non è corretto sintatticamente
+
+			Raises
+			------
+				ValueError
+					Si verifica se il progetto focale non appartiene all' indice, se `module_relpath` ha valore
+					`None` o è una stringa vuota, oppure se `module_hash` è una stringa vuota
+		"""
+		if project_name not in self._projects:
+			raise ValueError()
+		if (module_relpath is None) or (module_relpath == ""):
+			raise ValueError()
+		if module_hash == "":
+			raise ValueError()
+
+		self._projects[project_name]["modules"].append({
+			"path": module_relpath,
+			"hash": module_hash,
+			"entities": [
+				[entity["class"], entity["name"], entity["span"][0], entity["span"][1], entity["hash"]]
+				for entity in entities
+			] if entities is not None else None
+		})
+
+
+	def projects(self) -> List[str]:
+		"""
+			Restituisce i nomi dei progetti focali dell' indice
+		"""
+		return list(self._projects.keys())
+
+
+	def focal_root(self, project_name: str) -> str:
+		"""
+			Restituisce la Focal Project Root Path del progetto focale fornito
+
+			Raises
+			------
+				KeyError
+					Si verifica se il progetto focale non appartiene all' indice
+		"""
+		return self._projects[project_name]["focal_root"]
+
+
+	def modules(self, project_name: str) -> List[str]:
+		"""
+			Restituisce le paths, relative alla Focal Project Root Path, dei moduli del progetto
+			focale fornito, nell' ordine di visita
+
+			Raises
+			------
+				KeyError
+					Si verifica se il progetto focale non appartiene all' indice
+		"""
+		return [
+			module["path"]
+			for module in self._projects[project_name]["modules"]
+		]
+
+
+	def module_hash(self, project_name: str, module_relpath: str) -> str:
+		"""
+			Restituisce l' hash SHA-256 del contenuto del modulo fornito, di un progetto focale dell' indice
+			(`None` se il modulo non è leggibile)
+
+			Raises
+			------
+				KeyError
+					Si verifica se il progetto focale, o il modulo, non appartiene all' indice
+		"""
+		return self._get_module(project_name, module_relpath)["hash"]
+
+
+	def entities(self, project_name: str, module_relpath: str) -> List[Dict[str, Any]]:
+		"""
+			Restituisce le entità del modulo fornito, di un progetto focale dell' indice
+
+			Returns
+			-------
+				List[Dict[str, Any]]
+					Una lista di dizionari, nell' ordine di definizione, ognuno dei quali contiene:
+
+						- "class" (str): Il nome della classe del metodo (`None` per le funzioni)
+						- "name" (str): Il nome dell' entità
+						- "span" (List[int]): L' intervallo [inizio, fine], in bytes, dell' entità nel modulo
+						- "hash" (str): L' hash SHA-256 del codice dell' entità
+
+					Vale `None` se il modulo non è leggibile o il suo codice non è corretto sintatticamente
+
+			Raises
+			------
+				KeyError
+					Si verifica se il progetto focale, o il modulo, non appartiene all' indice
+		"""
+		mod_entities: List[List[Any]] = self._get_module(project_name, module_relpath)["entities"]
+		if mod_entities is None:
+			return None
+
+		return [
+			{
+				"class": class_name,
+				"name": entity_name,
+				"span": [span_start, span_end],
+				"hash": entity_hash
+			}
+			for class_name, entity_name, span_start, span_end, entity_hash in mod_entities
+		]
+
+
+	def entities_count(self, project_name: str = None) -> int:
+		"""
+			Restituisce il numero di entità del progetto focale fornito, oppure di tutti i
+			progetti focali dell' indice se non viene fornito alcun progetto focale
+
+			Raises
+			------
+				KeyError
+					Si verifica se il progetto focale non appartiene all' indice
+		"""
+		projects_names: List[str] = [project_name] if project_name is not None else self.projects()
+
+		return sum(
+			len(module["entities"])
+			for proj_name in projects_names
+			for module in self._projects[proj_name]["modules"]
+			if module["entities"] is not None
+		)
+
+
+	def save(self, index_path: str):
+		"""
+			Memorizza l' indice nel file fornito (sovrascrivendolo se esistente)
+
+			Parameters
+			----------
+				index_path: str
+					Una stringa contenente la path del file dell' indice
+
+			Raises
+			------
+				ValueError
+					Si verifica se il parametro `index_path` ha valore `None` o è una stringa vuota
+		"""
+		if (index_path is None) or (index_path == ""):
+			raise ValueError()
+
+		with open(index_path, "w", encoding="utf-8") as findex:
+			json_dump(
+				{"format": self._INDEX_FORMAT, "projects": self._projects},
+				findex,
+				separators=(",", ":")
+			)
+
+
+	##	============================================================
+	##						PRIVATE METHODS
+	##	============================================================
+
+
+	def _get_module(self, project_name: str, module_relpath: str) -> Dict[str, Any]:
+		"""
+			Restituisce il modulo fornito di un progetto focale dell' indice
+		"""
+		for module in self._projects[project_name]["modules"]:
+			if module["path"] == module_relpath:
+				return module
+
+		raise KeyError(module_relpath)
@@ -0,0 +1,264 @@
+from typing import List, Dict, Tuple, Any
+from .focal_entities_index import FocalEntitiesIndex
+
+from hashlib import sha256
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context as mp_get_context
+# ============== OS Utilities ============== #
+from os import (
+	walk as os_walk,
+	cpu_count as os_cpucount
+)
+# ========================================== #
+# ============ Path Utilities ============ #
+from os.path import (
+	normpath as os_normpath,
+	join as path_join,
+	relpath as path_relative,
+	sep as path_sep
+)
+# ======================================== #
+
+from ...moddecls_extractor import (
+	AMutableModuleDeclsExtractor,
+	MutableModuleDeclsExtractorFactory
+)
+from ...moddecls_extractor.exceptions import IncorrectModuleCodeError
+from ..._private.e_parser_tool import ECodeParserTool
+
+
+
+class FocalEntitiesIndexer:
+	"""
+		Rappresenta un oggetto in grado di calcolare il `FocalEntitiesIndex` di più progetti focali.
+
+		I moduli di ogni progetto focale vengono individuati visitando la sua Focal Project Root Path, senza
+		scendere nelle directories escluse; le dichiarazioni dei moduli vengono poi estratte, da un pool di
+		processi, dagli estrattori del tool di parsing fornito (uno per processo).
+		
+		I processi del pool vengono avviati con il metodo "spawn" (e non duplicando il processo corrente),
+		quindi l' indicizzazione può avvenire anche in presenza di altri threads, connessioni o clients aperti
+	"""
+
+	# Dimensione dei gruppi di moduli assegnati ad ogni processo
+	_MODULES_CHUNK: int = 8
+
+	def __init__(
+			self,
+			workers_num: int = None,
+			tool: ECodeParserTool = ECodeParserTool.TREE_SITTER
+	):
+		"""
+			Costruisce un nuovo FocalEntitiesIndexer
+
+			Parameters
+			----------
+				workers_num: int
+					Opzionale. Default = `None`. Un intero indicante il numero di processi che estraggono
+					le dichiarazioni dei moduli. Se `None` viene utilizzato il numero di CPUs disponibili
+
+				tool: ECodeParserTool
+					Opzionale. Default = `ECodeParserTool.TREE_SITTER`. Un valore `ECodeParserTool`
+					rappresentante il tool di parsing degli estrattori delle dichiarazioni
+
+			Raises
+			------
+				ValueError
+					Si verifica se il parametro `workers_num` è minore o uguale a 0
+		"""
+		if (workers_num is not None) and (workers_num <= 0):
+			raise ValueError()
+
+		self._workers_num: int = workers_num if workers_num is not None else (os_cpucount() or 1)
+		self._tool: ECodeParserTool = tool
+
+
+	def index_projects(
+			self,
+			projects: Dict[str, Tuple[str, List[str]]],
+			always_excluded: List[str]
+	) -> FocalEntitiesIndex:
+		"""
+			Calcola l' indice delle entità focali dei progetti focali forniti
+
+			Parameters
+			----------
+				projects: Dict[str, Tuple[str, List[str]]]
+					Un dizionario, indicizzato dai nomi dei progetti focali, contenente le coppie
+					(Focal Project Root Path, paths escluse dal codice focale) di ogni progetto focale
+
+				always_excluded: List[str]
+					Una lista di stringhe contenente i nomi dei files, o delle directories, esclusi
+					dal codice focale di ogni progetto focale
+
+			Returns
+			-------
+				FocalEntitiesIndex
+					Un oggetto `FocalEntitiesIndex` contenente l' indice calcolato
+
+			Raises
+			------
+				ValueError
+					Si verifica se il parametro `projects` ha valore `None`
+		"""
+		if projects is None:
+			raise ValueError()
+
+		index: FocalEntitiesIndex = FocalEntitiesIndex()
+
+		# La visita delle directories è sequenziale, l' estrazione delle dichiarazioni parallela
+		modules_paths: List[Tuple[str, str, str]] = list()
+		for project_name, (focal_root, focal_excluded) in projects.items():
+			focal_root = os_normpath(focal_root)
+			index.add_project(project_name, focal_root)
+			modules_paths.extend(
+				(project_name, focal_root, module_path)
+				for module_path in self.focal_modules(focal_root, focal_excluded, always_excluded)
+			)
+
+		with ProcessPoolExecutor(
+				max_workers=self._workers_num,
+				# La duplicazione ("fork") di un processo con più threads può causare dei deadlocks
+				mp_context=mp_get_context("spawn"),
+				initializer=_init_worker,
+				initargs=(self._tool,)
+		) as index_executor:
+			modules_decls = index_executor.map(
+				_index_module,
+				[module_path for _, _, module_path in modules_paths],
+				chunksize=self._MODULES_CHUNK
+			)
+			for (project_name, focal_root, module_path), (module_hash, entities) in zip(modules_paths, modules_decls):
+				index.add_module(
+					project_name,
+					path_relative(module_path, start=focal_root).replace(path_sep, "/"),
+					module_hash, entities
+				)
+
+		return index
+
+
+	@classmethod
+	def focal_modules(
+			cls,
+			focal_root: str,
+			focal_excluded: List[str],
+			always_excluded: List[str]
+	) -> List[str]:
+		"""
+			Individua i moduli del codice focale di un progetto focale, visitandone la Focal Project Root Path
+			senza scendere nelle directories escluse
+
+			Parameters
+			----------
+				focal_root: str
+					Una stringa contenente la Focal Project Root Path del progetto focale
+
+				focal_excluded: List[str]
+					Una lista di stringhe contenente le paths (assolute, o relative alla Focal Project
+					Root Path) dei files, o delle directories, esclusi dal codice focale del progetto
+
+				always_excluded: List[str]
+					Una lista di stringhe contenente i nomi dei files, o delle directories, esclusi
+					dal codice focale di ogni progetto focale
+
+			Returns
+			-------
+				List[str]
+					Una lista di stringhe contenente le paths dei moduli del codice focale,
+					nell' ordine di visita
+		"""
+		focal_root = os_normpath(focal_root)
+		excluded_paths: List[str] = [
+			os_normpath(path_join(focal_root, focal_excl))
+			for focal_excl in focal_excluded
+		]
+
+		modules_paths: List[str] = list()
+		for curr_path, dir_names, file_names in os_walk(focal_root):
+			curr_path = os_normpath(curr_path)
+			# Le directories escluse non vengono visitate
+			dir_names[:] = [
+				dir_name for dir_name in dir_names
+				if (dir_name not in always_excluded) and
+				(path_join(curr_path, dir_name) not in excluded_paths)
+			]
+
+			for file_name in file_names:
+				if (not file_name.endswith(".py")) or (file_name in always_excluded):
+					continue
+				if path_join(curr_path, file_name) in excluded_paths:
+					continue
+				modules_paths.append(path_join(curr_path, file_name))
+
+		return modules_paths
+
+
+
+# Estrattore delle dichiarazioni del processo corrente (uno per processo del pool)
+_worker_extr: AMutableModuleDeclsExtractor = None
+
+
+def _init_worker(tool: ECodeParserTool):
+	"""
+		Crea l' estrattore delle dichiarazioni del processo corrente del pool
+	"""
+	global _worker_extr
+	_worker_extr = MutableModuleDeclsExtractorFactory().create(tool, "pass")
+
+
+def _index_module(module_path: str) -> Tuple[str, List[Dict[str, Any]]]:
+	"""
+		Estrae le entità del modulo fornito, restituendo la coppia (hash del contenuto, entità).
+		Le entità dei moduli non decodificabili, o non corretti sintatticamente, valgono `None`;
+		dei moduli non leggibili (es. links non validi o permessi insufficienti) vale `None` anche l' hash
+	"""
+	module_source: bytes
+	try:
+		with open(module_path, "rb") as fmodule:
+			module_source = fmodule.read()
+	except OSError:
+		return None, None
+	module_hash: str = sha256(module_source).hexdigest()
+
+	try:
+		module_code: str = module_source.decode("utf-8")
+	except UnicodeDecodeError:
+		return module_hash, None
+	if module_code == "":
+		return module_hash, []
+
+	try:
+		_worker_extr.set_module_code(module_code)
+	except IncorrectModuleCodeError:
+		return module_hash, None
+	module_decls: Dict[str, Any] = _worker_extr.extract_module_decls()
+
+	entities: List[Dict[str, Any]] = [
+		_entity(module_source, None, func_decls)
+		for func_decls in module_decls["funcs"]
+	]
+	for class_decls in module_decls["classes"]:
+		entities.extend(
+			_entity(module_source, class_decls["name"], meth_decls)
+			for meth_decls in class_decls["methods"]
+		)
+	entities.sort(key=lambda entity: entity["span"][0])
+	return module_hash, entities
+
+
+def _entity(
+		module_source: bytes,
+		class_name: str,
+		entity_decls: Dict[str, Any]
+) -> Dict[str, Any]:
+	"""
+		Costruisce l' entità dell' indice corrispondente alla dichiarazione fornita
+	"""
+	span_start, span_end = entity_decls["span"]
+	return {
+		"class": class_name,
+		"name": entity_decls["name"],
+		"span": [span_start, span_end],
+		"hash": sha256(module_source[span_start:span_end]).hexdigest()
+	}
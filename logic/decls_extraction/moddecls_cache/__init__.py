@@ -0,0 +1,3 @@
+from ._private.i_moddecls_cache import IModuleDeclsCache
+
+from ._factory.moddecls_cache_f import ModuleDeclsCacheFactory
\ No newline at end of file
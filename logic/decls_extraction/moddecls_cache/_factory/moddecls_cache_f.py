@@ -0,0 +1,54 @@
+from .. import IModuleDeclsCache
+
+from .._private.sqlite3_moddecls_cache import Sqlite3ModuleDeclsCache
+
+from ....ptsuite_generation.cache_accessor import ECacheAccessorType
+
+
+
+class ModuleDeclsCacheFactory:
+	"""
+		Rappresenta una factory per ogni `IModuleDeclsCache`
+	"""
+	
+	
+	@classmethod
+	def create(
+			cls,
+			tech: ECacheAccessorType,
+			cache_path: str
+	) -> IModuleDeclsCache:
+		"""
+			Istanzia una nuova cache delle analisi delle dichiarazioni dei module-files della tecnologia
+			implementativa specificata
+			
+			Parameters
+			----------
+				tech: ECacheAccessorType
+					Un valore `ECacheAccessorType` rappresentante la tecnologia richiesta
+					per l' oggetto `IModuleDeclsCache`
+					
+				cache_path: str
+					Una stringa rappresentante la path del file di caching da utilizzare
+					
+			Returns
+			-------
+				IModuleDeclsCache
+					Un oggetto `IModuleDeclsCache` della tecnologia implementativa specificata
+					
+			Raises
+			------
+				ValueError
+					Si verifica se il parametro `cache_path` ha valore `None` o è una stringa vuota
+		"""
+		obj: IModuleDeclsCache
+		match tech:
+			case ECacheAccessorType.SQLITE3:
+				obj = Sqlite3ModuleDeclsCache(cache_path)
+		
+		return obj
+	
+	
+	##	============================================================
+	##						PRIVATE METHODS
+	##	============================================================
@@ -0,0 +1,96 @@
+from typing import Dict, Any
+from abc import ABC, abstractmethod
+
+
+
+class IModuleDeclsCache(ABC):
+	"""
+		Rappresenta una cache, persistente, delle analisi delle dichiarazioni dei module-files (funzioni, classi,
+		metodi e relativi intervalli nel codice) indicizzate da una chiave calcolata dal contenuto del module-file,
+		in modo che lo stesso codice non venga analizzato più di una volta, anche tra esecuzioni differenti.
+		
+		La tecnologia implementativa della cache è specificata dai discendenti di questa interfaccia
+	"""
+	
+	
+	@abstractmethod
+	def get_decls(self, code_key: str) -> Dict[str, Any]:
+		"""
+			Restituisce l' analisi memorizzata per il module-file identificato dalla chiave fornita,
+			registrando l' esito della ricerca (hit o miss)
+			
+			Parameters
+			----------
+				code_key: str
+					Una stringa contenente la chiave del contenuto del module-file
+					
+			Returns
+			-------
+				Dict[str, Any]
+					Un dizionario, indicizzato da stringhe, contenente l' analisi memorizzata.
+					Vale `None` se l' analisi non è presente nella cache
+					
+			Raises
+			------
+				ValueError
+					Si verifica se il parametro `code_key` ha valore `None` o è una stringa vuota
+		"""
+		pass
+	
+	
+	@abstractmethod
+	def put_decls(self, code_key: str, module_decls: Dict[str, Any]):
+		"""
+			Memorizza l' analisi del module-file identificato dalla chiave fornita,
+			sovrascrivendo l' eventuale analisi già presente
+			
+			Parameters
+			----------
+				code_key: str
+					Una stringa contenente la chiave del contenuto del module-file
+					
+				module_decls: Dict[str, Any]
+					Un dizionario, indicizzato da stringhe, contenente l' analisi da memorizzare
+					(deve essere serializzabile in JSON)
+					
+			Raises
+			------
+				ValueError
+					Si verifica se almeno uno tra `code_key` e `module_decls` ha valore `None`, oppure se
+					`code_key` è una stringa vuota
+		"""
+		pass
+	
+	
+	@abstractmethod
+	def hits(self) -> int:
+		"""
+			Restituisce il numero di analisi trovate nella cache dalla sua apertura
+			
+			Returns
+			-------
+				int
+					Un intero indicante il numero di "hits" della cache
+		"""
+		pass
+	
+	
+	@abstractmethod
+	def misses(self) -> int:
+		"""
+			Restituisce il numero di analisi non trovate nella cache dalla sua apertura
+			
+			Returns
+			-------
+				int
+					Un intero indicante il numero di "misses" della cache
+		"""
+		pass
+	
+	
+	@abstractmethod
+	def close(self):
+		"""
+			Chiude la cache rilasciandone le risorse
+		"""
+		pass
@@ -0,0 +1,118 @@
+from typing import Dict, Tuple, Any
+from .i_moddecls_cache import IModuleDeclsCache
+
+from threading import RLock
+
+# =========== SQLite3 Utilities ============ #
+from sqlite3 import (
+	connect as sql_connect,
+	Connection as SqlConnection,
+	Cursor as SqlConnectionCursor,
+)
+# ========================================== #
+# ============== JSON Utilities ============== #
+from json import (
+	JSONEncoder,
+	JSONDecoder
+)
+# ============================================ #
+
+
+
+class Sqlite3ModuleDeclsCache(IModuleDeclsCache):
+	"""
+		Rappresenta un `IModuleDeclsCache` che utilizza come cache un database locale SQLite3.
+		Ogni analisi è memorizzata come oggetto JSON.
+		
+		L' accesso al database è serializzato, in modo che lo stesso Sqlite3ModuleDeclsCache
+		possa essere utilizzato da più threads contemporaneamente
+	"""
+	
+	_TABLE_NAME: str = "module_decls"
+	
+	def __init__(
+			self,
+			cache_path: str
+	):
+		"""
+			Costruisce un nuovo Sqlite3ModuleDeclsCache associandolo alla path del database
+			SQLite3 da utilizzare (creato se non esistente)
+			
+			Parameters
+			----------
+				cache_path: str
+					Una stringa rappresentante la path del database SQLite3 da utilizzare
+					
+			Raises
+			------
+				ValueError
+					Si verifica se il parametro `cache_path` ha valore `None` o è una stringa vuota
+		"""
+		if (cache_path is None) or (cache_path == ""):
+			raise ValueError()
+		
+		self._hits: int = 0
+		self._misses: int = 0
+		
+		self._json_enc: JSONEncoder = JSONEncoder()
+		self._json_dec: JSONDecoder = JSONDecoder()
+		
+		self._db_lock: RLock = RLock()
+		self._conn: SqlConnection = sql_connect(cache_path, check_same_thread=False)
+		self._cursor: SqlConnectionCursor = self._conn.cursor()
+		
+		with self._db_lock:
+			self._cursor.execute(f"""
+				CREATE TABLE IF NOT EXISTS `{self._TABLE_NAME}` (
+					`code_key` TEXT NOT NULL PRIMARY KEY,
+					`module_decls` TEXT NOT NULL
+				)
+			""")
+			self._conn.commit()
+	
+	
+	def get_decls(self, code_key: str) -> Dict[str, Any]:
+		if (code_key is None) or (code_key == ""):
+			raise ValueError()
+		
+		with self._db_lock:
+			self._cursor.execute(f"""
+				SELECT `module_decls` FROM `{self._TABLE_NAME}`
+				WHERE `code_key` = ?
+			""", [code_key])
+			row: Tuple[str] = self._cursor.fetchone()
+			
+			if row is None:
+				self._misses += 1
+				return None
+			
+			self._hits += 1
+			return self._json_dec.decode(row[0])
+	
+	
+	def put_decls(self, code_key: str, module_decls: Dict[str, Any]):
+		if (code_key is None) or (code_key == "") or (module_decls is None):
+			raise ValueError()
+		
+		with self._db_lock:
+			self._cursor.execute(f"""
+				INSERT OR REPLACE INTO `{self._TABLE_NAME}` (`code_key`, `module_decls`)
+				VALUES (?, ?)
+			""", [code_key, self._json_enc.encode(module_decls)])
+			self._conn.commit()
+	
+	
+	def hits(self) -> int:
+		with self._db_lock:
+			return self._hits
+	
+	
+	def misses(self) -> int:
+		with self._db_lock:
+			return self._misses
+	
+	
+	def close(self):
+		with self._db_lock:
+			self._cursor.close()
+			self._conn.close()
@@ -1,6 +1,7 @@
 from .._private.i_moddecls_extractor import IModuleDeclsExtractor
 
 from ..._private.e_parser_tool import ECodeParserTool
+from ...moddecls_cache import IModuleDeclsCache
 
 
 
@@ -16,7 +17,8 @@ class IModuleDeclsExtractorFactory:
 	def create(
 			self,
 			tool: ECodeParserTool,
-	        module_code: str
+	        module_code: str,
+			decls_cache: IModuleDeclsCache = None
 	) -> IModuleDeclsExtractor:
 		"""
 			Istanzia un nuovo estrattore di codice focale dei moduli che utilizza il tool di parsing
@@ -32,6 +34,10 @@ class IModuleDeclsExtractorFactory:
 					Una stringa contenente il codice del modulo Python da associare
 					all' estrattore
 					
+				decls_cache: IModuleDeclsCache
+					Opzionale. Default = `None`. Un oggetto `IModuleDeclsCache` rappresentante la cache
+					delle analisi dei module-files da utilizzare (se supportata dall' estrattore richiesto)
+					
 			Returns
 			-------
 				IModuleDeclsExtractor
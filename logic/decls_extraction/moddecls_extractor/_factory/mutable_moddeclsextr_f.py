@@ -1,6 +1,7 @@
 from .i_moddecls_extr_f import IModuleDeclsExtractorFactory
 
 from ..._private.e_parser_tool import ECodeParserTool
+from ...moddecls_cache import IModuleDeclsCache
 from .._private.a_mutable_moddeclsextr import AMutableModuleDeclsExtractor
 from .._private.treesitter_moddeclsextr import TreeSitterModuleDeclsExtractor
 
@@ -14,11 +15,12 @@ class MutableModuleDeclsExtractorFactory(IModuleDeclsExtractorFactory):
 	def create(
 			self,
 			tool: ECodeParserTool,
-			module_code: str
+			module_code: str,
+			decls_cache: IModuleDeclsCache = None
 	) -> AMutableModuleDeclsExtractor:
 		match tool:
 			case ECodeParserTool.TREE_SITTER:
-				return TreeSitterModuleDeclsExtractor(module_code)
+				return TreeSitterModuleDeclsExtractor(module_code, decls_cache)
 			case _:
 				raise NotImplementedError()
 
@@ -1,22 +1,12 @@
-from typing import List
+from typing import List, Dict, Any
 from abc import abstractmethod
 from .. import IModuleDeclsExtractor
 
-# ============== OS Utilities ============== #
-from os import remove as os_remove
-from tempfile import gettempdir as os_tempdir
-# ========================================== #
-# ============ Path Utilities ============ #
-from pathlib import Path as SystemPath
-# ======================================== #
-from datetime import datetime as DateTime
-from py_compile import (
-	compile as py_compile,
-	PycInvalidationMode as Pyc_InvMode,
-	PyCompileError
-)
+from hashlib import sha256
+from copy import deepcopy
 
 from ...classdecls_extractor import IClassDeclsExtractor
+from ...moddecls_cache import IModuleDeclsCache
 
 from ..exceptions import IncorrectModuleCodeError
 
@@ -26,12 +16,21 @@ class AMutableModuleDeclsExtractor(IModuleDeclsExtractor):
 	"""
 		Rappresenta un `IModuleDeclsExtractor` a cui è possibile variare il codice del module-file associato.
 		
+		Ogni module-file viene analizzato una sola volta (dichiarazioni di funzioni, classi e metodi, con i relativi
+		intervalli nel codice). Se viene fornita una cache delle analisi, le analisi dei module-files impostati
+		vengono memorizzate indicizzate dal contenuto del module-file, e un module-file già analizzato (anche in
+		un' esecuzione precedente) non viene nè verificato sintatticamente nè analizzato nuovamente.
+		
 		La tecnologia implementativa dell' estrazione è specificata dai discendenti di questa interfaccia.
 	"""
 	
+	# Versione del formato delle analisi (fa parte della chiave di ogni analisi nella cache)
+	_DECLS_FORMAT: int = 1
+	
 	def __init__(
 			self,
-			module_code: str
+			module_code: str,
+			decls_cache: IModuleDeclsCache = None
 	):
 		"""
 			Costruisce un nuovo AMutableModuleDeclsExtractor fornendo il primo module-file
@@ -43,6 +42,10 @@ class AMutableModuleDeclsExtractor(IModuleDeclsExtractor):
 					Una stringa contenente il codice del module-file di cui estrarre
 					le dichiarazioni
 					
+				decls_cache: IModuleDeclsCache
+					Opzionale. Default = `None`. Un oggetto `IModuleDeclsCache` rappresentante la cache
+					delle analisi dei module-files impostati tramite `set_module_code(...)`
+					
 			Raises
 			------
 				ValueError
@@ -52,6 +55,12 @@ class AMutableModuleDeclsExtractor(IModuleDeclsExtractor):
 			raise ValueError()
 		
 		self._module_code: str = module_code
+		self._decls_cache: IModuleDeclsCache = decls_cache
+		
+		# Analisi del module-file impostato (calcolata alla prima estrazione se non presente nella cache)
+		self._module_decls: Dict[str, Any] = None
+		# Chiave dell' analisi nella cache (`None` se l' analisi non deve essere memorizzata)
+		self._decls_key: str = None
 
 
 	def set_module_code(
@@ -82,9 +91,38 @@ class AMutableModuleDeclsExtractor(IModuleDeclsExtractor):
 		if (module_code is None) or (module_code == ""):
 			raise ValueError()
 		
-		self._assert_synt_correctness(module_code)
+		decls_key: str = None
+		module_decls: Dict[str, Any] = None
+		if self._decls_cache is not None:
+			decls_key = self._code_key(module_code)
+			module_decls = self._decls_cache.get_decls(decls_key)
+		
+		# Nella cache sono presenti soltanto le analisi di module-files corretti sintatticamente
+		if module_decls is None:
+			self._assert_synt_correctness(module_code)
 		
 		self._module_code = module_code
+		self._module_decls = module_decls
+		self._decls_key = decls_key
+	
+	
+	def extract_module_decls(self) -> Dict[str, Any]:
+		"""
+			Restituisce l' analisi, effettuata in un unico passaggio, del module-file associato
+			
+			Returns
+			-------
+				Dict[str, Any]
+					Un dizionario, indicizzato da stringhe, contenente l' analisi del module-file. Gli intervalli
+					sono coppie [inizio, fine] di posizioni in bytes del codice codificato in UTF-8. Contiene:
+					
+						- "funcs" (List[Dict[str, Any]]): Le funzioni del module-file, ognuna con campi "name" (str)
+						  e "span" (List[int])
+						- "classes" (List[Dict[str, Any]]): Le classi del module-file, ognuna con campi "name" (str),
+						  "span" (List[int], decoratori compresi) e "methods" (List[Dict[str, Any]], con gli stessi
+						  campi delle funzioni)
+		"""
+		return deepcopy(self._pf_get_module_decls())
 		
 	
 	#	============================================================
@@ -107,6 +145,35 @@ class AMutableModuleDeclsExtractor(IModuleDeclsExtractor):
 		pass
 	
 	
+	@abstractmethod
+	def extract_entity_context(
+			self,
+			entity_name: str,
+			class_name: str = None
+	) -> str:
+		pass
+	
+	
+	@abstractmethod
+	def _ap__analyze_module(self, module_code: str) -> Dict[str, Any]:
+		"""
+			Analizza, in un unico passaggio, il module-file fornito tramite la tecnologia implementativa
+			specificata dai discendenti di questa classe astratta
+			
+			Parameters
+			----------
+				module_code: str
+					Una stringa contenente il codice del module-file da analizzare
+					
+			Returns
+			-------
+				Dict[str, Any]
+					Un dizionario, indicizzato da stringhe e serializzabile in JSON, contenente l' analisi
+					del module-file (nel formato di `extract_module_decls(...)`)
+		"""
+		pass
+	
+	
 	#	============================================================
 	#						PRIVATE METHODS
 	#	============================================================
@@ -125,6 +192,34 @@ class AMutableModuleDeclsExtractor(IModuleDeclsExtractor):
 		return self._module_code
 	
 	
+	def _pf_get_module_decls(self) -> Dict[str, Any]:
+		"""
+			Restituisce l' analisi dell' ultimo module-file impostato, calcolandola (e memorizzandola
+			nell' eventuale cache) se non ancora calcolata
+			
+			Returns
+			-------
+				Dict[str, Any]
+					Un dizionario, indicizzato da stringhe, contenente l' analisi del module-file
+					(nel formato di `extract_module_decls(...)`)
+		"""
+		if self._module_decls is None:
+			self._module_decls = self._ap__analyze_module(self._module_code)
+			if self._decls_key is not None:
+				self._decls_cache.put_decls(self._decls_key, self._module_decls)
+		
+		return self._module_decls
+	
+	
+	@classmethod
+	def _code_key(cls, module_code: str) -> str:
+		"""
+			Calcola la chiave, nella cache delle analisi, del module-file fornito
+			(versione del formato delle analisi e hash SHA-256 del contenuto)
+		"""
+		return f"{cls._DECLS_FORMAT}:{sha256(module_code.encode('utf-8')).hexdigest()}"
+	
+	
 	@classmethod
 	def _assert_synt_correctness(
 			cls,
@@ -144,26 +239,8 @@ class AMutableModuleDeclsExtractor(IModuleDeclsExtractor):
 				IncorrectModuleCodeError
 					Si verifica se il codice del modulo contiene errori da un punto di vista sintattico
 		"""
-		now: DateTime = DateTime.now()
-		tmpfile_name: str = (
-				"tmp_" +
-				f"{int(now.timestamp()*100)}" +
-				".py"
-		)
-		tmpfile_path: SystemPath = SystemPath(os_tempdir(), tmpfile_name)
-		
-		with tmpfile_path.open("w") as ftemp:
-			ftemp.write(module_code)
-			ftemp.flush()
-			
+		# La compilazione avviene direttamente dalla memoria, senza scrivere files temporanei
 		try:
-			py_compile(
-				str(tmpfile_path),
-				doraise=True,
-				invalidation_mode=Pyc_InvMode.TIMESTAMP
-			)
-		except PyCompileError:
-			os_remove(str(tmpfile_path))
-			raise IncorrectModuleCodeError()
-		
-		os_remove(str(tmpfile_path))
\ No newline at end of file
+			compile(module_code, "<module>", "exec", dont_inherit=True)
+		except Exception:
+			raise IncorrectModuleCodeError()
\ No newline at end of file
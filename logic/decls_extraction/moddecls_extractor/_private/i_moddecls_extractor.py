@@ -53,4 +53,45 @@ class IModuleDeclsExtractor(ABC):
 					Una lista di oggetti `IClassDeclsExtractor`, uno per ogni classe definita
 					nel module-file
 		"""
-		pass
\ No newline at end of file
+		pass	
+	
+	@abstractmethod
+	def extract_entity_context(
+			self,
+			entity_name: str,
+			class_name: str = None
+	) -> str:
+		"""
+			Estrae il contesto minimo necessario a descrivere un' entità (funzione o metodo) del
+			module-file associato, in alternativa all' intero codice del module-file.
+			
+			Il contesto è composto, nell' ordine, da:
+			
+				- Gli imports del module-file
+				- Le firme dei nomi definiti nel namespace del module-file e referenziati dall' entità
+				- Il codice dell' entità, se è una funzione, oppure lo scheletro della sua classe
+				  (con il solo metodo richiesto completo), se è un metodo
+			
+			Parameters
+			----------
+				entity_name: str
+					Una stringa contenente il nome della funzione, o del metodo, di cui estrarre il contesto
+					
+				class_name: str
+					Opzionale. Default = `None`. Una stringa contenente il nome della classe a cui appartiene
+					il metodo. Se `None` l' entità è considerata una funzione del module-file
+					
+			Returns
+			-------
+				str
+					Una stringa contenente il codice del contesto dell' entità richiesta
+					
+			Raises
+			------
+				ValueError
+					Si verifica se il parametro `entity_name` ha valore `None` o è una stringa vuota
+					
+				EntityNotFoundError
+					Si verifica se l' entità richiesta non è definita nel module-file associato
+		"""
+		pass
@@ -1,4 +1,4 @@
-from typing import List, FrozenSet
+from typing import List, Dict, Set, Tuple, FrozenSet, Any
 from .. import AMutableModuleDeclsExtractor
 
 from tree_sitter import (
@@ -9,22 +9,31 @@ from tree_sitter_python import language as py_grammar
 
 from ...classdecls_extractor import (
 	IClassDeclsExtractor,
-	TreeSitterClassDeclsExtractor
+	SpanClassDeclsExtractor
 )
+from ...moddecls_cache import IModuleDeclsCache
+
+from ..exceptions import EntityNotFoundError
 
 
 
 class TreeSitterModuleDeclsExtractor(AMutableModuleDeclsExtractor):
 	"""
 		Rappresenta un `AMutableModuleDeclsExtractor` che è implementato tramite l'utilizzo
-		della libreria `tree-sitter` di Python
+		della libreria `tree-sitter` di Python.
+		
+		Ogni module-file viene analizzato da un unico albero sintattico, calcolato solo se necessario
+		(le estrazioni dei contesti delle entità richiedono l' albero anche se l' analisi è nella cache).
+		Gli estrattori delle classi sono viste sull' analisi del module-file, senza ulteriori parsing
 	"""
 	
 	_FUNCS_TIPOLOGY: FrozenSet[str] = {"function_definition", "async_function_definition"}
+	_IMPORTS_TIPOLOGY: FrozenSet[str] = {"import_statement", "import_from_statement", "future_import_statement"}
 	
 	def __init__(
 			self,
-			module_code: str
+			module_code: str,
+			decls_cache: IModuleDeclsCache = None
 	):
 		"""
 			Costruisce un nuovo TreeSitterModuleDeclsExtractor fornendo il primo module-file
@@ -36,6 +45,10 @@ class TreeSitterModuleDeclsExtractor(AMutableModuleDeclsExtractor):
 					Una stringa contenente il codice del module-file di cui estrarre
 					le dichiarazioni
 					
+				decls_cache: IModuleDeclsCache
+					Opzionale. Default = `None`. Un oggetto `IModuleDeclsCache` rappresentante la cache
+					delle analisi dei module-files impostati tramite `set_module_code(...)`
+					
 			Raises
 			------
 				ValueError
@@ -47,50 +60,141 @@ class TreeSitterModuleDeclsExtractor(AMutableModuleDeclsExtractor):
 				IncorrectModuleCodeError
 					Si verifica se il codice del modulo contiene errori da un punto di vista sintattico
 		"""
-		super().__init__(module_code)
+		super().__init__(module_code, decls_cache)
 		
 		self._py_parser: Parser = Parser(Language(py_grammar()))
 		
 		self._module_source: bytes = module_code.encode("utf-8")
-		self._module: TreeNode = self._py_parser.parse(self._module_source).root_node
+		# Albero sintattico del module-file impostato (calcolato solo se necessario)
+		self._module: TreeNode = None
 	
 	
 	def set_module_code(self, module_code: str):
 		super().set_module_code(module_code)
 		
-		self._module = self._py_parser.parse(module_code.encode()).root_node
+		self._module_source = module_code.encode("utf-8")
+		self._module = None
 	
 	
 	def extract_funcnames(self) -> List[str]:
-		mod_funcsnames: List[str] = self._extract_functions(with_code=False)
-				
+		mod_funcsnames: List[str] = [
+			func_decls["name"]
+			for func_decls in self._pf_get_module_decls()["funcs"]
+		]
+		
 		return mod_funcsnames
 	
 	
 	def extract_funcs(self) -> List[str]:
-		mod_funcs: List[str] = self._extract_functions(with_code=True)
+		mod_funcs: List[str] = [
+			self._span_code(func_decls["span"])
+			for func_decls in self._pf_get_module_decls()["funcs"]
+		]
 		
 		return mod_funcs
 	
 	
 	def extract_classes(self) -> List[IClassDeclsExtractor]:
-		mod_classes: List[IClassDeclsExtractor] = []
-		class_node: TreeNode
-		class_code: str
-		
-		for mod_stmt in self._module.named_children:
-			if mod_stmt.type == "class_definition":
-				self._add_class_tolist(
-					mod_stmt, mod_classes
-				)
-			elif mod_stmt.type == "decorated_definition":
-				class_node = mod_stmt.child_by_field_name("definition")
-				if (class_node is not None) and (class_node.type == "class_definition"):
-					self._add_class_tolist(
-						mod_stmt, mod_classes
-					)
+		mod_classes: List[IClassDeclsExtractor] = [
+			SpanClassDeclsExtractor(self._module_source, class_decls)
+			for class_decls in self._pf_get_module_decls()["classes"]
+		]
 		
 		return mod_classes
+	
+	
+	def extract_entity_context(
+			self,
+			entity_name: str,
+			class_name: str = None
+	) -> str:
+		if (entity_name is None) or (entity_name == ""):
+			raise ValueError()
+		
+		# Separazione degli imports dalle definizioni del namespace del module-file
+		mod_imports: List[str] = []
+		mod_defs: Dict[str, TreeNode] = dict()
+		def_name: str
+		module_node: TreeNode = self._get_module_tree()
+		for mod_stmt in module_node.named_children:
+			if mod_stmt.type in self._IMPORTS_TIPOLOGY:
+				mod_imports.append(self._node_code(mod_stmt))
+			else:
+				def_name = self._defined_name(mod_stmt)
+				if (def_name is not None) and (def_name not in mod_defs):
+					mod_defs[def_name] = mod_stmt
+		
+		entity_code: str
+		refs_nodes: List[TreeNode]
+		owner_name: str
+		if class_name is None:
+			# L' entità è una funzione del module-file
+			func_stmt: TreeNode = self._find_definition(module_node, entity_name, self._FUNCS_TIPOLOGY)
+			if func_stmt is None:
+				raise EntityNotFoundError()
+			
+			entity_code = self._node_code(func_stmt)
+			refs_nodes = [func_stmt]
+			owner_name = entity_name
+		else:
+			# L' entità è un metodo di una classe del module-file
+			class_stmt: TreeNode = self._find_definition(module_node, class_name, {"class_definition"})
+			if class_stmt is None:
+				raise EntityNotFoundError()
+			
+			meth_stmt: TreeNode
+			entity_code, meth_stmt = self._class_skeleton(class_stmt, entity_name)
+			refs_nodes = [
+				meth_stmt,
+				self._unwrap_definition(class_stmt).child_by_field_name("superclasses")
+			]
+			owner_name = class_name
+		
+		# Firme dei soli nomi del module-file referenziati dall' entità
+		refs_names: Set[str] = self._referenced_names(refs_nodes)
+		mod_signatures: List[str] = [
+			self._signature(def_stmt)
+			for def_name, def_stmt in mod_defs.items()
+			if (def_name in refs_names) and (def_name != owner_name)
+		]
+		
+		context_parts: List[str] = [
+			"\n".join(mod_imports),
+			"\n\n".join(mod_signatures),
+			entity_code
+		]
+		return "\n\n\n".join([
+			context_part
+			for context_part in context_parts
+			if context_part != ""
+		])
+
+
+	def _ap__analyze_module(self, module_code: str) -> Dict[str, Any]:
+		module_node: TreeNode = self._get_module_tree()
+		
+		mod_funcs: List[Dict[str, Any]] = []
+		mod_classes: List[Dict[str, Any]] = []
+		def_node: TreeNode
+		for mod_stmt in module_node.named_children:
+			def_node = self._unwrap_definition(mod_stmt)
+			if def_node is None:
+				continue
+			
+			if def_node.type in self._FUNCS_TIPOLOGY:
+				# Il codice delle funzioni decorate non comprende i decoratori
+				mod_funcs.append(self._def_decls(def_node))
+			elif def_node.type == "class_definition":
+				# Il codice delle classi decorate comprende i decoratori
+				class_decls: Dict[str, Any] = self._def_decls(def_node)
+				class_decls["span"] = [mod_stmt.start_byte, mod_stmt.end_byte]
+				class_decls["methods"] = self._class_methods(def_node)
+				mod_classes.append(class_decls)
+		
+		return {
+			"funcs": mod_funcs,
+			"classes": mod_classes
+		}
 
 
 	##	============================================================
@@ -98,93 +202,231 @@ class TreeSitterModuleDeclsExtractor(AMutableModuleDeclsExtractor):
 	##	============================================================
 
 
-	def _extract_functions(self, with_code: bool) -> List[str]:
+	def _get_module_tree(self) -> TreeNode:
+		"""
+			Restituisce il nodo radice dell' albero sintattico del module-file impostato,
+			calcolandolo se non ancora calcolato
+		"""
+		if self._module is None:
+			self._module = self._py_parser.parse(self._module_source).root_node
+		
+		return self._module
+	
+	
+	@classmethod
+	def _def_decls(cls, def_node: TreeNode) -> Dict[str, Any]:
+		"""
+			Restituisce l' analisi (nome e intervallo in bytes) della definizione fornita
 		"""
-			Estrae le definizioni di funzioni che sono parte del module-file impostato.
-			E' possibile scegliere se estrarre il corpo della definizione o solo il nome
-			di ogni funzione trovata
+		return {
+			"name": def_node.child_by_field_name("name").text.decode("utf-8"),
+			"span": [def_node.start_byte, def_node.end_byte]
+		}
+	
+	
+	@classmethod
+	def _class_methods(cls, class_node: TreeNode) -> List[Dict[str, Any]]:
+		"""
+			Restituisce l' analisi dei metodi (non decorati) definiti nel corpo della classe fornita
+		"""
+		classbody_node: TreeNode = class_node.child_by_field_name("body")
+		if classbody_node is None:
+			return []
+		
+		return [
+			cls._def_decls(stmt)
+			for stmt in classbody_node.named_children
+			if stmt.type in cls._FUNCS_TIPOLOGY
+		]
+	
+	
+	def _span_code(self, span: List[int]) -> str:
+		"""
+			Restituisce il codice, nel module-file impostato, dell' intervallo in bytes fornito
+		"""
+		return self._module_source[span[0]:span[1]].decode("utf-8")
+	
+	
+	def _node_code(self, node: TreeNode) -> str:
+		"""
+			Restituisce il codice, nel module-file impostato, del nodo fornito
+		"""
+		return self._module_source[node.start_byte:node.end_byte].decode("utf-8")
+	
+	
+	def _line_indent(self, node: TreeNode) -> str:
+		"""
+			Restituisce l' indentazione della riga su cui inizia il nodo fornito.
+			Se il nodo non è il primo della sua riga viene restituita una tabulazione
+		"""
+		indent: str = self._module_source[
+			(node.start_byte - node.start_point[1]):node.start_byte
+		].decode("utf-8")
+		
+		return indent if indent.strip() == "" else "\t"
+	
+	
+	@classmethod
+	def _unwrap_definition(cls, node: TreeNode) -> TreeNode:
+		"""
+			Restituisce la definizione contenuta nel nodo fornito se esso è una definizione
+			decorata, altrimenti il nodo stesso
+		"""
+		if node.type == "decorated_definition":
+			return node.child_by_field_name("definition")
+		return node
+	
+	
+	def _defined_name(self, node: TreeNode) -> str:
+		"""
+			Restituisce il nome definito dallo statement fornito (funzione, classe o assegnamento
+			ad un identificatore), oppure `None` se lo statement non definisce alcun nome
+		"""
+		def_node: TreeNode = self._unwrap_definition(node)
+		if (def_node.type in self._FUNCS_TIPOLOGY) or (def_node.type == "class_definition"):
+			return def_node.child_by_field_name("name").text.decode("utf-8")
+		
+		if (node.type == "expression_statement") and (node.named_child_count > 0):
+			assign_node: TreeNode = node.named_child(0)
+			if assign_node.type == "assignment":
+				left_node: TreeNode = assign_node.child_by_field_name("left")
+				if left_node.type == "identifier":
+					return left_node.text.decode("utf-8")
+		
+		return None
+	
+	
+	def _find_definition(
+			self,
+			block_node: TreeNode,
+			def_name: str,
+			def_types: FrozenSet[str]
+	) -> TreeNode:
+		"""
+			Cerca, tra gli statements figli del blocco fornito, la prima definizione (eventualmente
+			decorata) del nome e della tipologia forniti.
 			
-			Parameters
-			----------
-				with_code: bool
-					Un booleano che indica se estrarre il codice dalla definizione
-					di ogni funzione
-		"""
-		name_only: bool = (not with_code)
-		mod_funcs: List[str] = []
-		inner_node: TreeNode
-		
-		for mod_stmt in self._module.named_children:
-			if mod_stmt.type == "decorated_definition":
-				inner_node = mod_stmt.child_by_field_name("definition")
-				if inner_node is not None:
-					self._add_iffunc_tolist(
-						inner_node, mod_funcs,
-						name_only=name_only
-					)
-			else:
-				self._add_iffunc_tolist(
-					mod_stmt, mod_funcs,
-					name_only=name_only
-				)
-				
-		return mod_funcs
-
-
-	def _add_iffunc_tolist(
+			Returns
+			-------
+				TreeNode
+					Un oggetto `TreeNode` rappresentante lo statement della definizione trovata,
+					oppure `None` se non esiste
+		"""
+		def_node: TreeNode
+		for stmt in block_node.named_children:
+			def_node = self._unwrap_definition(stmt)
+			if (def_node is not None) and (def_node.type in def_types):
+				if def_node.child_by_field_name("name").text.decode("utf-8") == def_name:
+					return stmt
+		
+		return None
+	
+	
+	def _header_code(self, node: TreeNode) -> str:
+		"""
+			Restituisce l' intestazione (decoratori compresi) della definizione di funzione o
+			di classe fornita, fino ai ":" che ne precedono il corpo
+		"""
+		def_node: TreeNode = self._unwrap_definition(node)
+		header_end: int = def_node.child_by_field_name("body").start_byte
+		for def_child in def_node.children:
+			if def_child.type == ":":
+				header_end = def_child.end_byte
+		
+		return self._module_source[node.start_byte:header_end].decode("utf-8")
+	
+	
+	def _signature(self, node: TreeNode) -> str:
+		"""
+			Restituisce la firma dello statement di definizione fornito:
+			
+				- Per le funzioni l' intestazione, con corpo `...`
+				- Per le classi l' intestazione seguita dalla firma dell' eventuale metodo `__init__`
+				- Per gli assegnamenti lo statement stesso, se su una sola riga, altrimenti
+				  la parte sinistra dell' assegnamento con valore `...`
+		"""
+		def_node: TreeNode = self._unwrap_definition(node)
+		if def_node.type in self._FUNCS_TIPOLOGY:
+			return f"{self._header_code(node)} ..."
+		
+		if def_node.type == "class_definition":
+			init_stmt: TreeNode = self._find_definition(
+				def_node.child_by_field_name("body"), "__init__", self._FUNCS_TIPOLOGY
+			)
+			if init_stmt is None:
+				return f"{self._header_code(node)} ..."
+			return (
+				f"{self._header_code(node)}\n"
+				f"{self._line_indent(init_stmt)}{self._signature(init_stmt)}"
+			)
+		
+		stmt_code: str = self._node_code(node)
+		if stmt_code.find("\n") == -1:
+			return stmt_code
+		
+		assign_node: TreeNode = node.named_child(0)
+		right_node: TreeNode = assign_node.child_by_field_name("right")
+		if right_node is None:
+			return stmt_code.split("\n")[0]
+		return self._module_source[assign_node.start_byte:right_node.start_byte].decode("utf-8") + "..."
+	
+	
+	def _class_skeleton(
 			self,
-			node: TreeNode,
-			list_: List[str],
-			name_only: bool = True
-	):
+			class_stmt: TreeNode,
+			meth_name: str
+	) -> Tuple[str, TreeNode]:
 		"""
-			Aggiunge l' attributo "name", o l' attributo "block", del nodo fornito alla lista data,
-			se e solo se il nodo fornito è una funzione.
+			Costruisce lo scheletro della classe fornita, in cui il metodo richiesto è completo
+			mentre tutti gli altri metodi sono ridotti alla loro firma
 			
-			Parameters
-			----------
-				node: TreeNode
-					Un oggetto `TreeNode` rappresentante la possibile funzione Python di cui
-					aggiungerne il nome alla lista data
-				
-				list_: List[str]
-					Una lista di stringhe indicante la lista in cui aggiungere la definizione
-					del nodo se esso rappresenta una funzione Python
+			Returns
+			-------
+				Tuple[str, TreeNode]
+					Una tupla contenente il codice dello scheletro della classe e lo statement
+					del metodo richiesto
 					
-				name_only: bool
-					Opzionale. Default = `True`. Un booleano che indica se bisogna estrarre soltanto
-					il nome della funzione. Se questo parametro è `False` verrà aggiunto alla lista
-					tutto il codice della funzione
-		"""
-		needed: str
-		if node.type in self._FUNCS_TIPOLOGY:
-			if name_only:
-				needed = node.child_by_field_name("name").text.decode("utf-8")
-			else:
-				needed = self._module_source[node.start_byte:node.end_byte].decode("utf-8")
-			list_.append(needed)
-			
+			Raises
+			------
+				EntityNotFoundError
+					Si verifica se il metodo richiesto non è definito nella classe fornita
+		"""
+		classbody_node: TreeNode = self._unwrap_definition(class_stmt).child_by_field_name("body")
+		meth_stmt: TreeNode = self._find_definition(classbody_node, meth_name, self._FUNCS_TIPOLOGY)
+		if meth_stmt is None:
+			raise EntityNotFoundError()
+		
+		skeleton_lines: List[str] = [self._header_code(class_stmt)]
+		stmt_code: str
+		for stmt in classbody_node.named_children:
+			if stmt.type == "comment":
+				continue
 			
+			if stmt == meth_stmt:
+				stmt_code = self._node_code(stmt)
+			elif self._unwrap_definition(stmt).type in self._FUNCS_TIPOLOGY:
+				stmt_code = self._signature(stmt)
+			else:
+				stmt_code = self._node_code(stmt)
+			skeleton_lines.append(f"{self._line_indent(stmt)}{stmt_code}")
+		
+		return "\n".join(skeleton_lines), meth_stmt
+	
+	
 	@classmethod
-	def _add_class_tolist(
-			cls,
-			node: TreeNode,
-			list_: List[IClassDeclsExtractor]
-	):
+	def _referenced_names(cls, nodes: List[TreeNode]) -> Set[str]:
 		"""
-			Crea un estrattore di codice per la classe fornita e lo aggiunge alla lista data
-			
-			Parameters
-			----------
-				node: TreeNode
-					Un oggetto `TreeNode` rappresentante la classe Python di cui creare e aggiungere
-					l' estrattore di codice alla lista data
-				
-				list_: List[str]
-					Una lista di oggetti `IClassDeclsExtractor` rappresentante la lista di estrattori
-					di codice di classe
-		"""
-		class_code: str = node.text.decode("utf-8")
-		list_.append(
-			TreeSitterClassDeclsExtractor(class_code)
-		)
\ No newline at end of file
+			Restituisce l' insieme degli identificatori che compaiono nei nodi forniti
+			(i nodi con valore `None` vengono ignorati)
+		"""
+		refs_names: Set[str] = set()
+		to_visit: List[TreeNode] = [node for node in nodes if node is not None]
+		curr_node: TreeNode
+		while len(to_visit) > 0:
+			curr_node = to_visit.pop()
+			if curr_node.type == "identifier":
+				refs_names.add(curr_node.text.decode("utf-8"))
+			else:
+				to_visit.extend(curr_node.children)
+		
+		return refs_names
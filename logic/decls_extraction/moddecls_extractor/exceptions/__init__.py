@@ -1 +1,2 @@
-from ._private.incmodcode_error import IncorrectModuleCodeError
\ No newline at end of file
+from ._private.incmodcode_error import IncorrectModuleCodeError
+from ._private.entitynotfound_error import EntityNotFoundError
\ No newline at end of file
@@ -0,0 +1,7 @@
+class EntityNotFoundError(Exception):
+	"""
+		Rappresenta un' eccezione (non-exiting) che si verifica quando viene
+		richiesta un' entità (funzione o metodo) che non è definita
+		nel module-file associato
+	"""
+	pass
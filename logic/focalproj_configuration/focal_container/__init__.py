@@ -1,2 +1,3 @@
 from . import exceptions
-from ._private.focal_container import FocalContainer
\ No newline at end of file
+from ._private.focal_container import FocalContainer
+from ._private.focal_container_pool import FocalContainerPool
\ No newline at end of file
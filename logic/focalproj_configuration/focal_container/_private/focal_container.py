@@ -1,9 +1,11 @@
-from typing import Tuple
+from typing import List, Dict, Tuple
 
 from io import BytesIO
+from socket import SHUT_WR
 # ============== OS Utilities ============== #
 from os import (
 	makedirs as os_mkdirs,
+	remove as os_remove,
 	environ as os_getenv
 )
 from shutil import rmtree as os_dremove
@@ -26,6 +28,12 @@ from docker.models.containers import (
 	Container as DockerContainer,
 	ExecResult as DockerContainerExecResult
 )
+from docker.errors import APIError as DockerApiError
+from docker.utils.socket import (
+	frames_iter as docker_frames_iter,
+	STDOUT as DOCKER_STDOUT,
+	STDERR as DOCKER_STDERR
+)
 # ============================================== #
 
 from ..exceptions import (
@@ -101,12 +109,7 @@ class FocalContainer:
 		):
 			raise ValueError()
 		
-		self._docker: DockerClient = None
-		try:
-			docker_host: str = os_getenv["DOCKER_HOST"]
-			self._docker = DockerClient(base_url=docker_host)
-		except KeyError:
-			self._docker = docker_getclient()
+		self._docker: DockerClient = _docker_client()
 
 		self._image = docker_image
 		self._full_root: str = full_root.rstrip(_PATH_SEPS)
@@ -126,11 +129,25 @@ class FocalContainer:
 		self._lexec_stderr: str = None
 
 
-	def start_container(self):
+	def start_container(
+			self,
+			clean_results: bool = True,
+			labels: Dict[str, str] = None
+	):
 		"""
 			Avvia il container docker basato sull' immagine associata a questo FocalContainer.
 			Se il container docker, gestito da questo FocalContainer, è già in esecuzione allora esso deve
 			essere prima terminato per essere ri-avviato.
+			
+			Parameters
+			----------
+				clean_results: bool
+					Opzionale. Default = `True`. Un booleano che indica se ri-creare vuota la directory-volume dei
+					risultati. Deve essere `False` se altri containers in esecuzione montano la stessa directory
+					
+				labels: Dict[str, str]
+					Opzionale. Default = `None`. Un dizionario di stringhe, indicizzato da stringhe, contenente
+					le eventuali etichette da associare al container docker avviato
 
 			Raises
 			------
@@ -143,12 +160,14 @@ class FocalContainer:
 		
 		results_path: str = path_join(self._full_root, self._results_dir)
 		
-		os_dremove(results_path, ignore_errors=True)
-		os_mkdirs(results_path)
+		if clean_results:
+			os_dremove(results_path, ignore_errors=True)
+		os_mkdirs(results_path, exist_ok=True)
 
 		self._environ = self._docker.containers.run(
 			image=self._image,
 			detach=True,
+			labels=(labels if labels is not None else dict()),
 			volumes={
 				results_path: {
 					"bind": f"{self._path_prefix}/{self._results_dir}",
@@ -160,6 +179,70 @@ class FocalContainer:
 		self._running = True
 		
 		
+	def adopt_container(self, container: DockerContainer):
+		"""
+			Associa a questo FocalContainer un container docker già in esecuzione (ad es. mantenuto attivo da
+			un' esecuzione precedente di GenTestsAI), che deve essere stato avviato dalla stessa immagine e con la
+			stessa directory-volume dei risultati
+			
+			Parameters
+			----------
+				container: DockerContainer
+					Un oggetto `docker.models.containers.Container` rappresentante il container docker da gestire
+					
+			Raises
+			------
+				ValueError
+					Si verifica se il parametro `container` ha valore `None`
+					
+				ContainerAlreadyRunningError
+					Se è già in esecuzione il container docker, gestito da questo FocalContainer, alla
+					chiamata di quest' operazione
+		"""
+		if container is None:
+			raise ValueError()
+		if self._running:
+			raise ContainerAlreadyRunningError()
+		
+		self._environ = container
+		self._running = True
+	
+	
+	def check_health(self) -> bool:
+		"""
+			Verifica che il container docker, gestito da questo FocalContainer, sia in esecuzione e
+			che la sua directory-volume dei risultati sia ancora condivisa con la macchina host
+			
+			Returns
+			-------
+				bool
+					Un booleano che indica se il container docker gestito è utilizzabile
+		"""
+		if not self._running:
+			return False
+		
+		try:
+			self._environ.reload()
+			if self._environ.status != "running":
+				return False
+			
+			# Un file "sonda" scritto dall' host deve essere visibile nel container
+			probe_fname: str = f"gtsai__probe_{self._environ.short_id}"
+			probe_path: str = path_join(self._full_root, self._results_dir, probe_fname)
+			with open(probe_path, "w") as fprobe:
+				fprobe.write("")
+			try:
+				result: DockerContainerExecResult = self._environ.exec_run(
+					f"test -f {self._path_prefix}/{self._results_dir}/{probe_fname}"
+				)
+			finally:
+				os_remove(probe_path)
+			
+			return result.exit_code == 0
+		except (DockerApiError, OSError):
+			return False
+	
+	
 	def put_tararchive(self, dest_path: str, tar_stream: BytesIO):
 		"""
 			Estrae all' interno del container docker il contenuto dello stream TAR, fornito
@@ -196,11 +279,15 @@ class FocalContainer:
 	def execute(
 			self,
 			command: str,
-			privileged: bool = False
+			privileged: bool = False,
+			detach: bool = False
 	):
 		"""
 			Esegue il comando shell dato come argomento nel container docker gestito da questo FocalContainer;
-			e ne memorizza lo standard output, lo standard error e l' exit-code risultanti
+			e ne memorizza lo standard output, lo standard error e l' exit-code risultanti.
+			
+			Se il comando viene eseguito in background (`detach`) non ne viene atteso il termine, e
+			lo standard output, lo standard error e l' exit-code memorizzati vengono azzerati
 
 			Parameters
 			----------
@@ -211,6 +298,10 @@ class FocalContainer:
 				privileged: bool
 					Opzionale. Default = `False`. Un booleano che specifica se è necessario eseguire il
 					comando con priviligi
+					
+				detach: bool
+					Opzionale. Default = `False`. Un booleano che specifica se eseguire il comando in
+					background, senza attenderne il termine (ad es. per avviare un processo persistente)
 
 			Raises
 			------
@@ -224,6 +315,20 @@ class FocalContainer:
 					Se non è in esecuzione il container docker, gestito da questo FocalContainer, alla
 					chiamata di quest' operazione
 		"""
+		if detach:
+			self._environ.exec_run(
+				command,
+				privileged=privileged,
+				detach=True
+			)
+			
+			self._lexec_exitcode = -1
+			self._lexec_stdout = None
+			self._lexec_stderr = None
+			if not self._cmd_ever_execd:
+				self._cmd_ever_execd = True
+			return
+		
 		result: DockerContainerExecResult = self._environ.exec_run(
 			command,
 			privileged=privileged,
@@ -246,6 +351,93 @@ class FocalContainer:
 			self._cmd_ever_execd = True
 
 
+	def execute_piped(
+			self,
+			command: str,
+			input_data: str,
+			privileged: bool = False
+	) -> Tuple[int, str, str]:
+		"""
+			Esegue il comando shell dato come argomento nel container docker gestito da questo FocalContainer,
+			fornendogli i dati specificati come standard input, e ne restituisce l' exit-code, lo standard
+			output e lo standard error risultanti.
+			
+			A differenza di `.execute(...)` i risultati non vengono memorizzati, in modo che più comandi possano
+			essere eseguiti contemporaneamente (da threads diversi) nello stesso container
+			
+			Parameters
+			----------
+				command: str
+					Una stringa contenente il comando shell da eseguire all' interno del container
+					docker in esecuzione gestito da questo FocalContainer
+					
+				input_data: str
+					Una stringa contenente i dati da fornire come standard input al comando
+					
+				privileged: bool
+					Opzionale. Default = `False`. Un booleano che specifica se è necessario eseguire il
+					comando con priviligi
+					
+			Returns
+			-------
+				Tuple[int, str, str]
+					Una tupla contenente:
+					
+						- [0]: L' exit-code del comando eseguito
+						- [1]: Lo standard output del comando eseguito (`None` se vuoto)
+						- [2]: Lo standard error del comando eseguito (`None` se vuoto)
+					
+			Raises
+			------
+				ValueError
+					Si verifica se:
+					
+						- Il parametro `command` ha valore None o è una stringa vuota
+						- Il parametro `input_data` ha valore None
+			
+				ContainerNotRunningError
+					Se non è in esecuzione il container docker, gestito da questo FocalContainer, alla
+					chiamata di quest' operazione
+		"""
+		if (command is None) or (command == ""):
+			raise ValueError()
+		if input_data is None:
+			raise ValueError()
+		if not self._running:
+			raise ContainerNotRunningError()
+		
+		exec_id: str = self._docker.api.exec_create(
+			self._environ.id,
+			command,
+			stdin=True,
+			privileged=privileged
+		)["Id"]
+		exec_sock = self._docker.api.exec_start(exec_id, socket=True)
+		
+		stdout_parts: List[bytes] = list()
+		stderr_parts: List[bytes] = list()
+		try:
+			# Scrittura dello standard input e chiusura del suo lato (EOF per il comando)
+			raw_sock = getattr(exec_sock, "_sock", exec_sock)
+			raw_sock.sendall(input_data.encode("utf-8"))
+			raw_sock.shutdown(SHUT_WR)
+			
+			# Lettura dello standard output e dello standard error (multiplexati)
+			for stream_id, data in docker_frames_iter(exec_sock, tty=False):
+				if stream_id == DOCKER_STDOUT:
+					stdout_parts.append(data)
+				elif stream_id == DOCKER_STDERR:
+					stderr_parts.append(data)
+		finally:
+			exec_sock.close()
+		
+		exit_code: int = self._docker.api.exec_inspect(exec_id)["ExitCode"]
+		stdout: str = b"".join(stdout_parts).decode("utf-8") if len(stdout_parts) > 0 else None
+		stderr: str = b"".join(stderr_parts).decode("utf-8") if len(stderr_parts) > 0 else None
+		
+		return (exit_code, stdout, stderr)
+
+
 	def stop_container(self):
 		"""
 			Termina l' esecuzione del container docker, gestito da questo FocalContainer
@@ -280,7 +472,7 @@ class FocalContainer:
 				CommandNeverExecutedError
 					Se non è mai stato eseguito nessun comando shell prima di chiamare quest' operazione
 		"""
-		if self._cmd_ever_execd:
+		if not self._cmd_ever_execd:
 			raise CommandNeverExecutedError()
 		
 		return self._lexec_stdout
@@ -296,7 +488,7 @@ class FocalContainer:
 				CommandNeverExecutedError
 					Se non è mai stato eseguito nessun comando shell prima di chiamare quest' operazione
 		"""
-		if self._cmd_ever_execd:
+		if not self._cmd_ever_execd:
 			raise CommandNeverExecutedError()
 		
 		return self._lexec_stderr
@@ -312,7 +504,20 @@ class FocalContainer:
 				CommandNeverExecutedError
 					Se non è mai stato eseguito nessun comando shell prima di chiamare quest' operazione
 		"""
-		if self._cmd_ever_execd:
+		if not self._cmd_ever_execd:
 			raise CommandNeverExecutedError()
 		
-		return self._lexec_exitcode
\ No newline at end of file
+		return self._lexec_exitcode
+
+
+
+def _docker_client() -> DockerClient:
+	"""
+		Crea un client docker verso l' eventuale host specificato dalla variabile d' ambiente
+		"DOCKER_HOST", oppure configurato dall' ambiente
+	"""
+	try:
+		docker_host: str = os_getenv["DOCKER_HOST"]
+		return DockerClient(base_url=docker_host)
+	except KeyError:
+		return docker_getclient()
\ No newline at end of file
@@ -0,0 +1,388 @@
+from typing import List, Dict
+
+from threading import Condition
+# ============ Hashing Utilities ============ #
+from hashlib import sha256
+from json import dumps as json_dumps
+# =========================================== #
+# ============ Path Utilities ============ #
+from os.path import (
+	sep as path_sep,
+	altsep as path_altsep,
+)
+_PATH_SEPS: str = f"{path_sep}{path_altsep if path_altsep is not None else ''}"
+# ======================================== #
+# ============ Docker SDK Utilities ============ #
+from docker import DockerClient
+from docker.errors import APIError as DockerApiError
+from docker.models.images import Image as DockerImage
+from docker.models.containers import Container as DockerContainer
+# ============================================== #
+
+from .focal_container import (
+	FocalContainer,
+	_docker_client
+)
+
+from ..exceptions import ContainerPoolClosedError
+
+
+
+class FocalContainerPool:
+	"""
+		Rappresenta un pool di containers docker "caldi" (già avviati) degli ambienti focali, condiviso tra
+		più utilizzatori (ad es. verifiche di linting o calcoli della coverage contemporanei).
+		
+		Per ogni immagine docker (e progetto focale) vengono mantenuti al più `pool_size` containers: quelli inattivi
+		vengono riutilizzati, dopo averne verificato lo stato, invece di avviarne di nuovi. Ogni container viene
+		terminato e sostituito dopo un numero massimo di utilizzi.
+		
+		Se richiesto, alla chiusura del pool i containers inattivi vengono lasciati in esecuzione, in modo da
+		essere riutilizzati dalle esecuzioni successive di GenTestsAI (vengono riconosciuti tramite un' etichetta
+		docker che identifica immagine e progetto focale).
+		
+		Tutte le operazioni possono essere invocate da più threads contemporaneamente
+	"""
+	
+	_POOL_LABEL: str = "gtsai.fenv_pool"
+	
+	def __init__(
+			self,
+			pool_size: int = 1,
+			max_uses: int = 0,
+			keep_alive: bool = False,
+			stop_timeout: int = 1
+	):
+		"""
+			Costruisce un nuovo FocalContainerPool
+			
+			Parameters
+			----------
+				pool_size: int
+					Opzionale. Default = `1`. Un intero indicante il numero massimo di containers docker
+					mantenuti per ogni immagine docker (e progetto focale)
+					
+				max_uses: int
+					Opzionale. Default = `0`. Un intero indicante il numero di utilizzi dopo il quale un
+					container docker viene terminato e sostituito (`0` indica nessun limite)
+					
+				keep_alive: bool
+					Opzionale. Default = `False`. Un booleano che indica se lasciare in esecuzione i containers
+					docker inattivi alla chiusura del pool, per riutilizzarli nelle esecuzioni successive
+					
+				stop_timeout: int
+					Opzionale. Default = `1`. Un intero che indica il valore di timeout (in secondi)
+					per lo stop di ogni container docker gestito
+					
+			Raises
+			------
+				ValueError
+					Si verifica se:
+					
+						- Il parametro `pool_size` è minore di 1
+						- Il parametro `max_uses` è negativo
+						- Il parametro `stop_timeout` è minore di 1
+		"""
+		if (pool_size < 1) or (max_uses < 0) or (stop_timeout < 1):
+			raise ValueError()
+		
+		self._pool_size: int = pool_size
+		self._max_uses: int = max_uses
+		self._keep_alive: bool = keep_alive
+		self._timeout: int = stop_timeout
+		
+		self._pool_cond: Condition = Condition()
+		self._closed: bool = False
+		
+		# Containers inattivi, e numero di containers esistenti (inattivi o in uso), per ogni chiave
+		self._idle: Dict[str, List[FocalContainer]] = dict()
+		self._created: Dict[str, int] = dict()
+		# Chiave e numero di utilizzi di ogni container gestito (indicizzati dall' identità dell' oggetto)
+		self._fenv_keys: Dict[int, str] = dict()
+		self._fenv_uses: Dict[int, int] = dict()
+	
+	
+	def acquire(
+			self,
+			docker_image: DockerImage,
+			full_root: str,
+			path_prefix: str,
+			wait: bool = True
+	) -> FocalContainer:
+		"""
+			Restituisce un container docker, in esecuzione, basato sull' immagine docker fornita e legato al
+			progetto focale specificato. Se non ci sono containers inattivi utilizzabili ne viene avviato uno nuovo,
+			oppure (raggiunto il numero massimo) si attende il rilascio di uno di essi
+			
+			Parameters
+			----------
+				docker_image: DockerImage
+					Un oggetto `docker.models.images.Image` che rappresenta l' immagine docker pre-configurata
+					del progetto focale
+					
+				full_root: str
+					Una stringa contenente la Full Project Root Path del progetto focale
+					
+				path_prefix: str
+					Una stringa contenente il path prefix, stabilito alla costruzione dell' immagine, che
+					rappresenta la Full Project Root Path all' interno del container docker
+					
+				wait: bool
+					Opzionale. Default = `True`. Un booleano che indica se attendere il rilascio di un container
+					quando è stato raggiunto il numero massimo di containers per l' immagine fornita
+					
+			Returns
+			-------
+				FocalContainer
+					Un oggetto `FocalContainer` che gestisce il container docker ottenuto, da rilasciare
+					tramite `.release(...)`. Se `wait` è `False` viene restituito `None` quando nessun
+					container è disponibile
+					
+			Raises
+			------
+				ValueError
+					Si verifica se:
+					
+						- Il parametro `docker_image` ha valore `None`
+						- Il parametro `full_root` ha valore `None` o è una stringa vuota
+						- Il parametro `path_prefix` ha valore `None` o è una stringa vuota
+						
+				ContainerPoolClosedError
+					Si verifica se il pool è stato già chiuso
+		"""
+		if (
+			(docker_image is None) or
+			(full_root is None) or (full_root == "") or
+			(path_prefix is None) or (path_prefix == "")
+		):
+			raise ValueError()
+		
+		pool_key: str = self._pool_key(docker_image, full_root, path_prefix)
+		
+		to_adopt: bool = False
+		with self._pool_cond:
+			if self._closed:
+				raise ContainerPoolClosedError()
+			if pool_key not in self._created:
+				self._idle[pool_key] = list()
+				self._created[pool_key] = 0
+				to_adopt = self._keep_alive
+		if to_adopt:
+			self._adopt_running(pool_key, docker_image, full_root, path_prefix)
+		
+		focal_env: FocalContainer
+		while True:
+			with self._pool_cond:
+				if self._closed:
+					raise ContainerPoolClosedError()
+				
+				if len(self._idle[pool_key]) > 0:
+					focal_env = self._idle[pool_key].pop()
+				# Se è possibile avviare un nuovo container viene riservato il suo posto
+				elif self._created[pool_key] < self._pool_size:
+					self._created[pool_key] += 1
+					break
+				elif not wait:
+					return None
+				else:
+					self._pool_cond.wait()
+					continue
+			
+			# Il container inattivo viene verificato (ed eventualmente terminato) senza bloccare il pool
+			if focal_env.check_health():
+				return focal_env
+			with self._pool_cond:
+				self._forget(focal_env)
+				self._pool_cond.notify_all()
+			self._stop_quietly(focal_env)
+		
+		# L' avvio del container avviene senza bloccare gli altri utilizzatori del pool
+		try:
+			focal_env = FocalContainer(
+				docker_image, full_root, path_prefix,
+				stop_timeout=self._timeout
+			)
+			# La directory dei risultati è condivisa da tutti i containers dello stesso progetto focale
+			focal_env.start_container(
+				clean_results=False,
+				labels={self._POOL_LABEL: pool_key}
+			)
+		except BaseException:
+			with self._pool_cond:
+				self._created[pool_key] -= 1
+				self._pool_cond.notify_all()
+			raise
+		
+		with self._pool_cond:
+			self._fenv_keys[id(focal_env)] = pool_key
+			self._fenv_uses[id(focal_env)] = 0
+		return focal_env
+	
+	
+	def release(
+			self,
+			focal_env: FocalContainer,
+			discard: bool = False
+	):
+		"""
+			Rilascia un container docker ottenuto tramite `.acquire(...)`, rendendolo disponibile ad altri
+			utilizzatori. Il container viene invece terminato se ha raggiunto il numero massimo di utilizzi,
+			se ne è richiesto lo scarto, oppure se il pool è stato già chiuso
+			
+			Parameters
+			----------
+				focal_env: FocalContainer
+					Un oggetto `FocalContainer` ottenuto tramite `.acquire(...)` da questo pool
+					
+				discard: bool
+					Opzionale. Default = `False`. Un booleano che indica se terminare il container docker
+					invece di renderlo disponibile (ad es. perchè non più utilizzabile)
+					
+			Raises
+			------
+				ValueError
+					Si verifica se il parametro `focal_env` ha valore `None`, non è stato ottenuto
+					da questo pool oppure è stato già rilasciato
+		"""
+		if focal_env is None:
+			raise ValueError()
+		
+		to_stop: bool
+		with self._pool_cond:
+			pool_key: str = self._fenv_keys.get(id(focal_env), None)
+			if pool_key is None:
+				raise ValueError()
+			# Un container inattivo non può essere rilasciato di nuovo
+			if any(idle_env is focal_env for idle_env in self._idle[pool_key]):
+				raise ValueError()
+			
+			self._fenv_uses[id(focal_env)] += 1
+			to_stop = (
+				discard or self._closed or
+				((self._max_uses > 0) and (self._fenv_uses[id(focal_env)] >= self._max_uses))
+			)
+			if to_stop:
+				self._forget(focal_env)
+			else:
+				self._idle[pool_key].append(focal_env)
+			self._pool_cond.notify_all()
+		
+		if to_stop:
+			self._stop_quietly(focal_env)
+	
+	
+	def close(self):
+		"""
+			Chiude il pool terminando i containers docker inattivi, oppure lasciandoli in esecuzione se
+			richiesto alla costruzione. I containers ancora in uso vengono terminati al loro rilascio
+		"""
+		idle_fenvs: List[FocalContainer] = list()
+		with self._pool_cond:
+			if self._closed:
+				return
+			self._closed = True
+			
+			for pool_key in self._idle.keys():
+				idle_fenvs.extend(self._idle[pool_key])
+				self._idle[pool_key].clear()
+			for focal_env in idle_fenvs:
+				self._forget(focal_env)
+			self._pool_cond.notify_all()
+		
+		if not self._keep_alive:
+			for focal_env in idle_fenvs:
+				self._stop_quietly(focal_env)
+	
+	
+	##	============================================================
+	##						PRIVATE METHODS
+	##	============================================================
+	
+	
+	@classmethod
+	def _pool_key(
+			cls,
+			docker_image: DockerImage,
+			full_root: str,
+			path_prefix: str
+	) -> str:
+		"""
+			Calcola la chiave che identifica i containers intercambiabili (stessa immagine docker,
+			stesso progetto focale e stesso path prefix)
+		"""
+		key_repr: str = json_dumps(
+			[docker_image.id, full_root.rstrip(_PATH_SEPS), path_prefix],
+			ensure_ascii=False
+		)
+		return sha256(key_repr.encode("utf-8")).hexdigest()[:32]
+	
+	
+	def _adopt_running(
+			self,
+			pool_key: str,
+			docker_image: DockerImage,
+			full_root: str,
+			path_prefix: str
+	):
+		"""
+			Aggiunge ai containers inattivi quelli, relativi alla chiave fornita, lasciati in esecuzione
+			da un' esecuzione precedente. Quelli in eccesso vengono terminati.
+			Deve essere invocato senza possedere il lock del pool
+		"""
+		docker: DockerClient = _docker_client()
+		running: List[DockerContainer]
+		try:
+			running = docker.containers.list(
+				filters={"label": f"{self._POOL_LABEL}={pool_key}", "status": "running"}
+			)
+		except DockerApiError:
+			return
+		
+		adopted_fenvs: List[FocalContainer] = list()
+		for container in running:
+			focal_env: FocalContainer = FocalContainer(
+				docker_image, full_root, path_prefix,
+				stop_timeout=self._timeout
+			)
+			focal_env.adopt_container(container)
+			adopted_fenvs.append(focal_env)
+		
+		exceeding_fenvs: List[FocalContainer] = list()
+		with self._pool_cond:
+			for focal_env in adopted_fenvs:
+				# Dopo la chiusura del pool i containers restano in esecuzione per le esecuzioni successive
+				if self._closed:
+					break
+				if self._created[pool_key] < self._pool_size:
+					self._created[pool_key] += 1
+					self._fenv_keys[id(focal_env)] = pool_key
+					self._fenv_uses[id(focal_env)] = 0
+					self._idle[pool_key].append(focal_env)
+				else:
+					exceeding_fenvs.append(focal_env)
+			self._pool_cond.notify_all()
+		
+		for focal_env in exceeding_fenvs:
+			self._stop_quietly(focal_env)
+	
+	
+	def _forget(self, focal_env: FocalContainer):
+		"""
+			Rimuove dal pool le informazioni relative al container fornito, liberandone il posto.
+			Deve essere invocato possedendo il lock del pool
+		"""
+		pool_key: str = self._fenv_keys.pop(id(focal_env), None)
+		self._fenv_uses.pop(id(focal_env), None)
+		if pool_key is not None:
+			self._created[pool_key] -= 1
+	
+	
+	@classmethod
+	def _stop_quietly(cls, focal_env: FocalContainer):
+		"""
+			Termina il container fornito ignorando gli errori (il container potrebbe essere già terminato)
+		"""
+		try:
+			focal_env.stop_container()
+		except Exception:
+			pass
@@ -1,3 +1,4 @@
 from ._private.contalreadyrunning_error import ContainerAlreadyRunningError
 from ._private.contnotrunning_error import ContainerNotRunningError
-from ._private.cmdneverexecuted_error import CommandNeverExecutedError
\ No newline at end of file
+from ._private.cmdneverexecuted_error import CommandNeverExecutedError
+from ._private.poolclosed_error import ContainerPoolClosedError
\ No newline at end of file
@@ -0,0 +1,6 @@
+class ContainerPoolClosedError(Exception):
+	"""
+		Rappresenta un' eccezione (non-exiting) che si verifica quando viene richiesto un container
+		docker ad un pool di containers che è stato già chiuso
+	"""
+	pass
\ No newline at end of file
@@ -65,6 +65,7 @@ class _ABaseFocalEnvConfigurator(IFocalEnvConfigurator):
 		
 		Attributi di Classe Pubblici:
 			- `PATH_PREFIX` (str) : Prefisso, di default, del percorso, interno al container docker, a cui verrà collegato il contenuto del progetto focale per renderlo accessibile al suo interno.
+			- `ASTROID_MODEL_LABEL` (str) : Etichetta docker, delle immagini create, che indica (con valore "true" o "false") se è stato richiesto il pre-calcolo del modello di "astroid" del progetto focale.
 		
 		La versione di `pylint` installata è specificata dai discendenti di questa classe astratta.
 		La versione di `coverage.py` installata è specificata dai discendenti di questa classe astratta.
@@ -74,7 +75,9 @@ class _ABaseFocalEnvConfigurator(IFocalEnvConfigurator):
 	
 	_PYVERS_PATT: str = r"[0-9]+\.[0-9]+(\.[0-9]+)?"
 	_LINUXPATH_PATT: str = r"^(?P<path_prefix>(/[\w.-]+/?)+)$"
+	_ASTROID_MODEL_FNAME: str = "gtsai__astroid_model.pickle"
 	PATH_PREFIX: str = "/app"
+	ASTROID_MODEL_LABEL: str = "gtsai.astroid_model"
 	
 	def __init__(
 			self,
@@ -332,7 +335,8 @@ class _ABaseFocalEnvConfigurator(IFocalEnvConfigurator):
 	
 	def build_image(
 			self,
-			wants_dockign: bool = True
+			wants_dockign: bool = True,
+			astroid_model: bool = False
 	) -> DockerImage:
 		self._assert_inited()
 
@@ -411,6 +415,12 @@ class _ABaseFocalEnvConfigurator(IFocalEnvConfigurator):
 		# Impostazione della directory corrente sulla root dei tools
 		self._dockf_builder.add_workdir(f"{self._path_prefix}/tools")
 		
+		# Pre-calcolo del modello di "astroid" del progetto focale (se fallisce viene scartato)
+		if astroid_model:
+			self._dockf_builder.set_envvar("ASTROID_MODEL", f"{self._path_prefix}/{self._ASTROID_MODEL_FNAME}")
+			self._dockf_builder.add_shellcmd(f"python -m {self._linttools_dir}.exec_astroid_model $ASTROID_MODEL"
+			                                 f" || rm -f $ASTROID_MODEL $ASTROID_MODEL.tmp")
+		
 		# Impostazione del processo principale dell' ambiente focale
 		self._dockf_builder.set_entrypoint("sleep infinity")
 		
@@ -440,6 +450,7 @@ class _ABaseFocalEnvConfigurator(IFocalEnvConfigurator):
 			path=self._orig_full_root,
 			dockerfile=self._dockf_fname,
 			tag=f"{self._tag_prefix}_{self._proj_name}",
+			labels={self.ASTROID_MODEL_LABEL: "true" if astroid_model else "false"},
 			rm=True, forcerm=True, nocache=True,
 			pull=False
 		)[0]
@@ -117,7 +117,8 @@ class IFocalEnvConfigurator(ABC):
 	@abstractmethod
 	def build_image(
 			self,
-			wants_dockign: bool = True
+			wants_dockign: bool = True,
+			astroid_model: bool = False
 	) -> DockerImage:
 		"""
 			Crea un' immagine docker, corrispondente all' ambiente focale, dell' ultimo progetto impostato
@@ -146,9 +147,14 @@ class IFocalEnvConfigurator(ABC):
 					- `TESTS_ROOT`: La Tests Project Root Path all' interno dell' ambiente focale
 					- `GENTESTS_ROOT`: La Gen-tests Project Root Path all' interno dell' ambiente focale
 					- `LINTTOOLS_DIR`: Il nome della cartella con i tools per la verifica di linting
+					- `ASTROID_MODEL`: La path del modello di "astroid" del progetto focale (solo se richiesto)
 					
 				- Vengono installate tutte le dipendenze del progetto focale, siano esse Python o non-Python,
 				  specificate tramite i files nella sua Env-config Project Root Path
+				  
+				- Se richiesto, viene pre-calcolato e memorizzato il modello di "astroid" dei moduli del
+				  progetto focale, caricato dai tools di linting di lunga durata al loro avvio. L' immagine
+				  riporta la richiesta in un' etichetta docker (vedi `ASTROID_MODEL_LABEL` dei discendenti)
 
 			Parameters
 			----------
@@ -158,6 +164,11 @@ class IFocalEnvConfigurator(ABC):
 					Se il progetto focale impostato ha già un eventuale ".dockerignore", esso verrà
 					preservato e risostituito alla fine cancellando il ".dockerignore" scritto da questa
 					operazione
+					
+				astroid_model: bool
+					Opzionale. Default = `False`. Un booleano che indica se pre-calcolare, durante la costruzione
+					dell' immagine, il modello di "astroid" dei moduli del progetto focale. Se il calcolo del modello
+					fallisce l' immagine viene comunque costruita (senza modello)
 
 			Returns
 			-------
@@ -12,7 +12,6 @@ from os.path import isdir as os_isdir
 from ..exceptions import (
 	CacheFileTypeError,
 	ProjectSpaceNotExistsError,
-	EntryAlreadyExistsError,
 	EntryNotExistsError
 )
 
@@ -56,6 +55,10 @@ class _ABasePtsuiteCacheAccessor(IPtsuiteCacheAccessor):
 		return
 	
 	
+	def legacy_projspaces(self) -> Set[str]:
+		return set()
+	
+	
 	def create_projspace(self, proj_name: str):
 		if (proj_name is None) or (proj_name == ""):
 			raise ValueError()
@@ -68,13 +71,15 @@ class _ABasePtsuiteCacheAccessor(IPtsuiteCacheAccessor):
 	def register_ptsuite(
 			self,
 			proj_name: str,
-			module_name: str, entity: str, model: str, try_num: int,
+			module_name: str, entity: str, model: str,
+			content_key: str, try_num: int,
 			ptsuite_code: str
 	):
 		if ((proj_name is None) or (proj_name == "") or
 			(module_name is None) or (module_name == "") or
 			(entity is None) or (entity == "") or
 			(model is None) or (model == "") or
+			(content_key is None) or (content_key == "") or
 			(ptsuite_code is None)
 		):
 			raise ValueError()
@@ -84,39 +89,28 @@ class _ABasePtsuiteCacheAccessor(IPtsuiteCacheAccessor):
 		if proj_name not in self._proj_spaces:
 			raise ProjectSpaceNotExistsError()
 		
-		if self.does_ptsuite_exists(proj_name, module_name, entity, model, try_num):
-			raise EntryAlreadyExistsError()
-		
+		# L' eventuale tentativo già esistente viene mantenuto dall' implementazione specifica
 		self._ap__register_ptsuite_spec(
 			proj_name,
-			module_name, entity, model, try_num,
+			module_name, entity, model,
+			content_key, try_num,
 			ptsuite_code
 		)
 		
 	
 	def get_ptsuite(
 			self,
-			proj_name: str,
-			module_name: str, entity: str, model: str, try_num: int
+			content_key: str, try_num: int
 	) -> str:
-		if ((proj_name is None) or (proj_name == "") or
-			(module_name is None) or (module_name == "") or
-			(entity is None) or (entity == "") or
-			(model is None) or (model == "")
-		):
+		if (content_key is None) or (content_key == ""):
 			raise ValueError()
 		if try_num < 0:
 			raise ValueError()
 		
-		if proj_name not in self._proj_spaces:
-			raise ProjectSpaceNotExistsError()
-		
-		if not self.does_ptsuite_exists(proj_name, module_name, entity, model, try_num):
+		if not self.does_ptsuite_exists(content_key, try_num):
 			raise EntryNotExistsError()
 		
-		return self._ap__get_ptsuite_spec(
-			proj_name, module_name, entity, model, try_num
-		)
+		return self._ap__get_ptsuite_spec(content_key, try_num)
 	
 	
 	def _pf__get_cache_path(self) -> str:
@@ -272,7 +266,8 @@ class _ABasePtsuiteCacheAccessor(IPtsuiteCacheAccessor):
 	@abstractmethod
 	def _ap__register_ptsuite_spec(self,
 	        proj_name: str,
-			module_name: str, entity: str, model: str, try_num: int,
+			module_name: str, entity: str, model: str,
+			content_key: str, try_num: int,
 			ptsuite_code: str
 	):
 		"""
@@ -285,8 +280,9 @@ class _ABasePtsuiteCacheAccessor(IPtsuiteCacheAccessor):
 				- Che nessun parametro stringa sia `None`
 				- Che nessun parametro stringa sia vuoto (eccetto `ptsuite_code`)
 				- Che lo spazio di memorizzazione del progetto `proj_name` esista
-				- Che non esiste già un tentativo corrispondente alla quintupla
-				  (`proj_name`, `module_name`, `entity`, `model`, `try_num`)
+			
+			Se esiste già un tentativo corrispondente alla coppia (`content_key`, `try_num`) esso deve essere
+			mantenuto, senza sollevare alcun errore
 			
 		
 			Parameters
@@ -307,6 +303,9 @@ class _ABasePtsuiteCacheAccessor(IPtsuiteCacheAccessor):
 					Una stringa rappresentante il nome del LLM da cui è stato prodotta il tentativo
 					da registrare nella cache
 					
+				content_key: str
+					Una stringa contenente la chiave, indirizzata dal contenuto, dei tentativi dell' entità
+					
 				try_num: int
 					Un intero indicante il numero del tentativo di generazione a cui corrisponde
 					questa "versione" della test-suite parziale che si vuole registrare nella cache
@@ -321,38 +320,23 @@ class _ABasePtsuiteCacheAccessor(IPtsuiteCacheAccessor):
 	@abstractmethod
 	def _ap__get_ptsuite_spec(
 			self,
-	        proj_name: str,
-			module_name: str, entity: str, model: str, try_num: int
+			content_key: str, try_num: int
 	) -> str:
 		"""
 			Restituisce il tentativo di produzione di una test-suite parziale, nella cache rappresentata,
-			associata alle seguenti caratteristiche.
+			associato alla chiave fornita.
 			
 			E' garantito all' interno di questo metodo:
 			
 				- Che `try_num >= 0`
-				- Che nessun parametro stringa sia `None` nè stringa vuota
-				- Che lo spazio di memorizzazione del progetto `proj_name` esista
-				- Che esiste un tentativo corrispondente alla quintupla
-				  (`proj_name`, `module_name`, `entity`, `model`, `try_num`)
+				- Che `content_key` non sia `None` nè stringa vuota
+				- Che esiste un tentativo corrispondente alla coppia (`content_key`, `try_num`)
 				  
 			Parameters
 			----------
-				proj_name: str
-					Una stringa contenente il nome del progetto di cui si cerca il tentativo
-					di produzione della test-suite parziale
-				
-				module_name: str
-					Una stringa contenente il nome del modulo focale di cui si sta registrando
-					la test-suite parziale nella cache
-					
-				entity: str
-					Una stringa contenente il nome dell' entità di codice a cui appartiene
-					la test-suite parziale che si sta registrando nella cache
-					
-				model: str
-					Una stringa rappresentante il nome del LLM da cui è stato prodotto
-					il tentativo presente nella cache
+				content_key: str
+					Una stringa contenente la chiave, indirizzata dal contenuto, dei tentativi
+					dell' entità cercati
 					
 				try_num: int
 					Un intero indicante il numero del tentativo di generazione a cui corrisponde
@@ -370,8 +354,7 @@ class _ABasePtsuiteCacheAccessor(IPtsuiteCacheAccessor):
 	@abstractmethod
 	def does_ptsuite_exists(
 			self,
-	        proj_name: str,
-			module_name: str, entity: str, model: str, try_num: int
+			content_key: str, try_num: int
 	) -> bool:
 		pass
 		
@@ -1,3 +1,4 @@
+from typing import Set
 from abc import ABC, abstractmethod
 
 
@@ -8,6 +9,11 @@ class IPtsuiteCacheAccessor(ABC):
 		risultanti da un processo in cui si utilizzano Large Language Models.
 		Ogni entry della cache è un tentativo di produrre, tramite LLM, una test-suite parziale funzionante.
 		
+		Le entries sono indirizzate dal contenuto: ogni tentativo è cercato tramite una chiave calcolata
+		da ciò da cui dipende (codice dell' entità, prompts e iperparametri effettivi del LLM), quindi
+		è riutilizzato da qualsiasi progetto focale, o versione di esso, che produce la stessa chiave
+		e non è mai riutilizzato se il codice dell' entità cambia.
+		
 		Ogni `IPtsuiteCacheAccessor` supporta il "Context Manager" di Python.
 		
 		La tecnologia implementativa della cache è specificata dai discendenti di questa interfaccia.
@@ -30,6 +36,23 @@ class IPtsuiteCacheAccessor(ABC):
 		pass
 
 
+	@abstractmethod
+	def legacy_projspaces(self) -> Set[str]:
+		"""
+			Restituisce i nomi degli spazi di progetto, presenti nella cache rappresentata, nel formato
+			precedente alle chiavi indirizzate dal contenuto. Le loro entries non hanno una chiave, quindi
+			non vengono mai utilizzate (nè migrate).
+			
+			L' implementazione di default restituisce un insieme vuoto
+			
+			Returns
+			-------
+				Set[str]
+					Un insieme di stringhe contenente i nomi degli spazi di progetto ignorati
+		"""
+		pass
+	
+	
 	@abstractmethod
 	def create_projspace(self, proj_name: str):
 		"""
@@ -62,12 +85,18 @@ class IPtsuiteCacheAccessor(ABC):
 	def register_ptsuite(
 			self,
 	        proj_name: str,
-			module_name: str, entity: str, model: str, try_num: int,
+			module_name: str, entity: str, model: str,
+			content_key: str, try_num: int,
 			ptsuite_code: str
 	):
 		"""
 			Registra un nuovo tentativo di produzione di una test-suite parziale
-			nella cache rappresentata
+			nella cache rappresentata.
+			
+			Il tentativo è identificato dalla coppia (`content_key`, `try_num`); il progetto, il modulo, l' entità
+			e il modello vengono registrati soltanto come descrizione del tentativo.
+			Se esiste già un tentativo con la stessa coppia (es. registrato contemporaneamente da un altro thread
+			per un' entità identica) viene mantenuto quello esistente, senza sollevare alcun errore
 			
 			Parameters
 			----------
@@ -87,6 +116,10 @@ class IPtsuiteCacheAccessor(ABC):
 					Una stringa rappresentante il nome del LLM da cui è stato prodotta il tentativo
 					da registrare nella cache
 					
+				content_key: str
+					Una stringa contenente la chiave, indirizzata dal contenuto, dei tentativi dell' entità
+					(il digest del codice dell' entità, dei prompts e degli iperparametri effettivi del LLM)
+					
 				try_num: int
 					Un intero indicante il numero del tentativo di generazione a cui corrisponde
 					questa "versione" della test-suite parziale che si vuole registrare nella cache
@@ -100,16 +133,13 @@ class IPtsuiteCacheAccessor(ABC):
 				ValueError
 					Si verifica se:
 					
-						- Almeno uno tra `proj_name`, `module_name`, `entity`, `model` e `ptsuite_code` ha valore `None`
-						- Almeno uno tra `proj_name`, `module_name`, `entity`, `model` sono una stringa vuota
+						- Almeno uno tra `proj_name`, `module_name`, `entity`, `model`, `content_key` e `ptsuite_code`
+						  ha valore `None`
+						- Almeno uno tra `proj_name`, `module_name`, `entity`, `model` e `content_key` sono una stringa vuota
 						- Il parametro `try_num` è minore di 0
 			
 				ProjectSpaceNotExistsError
 					Si verifica se lo spazio di memorizzazione di `proj_name` non esiste
-					
-				EntryAlreadyExistsError
-					Si verifica se esiste già un tentativo di produzione associato alla quintupla
-					(`proj_name`, `module_name`, `entity`, `model`, `try_num`) data
 		"""
 		pass
 	
@@ -117,30 +147,18 @@ class IPtsuiteCacheAccessor(ABC):
 	@abstractmethod
 	def does_ptsuite_exists(
 			self,
-	        proj_name: str,
-			module_name: str, entity: str, model: str, try_num: int,
+			content_key: str, try_num: int
 	) -> bool:
 		"""
 			Verifica se esiste un tentativo di produzione di una test-suite parziale
-			nella cache rappresentata associata alle seguenti caratteristiche
+			nella cache rappresentata associato alla chiave fornita, indipendentemente dal progetto
+			in cui è stato registrato
 			
 			Parameters
 			----------
-				proj_name: str
-					Una stringa contenente il nome del progetto di cui si cerca il tentativo
-					di produzione della test-suite parziale
-				
-				module_name: str
-					Una stringa contenente il nome del modulo focale di cui si sta registrando
-					la test-suite parziale nella cache
-					
-				entity: str
-					Una stringa contenente il nome dell' entità di codice a cui appartiene
-					la test-suite parziale che si sta registrando nella cache
-					
-				model: str
-					Una stringa rappresentante il nome del LLM da cui sarebbe stato prodotto
-					il tentativo presente nella cache
+				content_key: str
+					Una stringa contenente la chiave, indirizzata dal contenuto, dei tentativi
+					dell' entità cercati
 					
 				try_num: int
 					Un intero indicante il numero del tentativo di generazione a cui corrisponderebbe
@@ -157,30 +175,17 @@ class IPtsuiteCacheAccessor(ABC):
 	@abstractmethod
 	def get_ptsuite(
 			self,
-	        proj_name: str,
-			module_name: str, entity: str, model: str, try_num: int
+			content_key: str, try_num: int
 	) -> str:
 		"""
 			Restituisce il tentativo di produzione di una test-suite parziale, nella cache rappresentata,
-			associata alle seguenti caratteristiche
+			associato alla chiave fornita, indipendentemente dal progetto in cui è stato registrato
 			
 			Parameters
 			----------
-				proj_name: str
-					Una stringa contenente il nome del progetto di cui si cerca il tentativo
-					di produzione della test-suite parziale
-				
-				module_name: str
-					Una stringa contenente il nome del modulo focale di cui si sta registrando
-					la test-suite parziale nella cache
-					
-				entity: str
-					Una stringa contenente il nome dell' entità di codice a cui appartiene
-					la test-suite parziale che si sta registrando nella cache
-					
-				model: str
-					Una stringa rappresentante il nome del LLM da cui sarebbe stato prodotto
-					il tentativo presente nella cache
+				content_key: str
+					Una stringa contenente la chiave, indirizzata dal contenuto, dei tentativi
+					dell' entità cercati
 					
 				try_num: int
 					Un intero indicante il numero del tentativo di generazione a cui corrisponderebbe
@@ -197,15 +202,11 @@ class IPtsuiteCacheAccessor(ABC):
 				ValueError
 					Si verifica se:
 					
-						- Almeno uno tra `proj_name`, `module_name`, `entity`, `model` e `ptsuite_code` ha valore `None`
-						- Almeno uno tra `proj_name`, `module_name`, `entity`, `model` e `ptsuite_code` sono una stringa vuota
+						- Il parametro `content_key` ha valore `None` o è una stringa vuota
 						- Il parametro `try_num` è minore di 0
-			
-				ProjectSpaceNotExistsError
-					Si verifica se lo spazio di memorizzazione di `proj_name` non esiste
 					
 				EntryNotExistsError
 					Si verifica se non esiste un tentativo di test-suite parziale associato
-					alla quaterna (`proj_name`, `module_name`, `entity`, `model`, `try_num`) data
+					alla coppia (`content_key`, `try_num`) data
 		"""
 		pass
\ No newline at end of file
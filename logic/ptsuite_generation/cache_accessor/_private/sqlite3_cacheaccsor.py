@@ -1,6 +1,8 @@
 from typing import Tuple, Set
 from ._a_base_cacheaccsor import _ABasePtsuiteCacheAccessor
 
+from threading import RLock
+
 # =========== SQLite3 Utilities ============ #
 from sqlite3 import (
 	connect as sql_connect,
@@ -16,9 +18,20 @@ from ..exceptions import CacheFileTypeError
 class Sqlite3CacheAccessor(_ABasePtsuiteCacheAccessor):
 	"""
 		Rappresenta un `IPtsuiteCacheAccessor` che utilizza come cache
-		un database locale SQLite3
+		un database locale SQLite3.
+		
+		I tentativi di tutti i progetti focali sono memorizzati in un' unica tabella, la cui chiave primaria
+		è la coppia (chiave indirizzata dal contenuto, numero del tentativo); gli spazi di progetto sono
+		memorizzati in una tabella a parte. Le tabelle per progetto del formato precedente vengono ignorate
+		(i loro nomi sono restituiti da `legacy_projspaces()`).
+		
+		L' accesso al database è serializzato, in modo che lo stesso Sqlite3CacheAccessor
+		possa essere utilizzato da più threads contemporaneamente
 	"""
 	
+	_SPACES_TABLE: str = "project_spaces"
+	_PTSUITES_TABLE: str = "ptsuites"
+	
 	def __init__(
 			self,
 			cache_path: str
@@ -35,73 +48,81 @@ class Sqlite3CacheAccessor(_ABasePtsuiteCacheAccessor):
 		"""
 		super().__init__(cache_path)
 		
-		self._conn: SqlConnection = sql_connect(cache_path)
+		self._db_lock: RLock = RLock()
+		self._conn: SqlConnection = sql_connect(cache_path, check_same_thread=False)
 		self._cursor: SqlConnectionCursor = self._conn.cursor()
 	
 	
 	def close(self):
-		self._cursor.close()
-		self._conn.close()
+		with self._db_lock:
+			self._cursor.close()
+			self._conn.close()
+	
+	
+	def legacy_projspaces(self) -> Set[str]:
+		with self._db_lock:
+			self._cursor.execute(f"""
+				SELECT name FROM sqlite_master
+				WHERE type='table';
+			""")
+			tables: Set[str] = {row[0] for row in self._cursor.fetchall()}
+		return tables.difference({self._SPACES_TABLE, self._PTSUITES_TABLE})
 	
 	
 	def does_ptsuite_exists(
 			self,
-			proj_name: str,
-			module_name: str, entity: str, model: str, try_num: int
+			content_key: str, try_num: int
 	) -> bool:
-		row: Tuple[str, str, str, str, str]= self._query_db(
-			proj_name, module_name, entity, model, try_num
-		)
+		row: Tuple[str] = self._query_db(content_key, try_num)
 
 		return (row is not None)
 	
 	
 	def _ap__create_new_cache(self, cache_path: str):
 		open(cache_path, "w").close()
+		self._create_tables()
 	
 	
 	def _ap__read_project_spaces(self) -> Set[str]:
-		self._cursor.execute(f"""
-			SELECT name FROM sqlite_master
-			WHERE type='table';
-		""")
-		tables: Set[str] = {row[0] for row in self._cursor.fetchall()}
-		return tables
+		self._create_tables()
+		with self._db_lock:
+			self._cursor.execute(f"""
+				SELECT `name` FROM `{self._SPACES_TABLE}`;
+			""")
+			spaces: Set[str] = {row[0] for row in self._cursor.fetchall()}
+		return spaces
 	
 	
 	def _ap__create_projspace_spec(self, proj_name: str):
-		self._cursor.execute(f"""
-			CREATE TABLE IF NOT EXISTS "{proj_name}" (
-				`module_name` TEXT NOT NULL,
-				`entity` TEXT NOT NULL,
-				`model` TEXT NOT NULL,
-				`try_num` INTEGER NOT NULL,
-				`ptsuite` TEXT NOT NULL,
-				PRIMARY KEY (`module_name`, `entity`, `model`, `try_num`)
-			)
-		""")
-		self._conn.commit()
+		with self._db_lock:
+			self._cursor.execute(f"""
+				INSERT OR IGNORE INTO `{self._SPACES_TABLE}` (`name`)
+				VALUES (?);
+			""",
+			[proj_name])
+			self._conn.commit()
 	
 	
 	def _ap__register_ptsuite_spec(
 			self,
 			proj_name: str,
-			module_name: str, entity: str, model: str, try_num: int,
+			module_name: str, entity: str, model: str,
+			content_key: str, try_num: int,
 			ptsuite_code: str
 	):
-		self._cursor.execute(f"""
-			INSERT INTO {proj_name} (module_name, entity, model, try_num, ptsuite)
-			VALUES (?, ?, ?, ?, ?);
-		""",
-		[module_name, entity, model, try_num, ptsuite_code])
-		self._conn.commit()
-	
-	
-	def _ap__get_ptsuite_spec(self, proj_name: str, module_name: str, entity: str, model: str, try_num: int) -> str:
-		partial_tsuite: str = self._query_db(
-			proj_name,
-			module_name, entity, model, try_num
-		)[4]
+		with self._db_lock:
+			# Un tentativo registrato contemporaneamente con la stessa chiave viene mantenuto
+			self._cursor.execute(f"""
+				INSERT OR IGNORE INTO `{self._PTSUITES_TABLE}`
+				(`content_key`, `try_num`, `project`, `module_name`, `entity`, `model`, `ptsuite`)
+				VALUES (?, ?, ?, ?, ?, ?, ?);
+			""",
+			[content_key, try_num, proj_name, module_name, entity, model, ptsuite_code])
+			self._conn.commit()
+	
+	
+	def _ap__get_ptsuite_spec(self, content_key: str, try_num: int) -> str:
+		partial_tsuite: str = self._query_db(content_key, try_num)[0]
 		return partial_tsuite
 	
 	
@@ -119,20 +140,41 @@ class Sqlite3CacheAccessor(_ABasePtsuiteCacheAccessor):
 	##	============================================================
 
 
+	def _create_tables(self):
+		"""
+			Crea, se non esistono, le tabelle degli spazi di progetto e dei tentativi
+		"""
+		with self._db_lock:
+			self._cursor.execute(f"""
+				CREATE TABLE IF NOT EXISTS `{self._SPACES_TABLE}` (
+					`name` TEXT NOT NULL PRIMARY KEY
+				)
+			""")
+			self._cursor.execute(f"""
+				CREATE TABLE IF NOT EXISTS `{self._PTSUITES_TABLE}` (
+					`content_key` TEXT NOT NULL,
+					`try_num` INTEGER NOT NULL,
+					`project` TEXT NOT NULL,
+					`module_name` TEXT NOT NULL,
+					`entity` TEXT NOT NULL,
+					`model` TEXT NOT NULL,
+					`ptsuite` TEXT NOT NULL,
+					PRIMARY KEY (`content_key`, `try_num`)
+				)
+			""")
+			self._conn.commit()
+	
+	
 	def _query_db(
 			self,
-			project_name: str,
-			module_name: str,
-			entity: str,
-			model: str,
+			content_key: str,
 			try_num: int
-	) -> Tuple[str, str, str, str, str]:
-		self._cursor.execute(f"""
-			SELECT * FROM `{project_name}`
-			WHERE `module_name` = ?
-			AND `entity` = ?
-			AND `model` = ?
-			AND `try_num` = ?
-		""", [module_name, entity, model, try_num])
+	) -> Tuple[str]:
+		with self._db_lock:
+			self._cursor.execute(f"""
+				SELECT `ptsuite` FROM `{self._PTSUITES_TABLE}`
+				WHERE `content_key` = ?
+				AND `try_num` = ?
+			""", [content_key, try_num])
 
-		return self._cursor.fetchone()
\ No newline at end of file
+			return self._cursor.fetchone()
\ No newline at end of file
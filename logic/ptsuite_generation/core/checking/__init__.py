@@ -1,2 +1,4 @@
 from . import synt_checker
-from . import lint_checker
\ No newline at end of file
+from . import lint_checker
+from . import lint_verdcache
+from . import lint_prechecker
\ No newline at end of file
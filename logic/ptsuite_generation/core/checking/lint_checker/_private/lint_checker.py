@@ -1,6 +1,7 @@
-from typing import Dict
+from typing import List, Dict, Tuple, Callable, Any, Union
 
 from io import BytesIO
+from threading import RLock
 from tarfile import (
 	open as tarf_open,
 	TarInfo
@@ -18,18 +19,31 @@ from os.path import (
 from pathlib import PurePath
 # ======================================== #
 # ============== JSON Utilities ============== #
-from json import JSONDecoder
+from json import (
+	JSONDecoder,
+	dumps as json_dumps
+)
 # ============================================ #
+# ============ Hashing Utilities ============ #
+from hashlib import sha256
+# =========================================== #
 
 from ......utils.logger import ATemporalFormattLogger
 from ......utils.logger.exceptions import FormatNotSetError
+from ......utils.pipeline_stage import PipelineStage
 
-from ......focalproj_configuration.focal_container import FocalContainer
+from ......focalproj_configuration.focal_container import (
+	FocalContainer,
+	FocalContainerPool
+)
 from ......focalproj_configuration.focal_container.exceptions import (
 	ContainerAlreadyRunningError,
 	ContainerNotRunningError
 )
 
+from ...lint_verdcache import ILintVerdictCache
+from ...lint_prechecker import ILintPreChecker
+
 from ..exceptions import ProjectNotSetError
 
 
@@ -46,6 +60,12 @@ class LintingChecker:
 	"""
 	
 	_RESULT_FNAME: str = "gtsai__linting_result.json"
+	_BATCH_RESULT_FNAME: str = "gtsai__linting_batch_result.json"
+	# Numero massimo di test-suites parziali verificate in un' unica esecuzione dello script di verifica "batch"
+	_BATCH_MAX_PTSUITES: int = 256
+	_SERVER_SOCKET: str = "/tmp/gtsai__linting.sock"
+	# Lock (nel container) che garantisce un unico server di linting per ambiente focale
+	_SERVER_LOCK: str = "/tmp/gtsai__linting.lock"
 	
 	def __init__(
 			self,
@@ -53,6 +73,15 @@ class LintingChecker:
 			fenv_script_fname: str,
 			inputctr_dirname: str,
 	        logger: ATemporalFormattLogger = None,
+			check_stage: PipelineStage = None,
+			lint_server: Tuple[str, str] = None,
+			verdict_cache: ILintVerdictCache = None,
+			batch_script_fname: str = None,
+			batch_jobs: int = 0,
+			stream_script_fname: str = None,
+			fenv_pool: FocalContainerPool = None,
+			all_errors: bool = False,
+			pre_checker: ILintPreChecker = None
 	):
 		"""
 			Costruisce un nuovo LintingChecker associandolo eventualmente al logger utilizzato per registrare
@@ -77,6 +106,55 @@ class LintingChecker:
 					da utilizzare per registrare le fasi di ogni tentativo di correzione (non per registrare le fasi
 					della richiesta al LLM)
 					
+				check_stage: PipelineStage
+					Opzionale. Default = `None`. Un oggetto `PipelineStage` rappresentante l' eventuale stadio
+					di pipeline tramite cui eseguire ogni verifica di linting
+					
+				lint_server: Tuple[str, str]
+					Opzionale. Default = `None`. Una tupla di 2 stringhe contenente, rispettivamente, il nome
+					dello script Python del server di linting persistente e il nome dello script Python del
+					client con cui richiedergli ogni verifica. Se fornita, ad ogni impostazione del progetto
+					focale viene avviato il server nell' ambiente focale, evitando di ri-avviare l' interprete
+					(e ri-analizzare le dipendenze del progetto) ad ogni verifica
+					
+				verdict_cache: ILintVerdictCache
+					Opzionale. Default = `None`. Un oggetto `ILintVerdictCache` rappresentante l' eventuale cache
+					dei risultati delle verifiche di linting. Se fornita, una test-suite parziale già verificata
+					con la stessa immagine dell' ambiente focale e gli stessi strumenti di verifica non viene
+					verificata di nuovo
+					
+				batch_script_fname: str
+					Opzionale. Default = `None`. Una stringa contenente il nome dello script Python che esegue la
+					verifica di correttezza, a livello di linting, di più test-suites parziali in un' unica esecuzione
+					di PyLint. Se non fornito le verifiche "batch" vengono effettuate una test-suite parziale alla volta
+					
+				batch_jobs: int
+					Opzionale. Default = `0`. Un intero indicante il numero di processi su cui PyLint distribuisce
+					ogni verifica "batch" (`0` indica tutti i cores disponibili nell' ambiente focale)
+					
+				stream_script_fname: str
+					Opzionale. Default = `None`. Una stringa contenente il nome dello script Python che esegue la
+					verifica di correttezza, a livello di linting, della test-suite parziale ricevuta come standard input,
+					scrivendone il risultato come standard output. Se fornito ogni verifica viene effettuata tramite esso
+					(e l' eventuale server di linting), senza files condivisi e quindi anche contemporaneamente ad altre
+					
+				fenv_pool: FocalContainerPool
+					Opzionale. Default = `None`. Un oggetto `FocalContainerPool` rappresentante l' eventuale pool da cui
+					ottenere gli ambienti focali, invece di avviarne (e terminarne) uno ad ogni impostazione del progetto
+					focale. Le verifiche tramite standard input/output utilizzano anche gli altri ambienti focali
+					inattivi del pool, se disponibili
+					
+				all_errors: bool
+					Opzionale. Default = `False`. Un booleano che indica se ogni verifica deve raccogliere tutti
+					gli errori distinti della test-suite parziale (restituiti da `.check_lintically_errors(...)`),
+					invece del solo primo errore
+					
+				pre_checker: ILintPreChecker
+					Opzionale. Default = `None`. Un oggetto `ILintPreChecker` rappresentante l' eventuale pre-verificatore
+					da utilizzare prima di ogni verifica. Le test-suites parziali con errori evidenti vengono scartate
+					con gli errori della pre-verifica, senza essere verificate nell' ambiente focale (nè cercate nella
+					cache dei risultati)
+					
 			Raises
 			------
 				ValueError
@@ -88,6 +166,10 @@ class LintingChecker:
 						- Il parametro `fenv_script_fname` è una stringa vuota
 						- Il parametro `shared_dirname` ha valore `None`
 						- Il parametro `shared_dirname` è una stringa vuota
+						- Il parametro `lint_server` contiene valori `None` o stringhe vuote
+						- Il parametro `batch_script_fname` è una stringa vuota
+						- Il parametro `stream_script_fname` è una stringa vuota
+						- Il parametro `batch_jobs` è negativo
 		"""
 		if(path_prefix is None) or (path_prefix == ""):
 			raise ValueError()
@@ -95,6 +177,15 @@ class LintingChecker:
 			raise ValueError()
 		if(inputctr_dirname is None) or (inputctr_dirname == ""):
 			raise ValueError()
+		if (lint_server is not None) and (
+			(lint_server[0] is None) or (lint_server[0] == "") or
+			(lint_server[1] is None) or (lint_server[1] == "")
+		):
+			raise ValueError()
+		if (batch_script_fname == "") or (batch_jobs < 0):
+			raise ValueError()
+		if stream_script_fname == "":
+			raise ValueError()
 		
 		self._focal_env: FocalContainer = None
 		
@@ -105,6 +196,36 @@ class LintingChecker:
 		
 		# Nome dello script Python che esegue il linter all' interno dell' ambiente focale
 		self._fenv_script_fname: str = fenv_script_fname
+		# Nomi degli eventuali scripts Python del server di linting persistente e del suo client
+		self._lint_server: Tuple[str, str] = lint_server
+		
+		# Eventuale cache dei risultati delle verifiche di linting
+		self._verdict_cache: ILintVerdictCache = verdict_cache
+		# Identificativo dell' immagine dell' ambiente focale impostato, e versione di PyLint che contiene
+		# (parti delle chiavi della cache)
+		self._image_id: str = None
+		self._pylint_version: str = None
+		
+		# Nome dell' eventuale script Python che esegue le verifiche "batch" e numero dei suoi processi
+		self._batch_script_fname: str = batch_script_fname
+		self._batch_jobs: int = batch_jobs
+		# Path (reale) e path (relativa) del risultato dell' ultima verifica "batch" effettuata
+		self._batch_result_path: str = None
+		self._batch_result_relpath: str = None
+		
+		# Nome dell' eventuale script Python che esegue le verifiche tramite standard input/output
+		self._stream_script_fname: str = stream_script_fname
+		
+		# Indica se le verifiche raccolgono tutti gli errori distinti, invece del solo primo errore
+		self._all_errors: bool = all_errors
+		
+		# Eventuale pre-verificatore, al di fuori dell' ambiente focale, delle test-suites parziali
+		self._pre_checker: ILintPreChecker = pre_checker
+		
+		# Eventuale pool degli ambienti focali, e parametri con cui richiederli
+		self._fenv_pool: FocalContainerPool = fenv_pool
+		self._env_image: DockerImage = None
+		self._env_path_prefix: str = None
 		
 		# Il path prefix (o path principale) di ogni ambiente focale
 		self._path_prefix: str = path_prefix
@@ -132,6 +253,12 @@ class LintingChecker:
 		
 		self._inited: bool = False
 		self._proj_set: bool = False
+		
+		# Lock che serializza l' utilizzo dell' ambiente focale condiviso
+		# (i files di input e di risultato sono unici per ogni ambiente focale)
+		self._fenv_lock: RLock = RLock()
+		# Eventuale stadio di pipeline tramite cui eseguire le verifiche
+		self._check_stage: PipelineStage = check_stage
 	
 	
 	def set_focal_project(
@@ -183,13 +310,16 @@ class LintingChecker:
 		# Stop dell' eventuale ambiente focale precedente
 		if self._focal_env is not None:
 			self._logger.log("Stop dell' ambiente focale ...") if self._logger is not None else None
-			self._focal_env.stop_container()
+			self._release_fenv()
 			self._logger.log(f"Ambiente focale del progetto {self._proj_name} fermato") if self._logger is not None else None
 			
 			del self._focal_env
 		
 		self._proj_name = project_name
 		self._full_root = full_root
+		self._image_id = env_image.id
+		self._env_image = env_image
+		self._env_path_prefix = path_prefix
 		
 		# Impostazione della path che conterrà il risultato delle verifiche di linting
 		self._lint_result_path = path_join(
@@ -204,28 +334,54 @@ class LintingChecker:
 			path_relative(self._lint_result_path, start=self._full_root)
 		).as_posix()
 		
-		self._focal_env = FocalContainer(
-			env_image,
+		self._batch_result_path = path_join(
 			self._full_root,
-			path_prefix,
+			"gtsai__results",
+			self._BATCH_RESULT_FNAME
 		)
+		self._batch_result_relpath = PurePath(
+			path_relative(self._batch_result_path, start=self._full_root)
+		).as_posix()
 		
 		if not self._proj_set:
 			self._proj_set = True
 		
-		# Avvio dell' ambiente focale (container)
+		# Avvio dell' ambiente focale (container), o suo ottenimento dal pool
 		self._logger.log("Avvio dell' ambiente focale ...") if self._logger is not None else None
-		self._focal_env.start_container()
+		if self._fenv_pool is not None:
+			self._focal_env = self._fenv_pool.acquire(
+				env_image, self._full_root, path_prefix
+			)
+		else:
+			self._focal_env = FocalContainer(
+				env_image,
+				self._full_root,
+				path_prefix,
+			)
+			self._focal_env.start_container()
 		
 		# Creazione della directory temporanea
 		self._create_inputctr()
+		
+		# Lettura della versione di PyLint dell' ambiente focale (parte delle chiavi della cache)
+		if self._verdict_cache is not None:
+			self._pylint_version = self._read_pylint_version()
+		
+		# Avvio dell' eventuale server di linting persistente
+		if self._lint_server is not None:
+			self._logger.log("Avvio del server di linting ...") if self._logger is not None else None
+			self._focal_env.execute(
+				f"/bin/bash -c '{self._server_start_cmd()}'",
+				detach=True
+			)
 
 		self._logger.log(f"Ambiente focale del progetto {self._proj_name} avviato") if self._logger is not None else None
 
 
 	def check_lintically(
 			self,
-			ptsuite_code: str
+			ptsuite_code: str,
+			fail_fast: bool = False
 	) -> Dict[str, str]:
 		"""
 			Effettua il controllo di correttezza sintattica della test-suite parziale
@@ -237,6 +393,12 @@ class LintingChecker:
 					Una stringa contenente il codice della test-suite parziale di cui effettuare
 					la verifica di correttezza sintattica
 					
+				fail_fast: bool
+					Opzionale. Default = `False`. Un booleano che indica se effettuare una verifica "fail-fast":
+					PyLint esegue solo i controlli che producono errori e si interrompe al primo errore trovato
+					(il risultato è lo stesso della verifica completa). Da utilizzarsi quando interessa solo
+					sapere se la test-suite parziale è corretta, o il suo primo errore
+					
 			Returns
 			-------
 				Dict[str, str]
@@ -268,47 +430,212 @@ class LintingChecker:
 			raise ValueError()
 		if not self._proj_set:
 			raise ProjectNotSetError()
-		if not self._inited:
-			self._create_inputctr()
-			
-		self._logger.log(
-			f"Inizio della verifica di linting ..."
-		) if self._logger is not None else None
-		
-		self._logger.log("Scrittura della test-suite parziale nell' ambiente focale ...") if self._logger is not None else None
-		tarfile_stream: BytesIO = BytesIO()
-		ptsuite_code_b: bytes = ptsuite_code.encode("utf-8")
-		with tarf_open(fileobj=tarfile_stream, mode="w") as tfptsuite:
-			tarfile_info: TarInfo = TarInfo(name=path_split(self._ptsuite_relpath)[1])
-			tarfile_info.size = len(ptsuite_code_b)
-			tfptsuite.addfile(tarinfo=tarfile_info, fileobj=BytesIO(ptsuite_code_b))
-		tarfile_stream.seek(0)
-		self._focal_env.put_tararchive(
-			f"{self._path_prefix}/{self._input_dir}",
-			tarfile_stream
-		)
-		self._logger.log("Scrittura eseguita") if self._logger is not None else None
 		
-		# Richiesta della verifica della correttezza (a livello di linting)
-		self._logger.log("Esecuzione della verifica di linting ...") if self._logger is not None else None
-		self._focal_env.execute(
-			f"/bin/bash -c 'python -m $LINTTOOLS_DIRNAME.{path_splitext(self._fenv_script_fname)[0]} "
-			f"{self._ptsuite_relpath} {self._lint_result_relpath}'"
-		)
-		self._logger.log("Verifica di linting eseguita") if self._logger is not None else None
+		# Scarto immediato delle test-suites parziali con errori evidenti
+		pre_errors: List[Dict[str, str]] = self._precheck(ptsuite_code)
+		if len(pre_errors) > 0:
+			return pre_errors[0]
 		
-		# Lettura del risultato della verifica di correttezza
-		self._logger.log("Lettura del risultato della verifica ...") if self._logger is not None else None
-		json_dec: JSONDecoder = JSONDecoder()
-		result: Dict[str, str] = None
-		with open(self._lint_result_path, "r") as fjson:
-			result = json_dec.decode(fjson.read())
-		self._logger.log("Risultato della verifica letto") if self._logger is not None else None
+		# Ricerca del risultato di una verifica identica nell' eventuale cache
+		check_key: str = None
+		result: Dict[str, str]
+		if self._verdict_cache is not None:
+			check_key = self._check_key(ptsuite_code, fail_fast=fail_fast)
+			result = self._verdict_cache.get_verdict(check_key)
+			if result is not None:
+				self._logger.log("Risultato della verifica di linting trovato nella cache") if self._logger is not None else None
+				return result
 		
-		self._logger.log("Fine della verifica di linting") if self._logger is not None else None
+		# Se si raccolgono tutti gli errori il primo errore è ricavato da essi
+		if self._all_errors and (not fail_fast):
+			errors: List[Dict[str, str]] = self._check_all_errors(ptsuite_code)
+			return errors[0] if len(errors) > 0 else dict()
+		
+		result = self._execute_check(
+			lambda: self._perform_lint_check(ptsuite_code, fail_fast=fail_fast)
+		)
+		
+		if check_key is not None:
+			self._verdict_cache.put_verdict(check_key, result)
 		return result
 	
 	
+	def check_lintically_errors(
+			self,
+			ptsuite_code: str
+	) -> List[Dict[str, str]]:
+		"""
+			Effettua il controllo di correttezza, a livello di linting, della test-suite parziale fornita
+			restituendone tutti gli errori distinti, se questo LintingChecker raccoglie tutti gli errori,
+			oppure il solo primo errore.
+			
+			Errori con lo stesso nome e lo stesso messaggio (ad esempio uno stesso import fallito in più
+			punti del codice) vengono riportati una sola volta, alla loro prima posizione
+			
+			Parameters
+			----------
+				ptsuite_code: str
+					Una stringa contenente il codice della test-suite parziale di cui effettuare
+					la verifica di correttezza a livello di linting
+					
+			Returns
+			-------
+				List[Dict[str, str]]
+					Una lista, nell' ordine in cui sono stati trovati, degli errori evidenziati dalla verifica
+					(vuota se non si è verificato nessun errore). Ogni errore è un dizionario con gli stessi campi
+					del risultato di `.check_lintically(...)`
+					
+			Raises
+			------
+				ValueError
+					Si verifica se il parametro `ptsuite_code` ha valore `None` o è una stringa vuota
+					
+				ProjectNotSetError
+					Si verifica se:
+						
+						- Non è mai stato impostato un progetto focale
+						- E' necessario re-impostare un progetto focale prima di eseguire di nuovo questa operazione
+		"""
+		if not self._all_errors:
+			result: Dict[str, str] = self.check_lintically(ptsuite_code)
+			return [result] if len(result) > 0 else []
+		
+		if (ptsuite_code is None) or (ptsuite_code == ""):
+			raise ValueError()
+		if not self._proj_set:
+			raise ProjectNotSetError()
+		
+		# Scarto immediato delle test-suites parziali con errori evidenti
+		pre_errors: List[Dict[str, str]] = self._precheck(ptsuite_code)
+		if len(pre_errors) > 0:
+			return pre_errors
+		
+		# Ricerca del risultato di una verifica identica nell' eventuale cache
+		if self._verdict_cache is not None:
+			errors: List[Dict[str, str]] = self._verdict_cache.get_verdict(
+				self._check_key(ptsuite_code, all_errors=True)
+			)
+			if errors is not None:
+				self._logger.log("Risultato della verifica di linting trovato nella cache") if self._logger is not None else None
+				return errors
+		
+		return self._check_all_errors(ptsuite_code)
+	
+	
+	def check_lintically_batch(
+			self,
+			ptsuites_codes: List[str],
+			all_errors: bool = False,
+			fail_fast: bool = False
+	) -> List[List[Dict[str, str]]]:
+		"""
+			Effettua il controllo di correttezza, a livello di linting, di più test-suites parziali
+			tramite un' unica esecuzione dello strumento di verifica (se è stato fornito lo script
+			di verifica "batch"), distribuita sui cores dell' ambiente focale
+			
+			Parameters
+			----------
+				ptsuites_codes: List[str]
+					Una lista di stringhe contenente il codice delle test-suites parziali di cui effettuare
+					la verifica di correttezza a livello di linting
+					
+				all_errors: bool
+					Opzionale. Default = `False`. Un booleano che indica se restituire tutti gli errori trovati
+					per ogni test-suite parziale, invece del solo primo errore
+					
+				fail_fast: bool
+					Opzionale. Default = `False`. Un booleano che indica se effettuare verifiche "fail-fast"
+					(come per `.check_lintically(...)`), interrompendo la verifica di ogni test-suite parziale
+					al suo primo errore. Viene ignorato se vengono richiesti tutti gli errori
+					
+			Returns
+			-------
+				List[List[Dict[str, str]]]
+					Una lista, nello stesso ordine delle test-suites parziali fornite, contenente per ognuna di esse
+					la lista degli errori evidenziati dalla verifica (vuota se non si è verificato nessun errore).
+					Ogni errore è un dizionario con gli stessi campi del risultato di `.check_lintically(...)`
+					
+			Raises
+			------
+				ValueError
+					Si verifica se il parametro `ptsuites_codes` ha valore `None`, oppure contiene codici
+					con valore `None` o stringhe vuote
+					
+				ProjectNotSetError
+					Si verifica se:
+						
+						- Non è mai stato impostato un progetto focale
+						- E' necessario re-impostare un progetto focale prima di eseguire di nuovo questa operazione
+		"""
+		if ptsuites_codes is None:
+			raise ValueError()
+		for ptsuite_code in ptsuites_codes:
+			if (ptsuite_code is None) or (ptsuite_code == ""):
+				raise ValueError()
+		if not self._proj_set:
+			raise ProjectNotSetError()
+		
+		results: List[List[Dict[str, str]]] = [None] * len(ptsuites_codes)
+		
+		# Scarto immediato delle test-suites parziali con errori evidenti
+		for idx, ptsuite_code in enumerate(ptsuites_codes):
+			pre_errors: List[Dict[str, str]] = self._precheck(ptsuite_code)
+			if len(pre_errors) > 0:
+				results[idx] = pre_errors if all_errors else pre_errors[:1]
+		
+		# Ricerca dei risultati nell' eventuale cache
+		if self._verdict_cache is not None:
+			for idx, ptsuite_code in enumerate(ptsuites_codes):
+				if results[idx] is not None:
+					continue
+				if all_errors:
+					results[idx] = self._verdict_cache.get_verdict(
+						self._check_key(ptsuite_code, all_errors=True)
+					)
+				else:
+					verdict: Dict[str, str] = self._verdict_cache.get_verdict(
+						self._check_key(ptsuite_code, fail_fast=fail_fast)
+					)
+					if verdict is not None:
+						results[idx] = [verdict] if len(verdict) > 0 else []
+		
+		to_check: List[int] = [idx for idx, result in enumerate(results) if result is None]
+		if len(to_check) > 0:
+			self._logger.log(
+				f"Verifica di linting di {len(to_check)} test-suites parziali ..."
+			) if self._logger is not None else None
+		
+		for chunk_start in range(0, len(to_check), self._BATCH_MAX_PTSUITES):
+			chunk: List[int] = to_check[chunk_start:(chunk_start + self._BATCH_MAX_PTSUITES)]
+			chunk_codes: List[str] = [ptsuites_codes[idx] for idx in chunk]
+			
+			chunk_results: List[List[Dict[str, str]]]
+			if self._batch_script_fname is not None:
+				chunk_results = self._execute_check(
+					lambda: self._perform_batch_lint_check(chunk_codes, all_errors, fail_fast)
+				)
+			else:
+				# Senza lo script "batch" le test-suites parziali vengono verificate una alla volta
+				chunk_results = list()
+				for ptsuite_code in chunk_codes:
+					if all_errors:
+						chunk_results.append(self._execute_check(
+							lambda: self._perform_lint_check(ptsuite_code, True)
+						))
+					else:
+						verdict: Dict[str, str] = self._execute_check(
+							lambda: self._perform_lint_check(ptsuite_code, fail_fast=fail_fast)
+						)
+						chunk_results.append([verdict] if len(verdict) > 0 else [])
+			
+			for idx, ptsuite_errors in zip(chunk, chunk_results):
+				results[idx] = ptsuite_errors
+				if self._verdict_cache is not None:
+					self._put_verdicts(ptsuites_codes[idx], ptsuite_errors, all_errors, fail_fast)
+		
+		return results
+	
+	
 	def clear_resources(self, stop_fenv: bool=False):
 		"""
 			Ripulisce le risorse che sono state utilizzate dal verificatore
@@ -321,16 +648,17 @@ class LintingChecker:
 					dell' ambiente focale che è stata avviata quando è stato impostato
 					il progetto focale
 		"""
-		if stop_fenv and (self._focal_env is not None):
-			self._logger.log("Stop dell' ambiente focale ...") if self._logger is not None else None
-			self._focal_env.stop_container()
-			self._logger.log(f"Ambiente focale del progetto {self._proj_name} fermato") if self._logger is not None else None
-			self._proj_set = False
-			
-			del self._focal_env
-			self._focal_env = None
+		with self._fenv_lock:
+			if stop_fenv and (self._focal_env is not None):
+				self._logger.log("Stop dell' ambiente focale ...") if self._logger is not None else None
+				self._release_fenv()
+				self._logger.log(f"Ambiente focale del progetto {self._proj_name} fermato") if self._logger is not None else None
+				self._proj_set = False
+				
+				del self._focal_env
+				self._focal_env = None
 
-		self._inited = False
+			self._inited = False
 	
 	
 	##	============================================================
@@ -338,6 +666,361 @@ class LintingChecker:
 	##	============================================================
 
 
+	def _precheck(self, ptsuite_code: str) -> List[Dict[str, str]]:
+		"""
+			Effettua l' eventuale pre-verifica della test-suite parziale fornita, restituendone
+			gli errori evidenti (lista vuota se non è stato fornito un pre-verificatore)
+		"""
+		if self._pre_checker is None:
+			return []
+
+		pre_errors: List[Dict[str, str]] = self._pre_checker.precheck(self._full_root, ptsuite_code)
+		if len(pre_errors) > 0:
+			self._logger.log(
+				f"Test-suite parziale scartata dalla pre-verifica ({pre_errors[0]['except_name']})"
+			) if self._logger is not None else None
+		return pre_errors
+
+
+	def _perform_lint_check(
+			self,
+			ptsuite_code: str,
+			all_errors: bool = False,
+			fail_fast: bool = False
+	) -> Union[Dict[str, str], List[Dict[str, str]]]:
+		"""
+			Effettua la verifica di correttezza, a livello di linting, della test-suite parziale
+			fornita utilizzando l' ambiente focale associato.
+			
+			Se richiesti tutti gli errori restituisce la lista degli errori distinti, invece del primo errore
+		"""
+		# Le verifiche tramite standard input/output non richiedono l' uso esclusivo dell' ambiente focale
+		if self._stream_script_fname is not None:
+			stream_result: Union[Dict[str, str], List[Dict[str, str]]] = self._perform_stream_lint_check(
+				ptsuite_code, all_errors, fail_fast
+			)
+			if stream_result is not None:
+				return stream_result
+		
+		with self._fenv_lock:
+			if not self._proj_set:
+				raise ProjectNotSetError()
+			if not self._inited:
+				self._create_inputctr()
+			
+			self._logger.log(
+				f"Inizio della verifica di linting ..."
+			) if self._logger is not None else None
+			
+			self._logger.log("Scrittura della test-suite parziale nell' ambiente focale ...") if self._logger is not None else None
+			tarfile_stream: BytesIO = BytesIO()
+			ptsuite_code_b: bytes = ptsuite_code.encode("utf-8")
+			with tarf_open(fileobj=tarfile_stream, mode="w") as tfptsuite:
+				tarfile_info: TarInfo = TarInfo(name=path_split(self._ptsuite_relpath)[1])
+				tarfile_info.size = len(ptsuite_code_b)
+				tfptsuite.addfile(tarinfo=tarfile_info, fileobj=BytesIO(ptsuite_code_b))
+			tarfile_stream.seek(0)
+			self._focal_env.put_tararchive(
+				f"{self._path_prefix}/{self._input_dir}",
+				tarfile_stream
+			)
+			self._logger.log("Scrittura eseguita") if self._logger is not None else None
+			
+			result: Union[Dict[str, str], List[Dict[str, str]]] = None
+			if self._lint_server is not None:
+				result = self._request_lint_server(all_errors, fail_fast)
+				if result is not None:
+					self._logger.log("Fine della verifica di linting") if self._logger is not None else None
+					return result
+			
+			# Richiesta della verifica della correttezza (a livello di linting)
+			self._logger.log("Esecuzione della verifica di linting ...") if self._logger is not None else None
+			self._focal_env.execute(
+				f"/bin/bash -c 'python -m $LINTTOOLS_DIRNAME.{path_splitext(self._fenv_script_fname)[0]} "
+				f"{self._ptsuite_relpath} {self._lint_result_relpath}{self._check_args(all_errors, fail_fast)}'"
+			)
+			self._logger.log("Verifica di linting eseguita") if self._logger is not None else None
+			
+			# Lettura del risultato della verifica di correttezza
+			self._logger.log("Lettura del risultato della verifica ...") if self._logger is not None else None
+			json_dec: JSONDecoder = JSONDecoder()
+			with open(self._lint_result_path, "r") as fjson:
+				result = json_dec.decode(fjson.read())
+			self._logger.log("Risultato della verifica letto") if self._logger is not None else None
+			
+			self._logger.log("Fine della verifica di linting") if self._logger is not None else None
+		return result
+
+
+	def _execute_check(self, check_func: Callable[[], Any]) -> Any:
+		"""
+			Esegue la verifica fornita tramite l' eventuale stadio di pipeline associato,
+			oppure direttamente se non è stato associato nessuno stadio
+		"""
+		if self._check_stage is not None:
+			return self._check_stage.execute(check_func)
+		return check_func()
+
+
+	def _check_all_errors(self, ptsuite_code: str) -> List[Dict[str, str]]:
+		"""
+			Effettua la verifica di tutti gli errori distinti della test-suite parziale fornita,
+			memorizzandone il risultato nell' eventuale cache
+		"""
+		errors: List[Dict[str, str]] = self._execute_check(
+			lambda: self._perform_lint_check(ptsuite_code, True)
+		)
+		if self._verdict_cache is not None:
+			self._put_verdicts(ptsuite_code, errors, True)
+		return errors
+
+
+	def _put_verdicts(
+			self,
+			ptsuite_code: str,
+			errors: List[Dict[str, str]],
+			all_errors: bool,
+			fail_fast: bool = False
+	):
+		"""
+			Memorizza nella cache dei risultati gli errori trovati per la test-suite parziale fornita.
+			Se sono stati trovati tutti gli errori viene memorizzato anche il solo primo errore
+			(che è lo stesso di una verifica del solo primo errore, non "fail-fast")
+		"""
+		if all_errors:
+			self._verdict_cache.put_verdict(self._check_key(ptsuite_code, all_errors=True), errors)
+		self._verdict_cache.put_verdict(
+			self._check_key(ptsuite_code, fail_fast=(fail_fast and (not all_errors))),
+			errors[0] if len(errors) > 0 else dict()
+		)
+
+
+	def _perform_stream_lint_check(
+			self,
+			ptsuite_code: str,
+			all_errors: bool,
+			fail_fast: bool
+	) -> Union[Dict[str, str], List[Dict[str, str]]]:
+		"""
+			Effettua la verifica di correttezza, a livello di linting, della test-suite parziale fornita
+			inviandone il codice come standard input allo script di verifica "stream" e leggendone il risultato
+			dallo standard output (ogni richiesta utilizza, nell' ambiente focale, un file univoco).
+			
+			Restituisce `None` se il risultato non è stato ottenuto, in modo da ripiegare sulla
+			verifica tramite files condivisi
+		"""
+		focal_env: FocalContainer
+		with self._fenv_lock:
+			if not self._proj_set:
+				raise ProjectNotSetError()
+			if not self._inited:
+				self._create_inputctr()
+			focal_env = self._focal_env
+		
+		# Utilizzo di un eventuale altro ambiente focale inattivo del pool (senza attenderlo)
+		pooled_env: FocalContainer = None
+		if self._fenv_pool is not None:
+			pooled_env = self._fenv_pool.acquire(
+				self._env_image, self._full_root, self._env_path_prefix,
+				wait=False
+			)
+		
+		self._logger.log("Inizio della verifica di linting (tramite standard input/output) ...") if self._logger is not None else None
+		# Negli ambienti focali del pool la directory temporanea e il server di linting
+		# potrebbero non essere ancora stati creati
+		setup_cmd: str = f"mkdir -p {self._path_prefix}/{self._input_dir} && "
+		server_arg: str = ""
+		if self._lint_server is not None:
+			setup_cmd += f"({self._server_start_cmd()} >/dev/null 2>&1 &); "
+			server_arg = f" --socket_path {self._SERVER_SOCKET}"
+		
+		exit_code: int
+		stream_out: str
+		try:
+			exit_code, stream_out, _ = (pooled_env if pooled_env is not None else focal_env).execute_piped(
+				f"/bin/bash -c '{setup_cmd}python -m $LINTTOOLS_DIRNAME.{path_splitext(self._stream_script_fname)[0]} "
+				f"{self._input_dir}{server_arg}{self._check_args(all_errors, fail_fast)}'",
+				ptsuite_code
+			)
+		finally:
+			if pooled_env is not None:
+				self._fenv_pool.release(pooled_env)
+		if (exit_code != 0) or (stream_out is None):
+			self._logger.log("Verifica tramite standard input/output fallita") if self._logger is not None else None
+			return None
+		
+		json_dec: JSONDecoder = JSONDecoder()
+		result: Union[Dict[str, str], List[Dict[str, str]]]
+		try:
+			result = json_dec.decode(stream_out.strip().splitlines()[-1])
+		except (ValueError, IndexError):
+			self._logger.log("Risultato della verifica tramite standard input/output non valido") if self._logger is not None else None
+			return None
+		
+		self._logger.log("Fine della verifica di linting") if self._logger is not None else None
+		return result
+
+
+	def _server_start_cmd(self) -> str:
+		"""
+			Restituisce il comando shell che avvia il server di linting persistente nell' ambiente focale,
+			solo se non ne è già in esecuzione un altro
+		"""
+		return (
+			f"flock -n {self._SERVER_LOCK} python -m $LINTTOOLS_DIRNAME.{path_splitext(self._lint_server[0])[0]} "
+			f"{self._SERVER_SOCKET}"
+		)
+	
+	
+	def _release_fenv(self):
+		"""
+			Rilascia l' ambiente focale associato, restituendolo all' eventuale pool oppure terminandolo
+		"""
+		if self._fenv_pool is not None:
+			self._fenv_pool.release(self._focal_env)
+		else:
+			self._focal_env.stop_container()
+
+
+	def _perform_batch_lint_check(
+			self,
+			ptsuites_codes: List[str],
+			all_errors: bool,
+			fail_fast: bool
+	) -> List[List[Dict[str, str]]]:
+		"""
+			Effettua la verifica di correttezza, a livello di linting, delle test-suites parziali
+			fornite, tramite un' unica esecuzione dello script di verifica "batch" nell' ambiente focale associato
+		"""
+		with self._fenv_lock:
+			if not self._proj_set:
+				raise ProjectNotSetError()
+			if not self._inited:
+				self._create_inputctr()
+			
+			self._logger.log("Scrittura delle test-suites parziali nell' ambiente focale ...") if self._logger is not None else None
+			ptsuites_relpaths: List[str] = list()
+			tarfile_stream: BytesIO = BytesIO()
+			with tarf_open(fileobj=tarfile_stream, mode="w") as tfptsuites:
+				for idx, ptsuite_code in enumerate(ptsuites_codes):
+					ptsuite_fname: str = f"temp_batch_{idx}.py"
+					ptsuites_relpaths.append(f"{self._input_dir}/{ptsuite_fname}")
+					
+					ptsuite_code_b: bytes = ptsuite_code.encode("utf-8")
+					tarfile_info: TarInfo = TarInfo(name=ptsuite_fname)
+					tarfile_info.size = len(ptsuite_code_b)
+					tfptsuites.addfile(tarinfo=tarfile_info, fileobj=BytesIO(ptsuite_code_b))
+			tarfile_stream.seek(0)
+			self._focal_env.put_tararchive(
+				f"{self._path_prefix}/{self._input_dir}",
+				tarfile_stream
+			)
+			self._logger.log("Scrittura eseguita") if self._logger is not None else None
+			
+			self._logger.log("Esecuzione della verifica di linting \"batch\" ...") if self._logger is not None else None
+			self._focal_env.execute(
+				f"/bin/bash -c 'python -m $LINTTOOLS_DIRNAME.{path_splitext(self._batch_script_fname)[0]} "
+				f"{self._batch_result_relpath} {' '.join(ptsuites_relpaths)} --jobs {self._batch_jobs}"
+				f"{self._check_args(all_errors, fail_fast)}'"
+			)
+			self._logger.log("Verifica di linting \"batch\" eseguita") if self._logger is not None else None
+			
+			json_dec: JSONDecoder = JSONDecoder()
+			results: List[List[Dict[str, str]]] = None
+			with open(self._batch_result_path, "r") as fjson:
+				results = json_dec.decode(fjson.read())
+			self._logger.log("Risultati della verifica letti") if self._logger is not None else None
+		return results
+
+
+	@classmethod
+	def _check_args(cls, all_errors: bool, fail_fast: bool) -> str:
+		"""
+			Restituisce gli argomenti, per gli scripts di verifica nell' ambiente focale, che richiedono
+			tutti gli errori oppure una verifica "fail-fast" (ignorata se sono richiesti tutti gli errori)
+		"""
+		if all_errors:
+			return " --all_errors"
+		if fail_fast:
+			return " --fail_fast --errors_only"
+		return ""
+
+
+	def _check_key(
+			self,
+			ptsuite_code: str,
+			all_errors: bool = False,
+			fail_fast: bool = False
+	) -> str:
+		"""
+			Calcola la chiave, nella cache dei risultati, della verifica di linting della test-suite parziale
+			fornita a partire dal suo codice, dall' immagine dell' ambiente focale impostato (e dalla versione
+			di PyLint che contiene), dagli scripts di verifica utilizzati e dagli argomenti forniti ad essi
+			(che determinano, insieme agli scripts, gli argomenti effettivi di PyLint).
+			
+			Le verifiche di tutti gli errori, del solo primo errore e "fail-fast" hanno quindi chiavi distinte
+		"""
+		check_comps: List[Any] = [
+			sha256(ptsuite_code.encode("utf-8")).hexdigest(),
+			self._image_id,
+			self._pylint_version,
+			self._fenv_script_fname,
+			self._lint_server,
+			self._check_args(all_errors, fail_fast)
+		]
+		check_repr: str = json_dumps(check_comps, ensure_ascii=False)
+		return sha256(check_repr.encode("utf-8")).hexdigest()
+
+
+	def _read_pylint_version(self) -> str:
+		"""
+			Restituisce la versione di PyLint (e delle sue dipendenze) installata nell' ambiente focale
+			impostato, oppure `None` se non è stato possibile ottenerla
+		"""
+		with self._fenv_lock:
+			self._focal_env.execute("/bin/bash -c 'python -m pylint --version'")
+			pylint_out: str = self._focal_env.get_last_stdout()
+			if (self._focal_env.get_last_exitcode() != 0) or (pylint_out is None):
+				return None
+		return pylint_out.strip()
+
+
+	def _request_lint_server(
+			self,
+			all_errors: bool,
+			fail_fast: bool
+	) -> Union[Dict[str, str], List[Dict[str, str]]]:
+		"""
+			Richiede la verifica di linting della test-suite parziale, già scritta nell' ambiente focale,
+			al server di linting persistente tramite il suo client, leggendone il risultato dallo
+			standard output.
+			
+			Restituisce `None` se il risultato non è stato ottenuto, in modo da ripiegare sulla
+			verifica tramite lo script di linting
+		"""
+		self._logger.log("Richiesta della verifica al server di linting ...") if self._logger is not None else None
+		self._focal_env.execute(
+			f"/bin/bash -c 'python -m $LINTTOOLS_DIRNAME.{path_splitext(self._lint_server[1])[0]} "
+			f"{self._ptsuite_relpath} {self._SERVER_SOCKET}{self._check_args(all_errors, fail_fast)}'"
+		)
+		
+		client_out: str = self._focal_env.get_last_stdout()
+		if (self._focal_env.get_last_exitcode() != 0) or (client_out is None):
+			self._logger.log("Server di linting non disponibile") if self._logger is not None else None
+			return None
+		
+		json_dec: JSONDecoder = JSONDecoder()
+		result: Union[Dict[str, str], List[Dict[str, str]]]
+		try:
+			result = json_dec.decode(client_out.strip().splitlines()[-1])
+		except (ValueError, IndexError):
+			self._logger.log("Risultato del server di linting non valido") if self._logger is not None else None
+			return None
+		
+		self._logger.log("Risultato della verifica ricevuto") if self._logger is not None else None
+		return result
+
+
 	def _create_inputctr(self):
 		"""
 			Crea la directory temporanea, internamente all' ambiente focale, per i files
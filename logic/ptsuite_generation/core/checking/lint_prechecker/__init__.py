@@ -0,0 +1,2 @@
+from ._private.i_lint_prechecker import ILintPreChecker
+from ._private.static_lint_prechecker import StaticLintPreChecker
\ No newline at end of file
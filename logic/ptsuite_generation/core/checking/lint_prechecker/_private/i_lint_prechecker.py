@@ -0,0 +1,54 @@
+from typing import List, Dict
+from abc import ABC, abstractmethod
+
+
+
+class ILintPreChecker(ABC):
+	"""
+		Rappresenta un oggetto in grado di effettuare, al di fuori dell' ambiente focale, una pre-verifica
+		economica di test-suites parziali, individuando solo gli errori di linting evidenti (rilevabili senza
+		le dipendenze del progetto focale).
+
+		Ogni errore individuato è un errore che la verifica di linting nell' ambiente focale riporterebbe
+		a sua volta; gli errori che non è possibile stabilire con certezza vengono lasciati a quest' ultima.
+
+		Le analisi effettuate sono specificate dai discendenti di questa interfaccia
+	"""
+
+
+	@abstractmethod
+	def precheck(
+			self,
+			full_root: str,
+			ptsuite_code: str
+	) -> List[Dict[str, str]]:
+		"""
+			Effettua la pre-verifica della test-suite parziale fornita, appartenente al progetto
+			focale fornito
+
+			Parameters
+			----------
+				full_root: str
+					Una stringa contenente la Full Project Root Path del progetto focale a cui
+					appartiene la test-suite parziale
+
+				ptsuite_code: str
+					Una stringa contenente il codice della test-suite parziale di cui effettuare
+					la pre-verifica
+
+			Returns
+			-------
+				List[Dict[str, str]]
+					Una lista, ordinata per posizione nel codice, degli errori distinti individuati
+					(vuota se non è stato individuato nessun errore evidente). Ogni errore è un dizionario
+					con gli stessi campi del risultato di `LintingChecker.check_lintically(...)`
+
+			Raises
+			------
+				ValueError
+					Si verifica se:
+
+						- Il parametro `full_root` ha valore `None` o è una stringa vuota
+						- Il parametro `ptsuite_code` ha valore `None` o è una stringa vuota
+		"""
+		pass
\ No newline at end of file
@@ -0,0 +1,186 @@
+from typing import List, Dict, Set, FrozenSet, Tuple, Optional
+from .i_lint_prechecker import ILintPreChecker
+
+import builtins
+# ============== AST Utilities ============== #
+from ast import (
+	parse as ast_parse,
+	walk as ast_walk,
+	AST,
+	Module as AstModule,
+	Name as AstName,
+	Load as AstLoad,
+	Store as AstStore,
+	Del as AstDel,
+	Global as AstGlobal,
+	Nonlocal as AstNonlocal,
+	Import as AstImport,
+	ImportFrom as AstImportFrom,
+	arg as AstArg,
+	AnnAssign as AstAnnAssign,
+	FunctionDef as AstFunctionDef,
+	AsyncFunctionDef as AstAsyncFunctionDef,
+	ClassDef as AstClassDef,
+	ExceptHandler as AstExceptHandler,
+	MatchAs as AstMatchAs,
+	MatchStar as AstMatchStar,
+	MatchMapping as AstMatchMapping
+)
+# =========================================== #
+
+
+
+class StaticLintPreChecker(ILintPreChecker):
+	"""
+		Rappresenta un `ILintPreChecker` che analizza staticamente (tramite il modulo `ast`) ogni test-suite
+		parziale, individuando l' errore di PyLint "undefined-variable": nomi utilizzati ma mai definiti nella
+		test-suite parziale (nè built-ins).
+
+		Gli import non vengono giudicati: i moduli, e i nomi, importabili sono quelli dell' ambiente focale
+		(in cui il progetto focale è installato, con gli eventuali moduli generati o compilati), che possono
+		differire da quelli della Full Project Root Path. L' analisi è conservativa: i nomi "dunder" e le
+		test-suites parziali che contengono import con "*" (o gestiscono `NameError`) non vengono giudicati.
+
+		Non possedendo alcuno stato, lo stesso StaticLintPreChecker può essere condiviso tra più `LintingChecker`,
+		anche utilizzati contemporaneamente
+	"""
+
+	_BUILTIN_NAMES: FrozenSet[str] = frozenset(dir(builtins))
+
+	def __init__(self):
+		"""
+			Costruisce un nuovo StaticLintPreChecker
+		"""
+		pass
+
+
+	def precheck(
+			self,
+			full_root: str,
+			ptsuite_code: str
+	) -> List[Dict[str, str]]:
+		if (full_root is None) or (full_root == ""):
+			raise ValueError()
+		if (ptsuite_code is None) or (ptsuite_code == ""):
+			raise ValueError()
+
+		# Il codice non analizzabile viene lasciato alla verifica nell' ambiente focale
+		try:
+			ptsuite_tree: AstModule = ast_parse(ptsuite_code)
+		except (SyntaxError, ValueError):
+			return []
+
+		found: List[Tuple[int, int, str, str]] = self._check_names(ptsuite_tree)
+		found.sort(key=lambda error: (error[0], error[1]))
+
+		errors: List[Dict[str, str]] = list()
+		distinct: Set[Tuple[str, str]] = set()
+		for line, column, except_name, except_mess in found:
+			if (except_name, except_mess) in distinct:
+				continue
+			distinct.add((except_name, except_mess))
+			errors.append({
+				"except_name": except_name,
+				"except_mess": except_mess,
+				"except_pos": f"{line};{column}"
+			})
+		return errors
+
+
+	##	============================================================
+	##						PRIVATE METHODS
+	##	============================================================
+
+
+	def _check_names(self, ptsuite_tree: AstModule) -> List[Tuple[int, int, str, str]]:
+		"""
+			Individua i nomi utilizzati ma mai definiti (in nessun punto) nella test-suite parziale.
+			Ogni errore è una tupla (linea, colonna, nome, messaggio)
+		"""
+		bound: Optional[FrozenSet[str]] = self._bound_names(ptsuite_tree)
+		# Con un import con "*", o una gestione di `NameError`, i nomi definiti non sono noti
+		if (bound is None) or any(
+			isinstance(node, AstName) and (node.id == "NameError")
+			for node in ast_walk(ptsuite_tree)
+		):
+			return []
+
+		skipped: Set[int] = self._postponed_annotations(ptsuite_tree)
+
+		found: List[Tuple[int, int, str, str]] = list()
+		for node in ast_walk(ptsuite_tree):
+			if (not isinstance(node, AstName)) or (not isinstance(node.ctx, AstLoad)):
+				continue
+			if (node.id in bound) or (node.id in self._BUILTIN_NAMES) or (id(node) in skipped):
+				continue
+			if node.id.startswith("__") and node.id.endswith("__"):
+				continue
+
+			found.append((
+				node.lineno, node.col_offset,
+				"undefined-variable", f"Undefined variable {node.id!r}"
+			))
+		return found
+
+
+	@classmethod
+	def _postponed_annotations(cls, ptsuite_tree: AstModule) -> Set[int]:
+		"""
+			Restituisce gli identificativi dei nomi contenuti nelle annotazioni di tipo della test-suite
+			parziale, se la loro valutazione è posticipata (`from __future__ import annotations`)
+		"""
+		postponed: bool = any(
+			isinstance(stmt, AstImportFrom) and (stmt.module == "__future__") and
+			any(alias.name == "annotations" for alias in stmt.names)
+			for stmt in ptsuite_tree.body
+		)
+		if not postponed:
+			return set()
+
+		annotations: List[AST] = list()
+		for node in ast_walk(ptsuite_tree):
+			if isinstance(node, (AstArg, AstAnnAssign)) and (node.annotation is not None):
+				annotations.append(node.annotation)
+			elif isinstance(node, (AstFunctionDef, AstAsyncFunctionDef)) and (node.returns is not None):
+				annotations.append(node.returns)
+
+		return {
+			id(node)
+			for annotation in annotations
+			for node in ast_walk(annotation)
+		}
+
+
+	@classmethod
+	def _bound_names(cls, tree: AST) -> Optional[FrozenSet[str]]:
+		"""
+			Restituisce tutti i nomi definiti nell' albero sintattico fornito (in qualsiasi scope),
+			oppure `None` se l' albero contiene un import con "*"
+		"""
+		names: Set[str] = set()
+
+		for node in ast_walk(tree):
+			if isinstance(node, (AstImport, AstImportFrom)):
+				for alias in node.names:
+					if alias.name == "*":
+						return None
+					names.add(alias.asname if alias.asname is not None else alias.name.split(".")[0])
+			elif isinstance(node, AstName) and isinstance(node.ctx, (AstStore, AstDel)):
+				names.add(node.id)
+			elif isinstance(node, (AstFunctionDef, AstAsyncFunctionDef, AstClassDef)):
+				names.add(node.name)
+			elif isinstance(node, AstExceptHandler) and (node.name is not None):
+				names.add(node.name)
+			elif isinstance(node, (AstMatchAs, AstMatchStar)) and (node.name is not None):
+				names.add(node.name)
+			elif isinstance(node, AstMatchMapping) and (node.rest is not None):
+				names.add(node.rest)
+			elif isinstance(node, (AstGlobal, AstNonlocal)):
+				names.update(node.names)
+			elif isinstance(node, AstArg):
+				names.add(node.arg)
+			# Parametri di tipo (es. `def f[T](...)`), disponibili dalla versione 3.12 dell' interprete
+			elif type(node).__name__ in ("TypeVar", "ParamSpec", "TypeVarTuple"):
+				names.add(node.name)
+
+		return frozenset(names)
\ No newline at end of file
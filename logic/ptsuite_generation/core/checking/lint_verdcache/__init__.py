@@ -0,0 +1,3 @@
+from ._private.i_lint_verdcache import ILintVerdictCache
+
+from ._factory.lint_verdcache_f import LintVerdictCacheFactory
\ No newline at end of file
@@ -0,0 +1,54 @@
+from .. import ILintVerdictCache
+
+from .._private.sqlite3_lint_verdcache import Sqlite3LintVerdictCache
+
+from .....cache_accessor import ECacheAccessorType
+
+
+
+class LintVerdictCacheFactory:
+	"""
+		Rappresenta una factory per ogni `ILintVerdictCache`
+	"""
+	
+	
+	@classmethod
+	def create(
+			cls,
+			tech: ECacheAccessorType,
+			cache_path: str
+	) -> ILintVerdictCache:
+		"""
+			Istanzia una nuova cache dei risultati delle verifiche di linting della tecnologia
+			implementativa specificata
+			
+			Parameters
+			----------
+				tech: ECacheAccessorType
+					Un valore `ECacheAccessorType` rappresentante la tecnologia richiesta
+					per l' oggetto `ILintVerdictCache`
+					
+				cache_path: str
+					Una stringa rappresentante la path del file di caching da utilizzare
+					
+			Returns
+			-------
+				ILintVerdictCache
+					Un oggetto `ILintVerdictCache` della tecnologia implementativa specificata
+					
+			Raises
+			------
+				ValueError
+					Si verifica se il parametro `cache_path` ha valore `None` o è una stringa vuota
+		"""
+		obj: ILintVerdictCache
+		match tech:
+			case ECacheAccessorType.SQLITE3:
+				obj = Sqlite3LintVerdictCache(cache_path)
+		
+		return obj
+	
+	
+	##	============================================================
+	##						PRIVATE METHODS
+	##	============================================================
@@ -0,0 +1,98 @@
+from typing import List, Dict, Union
+from abc import ABC, abstractmethod
+
+
+
+class ILintVerdictCache(ABC):
+	"""
+		Rappresenta una cache, persistente, dei risultati delle verifiche di linting delle test-suites parziali
+		indicizzati da una chiave che identifica univocamente la verifica effettuata (codice della test-suite
+		parziale, ambiente focale e strumenti di verifica utilizzati).
+		
+		La tecnologia implementativa della cache è specificata dai discendenti di questa interfaccia
+	"""
+	
+	
+	@abstractmethod
+	def get_verdict(self, check_key: str) -> Union[Dict[str, str], List[Dict[str, str]]]:
+		"""
+			Restituisce il risultato memorizzato per la verifica identificata dalla chiave fornita,
+			registrando l' esito della ricerca (hit o miss)
+			
+			Parameters
+			----------
+				check_key: str
+					Una stringa contenente la chiave della verifica
+					
+			Returns
+			-------
+				Union[Dict[str, str], List[Dict[str, str]]]
+					Un dizionario di stringhe, indicizzato da stringhe, contenente il risultato memorizzato
+					(vuoto se la test-suite parziale era corretta), oppure la lista di tali dizionari memorizzata
+					per le verifiche di tutti gli errori. Vale `None` se la verifica non è presente nella cache
+					
+			Raises
+			------
+				ValueError
+					Si verifica se il parametro `check_key` ha valore `None` o è una stringa vuota
+		"""
+		pass
+	
+	
+	@abstractmethod
+	def put_verdict(self, check_key: str, verdict: Union[Dict[str, str], List[Dict[str, str]]]):
+		"""
+			Memorizza il risultato ottenuto dalla verifica identificata dalla chiave fornita,
+			sovrascrivendo l' eventuale risultato già presente
+			
+			Parameters
+			----------
+				check_key: str
+					Una stringa contenente la chiave della verifica
+					
+				verdict: Union[Dict[str, str], List[Dict[str, str]]]
+					Un dizionario di stringhe, indicizzato da stringhe, contenente il risultato
+					della verifica da memorizzare (oppure la lista degli errori, per le verifiche
+					di tutti gli errori)
+					
+			Raises
+			------
+				ValueError
+					Si verifica se almeno uno tra `check_key` e `verdict` ha valore `None`, oppure se
+					`check_key` è una stringa vuota
+		"""
+		pass
+	
+	
+	@abstractmethod
+	def hits(self) -> int:
+		"""
+			Restituisce il numero di verifiche trovate nella cache dalla sua apertura
+			
+			Returns
+			-------
+				int
+					Un intero indicante il numero di "hits" della cache
+		"""
+		pass
+	
+	
+	@abstractmethod
+	def misses(self) -> int:
+		"""
+			Restituisce il numero di verifiche non trovate nella cache dalla sua apertura
+			
+			Returns
+			-------
+				int
+					Un intero indicante il numero di "misses" della cache
+		"""
+		pass
+	
+	
+	@abstractmethod
+	def close(self):
+		"""
+			Chiude la cache rilasciandone le risorse
+		"""
+		pass
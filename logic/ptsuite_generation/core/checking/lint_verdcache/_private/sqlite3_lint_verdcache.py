@@ -0,0 +1,118 @@
+from typing import List, Dict, Tuple, Union
+from .i_lint_verdcache import ILintVerdictCache
+
+from threading import RLock
+
+# =========== SQLite3 Utilities ============ #
+from sqlite3 import (
+	connect as sql_connect,
+	Connection as SqlConnection,
+	Cursor as SqlConnectionCursor,
+)
+# ========================================== #
+# ============== JSON Utilities ============== #
+from json import (
+	JSONEncoder,
+	JSONDecoder
+)
+# ============================================ #
+
+
+
+class Sqlite3LintVerdictCache(ILintVerdictCache):
+	"""
+		Rappresenta un `ILintVerdictCache` che utilizza come cache un database locale SQLite3.
+		Ogni risultato è memorizzato come oggetto JSON.
+		
+		L' accesso al database è serializzato, in modo che lo stesso Sqlite3LintVerdictCache
+		possa essere utilizzato da più threads contemporaneamente
+	"""
+	
+	_TABLE_NAME: str = "lint_verdicts"
+	
+	def __init__(
+			self,
+			cache_path: str
+	):
+		"""
+			Costruisce un nuovo Sqlite3LintVerdictCache associandolo alla path del database
+			SQLite3 da utilizzare (creato se non esistente)
+			
+			Parameters
+			----------
+				cache_path: str
+					Una stringa rappresentante la path del database SQLite3 da utilizzare
+					
+			Raises
+			------
+				ValueError
+					Si verifica se il parametro `cache_path` ha valore `None` o è una stringa vuota
+		"""
+		if (cache_path is None) or (cache_path == ""):
+			raise ValueError()
+		
+		self._hits: int = 0
+		self._misses: int = 0
+		
+		self._json_enc: JSONEncoder = JSONEncoder()
+		self._json_dec: JSONDecoder = JSONDecoder()
+		
+		self._db_lock: RLock = RLock()
+		self._conn: SqlConnection = sql_connect(cache_path, check_same_thread=False)
+		self._cursor: SqlConnectionCursor = self._conn.cursor()
+		
+		with self._db_lock:
+			self._cursor.execute(f"""
+				CREATE TABLE IF NOT EXISTS `{self._TABLE_NAME}` (
+					`check_key` TEXT NOT NULL PRIMARY KEY,
+					`verdict` TEXT NOT NULL
+				)
+			""")
+			self._conn.commit()
+	
+	
+	def get_verdict(self, check_key: str) -> Union[Dict[str, str], List[Dict[str, str]]]:
+		if (check_key is None) or (check_key == ""):
+			raise ValueError()
+		
+		with self._db_lock:
+			self._cursor.execute(f"""
+				SELECT `verdict` FROM `{self._TABLE_NAME}`
+				WHERE `check_key` = ?
+			""", [check_key])
+			row: Tuple[str] = self._cursor.fetchone()
+			
+			if row is None:
+				self._misses += 1
+				return None
+			
+			self._hits += 1
+			return self._json_dec.decode(row[0])
+	
+	
+	def put_verdict(self, check_key: str, verdict: Union[Dict[str, str], List[Dict[str, str]]]):
+		if (check_key is None) or (check_key == "") or (verdict is None):
+			raise ValueError()
+		
+		with self._db_lock:
+			self._cursor.execute(f"""
+				INSERT OR REPLACE INTO `{self._TABLE_NAME}` (`check_key`, `verdict`)
+				VALUES (?, ?)
+			""", [check_key, self._json_enc.encode(verdict)])
+			self._conn.commit()
+	
+	
+	def hits(self) -> int:
+		with self._db_lock:
+			return self._hits
+	
+	
+	def misses(self) -> int:
+		with self._db_lock:
+			return self._misses
+	
+	
+	def close(self):
+		with self._db_lock:
+			self._cursor.close()
+			self._conn.close()
@@ -7,4 +7,6 @@ class ESyntCheckerTool(PythonEnumerator):
 		Rappresenta un tool di verifica della correttezza sintattica
 		implementato in GenTestsAI
 	"""
-	PYCOMPILE = 0
\ No newline at end of file
+	PYCOMPILE = 0
+	INMEMORY_COMPILE = 1
+	TREESITTER = 2
\ No newline at end of file
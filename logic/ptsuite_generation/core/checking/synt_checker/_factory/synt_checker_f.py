@@ -2,6 +2,11 @@ from .. import ISyntacticChecker
 
 from .e_synt_chker_tool import ESyntCheckerTool
 from .._private.pycomp_syntcker import PyCompileSyntChecker
+from .._private.inmem_syntcker import InMemorySyntChecker
+from .._private.treesitter_syntcker import TreeSitterSyntChecker
+from .._private.staged_syntcker import StagedSyntacticChecker
+
+from ......utils.pipeline_stage import PipelineStage
 
 
 
@@ -37,9 +42,46 @@ class SyntacticCheckerFactory:
 		match tool:
 			case ESyntCheckerTool.PYCOMPILE:
 				obj = PyCompileSyntChecker()
+			case ESyntCheckerTool.INMEMORY_COMPILE:
+				obj = InMemorySyntChecker()
+			case ESyntCheckerTool.TREESITTER:
+				obj = TreeSitterSyntChecker()
 			
 		return obj
-		
+	
+	
+	@classmethod
+	def staged(
+			cls,
+			checker: ISyntacticChecker,
+			stage: PipelineStage
+	) -> ISyntacticChecker:
+		"""
+			Istanzia un nuovo verificatore della correttezza sintattica che esegue le verifiche
+			del verificatore fornito tramite lo stadio di pipeline indicato
+			
+			Parameters
+			----------
+				checker: ISyntacticChecker
+					Un oggetto `ISyntacticChecker` rappresentante il verificatore che effettuerà
+					realmente le verifiche
+					
+				stage: PipelineStage
+					Un oggetto `PipelineStage` rappresentante lo stadio tramite cui eseguire
+					le verifiche
+					
+			Returns
+			-------
+				ISyntacticChecker
+					Un oggetto `ISyntacticChecker` le cui verifiche vengono eseguite dallo
+					stadio di pipeline fornito
+					
+			Raises
+			------
+				ValueError
+					Si verifica se almeno uno tra `checker` e `stage` ha valore `None`
+		"""
+		return StagedSyntacticChecker(checker, stage)
 		
 	##	============================================================
 	##						PRIVATE METHODS
@@ -1,4 +1,4 @@
-from typing import Tuple
+from typing import List, Tuple
 from abc import abstractmethod
 from .. import ISyntacticChecker
 
@@ -23,6 +23,16 @@ class _ABaseSyntacticChecker(ISyntacticChecker):
 		return self._ap__check_synt_spec(ptsuite_code)
 		
 	
+	def check_synt_errors(
+			self,
+			ptsuite_code: str
+	) -> List[Tuple[str, str]]:
+		if (ptsuite_code is None) or (ptsuite_code == ""):
+			raise ValueError()
+			
+		return self._p__check_synt_errors_spec(ptsuite_code)
+		
+	
 	##	============================================================
 	##						ABSTRACT METHODS
 	##	============================================================
@@ -61,8 +71,36 @@ class _ABaseSyntacticChecker(ISyntacticChecker):
 	@abstractmethod
 	def clear_resources(self):
 		pass
-
-
+	
+	
 	##	============================================================
 	##						PRIVATE METHODS
-	##	============================================================
\ No newline at end of file
+	##	============================================================
+	
+	
+	def _p__check_synt_errors_spec(self, ptsuite_code: str) -> List[Tuple[str, str]]:
+		"""
+			Individua tutti gli errori sintattici della test-suite parziale fornita che il tool
+			di verifica è in grado di riportare in un' unica verifica.
+			
+			Di default viene riportato soltanto il primo errore sintattico (`_ap__check_synt_spec(...)`);
+			i discendenti di questa classe astratta possono ridefinire questo metodo se il loro tool
+			di verifica è in grado di individuare più errori.
+			
+			E' garantito all' interno di questo metodo che il parametro `ptsuite_code` non abbia
+			valore `None` nè sia una stringa vuota
+			
+			Parameters
+			----------
+				ptsuite_code: str
+					Una stringa contenente il codice della test-suite parziale di cui
+					effettuare la verifica di correttezza sintattica
+			
+			Returns
+			-------
+				List[Tuple[str, str]]
+					Una lista, ordinata per posizione nel codice, degli errori sintattici della
+					test-suite parziale (vuota se non si è verificato nessun errore)
+		"""
+		first_error: Tuple[str, str] = self._ap__check_synt_spec(ptsuite_code)
+		return [first_error] if len(first_error) > 0 else []
\ No newline at end of file
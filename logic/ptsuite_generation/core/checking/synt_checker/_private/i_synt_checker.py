@@ -1,4 +1,4 @@
-from typing import Tuple
+from typing import List, Tuple
 from abc import ABC, abstractmethod
 
 
@@ -46,6 +46,40 @@ class ISyntacticChecker(ABC):
 		pass
 	
 	
+	@abstractmethod
+	def check_synt_errors(
+			self,
+			ptsuite_code: str
+	) -> List[Tuple[str, str]]:
+		"""
+			Effettua il controllo di correttezza sintattica della test-suite parziale
+			fornita come argomento, individuando tutti gli errori che il tool di verifica
+			è in grado di riportare in un' unica verifica
+			
+			Parameters
+			----------
+				ptsuite_code: str
+					Una stringa contenente il codice della test-suite parziale di cui
+					effettuare la verifica di correttezza sintattica
+					
+			Returns
+			-------
+				List[Tuple[str, str]]
+					Una lista, ordinata per posizione nel codice, delle tuple (con lo stesso formato del
+					risultato di `check_synt(...)`) rappresentanti gli errori evidenziati dalla verifica
+					di correttezza sintattica effettuata. Il primo errore è sempre quello restituito da
+					`check_synt(...)`.
+					
+					Se non si è verificato nessun errore viene restituita una lista vuota
+					
+			Raises
+			------
+				ValueError
+					Si verifica se il parametro `ptsuite_code` ha valore `None` o è una stringa vuota
+		"""
+		pass
+	
+	
 	@abstractmethod
 	def clear_resources(self):
 		"""
@@ -0,0 +1,82 @@
+from typing import List, Tuple, Optional
+from ._a_base_syntcker import _ABaseSyntacticChecker
+
+from traceback import format_exception_only
+
+
+
+class InMemorySyntChecker(_ABaseSyntacticChecker):
+	"""
+		Rappresenta un `ISyntChecker` che compila ogni test-suite parziale direttamente dalla memoria
+		(tramite `compile(...)`), senza scriverla su file nè produrre il relativo ".pyc".
+
+		Gli errori riportati sono gli stessi, con lo stesso formato, del tool di verifica `pycompile`
+		(il nome del file nei messaggi è fittizio).
+		Non possedendo alcuno stato, lo stesso InMemorySyntChecker può essere utilizzato da più
+		threads contemporaneamente
+	"""
+
+	_PTSUITE_FNAME: str = "temp_ptsuite.py"
+
+	def __init__(self):
+		"""
+			Costruisce un nuovo InMemorySyntChecker
+		"""
+		pass
+
+
+	def _ap__check_synt_spec(self, ptsuite_code: str) -> Tuple[str, str]:
+		synt_error: Optional[Exception] = self._compile_error(ptsuite_code)
+		if synt_error is None:
+			return tuple()
+		return self._format_error(ptsuite_code, synt_error)
+
+
+	def clear_resources(self):
+		"""
+			Non essendo utilizzata alcuna risorsa quest' operazione è equivalente ad una no-op
+		"""
+		pass
+
+
+	##	============================================================
+	##						PRIVATE METHODS
+	##	============================================================
+	
+	
+	@classmethod
+	def _compile_error(cls, ptsuite_code: str) -> Optional[Exception]:
+		"""
+			Compila la test-suite parziale fornita restituendo l' eccezione sollevata dalla
+			compilazione (`None` se la test-suite parziale è corretta sintatticamente)
+		"""
+		try:
+			# Come `pycompile` il codice viene compilato dai suoi bytes (rispettando l' eventuale codifica dichiarata)
+			compile(ptsuite_code.encode("utf-8"), cls._PTSUITE_FNAME, "exec", dont_inherit=True)
+			return None
+		except Exception as synt_error:
+			return synt_error
+	
+	
+	@classmethod
+	def _format_error(
+			cls,
+			ptsuite_code: str,
+			synt_error: Exception
+	) -> Tuple[str, str]:
+		"""
+			Restituisce la tupla (nome, messaggio) dell' errore di compilazione fornito,
+			nel formato del tool di verifica `pycompile`
+		"""
+		except_name: str = type(synt_error).__name__
+		except_mess: str
+		if type(synt_error) is SyntaxError:
+			# Per gli errori del compilatore (es. `return` esterni a funzioni) la linea di codice
+			# viene letta dal file, quindi va fornita esplicitamente
+			code_lines: List[str] = ptsuite_code.splitlines(keepends=True)
+			if (synt_error.text is None) and (synt_error.lineno is not None) and (0 < synt_error.lineno <= len(code_lines)):
+				synt_error.text = code_lines[synt_error.lineno - 1]
+			except_mess = "".join(format_exception_only(SyntaxError, synt_error))
+		else:
+			except_mess = f"Sorry: {except_name}: {synt_error}"
+		return (except_name, except_mess)
\ No newline at end of file
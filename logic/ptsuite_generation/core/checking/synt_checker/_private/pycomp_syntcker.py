@@ -2,6 +2,7 @@ from typing import Tuple
 from ._a_base_syntcker import _ABaseSyntacticChecker
 
 from datetime import datetime as DateTime
+from uuid import uuid4
 from py_compile import (
 	compile as py_compile,
 	PycInvalidationMode as Pyc_InvMode,
@@ -35,11 +36,14 @@ class PyCompileSyntChecker(_ABaseSyntacticChecker):
 		"""
 		timestamp: str = str(int(DateTime.now().timestamp() * 1000))
 		temp_fname: str = f"temp_{timestamp}.py"
+		# Ogni verificatore possiede la propria directory temporanea in modo che
+		# più verificatori possano essere utilizzati contemporaneamente
 		self._TEMP_BASEPATH: str = path_join(
 			os_tempdir(),
 			"gentests_ai",
 			"correction",
-			"synt"
+			"synt",
+			f"chker_{timestamp}_{uuid4().hex}"
 		)
 		
 		os_dremove(self._TEMP_BASEPATH, ignore_errors=True)
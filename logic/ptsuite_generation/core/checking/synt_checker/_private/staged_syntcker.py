@@ -0,0 +1,63 @@
+from typing import List, Tuple
+from .. import ISyntacticChecker
+
+from ......utils.pipeline_stage import PipelineStage
+
+
+
+class StagedSyntacticChecker(ISyntacticChecker):
+	"""
+		Rappresenta un `ISyntacticChecker` che esegue le verifiche di un altro `ISyntacticChecker`
+		tramite uno stadio di pipeline (lo stadio "consumatore" che effettua le verifiche di correttezza)
+	"""
+	
+	def __init__(
+			self,
+			wrapped: ISyntacticChecker,
+			stage: PipelineStage
+	):
+		"""
+			Costruisce un nuovo StagedSyntacticChecker associandolo al verificatore da avvolgere
+			e allo stadio di pipeline tramite cui eseguirne le verifiche
+			
+			Parameters
+			----------
+				wrapped: ISyntacticChecker
+					Un oggetto `ISyntacticChecker` rappresentante il verificatore che effettuerà
+					realmente le verifiche
+					
+				stage: PipelineStage
+					Un oggetto `PipelineStage` rappresentante lo stadio tramite cui eseguire le verifiche
+					
+			Raises
+			------
+				ValueError
+					Si verifica se almeno uno tra `wrapped` e `stage` ha valore `None`
+		"""
+		if (wrapped is None) or (stage is None):
+			raise ValueError()
+		
+		self._wrapped: ISyntacticChecker = wrapped
+		self._stage: PipelineStage = stage
+	
+	
+	def check_synt(
+			self,
+			ptsuite_code: str
+	) -> Tuple[str, str]:
+		return self._stage.execute(
+			lambda: self._wrapped.check_synt(ptsuite_code)
+		)
+	
+	
+	def check_synt_errors(
+			self,
+			ptsuite_code: str
+	) -> List[Tuple[str, str]]:
+		return self._stage.execute(
+			lambda: self._wrapped.check_synt_errors(ptsuite_code)
+		)
+	
+	
+	def clear_resources(self):
+		self._wrapped.clear_resources()
@@ -0,0 +1,144 @@
+from typing import List, Set, Tuple, Optional
+from .inmem_syntcker import InMemorySyntChecker
+
+from threading import local as ThreadLocal
+
+from tree_sitter import (
+	Language, Parser,
+	Node as TreeNode
+)
+from tree_sitter_python import language as py_grammar
+
+
+
+class TreeSitterSyntChecker(InMemorySyntChecker):
+	"""
+		Rappresenta un `ISyntChecker` che, oltre a compilare ogni test-suite parziale dalla memoria
+		(come `InMemorySyntChecker`), ne individua tutti gli errori sintattici in un' unica analisi tramite
+		il parser, con recupero dagli errori, della libreria `tree-sitter` di Python.
+
+		L' esito della verifica è sempre quello della compilazione: il primo errore riportato è quello del
+		compilatore, seguito dai nodi "ERROR" e "MISSING" dell' albero sintattico che si trovano nelle linee
+		successive (al più un errore per linea, con lo stesso formato degli errori del compilatore).
+
+		Ogni thread utilizza il proprio parser, quindi lo stesso TreeSitterSyntChecker può essere utilizzato
+		da più threads contemporaneamente
+	"""
+
+	_PY_LANGUAGE: Language = Language(py_grammar())
+	# Lunghezza massima del testo di un nodo "ERROR" riportato nel messaggio dell' errore
+	_MAX_SNIPPET_LEN: int = 40
+
+	def __init__(self):
+		"""
+			Costruisce un nuovo TreeSitterSyntChecker
+		"""
+		super().__init__()
+
+		self._parsers: ThreadLocal = ThreadLocal()
+
+
+	def _p__check_synt_errors_spec(self, ptsuite_code: str) -> List[Tuple[str, str]]:
+		compile_error: Optional[Exception] = self._compile_error(ptsuite_code)
+		if compile_error is None:
+			return []
+
+		errors: List[Tuple[str, str]] = [self._format_error(ptsuite_code, compile_error)]
+		# Senza una linea dell' errore del compilatore gli errori successivi non sono individuabili
+		compile_line: Optional[int] = getattr(compile_error, "lineno", None)
+		if compile_line is None:
+			return errors
+
+		code_bytes: bytes = ptsuite_code.encode("utf-8")
+		code_lines: List[bytes] = code_bytes.splitlines(keepends=True)
+		reported: Set[int] = {compile_line}
+		for error_node in self._error_nodes(self._get_parser().parse(code_bytes).root_node):
+			error_line: int = error_node.start_point[0] + 1
+			# Gli errori precedenti a quello del compilatore non sono errori reali
+			if (error_line < compile_line) or (error_line in reported) or (error_line > len(code_lines)):
+				continue
+			reported.add(error_line)
+
+			errors.append(self._format_error(
+				ptsuite_code,
+				self._node_error(error_node, code_lines[error_line - 1])
+			))
+
+		return errors
+
+
+	def clear_resources(self):
+		"""
+			Non essendo utilizzata alcuna risorsa quest' operazione è equivalente ad una no-op
+		"""
+		pass
+
+
+	##	============================================================
+	##						PRIVATE METHODS
+	##	============================================================
+
+
+	def _get_parser(self) -> Parser:
+		"""
+			Restituisce il parser del thread chiamante, creandolo se non ancora creato
+		"""
+		parser: Parser = getattr(self._parsers, "parser", None)
+		if parser is None:
+			parser = Parser(self._PY_LANGUAGE)
+			self._parsers.parser = parser
+		return parser
+
+
+	@classmethod
+	def _error_nodes(cls, root: TreeNode) -> List[TreeNode]:
+		"""
+			Restituisce, in ordine di posizione, i nodi "MISSING" e i nodi "ERROR" più interni
+			dell' albero sintattico fornito (un nodo "ERROR" che contiene altri errori non viene riportato)
+		"""
+		found: List[TreeNode] = list()
+
+		nodes: List[TreeNode] = [root]
+		while len(nodes) > 0:
+			node: TreeNode = nodes.pop()
+			if node.is_missing:
+				found.append(node)
+			elif node.is_error and not any(
+				child.is_missing or child.has_error
+				for child in node.children
+			):
+				found.append(node)
+			elif node.has_error:
+				nodes.extend(reversed(node.children))
+
+		return found
+
+
+	@classmethod
+	def _node_error(
+			cls,
+			error_node: TreeNode,
+			line_bytes: bytes
+	) -> SyntaxError:
+		"""
+			Costruisce l' errore sintattico corrispondente al nodo "ERROR" o "MISSING" fornito,
+			data la linea di codice che lo contiene
+		"""
+		error_mess: str
+		if error_node.is_missing:
+			expected: str = error_node.type
+			error_mess = f"expected {expected!r}" if not error_node.is_named else f"expected {expected}"
+		else:
+			snippet: str = error_node.text.decode("utf-8", errors="replace").split("\n")[0].strip()
+			if len(snippet) > cls._MAX_SNIPPET_LEN:
+				snippet = f"{snippet[:cls._MAX_SNIPPET_LEN]}..."
+			error_mess = f"invalid syntax near {snippet!r}" if snippet != "" else "invalid syntax"
+
+		# Le colonne dei nodi sono in bytes, quelle degli errori sintattici in caratteri (a partire da 1)
+		column_bytes: int = error_node.start_point[1]
+		error_column: int = len(line_bytes[:column_bytes].decode("utf-8", errors="replace")) + 1
+		return SyntaxError(error_mess, (
+			cls._PTSUITE_FNAME,
+			error_node.start_point[0] + 1, error_column,
+			line_bytes.decode("utf-8", errors="replace")
+		))
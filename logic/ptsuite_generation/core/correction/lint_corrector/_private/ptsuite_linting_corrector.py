@@ -1,17 +1,5 @@
 from typing import Tuple
 
-from datetime import datetime as DateTime
-# ============== OS Utilities ============== #
-from os import (
-	makedirs as os_mkdirs,
-	remove as os_remove,
-)
-from os.path import exists as os_fdexists
-from tempfile import gettempdir as os_tempdir
-# ========================================== #
-# ============ Path Utilities ============ #
-from os.path import join as path_join
-# ======================================== #
 # ============= RegEx Utilities ============ #
 from regex import (
 	search as reg_search,
@@ -19,12 +7,11 @@ from regex import (
 	RegexFlag as RegexFlags
 )
 # ========================================== #
-from py_compile import (
-	compile as py_compile,
-	PycInvalidationMode as Pyc_InvMode,
-	PyCompileError
-)
 
+from ....checking.synt_checker import (
+	ISyntacticChecker,
+	SyntacticCheckerFactory, ESyntCheckerTool
+)
 from ....checking.lint_checker import LintingChecker
 
 from .....llm_access.llm_apiaccessor import ILlmApiAccessor
@@ -136,6 +123,8 @@ class PtsuiteLintingCorrector:
 		
 		# Verificatore di linting delle test-suite parziali
 		self._lint_chker: LintingChecker = lint_checker
+		# Verificatore sintattico (in memoria) della test-suite parziale iniziale
+		self._synt_chker: ISyntacticChecker = SyntacticCheckerFactory.create(ESyntCheckerTool.INMEMORY_COMPILE)
 		
 		# Logger da utilizzare per loggare gli steps di ogni tentativo
 		self._logger: ATemporalFormattLogger = logger
@@ -443,32 +432,8 @@ class PtsuiteLintingCorrector:
 					Si verifica se il codice della test-suite parziale data è incorretto
 					sintatticamente
 		"""
-		timestamp: str = str(int(DateTime.now().timestamp() * 1000))
-		temp_fname: str = f"temp_{timestamp}.py"
-		temp_basepath: str = path_join(
-			os_tempdir(),
-			"gentests_ai",
-			"correction",
-			"synt"
-		)
-		tempfile_path: str = path_join(temp_basepath, temp_fname)
-		
-		if not os_fdexists(temp_basepath):
-			os_mkdirs(temp_basepath)
-		with open(tempfile_path, "w") as fptsuite:
-			fptsuite.write(ptsuite_code)
-			fptsuite.flush()
-		try:
-			py_compile(
-				tempfile_path,
-				doraise=True,
-				invalidation_mode=Pyc_InvMode.TIMESTAMP
-			)
-		except PyCompileError:
-			os_remove(tempfile_path)
+		if len(self._synt_chker.check_synt(ptsuite_code)) > 0:
 			raise SyntacticallyIncorrectPtsuiteError()
-		
-		os_remove(tempfile_path)
 	
 	
 	def _is_linting_correct(self) -> bool:
@@ -476,7 +441,8 @@ class PtsuiteLintingCorrector:
 			Effettua la verifica di correttezza a livello di linting sull' ultima
 			test-suite parziale prodotta
 		"""
-		if len(self._lint_chker.check_lintically(self._last_corrpts).keys()) == 0:
+		# Interessa solo la correttezza, quindi la verifica si interrompe al primo errore
+		if len(self._lint_chker.check_lintically(self._last_corrpts, fail_fast=True).keys()) == 0:
 			return True
 		else:
 			return False
\ No newline at end of file
@@ -1,6 +1,8 @@
 from typing import List, Any
 from ._a_base_skipwriter import _ABaseSkipWriter
 
+from threading import Lock
+
 # ============== JSON Utilities ============== #
 from json import (
 	JSONEncoder,
@@ -51,6 +53,9 @@ class JsonListSkipWriter(_ABaseSkipWriter):
 		self._json_enc: JSONEncoder = JSONEncoder()
 		self._json_dec: JSONDecoder = JSONDecoder()
 		
+		# Lock che rende atomica la lettura-modifica-scrittura del file
+		self._file_lock: Lock = Lock()
+		
 		
 	def write_skipd_test(
 			self,
@@ -60,13 +65,14 @@ class JsonListSkipWriter(_ABaseSkipWriter):
 			raise ValueError()
 		
 		content: List[str]
-		with open(self._pf__get_skipdf_path(), "r") as fjson:
-			content = self._json_dec.decode(fjson.read())
-		
-		content.append(entity_name)
-		with open(self._pf__get_skipdf_path(), "w") as fjson:
-			fjson.write(self._json_enc.encode(content))
-			fjson.flush()
+		with self._file_lock:
+			with open(self._pf__get_skipdf_path(), "r") as fjson:
+				content = self._json_dec.decode(fjson.read())
+			
+			content.append(entity_name)
+			with open(self._pf__get_skipdf_path(), "w") as fjson:
+				fjson.write(self._json_enc.encode(content))
+				fjson.flush()
 	
 	
 	#	============================================================
@@ -2,4 +2,5 @@ from . import llm_api
 from . import llm_chat
 from . import llm_hyperparam
 from . import llm_specimpl
+from . import llm_respcache
 from . import llm_apiaccessor
\ No newline at end of file
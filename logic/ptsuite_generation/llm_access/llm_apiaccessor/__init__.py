@@ -1,3 +1,5 @@
 from . import exceptions
 from ._private.i_llm_apiaccessor import ILlmApiAccessor
-from ._factory.llm_apiaccessor_f import LlmApiAccessorFactory
\ No newline at end of file
+from ._private.i_async_llm_apiaccessor import IAsyncLlmApiAccessor
+from ._factory.llm_apiaccessor_f import LlmApiAccessorFactory
+from ._private.ollama_endpoints_pool import OllamaEndpointsPool
\ No newline at end of file
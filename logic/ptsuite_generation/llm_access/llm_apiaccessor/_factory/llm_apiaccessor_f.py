@@ -1,8 +1,15 @@
-from .. import ILlmApiAccessor
+from typing import List, Union
+from .. import ILlmApiAccessor, IAsyncLlmApiAccessor
 
 from .....utils.logger import ATemporalFormattLogger
+from .....utils.pipeline_stage import PipelineStage
+from ...llm_respcache import ILlmResponseCache
 
 from .._private.ollama_llmapiacc import OllamaLlmApiAccessor
+from .._private.async_ollama_llmapiacc import AsyncOllamaLlmApiAccessor
+from .._private.ollama_endpoints_pool import OllamaEndpointsPool
+from .._private.staged_llmapiacc import StagedLlmApiAccessor
+from .._private.cached_llmapiacc import CachedLlmApiAccessor
 
 
 
@@ -15,21 +22,24 @@ class LlmApiAccessorFactory:
 	@classmethod
 	def for_ollama(
 			cls,
-			address: str,
+			address: Union[str, List[str], OllamaEndpointsPool],
 	        auth: str,
 	        conn_timeout: int,
 	        logger: ATemporalFormattLogger = None,
 	        log_resp: bool = False,
-	        logger_sep: str = "\n"
+	        logger_sep: str = "\n",
+	        stop_format: str = None
 	) -> ILlmApiAccessor:
 		"""
 			Istanzia un nuovo accessor per la piattaforma di inferenza "Ollama"
 			
 			Parameters
 			----------
-				address: str
+				address: Union[str, List[str], OllamaEndpointsPool]
 					Una stringa contenente l' indirizzo (URL assoluto, IPv4 o IPv6) che identifica
-					il server su cui è ospitata la piattaforma di inferenza
+					il server su cui è ospitata la piattaforma di inferenza.
+					In alternativa una lista di indirizzi, oppure un `OllamaEndpointsPool` (da condividere
+					con altri accessors), contenente i servers su cui distribuire le richieste
 					
 				auth: str
 					Una stringa contenente le credenziali di accesso, come coppia `user:token`,
@@ -52,6 +62,11 @@ class LlmApiAccessorFactory:
 					Opzionale. Default = `False`. Un booleano che indica se è necessario loggare anche
 					i "chunks" della risposta che vengono ricevuti
 					
+				stop_format: str
+					Opzionale. Default = `None`. Una stringa RegEx contenente il formato la cui prima corrispondenza
+					completa nella risposta ne determina l' interruzione anticipata. Se non fornito la risposta viene
+					ricevuta interamente
+					
 			Returns
 			-------
 				ILlmApiAccessor
@@ -64,13 +79,140 @@ class LlmApiAccessorFactory:
 					Si verifica se:
 						
 						- Almeno uno tra `address` e `auth` hanno valore `None`
+						- Il parametro `address` è una lista vuota o contenente indirizzi `None` o duplicati
 						- Il parametro `log_resp` ha valore `True` ma non è stato fornito un logger
 		"""
 		return OllamaLlmApiAccessor(
 			address, auth,
 			conn_timeout,
-			logger, log_resp, logger_sep
+			logger, log_resp, logger_sep,
+			stop_format
 		)
+	
+	
+	@classmethod
+	def for_ollama_async(
+			cls,
+			address: Union[str, List[str], OllamaEndpointsPool],
+	        auth: str,
+	        conn_timeout: int,
+	        logger: ATemporalFormattLogger = None,
+	        logger_sep: str = "\n"
+	) -> IAsyncLlmApiAccessor:
+		"""
+			Istanzia un nuovo accessor asincrono per la piattaforma di inferenza "Ollama"
+			
+			Parameters
+			----------
+				address: Union[str, List[str], OllamaEndpointsPool]
+					Una stringa contenente l' indirizzo (URL assoluto, IPv4 o IPv6) che identifica
+					il server su cui è ospitata la piattaforma di inferenza.
+					In alternativa una lista di indirizzi, oppure un `OllamaEndpointsPool` (da condividere
+					con altri accessors), contenente i servers su cui distribuire le richieste
+					
+				auth: str
+					Una stringa contenente le credenziali di accesso, come coppia `user:token`,
+					da utilizzare per le interazioni
+					
+				conn_timeout: int
+					Un intero rappresentante il timeout in millisecondi dopo il quale
+					dichiarare un tentativo di connessione fallito
+					
+				logger: ATemporalFormattLogger
+					Opzionale. Default = `None`. Un oggetto `ATemporalFormattableLogger` rappresentante
+					il logger da utilizzare per registrare i passaggi effettuati dall' accessor
+					durante ogni richiesta effettuata
+					
+				logger_sep: str
+					Opzionale. Default = `\\n`. Una stringa contenente il separatore da utilizzare per i
+					messaggi di logging che verranno registrati.
+					
+			Returns
+			-------
+				IAsyncLlmApiAccessor
+					Un oggetto `IAsyncLlmApiAccessor` che permette l' accesso asincrono alla piattaforma
+					di inferenza "Ollama"
+					
+			Raises
+			------
+				ValueError
+					Si verifica se:
+						
+						- Almeno uno tra `address` e `auth` hanno valore `None`
+						- Il parametro `address` è una lista vuota o contenente indirizzi `None` o duplicati
+		"""
+		return AsyncOllamaLlmApiAccessor(
+			address, auth,
+			conn_timeout,
+			logger, logger_sep
+		)
+	
+	
+	@classmethod
+	def staged(
+			cls,
+			accessor: ILlmApiAccessor,
+			stage: PipelineStage
+	) -> ILlmApiAccessor:
+		"""
+			Istanzia un nuovo accessor che esegue le richieste dell' accessor fornito
+			tramite lo stadio di pipeline indicato
+			
+			Parameters
+			----------
+				accessor: ILlmApiAccessor
+					Un oggetto `ILlmApiAccessor` rappresentante l' accessor che effettuerà
+					realmente le richieste
+					
+				stage: PipelineStage
+					Un oggetto `PipelineStage` rappresentante lo stadio tramite cui eseguire
+					le richieste
+					
+			Returns
+			-------
+				ILlmApiAccessor
+					Un oggetto `ILlmApiAccessor` le cui richieste vengono eseguite dallo
+					stadio di pipeline fornito
+					
+			Raises
+			------
+				ValueError
+					Si verifica se almeno uno tra `accessor` e `stage` ha valore `None`
+		"""
+		return StagedLlmApiAccessor(accessor, stage)
+	
+	
+	@classmethod
+	def cached(
+			cls,
+			accessor: ILlmApiAccessor,
+			resp_cache: ILlmResponseCache
+	) -> ILlmApiAccessor:
+		"""
+			Istanzia un nuovo accessor che cerca le risposte delle richieste nella cache fornita,
+			effettuandole tramite l' accessor indicato solo se non presenti
+			
+			Parameters
+			----------
+				accessor: ILlmApiAccessor
+					Un oggetto `ILlmApiAccessor` rappresentante l' accessor che effettuerà
+					realmente le richieste non presenti nella cache
+					
+				resp_cache: ILlmResponseCache
+					Un oggetto `ILlmResponseCache` rappresentante la cache delle risposte
+					
+			Returns
+			-------
+				ILlmApiAccessor
+					Un oggetto `ILlmApiAccessor` le cui risposte vengono memorizzate, e cercate,
+					nella cache fornita
+					
+			Raises
+			------
+				ValueError
+					Si verifica se almeno uno tra `accessor` e `resp_cache` ha valore `None`
+		"""
+		return CachedLlmApiAccessor(accessor, resp_cache)
 		
 		
 	##	============================================================
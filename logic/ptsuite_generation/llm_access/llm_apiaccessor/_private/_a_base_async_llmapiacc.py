@@ -0,0 +1,118 @@
+from typing import List
+from abc import abstractmethod
+from .. import IAsyncLlmApiAccessor
+from ._a_llmapiacc_settings import _ALlmApiAccessorSettings
+
+from ...llm_chat import ILlmChat
+from ...llm_hyperparam import ILlmHyperParam
+from ...llm_specimpl import ILlmSpecImpl
+
+from ..exceptions import (
+	ChatNeverSelectedError,
+	ModelNotSelectedError
+)
+
+
+
+class _ABaseAsyncLlmApiAccessor(_ALlmApiAccessorSettings, IAsyncLlmApiAccessor):
+	"""
+		Rappresenta un `IAsyncLlmApiAccessor` di base, ovvero che contiene la logica
+		di controllo comune ad ogni `IAsyncLlmApiAccessor`.
+		
+		La specifica API a cui è legato ogni oggetto IAsyncLlmApiAccessor è descritta dai discendenti di
+		questa classe astratta.
+	"""
+	
+	def __init__(self):
+		"""
+			Costruisce un nuovo _ABaseAsyncLlmApiAccessor
+		"""
+		super().__init__()
+	
+	
+	async def prompt(
+			self,
+			timeout: int
+	) -> str:
+		if self._chat is None:
+			raise ChatNeverSelectedError()
+		if self._model is None:
+			raise ModelNotSelectedError()
+		if timeout < 1:
+			raise ValueError()
+		
+		response: str = await self._ap__prompt_spec(
+			self._chat,
+			self._model,
+			list(self._hparams),
+			timeout
+		)
+		self._chat.add_response(response)
+		
+		return response
+	
+	
+	#	============================================================
+	#						ABSTRACT METHODS
+	#	============================================================
+
+
+	@abstractmethod
+	async def _ap__prompt_spec(
+			self,
+			chat: ILlmChat,
+			model: ILlmSpecImpl,
+			hparams: List[ILlmHyperParam],
+			timeout: int
+	) -> str:
+		"""
+			Effettua, in modo asincrono, una singola interazione tramite l' API specifica con il modello
+			selezionato. Allo scadere di `timeout` la richiesta deve essere cancellata.
+			
+			E' garantito all' interno di questo metodo:
+				- Che `timeout >= 1`
+				- Che il modello `model` sia accettato dall' API
+				- Che ogni iperparametro di `hparams` è valido per il modello `model`
+
+			Parameters
+			----------
+				chat: ILlmChat
+					Un oggetto `ILlmChat` rappresentante la chat da utilizzare per effettuare
+					l' interazione con il modello
+					
+				model: ILlmSpecImpl
+					Un oggetto `ILlmSpecImpl` rappresentante il LLM con cui effettuare l'interazione
+					
+				hparams: List[ILlmHyperParam]
+					Un oggetto `ILlmHyperParam` rappresentante l' elenco di iperparametri da utilizzare
+					in questa interazione
+					
+				timeout: int
+					Un intero rappresentante il timeout in millisecondi dopo il quale
+					cancellare la richiesta e dichiarare la risposta fallita
+				
+			Returns
+			-------
+				str
+					Una stringa contenente la risposta del modello all' interazione effettuata
+
+			Raises
+			------
+				InvalidPromptError
+					Si verifica se il prompt di richiesta è invalido per l' API rappresentata
+					
+				ApiConnectionError
+					Si verifica se avviene un errore di connessione con la piattaforma di inferenza
+					(con `args[0]` uguale a "timeout" oppure "other")
+				
+				ResponseTimedOutError
+					Si verifica se scatta il tempo `timeout` indicato prima del termine della risposta
+					
+				ApiResponseError
+					Si verifica se la richiesta fornita all' API produce un errore di risposta
+					(con `args[0]` uguale a "known" oppure "unknown")
+					
+				SaturatedContextWindowError
+					Si verifica se viene saturata la finestra di contesto durante l' interazione
+		"""
+		pass
@@ -0,0 +1,127 @@
+from typing import List, Set
+from abc import ABC, abstractmethod
+
+from ...llm_api import ILlmApi
+from ...llm_chat import ILlmChat
+from ...llm_hyperparam import ILlmHyperParam
+from ...llm_hyperparam.id import ILlmHyperParamId
+from ...llm_specimpl import ILlmSpecImpl
+
+from ..exceptions import (
+	ChatNeverSelectedError,
+	ModelNotSelectedError,
+	IncompatibleApiError,
+	IncompatibleHyperparamError,
+	HyperparamNotExistsError,
+	HyperparamAlreadyExistsError
+)
+
+
+
+class _ALlmApiAccessorSettings(ABC):
+	"""
+		Rappresenta la logica di controllo, comune ad ogni accessor (sincrono o asincrono), relativa
+		alle impostazioni delle interazioni: la chat, il modello selezionato e i suoi iperparametri.
+		
+		La specifica API a cui è legato ogni accessor è descritta dai discendenti di
+		questa classe astratta.
+	"""
+	
+	def __init__(self):
+		"""
+			Costruisce un nuovo _ALlmApiAccessorSettings
+		"""
+		self._erase_chat: bool = False
+		self._model: ILlmSpecImpl = None
+		self._hparams: List[ILlmHyperParam] = list()
+		self._repr_api: ILlmApi = None
+		self._chat: ILlmChat = None
+	
+	
+	def set_chat(
+			self,
+			chat: ILlmChat,
+			erase_now: bool = True,
+			erase_model: bool = True
+	):
+		if chat is None:
+			raise ValueError()
+		
+		if self._repr_api is None:
+			self._repr_api = self._ap__accepted_api()
+		if self._repr_api not in chat.compat_apis():
+			raise IncompatibleApiError()
+		
+		self._chat = chat
+		if erase_now:
+			self._chat.clear()
+		self._erase_chat = erase_model
+	
+	
+	def select_model(
+			self,
+			model: ILlmSpecImpl
+	):
+		if model is None:
+			raise ValueError()
+		if self._chat is None:
+			raise ChatNeverSelectedError()
+		if self._repr_api not in model.compat_apis():
+			raise IncompatibleApiError()
+		
+		self._model = model
+		self._hparams.clear()
+		if self._erase_chat:
+			self._chat.clear()
+	
+	
+	def add_hyperparam(self, hparam: ILlmHyperParam):
+		if hparam is None:
+			raise ValueError()
+		if self._chat is None:
+			raise ChatNeverSelectedError()
+		if self._model is None:
+			raise ModelNotSelectedError()
+		if self._model.model_hyperparams().intersection({hparam.param_id()}) == {}:
+			raise IncompatibleHyperparamError()
+		
+		set_ids: Set[ILlmHyperParamId] = {hparam_c.param_id() for hparam_c in self._hparams}
+		if hparam.param_id() in set_ids:
+			raise HyperparamAlreadyExistsError()
+		
+		self._hparams.append(hparam)
+	
+	
+	def remove_hyperparam(self, hparam: ILlmHyperParam):
+		if hparam is None:
+			raise ValueError()
+		if self._chat is None:
+			raise ChatNeverSelectedError()
+		if self._model is None:
+			raise ModelNotSelectedError()
+		
+		list_ids: List[ILlmHyperParamId] = [hparam_c.param_id() for hparam_c in self._hparams]
+		if hparam.param_id() not in list_ids:
+			raise HyperparamNotExistsError()
+		
+		to_remove: int = list_ids.index(hparam.param_id())
+		self._hparams.pop(to_remove)
+	
+	
+	#	============================================================
+	#						ABSTRACT METHODS
+	#	============================================================
+	
+	
+	@abstractmethod
+	def _ap__accepted_api(self) -> ILlmApi:
+		"""
+			Restituisce l' oggetto che identifica dell' API associata a questo ILlmApiAccessor.
+			
+			Returns
+			-------
+				ILlmApi
+					Un oggetto `ILlmApi` rappresentante l' identificativo dell' API
+					associata a questo ILlmApiAccessor
+		"""
+		pass
@@ -0,0 +1,326 @@
+from typing import List, Dict, Tuple, AsyncIterator, Any, Union
+from ._a_base_async_llmapiacc import _ABaseAsyncLlmApiAccessor
+from .ollama_endpoints_pool import OllamaEndpointsPool
+
+from base64 import b64encode as b64_encode
+from ollama import (
+	AsyncClient as OllamaAsyncClient,
+	ChatResponse,
+	ResponseError as OllamaApiResponseError
+)
+# ============ Asyncio Utilities ============ #
+from asyncio import (
+	wait_for as aio_wait_for,
+	TimeoutError as AioTimeoutError
+)
+# =========================================== #
+from httpx import (
+	Timeout as HttpxTimeout,
+	TimeoutException as HttpxTimeoutError,
+	ConnectTimeout as HttpxConnectTimeoutError,
+	ConnectError as HttpxConnectError
+)
+
+from ...llm_api import (
+	ILlmApi,
+	OllamaApi
+)
+from ...llm_chat import ILlmChat
+from ...llm_hyperparam.id import (
+	ILlmHyperParamId,
+	LlmHyperParamIdFactoryResolver,
+)
+from ...llm_hyperparam import ILlmHyperParam
+from ...llm_specimpl import ILlmSpecImpl
+
+from .....utils.logger import ATemporalFormattLogger
+from .....utils.logger.exceptions import FormatNotSetError
+
+from ..exceptions import (
+	ApiConnectionError,
+	ApiResponseError,
+	ResponseTimedOutError,
+	SaturatedContextWindowError
+)
+
+
+
+class AsyncOllamaLlmApiAccessor(_ABaseAsyncLlmApiAccessor):
+	"""
+		Rappresenta un `IAsyncLlmApiAccessor` per la piattaforma di inferenza "Ollama".
+
+		Le richieste possono essere distribuite su più servers Ollama tramite un `OllamaEndpointsPool`,
+		eventualmente condiviso con altri accessors (anche sincroni). Per ogni server viene mantenuto
+		un unico client HTTP asincrono, legato all' event loop in cui viene effettuata la prima
+		richiesta verso di esso.
+
+		Vengono loggati i seguenti step dell' intera fase di richiesta al LLM:
+			- Inizio della richiesta (con il server scelto)
+			- Fine della risposta, oppure la sua cancellazione
+			- Numero di tokens del prompt valutati dal server (esclusi quelli riutilizzati dalla sua KV-cache)
+			  e durata della loro valutazione
+
+		I "chunks" della risposta non vengono loggati, poichè le risposte di più richieste
+		contemporanee risulterebbero mescolate.
+	"""
+
+	def __init__(
+			self,
+			address: Union[str, List[str], OllamaEndpointsPool],
+			auth: str,
+			conn_timeout: int,
+			logger: ATemporalFormattLogger = None,
+			logger_sep: str = "\n",
+	):
+		"""
+			Costruisce un nuovo AsyncOllamaLlmApiAccessor
+
+			Parameters
+			----------
+				address: Union[str, List[str], OllamaEndpointsPool]
+					Una stringa contenente l' indirizzo (URL assoluto, IPv4 o IPv6) che identifica
+					il server Ollama su cui è ospitata la piattaforma di inferenza.
+					In alternativa una lista di indirizzi, oppure un `OllamaEndpointsPool` (da condividere
+					con altri accessors), contenente i servers su cui distribuire le richieste
+
+				auth: str
+					Una stringa contenente le credenziali di accesso, come coppia `user:token`,
+					da utilizzare per le interazioni
+
+				conn_timeout: int
+					Un intero rappresentante il timeout in millisecondi dopo il quale
+					dichiarare un tentativo di connessione fallito
+
+				logger: ATemporalFormattLogger
+					Opzionale. Default = `None`. Un oggetto `ATemporalFormattableLogger` rappresentante
+					il logger da utilizzare per registrare i passaggi effettuati da questo AsyncOllamaLlmApiAccessor
+					durante ogni richiesta effettuata
+
+				logger_sep: str
+					Opzionale. Default = `\\n`. Una stringa contenente il separatore da utilizzare per i
+					messaggi di logging che verranno registrati.
+
+			Raises
+			------
+				ValueError
+					Si verifica se:
+
+						- Almeno uno tra `address` e `auth` hanno valore `None`
+						- Il parametro `address` è una lista vuota o contenente indirizzi `None` o duplicati
+		"""
+		super().__init__()
+
+		self._logger: ATemporalFormattLogger = logger
+		if logger is not None:
+			self._logger_sep = logger_sep if logger_sep is not None else "\n"
+
+		if (address is None) or (auth is None):
+			raise ValueError()
+
+		self._o_endpoints: OllamaEndpointsPool
+		if isinstance(address, OllamaEndpointsPool):
+			self._o_endpoints = address
+		elif isinstance(address, str):
+			self._o_endpoints = OllamaEndpointsPool([address])
+		else:
+			self._o_endpoints = OllamaEndpointsPool(list(address))
+		self._o_auth: str = b64_encode(auth.encode()).decode()
+		self._conn_tout: HttpxTimeout = HttpxTimeout(
+			None, connect=int(conn_timeout) / 1000.0
+		)
+
+		# Clients HTTP asincroni verso i servers Ollama, creati al primo utilizzo di ogni server
+		self._o_clients: Dict[str, OllamaAsyncClient] = dict()
+
+		self._think_param: ILlmHyperParamId = LlmHyperParamIdFactoryResolver.resolve("ollama").create("think")
+		self._numctx_param: ILlmHyperParamId = LlmHyperParamIdFactoryResolver.resolve("ollama").create("context_window")
+
+
+	async def aclose(self):
+		"""
+			Chiude i clients HTTP asincroni di questo AsyncOllamaLlmApiAccessor.
+			Deve essere invocato nello stesso event loop in cui sono state effettuate le richieste
+		"""
+		o_addrs: List[str] = list(self._o_clients.keys())
+		for o_addr in o_addrs:
+			await self._discard_client(o_addr)
+
+
+	async def _ap__prompt_spec(
+			self,
+			chat: ILlmChat,
+			model: ILlmSpecImpl,
+			hparams: List[ILlmHyperParam],
+			timeout: int,
+	) -> str:
+		options_param: Dict[str, Any] = {
+			hparam.param_id().id(): hparam.to_effvalue()
+			for hparam in hparams
+		}
+		think_param: bool = options_param.pop(self._think_param.id())
+		num_ctx_param: int = options_param[self._numctx_param.id()]
+		resp_timeout: float = timeout / 1000.0
+
+		if self._logger is not None:
+			try:
+				self._logger.set_format(self._logger.unset_format())
+			except FormatNotSetError:
+				self._logger.set_format(
+					"[LLM REQUEST (Ollama, async)] {message} ( {day}-{month}-{year} | {hour}:{min}:{second} )"
+				)
+			self._logger.set_messages_sep(self._logger_sep)
+
+		# Scelta del server a cui inviare la richiesta
+		model_name: str = model.model_name()
+		o_addr: str = self._o_endpoints.acquire(model_name)
+		self._logger.log(f'Richiesta asincrona a Ollama ("{o_addr}") ...') if self._logger is not None else None
+
+		full_response: str
+		prompt_tokens: int
+		resp_tokens: int
+		eval_duration: int
+		try:
+			full_response, (prompt_tokens, resp_tokens, eval_duration) = await aio_wait_for(
+				self._prompt_endpoint(
+					o_addr, chat, model_name,
+					options_param, think_param
+				),
+				resp_timeout
+			)
+		except AioTimeoutError as aio_tout_err:
+			# La richiesta è stata cancellata da `wait_for(...)` e la risposta parziale chiusa
+			self._o_endpoints.release(o_addr, model_name)
+			self._logger.log("Risposta cancellata per timeout.") if self._logger is not None else None
+			raise ResponseTimedOutError() from aio_tout_err
+		except ApiConnectionError:
+			self._o_endpoints.eject(o_addr)
+			await self._discard_client(o_addr)
+			self._logger.log(f'Server Ollama "{o_addr}" escluso temporaneamente.') if self._logger is not None else None
+			raise
+		except BaseException:
+			# Include la cancellazione della coroutine dall' esterno
+			self._o_endpoints.release(o_addr, model_name)
+			raise
+		self._o_endpoints.release(o_addr, model_name, resp_tokens, eval_duration)
+		self._logger.log("Fine della risposta.") if self._logger is not None else None
+
+		if (prompt_tokens + resp_tokens) >= num_ctx_param:
+			raise SaturatedContextWindowError()
+
+		return full_response
+
+
+	def _ap__accepted_api(self) -> ILlmApi:
+		return OllamaApi()
+
+
+	##	============================================================
+	##						PRIVATE METHODS
+	##	============================================================
+
+
+	async def _prompt_endpoint(
+			self,
+			o_addr: str,
+			chat: ILlmChat,
+			model_name: str,
+			options_param: Dict[str, Any],
+			think_param: bool
+	) -> Tuple[str, Tuple[int, int, int]]:
+		"""
+			Effettua la richiesta al server Ollama fornito, restituendo la risposta completa
+			insieme al numero di tokens del prompt, al numero di tokens della risposta e al tempo
+			(in nanosecondi) impiegato per generarla.
+
+			Se la coroutine viene cancellata la risposta ancora in corso viene chiusa
+
+			Raises
+			------
+				ApiConnectionError
+					Si verifica se non è possibile connettersi al server fornito
+		"""
+		oll_client: OllamaAsyncClient = self._get_client(o_addr)
+
+		prompt_tokens: int = -1
+		resp_tokens: int = -1
+		eval_duration: int = -1
+		prompt_eval_duration: int = -1
+		resp_parts: List[str] = list()
+		response_iter: AsyncIterator[ChatResponse] = None
+		try:
+			response_iter = await oll_client.chat(
+				model_name,
+				chat.chat_messages(),
+				options=options_param,
+				stream=True,
+				think=think_param,
+			)
+			async for chunk in response_iter:
+				resp_parts.append(chunk['message']['content'])
+
+				# Se è arrivato alla fine
+				if "eval_count" in chunk:
+					resp_tokens = chunk["eval_count"]
+					prompt_tokens = chunk["prompt_eval_count"]
+					eval_duration = chunk.get("eval_duration", None) or -1
+					prompt_eval_duration = chunk.get("prompt_eval_duration", None) or -1
+		except HttpxConnectTimeoutError as httpx_tout_error:
+			gensai_exc: ApiConnectionError = ApiConnectionError()
+			gensai_exc.args = ("timeout",) + httpx_tout_error.args
+			raise gensai_exc from httpx_tout_error
+		except (HttpxConnectError, ConnectionError) as ollama_err:
+			gensai_exc: ApiConnectionError = ApiConnectionError()
+			gensai_exc.args = ("other",) + ollama_err.args
+			raise gensai_exc from ollama_err
+		except HttpxTimeoutError as httpx_tout_err:
+			gensai_exc: ResponseTimedOutError = ResponseTimedOutError()
+			gensai_exc.args = httpx_tout_err.args
+			raise gensai_exc from httpx_tout_err
+		except OllamaApiResponseError as ollama_err:
+			gensai_exc: ApiResponseError = ApiResponseError()
+			gensai_exc.args = ("known",) + ollama_err.args
+			raise gensai_exc from ollama_err
+		finally:
+			# Chiusura esplicita dello stream (necessaria in caso di cancellazione)
+			if (response_iter is not None) and hasattr(response_iter, "aclose"):
+				await response_iter.aclose()
+
+		full_response: str = "".join(resp_parts)
+		if ((prompt_tokens == -1) or (resp_tokens == -1) or
+			(full_response == "")):
+			gensai_exc: ApiResponseError = ApiResponseError()
+			gensai_exc.args = ("unknown",) + (str(prompt_tokens), str(resp_tokens), full_response)
+			raise gensai_exc
+
+		self._logger.log(
+			f'Prompt valutato da "{o_addr}": {prompt_tokens} tokens in {prompt_eval_duration / 1e6:.0f} ms.'
+		) if self._logger is not None else None
+
+		return full_response, (prompt_tokens, resp_tokens, eval_duration)
+
+
+	def _get_client(self, o_addr: str) -> OllamaAsyncClient:
+		"""
+			Restituisce il client HTTP asincrono relativo al server Ollama fornito, creandolo se
+			non ancora esistente
+		"""
+		if o_addr not in self._o_clients:
+			self._o_clients[o_addr] = OllamaAsyncClient(
+				host=o_addr,
+				headers={ 'Authorization': f'Basic {self._o_auth}' },
+				timeout=self._conn_tout
+			)
+		return self._o_clients[o_addr]
+
+
+	async def _discard_client(self, o_addr: str):
+		"""
+			Chiude e rimuove il client HTTP asincrono relativo al server Ollama fornito, in modo
+			che al prossimo utilizzo vengano instaurate nuove connessioni
+		"""
+		oll_client: OllamaAsyncClient = self._o_clients.pop(o_addr, None)
+		if oll_client is not None:
+			try:
+				await oll_client._client.aclose()
+			except Exception:
+				pass
@@ -0,0 +1,123 @@
+from typing import Dict, Any
+from .. import ILlmApiAccessor
+
+# ============ Hashing Utilities ============ #
+from hashlib import sha256
+from json import dumps as json_dumps
+# =========================================== #
+
+from ...llm_chat import ILlmChat
+from ...llm_hyperparam import ILlmHyperParam
+from ...llm_specimpl import ILlmSpecImpl
+from ...llm_respcache import ILlmResponseCache
+
+
+
+class CachedLlmApiAccessor(ILlmApiAccessor):
+	"""
+		Rappresenta un `ILlmApiAccessor` che, prima di effettuare una richiesta tramite un altro
+		`ILlmApiAccessor`, ne cerca la risposta in una cache delle risposte dei LLMs.
+
+		La chiave di ogni richiesta è il digest SHA-256 del nome del modello selezionato, dei valori
+		effettivi degli iperparametri aggiunti e dell' intera chat di messaggi. Le risposte trovate nella
+		cache vengono aggiunte alla chat come se fossero state appena ricevute.
+
+		Ogni operazione diversa da `.prompt(...)` è delegata direttamente all' accessor avvolto
+	"""
+
+	def __init__(
+			self,
+			wrapped: ILlmApiAccessor,
+			resp_cache: ILlmResponseCache
+	):
+		"""
+			Costruisce un nuovo CachedLlmApiAccessor associandolo all' accessor da avvolgere
+			e alla cache delle risposte da utilizzare
+
+			Parameters
+			----------
+				wrapped: ILlmApiAccessor
+					Un oggetto `ILlmApiAccessor` rappresentante l' accessor che effettuerà
+					realmente le richieste non presenti nella cache
+
+				resp_cache: ILlmResponseCache
+					Un oggetto `ILlmResponseCache` rappresentante la cache delle risposte
+
+			Raises
+			------
+				ValueError
+					Si verifica se almeno uno tra `wrapped` e `resp_cache` ha valore `None`
+		"""
+		if (wrapped is None) or (resp_cache is None):
+			raise ValueError()
+
+		self._wrapped: ILlmApiAccessor = wrapped
+		self._resp_cache: ILlmResponseCache = resp_cache
+
+		# Impostazioni correnti delle interazioni (necessarie per il calcolo delle chiavi)
+		self._chat: ILlmChat = None
+		self._model: ILlmSpecImpl = None
+		self._hparams: Dict[str, Any] = dict()
+
+
+	def set_chat(
+			self,
+			chat: ILlmChat,
+			erase_now: bool = True,
+			erase_model: bool = True
+	):
+		self._wrapped.set_chat(chat, erase_now, erase_model)
+		self._chat = chat
+
+
+	def select_model(self, model: ILlmSpecImpl):
+		self._wrapped.select_model(model)
+		self._model = model
+		self._hparams.clear()
+
+
+	def add_hyperparam(self, hparam: ILlmHyperParam):
+		self._wrapped.add_hyperparam(hparam)
+		self._hparams[hparam.param_id().id()] = hparam.to_effvalue()
+
+
+	def remove_hyperparam(self, hparam: ILlmHyperParam):
+		self._wrapped.remove_hyperparam(hparam)
+		self._hparams.pop(hparam.param_id().id(), None)
+
+
+	def prompt(self, timeout: int) -> str:
+		# Le condizioni di errore (chat o modello non impostati) sono verificate dall' accessor avvolto
+		if (self._chat is None) or (self._model is None):
+			return self._wrapped.prompt(timeout)
+
+		req_key: str = self._request_key()
+		response: str = self._resp_cache.get_response(req_key)
+		if response is not None:
+			self._chat.add_response(response)
+			return response
+
+		response = self._wrapped.prompt(timeout)
+		self._resp_cache.put_response(req_key, response)
+		return response
+
+
+	##	============================================================
+	##						PRIVATE METHODS
+	##	============================================================
+
+
+	def _request_key(self) -> str:
+		"""
+			Calcola la chiave della richiesta corrente a partire dal modello selezionato,
+			dagli iperparametri aggiunti e dalla chat di messaggi
+		"""
+		req_repr: str = json_dumps(
+			[
+				self._model.model_name(),
+				self._hparams,
+				self._chat.chat_messages()
+			],
+			sort_keys=True, ensure_ascii=False, default=str
+		)
+		return sha256(req_repr.encode("utf-8")).hexdigest()
@@ -0,0 +1,287 @@
+from typing import List, Dict
+
+# ============ Concurrency Utilities ============ #
+from threading import Lock
+# =============================================== #
+from time import monotonic as time_monotonic
+
+
+
+class _OllamaEndpointState:
+	"""
+		Rappresenta lo stato, osservato dal pool, di un singolo server Ollama
+	"""
+
+	def __init__(self, address: str):
+		self.address: str = address
+		# Numero di richieste attualmente in corso verso il server
+		self.in_flight: int = 0
+		# Stima (media mobile esponenziale) dei tokens/s generati dal server
+		self.tokens_sec: float = None
+		# Istante (monotonic) dell' ultima risposta ottenuta per ogni modello
+		self.models_seen: Dict[str, float] = dict()
+		# Istante (monotonic) fino al quale il server è escluso dalle richieste
+		self.ejected_until: float = 0.0
+		self.consec_failures: int = 0
+
+
+
+class OllamaEndpointsPool:
+	"""
+		Rappresenta un insieme di servers Ollama su cui distribuire le richieste di più
+		`OllamaLlmApiAccessor`.
+
+		Ad ogni richiesta viene scelto il server ritenuto più conveniente considerando:
+
+			- Se il modello richiesto è già caricato nel server (ovvero se vi è stato utilizzato di recente)
+			- Il numero di richieste attualmente in corso verso il server
+			- La velocità di generazione (in tokens/s) osservata nelle risposte precedenti del server
+
+		I servers che falliscono la connessione vengono esclusi temporaneamente dal pool, per un
+		tempo che raddoppia ad ogni fallimento consecutivo.
+
+		Un OllamaEndpointsPool può essere condiviso tra più threads
+	"""
+
+	# Fattore di penalità applicato ai servers che non hanno il modello richiesto già caricato
+	_COLD_MODEL_PENALTY: float = 2.0
+	# Peso delle nuove osservazioni nella stima dei tokens/s
+	_TPS_SMOOTHING: float = 0.3
+
+	def __init__(
+			self,
+			addresses: List[str],
+			eject_time: int = 30000,
+			max_eject_time: int = 300000,
+			keep_alive: int = 300000
+	):
+		"""
+			Costruisce un nuovo OllamaEndpointsPool contenente i servers forniti
+
+			Parameters
+			----------
+				addresses: List[str]
+					Una lista di stringhe contenente gli indirizzi (URL assoluti, IPv4 o IPv6) dei
+					servers Ollama su cui distribuire le richieste
+
+				eject_time: int
+					Opzionale. Default = `30000`. Un intero rappresentante il tempo in millisecondi per
+					cui escludere un server dopo il suo primo fallimento di connessione
+
+				max_eject_time: int
+					Opzionale. Default = `300000`. Un intero rappresentante il tempo massimo in millisecondi
+					per cui un server può essere escluso
+
+				keep_alive: int
+					Opzionale. Default = `300000`. Un intero rappresentante il tempo in millisecondi per cui
+					un modello resta caricato in un server dopo il suo ultimo utilizzo
+
+			Raises
+			------
+				ValueError
+					Si verifica se:
+
+						- Il parametro `addresses` ha valore `None`, è una lista vuota o contiene
+						  indirizzi `None` o duplicati
+						- Almeno uno tra `eject_time`, `max_eject_time` e `keep_alive` non è positivo
+		"""
+		if (addresses is None) or (len(addresses) == 0):
+			raise ValueError()
+		if (None in addresses) or (len(set(addresses)) != len(addresses)):
+			raise ValueError()
+		if (eject_time <= 0) or (max_eject_time <= 0) or (keep_alive <= 0):
+			raise ValueError()
+
+		self._endpoints: List[_OllamaEndpointState] = [
+			_OllamaEndpointState(address) for address in addresses
+		]
+		self._eject_time: float = eject_time / 1000.0
+		self._max_eject_time: float = max_eject_time / 1000.0
+		self._keep_alive: float = keep_alive / 1000.0
+		self._lock: Lock = Lock()
+
+
+	def addresses(self) -> List[str]:
+		"""
+			Restituisce gli indirizzi dei servers di questo pool
+
+			Returns
+			-------
+				List[str]
+					Una lista di stringhe contenente gli indirizzi dei servers, nell' ordine fornito
+		"""
+		return [endpoint.address for endpoint in self._endpoints]
+
+
+	def acquire(self, model_name: str) -> str:
+		"""
+			Sceglie il server a cui inviare la prossima richiesta per il modello fornito,
+			registrandola come in corso.
+
+			Se tutti i servers sono esclusi viene scelto quello la cui esclusione termina prima
+
+			Parameters
+			----------
+				model_name: str
+					Una stringa contenente il nome del modello che verrà richiesto
+
+			Returns
+			-------
+				str
+					Una stringa contenente l' indirizzo del server scelto. Al termine della richiesta
+					deve essere invocato `release(...)` oppure `eject(...)` con lo stesso indirizzo
+
+			Raises
+			------
+				ValueError
+					Si verifica se il parametro `model_name` ha valore `None`
+		"""
+		if model_name is None:
+			raise ValueError()
+
+		with self._lock:
+			now: float = time_monotonic()
+			available: List[_OllamaEndpointState] = [
+				endpoint for endpoint in self._endpoints
+				if endpoint.ejected_until <= now
+			]
+
+			chosen: _OllamaEndpointState
+			if len(available) == 0:
+				chosen = min(self._endpoints, key=lambda endpoint: endpoint.ejected_until)
+			else:
+				known_tps: List[float] = [
+					endpoint.tokens_sec for endpoint in self._endpoints
+					if endpoint.tokens_sec is not None
+				]
+				# I servers mai osservati vengono considerati veloci quanto la media degli altri
+				default_tps: float = (sum(known_tps) / len(known_tps)) if len(known_tps) > 0 else 1.0
+				chosen = min(
+					available,
+					key=lambda endpoint: self._route_cost(endpoint, model_name, default_tps, now)
+				)
+
+			chosen.in_flight += 1
+			return chosen.address
+
+
+	def release(
+			self,
+			address: str,
+			model_name: str,
+			resp_tokens: int = -1,
+			eval_duration: int = -1
+	):
+		"""
+			Registra il termine di una richiesta inviata al server fornito, aggiornandone
+			le statistiche se la richiesta è stata completata
+
+			Parameters
+			----------
+				address: str
+					Una stringa contenente l' indirizzo del server restituito da `acquire(...)`
+
+				model_name: str
+					Una stringa contenente il nome del modello richiesto
+
+				resp_tokens: int
+					Opzionale. Default = `-1`. Un intero indicante il numero di tokens generati nella
+					risposta. Se negativo, o `None` (non noto), le statistiche di velocità del server non
+					vengono aggiornate
+
+				eval_duration: int
+					Opzionale. Default = `-1`. Un intero indicante il tempo, in nanosecondi, impiegato dal
+					server per generare la risposta. Se non positivo, o `None` (non noto), le statistiche di
+					velocità del server non vengono aggiornate
+
+			Raises
+			------
+				ValueError
+					Si verifica se il parametro `address` non appartiene a questo pool
+		"""
+		with self._lock:
+			endpoint: _OllamaEndpointState = self._find_endpoint(address)
+			endpoint.in_flight = max(0, endpoint.in_flight - 1)
+
+			if (resp_tokens is not None) and (eval_duration is not None) and (resp_tokens >= 0) and (eval_duration > 0):
+				observed_tps: float = resp_tokens / (eval_duration / 1e9)
+				if endpoint.tokens_sec is None:
+					endpoint.tokens_sec = observed_tps
+				else:
+					endpoint.tokens_sec = (
+						self._TPS_SMOOTHING * observed_tps
+						+ (1.0 - self._TPS_SMOOTHING) * endpoint.tokens_sec
+					)
+				endpoint.models_seen[model_name] = time_monotonic()
+				endpoint.consec_failures = 0
+
+
+	def eject(self, address: str):
+		"""
+			Registra il fallimento di connessione di una richiesta inviata al server fornito,
+			escludendolo temporaneamente dal pool
+
+			Parameters
+			----------
+				address: str
+					Una stringa contenente l' indirizzo del server restituito da `acquire(...)`
+
+			Raises
+			------
+				ValueError
+					Si verifica se il parametro `address` non appartiene a questo pool
+		"""
+		with self._lock:
+			endpoint: _OllamaEndpointState = self._find_endpoint(address)
+			endpoint.in_flight = max(0, endpoint.in_flight - 1)
+
+			eject_time: float = min(
+				self._eject_time * (2 ** endpoint.consec_failures),
+				self._max_eject_time
+			)
+			endpoint.consec_failures += 1
+			endpoint.ejected_until = time_monotonic() + eject_time
+			# Un server che non risponde non mantiene i modelli caricati
+			endpoint.models_seen.clear()
+
+
+	##	============================================================
+	##						PRIVATE METHODS
+	##	============================================================
+
+
+	def _find_endpoint(self, address: str) -> _OllamaEndpointState:
+		"""
+			Restituisce lo stato del server con l' indirizzo fornito
+
+			Raises
+			------
+				ValueError
+					Si verifica se l' indirizzo non appartiene a questo pool
+		"""
+		for endpoint in self._endpoints:
+			if endpoint.address == address:
+				return endpoint
+		raise ValueError()
+
+
+	def _route_cost(
+			self,
+			endpoint: _OllamaEndpointState,
+			model_name: str,
+			default_tps: float,
+			now: float
+	) -> float:
+		"""
+			Calcola il costo stimato di inviare una richiesta, per il modello fornito, al server
+			indicato. Il costo è proporzionale al tempo di attesa atteso, ovvero al numero di richieste
+			da servire (inclusa la nuova) diviso la velocità del server
+		"""
+		tokens_sec: float = endpoint.tokens_sec if endpoint.tokens_sec is not None else default_tps
+		cost: float = (endpoint.in_flight + 1) / max(tokens_sec, 1e-6)
+
+		last_seen: float = endpoint.models_seen.get(model_name, None)
+		if (last_seen is None) or ((now - last_seen) > self._keep_alive):
+			cost *= self._COLD_MODEL_PENALTY
+
+		return cost
@@ -1,5 +1,6 @@
-from typing import List, Dict, Iterator, Any
+from typing import List, Dict, Tuple, Iterator, Any, Union
 from ._a_base_llmapiacc import _ABaseLlmApiAccessor
+from .ollama_endpoints_pool import OllamaEndpointsPool
 
 from base64 import b64encode as b64_encode
 from ollama import (
@@ -8,10 +9,21 @@ from ollama import (
 	ResponseError as OllamaApiResponseError
 )
 from time import monotonic as time_monotonic
+from itertools import chain as iter_chain
+from io import StringIO
+# ============= RegEx Utilities ============ #
+from regex import (
+	search as reg_search,
+	Match,
+	RegexFlag as RegexFlags,
+)
+# ========================================== #
 from httpx import (
+	Request as HttpxRequest,
 	Timeout as HttpxTimeout,
 	TimeoutException as HttpxTimeoutError,
-	ConnectTimeout as HttpxConnectTimeoutError
+	ConnectTimeout as HttpxConnectTimeoutError,
+	ConnectError as HttpxConnectError
 )
 
 from ...llm_api import (
@@ -49,16 +61,42 @@ class OllamaLlmApiAccessor(_ABaseLlmApiAccessor):
 			- Inizio della sotto-fase di ricevimento della risposta
 			- Ogni "chunk" della risposta ricevuta (a scelta indipendentemente dal logger)
 			- Fine della sotto-fase di ricevimento della risposta
+			- Numero di tokens del prompt valutati dal server e durata della loro valutazione
+			
+		Il numero di tokens del prompt valutati esclude quelli riutilizzati dalla cache (KV-cache) del server,
+		e permette quindi di verificare il riutilizzo dei prefissi comuni tra richieste consecutive.
+			
+		Le richieste possono essere distribuite su più servers Ollama tramite un `OllamaEndpointsPool`,
+		eventualmente condiviso con altri OllamaLlmApiAccessor. I servers che falliscono la connessione
+		vengono esclusi temporaneamente dal pool.
+		
+		Per ogni server viene mantenuto un unico client HTTP, le cui connessioni (keep-alive) vengono
+		riutilizzate tra richieste successive. Il tempo di instaurazione della connessione viene
+		registrato separatamente dal tempo di attesa del primo token della risposta.
+		
+		Opzionalmente (fornendo un formato di terminazione) la risposta viene interrotta non appena
+		contiene una corrispondenza completa del formato, restituendone solo la parte fino alla fine
+		della corrispondenza. In questo modo non vengono generati i tokens successivi al codice
+		richiesto (es. le spiegazioni del modello).
+		La risposta non viene riesaminata ad ogni "chunk": viene osservato soltanto il testo appena ricevuto
+		alla ricerca dei delimitatori di codice ("```"), e il formato viene cercato nella risposta soltanto
+		quando compare un delimitatore successivo a quello di apertura. Per i formati che non contengono il
+		delimitatore l' interruzione anticipata non è disponibile. Delle risposte interrotte non sono note
+		le statistiche dei tokens.
 	"""
 	
+	# Delimitatore dei blocchi di codice osservato durante la ricezione della risposta
+	_CODE_FENCE: str = "```"
+	
 	def __init__(
 			self,
-			address: str,
+			address: Union[str, List[str], OllamaEndpointsPool],
 			auth: str,
 			conn_timeout: int,
 			logger: ATemporalFormattLogger = None,
 			log_resp: bool = False,
 			logger_sep: str="\n",
+			stop_format: str = None,
 	):
 		"""
 			Costruisce un nuovo OllamaLlmApiAccessor associandolo alla prima chat da utilizzare
@@ -66,9 +104,11 @@ class OllamaLlmApiAccessor(_ABaseLlmApiAccessor):
 			
 			Parameters
 			----------
-				address: str
+				address: Union[str, List[str], OllamaEndpointsPool]
 					Una stringa contenente l' indirizzo (URL assoluto, IPv4 o IPv6) che identifica
-					il server Ollama su cui è ospitata la piattaforma di inferenza
+					il server Ollama su cui è ospitata la piattaforma di inferenza.
+					In alternativa una lista di indirizzi, oppure un `OllamaEndpointsPool` (da condividere
+					con altri accessors), contenente i servers su cui distribuire le richieste
 					
 				auth: str
 					Una stringa contenente le credenziali di accesso, come coppia `user:token`,
@@ -91,12 +131,18 @@ class OllamaLlmApiAccessor(_ABaseLlmApiAccessor):
 					Opzionale. Default = `False`. Un booleano che indica se è necessario loggare anche
 					i "chunks" della risposta che vengono ricevuti
 					
+				stop_format: str
+					Opzionale. Default = `None`. Una stringa RegEx contenente il formato la cui prima corrispondenza
+					completa nella risposta ne determina l' interruzione anticipata. Se non fornito, o se non contiene
+					il delimitatore "```", la risposta viene ricevuta interamente
+					
 			Raises
 			------
 				ValueError
 					Si verifica se:
 						
 						- Almeno uno tra `address` e `auth` hanno valore `None`
+						- Il parametro `address` è una lista vuota o contenente indirizzi `None` o duplicati
 						- Il parametro `log_resp` ha valore `True` ma non è stato fornito un logger
 		"""
 		super().__init__()
@@ -111,9 +157,24 @@ class OllamaLlmApiAccessor(_ABaseLlmApiAccessor):
 			raise ValueError()
 		
 		self._log_resp: bool = log_resp
-		self._o_addr: str = address
+		self._stop_format: str = stop_format if (stop_format is not None) and (self._CODE_FENCE in stop_format) else None
+		self._o_endpoints: OllamaEndpointsPool
+		if isinstance(address, OllamaEndpointsPool):
+			self._o_endpoints = address
+		elif isinstance(address, str):
+			self._o_endpoints = OllamaEndpointsPool([address])
+		else:
+			self._o_endpoints = OllamaEndpointsPool(list(address))
 		self._o_auth: str = b64_encode(auth.encode()).decode()
-		self._conn_tout: int = conn_timeout
+		self._conn_tout: HttpxTimeout = HttpxTimeout(
+			None, connect=int(conn_timeout) / 1000.0
+		)
+		
+		# Clients HTTP verso i servers Ollama, creati al primo utilizzo di ogni server
+		self._o_clients: Dict[str, OllamaClient] = dict()
+		# Istante di inizio e durata dell' instaurazione della connessione nella richiesta corrente
+		self._conn_start: float = None
+		self._conn_time: float = None
 		
 		self._think_param: ILlmHyperParamId = LlmHyperParamIdFactoryResolver.resolve("ollama").create("think")
 		self._numctx_param: ILlmHyperParamId = LlmHyperParamIdFactoryResolver.resolve("ollama").create("context_window")
@@ -132,10 +193,6 @@ class OllamaLlmApiAccessor(_ABaseLlmApiAccessor):
 		}
 		think_param: bool = options_param.pop(self._think_param.id())
 		num_ctx_param: int = options_param[self._numctx_param.id()]
-		
-		conn_timeout: HttpxTimeout = HttpxTimeout(
-			None, connect=int(self._conn_tout) / 1000.0
-		)
 		resp_timeout: float = timeout / 1000.0
 
 		def_time_format: str = "( {day}-{month}-{year} | {hour}:{min}:{second} )"
@@ -148,17 +205,75 @@ class OllamaLlmApiAccessor(_ABaseLlmApiAccessor):
 				self._logger.set_format("[LLM REQUEST (Ollama)] {message} " + def_time_format)
 				
 			self._logger.set_messages_sep(self._logger_sep)
-			self._logger.log("Tentativo di connesione con Ollama ...")
+		
+		# Scelta del server a cui inviare la richiesta
+		model_name: str = model.model_name()
+		o_addr: str = self._o_endpoints.acquire(model_name)
+		
+		full_response: str
+		prompt_tokens: int
+		resp_tokens: int
+		eval_duration: int
+		try:
+			full_response, (prompt_tokens, resp_tokens, eval_duration) = self._prompt_endpoint(
+				o_addr, chat, model_name,
+				options_param, think_param,
+				resp_timeout, log_format
+			)
+		except ApiConnectionError:
+			self._o_endpoints.eject(o_addr)
+			self._discard_client(o_addr)
+			self._logger.log(f'Server Ollama "{o_addr}" escluso temporaneamente.') if self._logger is not None else None
+			raise
+		except BaseException:
+			self._o_endpoints.release(o_addr, model_name)
+			raise
+		self._o_endpoints.release(o_addr, model_name, resp_tokens, eval_duration)
+		
+		# Con i conteggi dei tokens non noti (risposta interrotta) la saturazione non è verificabile
+		if (prompt_tokens is not None) and (resp_tokens is not None):
+			if (prompt_tokens + resp_tokens) >= num_ctx_param:
+				raise SaturatedContextWindowError()
+		
+		return full_response
+	
+	
+	def _ap__accepted_api(self) -> ILlmApi:
+		return OllamaApi()
+
+
+	##	============================================================
+	##						PRIVATE METHODS
+	##	============================================================
+	
+	
+	def _prompt_endpoint(
+			self,
+			o_addr: str,
+			chat: ILlmChat,
+			model_name: str,
+			options_param: Dict[str, Any],
+			think_param: bool,
+			resp_timeout: float,
+			log_format: str
+	) -> Tuple[str, Tuple[int, int, int]]:
+		"""
+			Effettua la richiesta al server Ollama fornito, restituendo la risposta completa
+			insieme al numero di tokens del prompt, al numero di tokens della risposta e al tempo
+			(in nanosecondi) impiegato per generarla (tutti `None` se la risposta è stata interrotta
+			anticipatamente)
+			
+			Raises
+			------
+				ApiConnectionError
+					Si verifica se non è possibile connettersi al server fornito
+		"""
+		if self._logger is not None:
+			self._logger.log(f'Tentativo di connesione con Ollama ("{o_addr}") ...')
 			
 		oll_client: OllamaClient
 		try:
-			oll_client = OllamaClient(
-				host=self._o_addr,
-				headers={ 'Authorization': f'Basic {self._o_auth}' },
-				timeout=conn_timeout
-			)
-			if self._logger is not None:
-				self._logger.log("Connessione con Ollama stabilita.")
+			oll_client = self._get_client(o_addr)
 		except HttpxConnectTimeoutError as httpx_tout_error:
 			gensai_exc: ApiConnectionError = ApiConnectionError()
 			gensai_exc.args = ("timeout",) + httpx_tout_error.args
@@ -169,10 +284,14 @@ class OllamaLlmApiAccessor(_ABaseLlmApiAccessor):
 			gensai_exc.errno = ollama_err.errno
 			raise gensai_exc from ollama_err
 		
+		self._conn_start = None
+		self._conn_time = None
+		start_time: float = time_monotonic()
+		
 		response_iter: Iterator[ChatResponse]
 		try:
 			response_iter = oll_client.chat(
-				model.model_name(),
+				model_name,
 				chat.chat_messages(),
 				options=options_param,
 				stream=True,
@@ -182,24 +301,67 @@ class OllamaLlmApiAccessor(_ABaseLlmApiAccessor):
 			gensai_exc: ApiResponseError = ApiResponseError()
 			gensai_exc.args = ("known",) + ollama_err.args
 			raise gensai_exc from ollama_err
+		except (HttpxConnectError, ConnectionError) as ollama_err:
+			gensai_exc: ApiConnectionError = ApiConnectionError()
+			gensai_exc.args = ("other",) + ollama_err.args
+			raise gensai_exc from ollama_err
 		
-		start_time: float
 		timed_out: bool = False
 		drifted: bool = False
 		prompt_tokens: int = -1
 		resp_tokens: int = -1
-		full_response: str = ""
+		eval_duration: int = -1
+		prompt_eval_duration: int = -1
+		# Buffer della risposta (evita le concatenazioni ripetute di stringhe)
+		resp_buffer: StringIO = StringIO()
+		stopped: bool = False
+		stop_match: Match[str] = None
+		# Stato dell' osservazione dei delimitatori di codice: lunghezza della risposta ricevuta, sua coda
+		# (per i delimitatori spezzati tra due "chunks") e posizione del delimitatore di apertura
+		resp_len: int = 0
+		resp_tail: str = ""
+		fence_start: int = -1
+		fence_pos: int
+		chunk_text: str
 		try:
+			# Con lo streaming la connessione avviene alla lettura del primo "chunk"
+			first_chunk: ChatResponse = next(response_iter, None)
+			first_tok_time: float = time_monotonic() - start_time
+			if self._logger is not None:
+				if self._conn_time is not None:
+					self._logger.log(f"Connessione con Ollama stabilita in {self._conn_time * 1000:.0f} ms.")
+				else:
+					self._logger.log("Connessione con Ollama riutilizzata.")
+				self._logger.log(f"Primo token ricevuto dopo {first_tok_time * 1000:.0f} ms.")
+			
 			self._logger.log("Inizio della risposta ...") if self._logger is not None else None
 			if self._log_resp:
 				log_format = self._logger.unset_format()
 				self._logger.set_messages_sep("")
-				
-			start_time = time_monotonic()
-			for chunk in response_iter:
-				full_response += chunk['message']['content']
+			
+			for chunk in iter_chain([first_chunk] if first_chunk is not None else [], response_iter):
+				chunk_text = chunk['message']['content']
+				resp_buffer.write(chunk_text)
 				if self._log_resp:
-					self._logger.log(chunk['message']['content'])
+					self._logger.log(chunk_text)
+				
+				# Check della presenza di una corrispondenza completa del formato di terminazione,
+				# effettuato soltanto quando il testo appena ricevuto chiude un blocco di codice
+				if (self._stop_format is not None) and (chunk_text != ""):
+					for fence_pos in self._find_fences(resp_tail + chunk_text, resp_len - len(resp_tail)):
+						if fence_start == -1:
+							fence_start = fence_pos
+							continue
+						stop_match = reg_search(
+							self._stop_format, resp_buffer.getvalue(), RegexFlags.MULTILINE, pos=fence_start
+						)
+						if stop_match is not None:
+							stopped = True
+							break
+					if stopped:
+						break
+					resp_len += len(chunk_text)
+					resp_tail = (resp_tail + chunk_text)[-(len(self._CODE_FENCE) - 1):]
 				
 				# Check del tempo complessivo occupato dalla risposta fino ad ora
 				if ((time_monotonic() - start_time) > resp_timeout):
@@ -210,15 +372,32 @@ class OllamaLlmApiAccessor(_ABaseLlmApiAccessor):
 				if "eval_count" in chunk:
 					resp_tokens = chunk["eval_count"]
 					prompt_tokens = chunk["prompt_eval_count"]
+					eval_duration = chunk.get("eval_duration", None) or -1
+					prompt_eval_duration = chunk.get("prompt_eval_duration", None) or -1
 					if self._log_resp:
 						self._logger.log(f'{self._logger_sep}')
 							
+			if stopped:
+				# La chiusura dello stream interrompe la generazione nel server
+				response_iter.close() if hasattr(response_iter, "close") else None
+				if self._log_resp:
+					self._logger.log(f'{self._logger_sep}')
+			
 			if timed_out or drifted:
 				if self._log_resp:
 					self._logger.set_format(log_format)
 					self._logger.set_messages_sep(self._logger_sep)
 				if timed_out:
 					raise ResponseTimedOutError()
+		except HttpxConnectTimeoutError as httpx_tout_error:
+			gensai_exc: ApiConnectionError = ApiConnectionError()
+			gensai_exc.args = ("timeout",) + httpx_tout_error.args
+			raise gensai_exc from httpx_tout_error
+		except (HttpxConnectError, ConnectionError) as ollama_err:
+			# Con lo streaming la connessione al server avviene solo alla lettura del primo "chunk"
+			gensai_exc: ApiConnectionError = ApiConnectionError()
+			gensai_exc.args = ("other",) + ollama_err.args
+			raise gensai_exc from ollama_err
 		except HttpxTimeoutError as httpx_tout_err:
 			gensai_exc: ResponseTimedOutError = ResponseTimedOutError()
 			gensai_exc.args = httpx_tout_err.args
@@ -232,23 +411,84 @@ class OllamaLlmApiAccessor(_ABaseLlmApiAccessor):
 			self._logger.set_format(log_format)
 			self._logger.set_messages_sep(self._logger_sep)
 		self._logger.log(f'Fine della risposta.') if self._logger is not None else None
+		if (self._logger is not None) and (prompt_tokens != -1):
+			self._logger.log(
+				f"Prompt valutato: {prompt_tokens} tokens in {prompt_eval_duration / 1e6:.0f} ms."
+			)
+		
+		full_response: str = resp_buffer.getvalue()
+		if stopped:
+			if self._logger is not None:
+				self._logger.log("Risposta interrotta al termine del formato richiesto.")
+				self._logger.log("Statistiche dei tokens non disponibili (risposta interrotta).")
+			# I conteggi dei tokens non vengono ricevuti, quindi non sono noti
+			return full_response[:stop_match.end()], (None, None, None)
 
 		if ((prompt_tokens == -1) or (resp_tokens == -1) or
 			(full_response == "")):
 			gensai_exc: ApiResponseError = ApiResponseError()
 			gensai_exc.args = ("unknown",) + (str(prompt_tokens), str(resp_tokens), full_response)
 			raise gensai_exc
-
-		if (prompt_tokens + resp_tokens) >= num_ctx_param:
-			raise SaturatedContextWindowError()
 		
-		return full_response
+		return full_response, (prompt_tokens, resp_tokens, eval_duration)
 	
 	
-	def _ap__accepted_api(self) -> ILlmApi:
-		return OllamaApi()
-
-
-	##	============================================================
-	##						PRIVATE METHODS
-	##	============================================================
\ No newline at end of file
+	@classmethod
+	def _find_fences(cls, text: str, text_start: int) -> List[int]:
+		"""
+			Restituisce le posizioni, nella risposta, dei delimitatori di codice contenuti nel testo fornito,
+			che inizia alla posizione `text_start` della risposta
+		"""
+		positions: List[int] = list()
+		fence_pos: int = text.find(cls._CODE_FENCE)
+		while fence_pos != -1:
+			positions.append(text_start + fence_pos)
+			fence_pos = text.find(cls._CODE_FENCE, fence_pos + len(cls._CODE_FENCE))
+		return positions
+	
+	
+	def _get_client(self, o_addr: str) -> OllamaClient:
+		"""
+			Restituisce il client HTTP relativo al server Ollama fornito, creandolo se
+			non ancora esistente
+		"""
+		if o_addr not in self._o_clients:
+			self._o_clients[o_addr] = OllamaClient(
+				host=o_addr,
+				headers={ 'Authorization': f'Basic {self._o_auth}' },
+				timeout=self._conn_tout,
+				event_hooks={ "request": [self._trace_request] }
+			)
+		return self._o_clients[o_addr]
+	
+	
+	def _discard_client(self, o_addr: str):
+		"""
+			Chiude e rimuove il client HTTP relativo al server Ollama fornito, in modo
+			che al prossimo utilizzo vengano instaurate nuove connessioni
+		"""
+		oll_client: OllamaClient = self._o_clients.pop(o_addr, None)
+		if oll_client is not None:
+			try:
+				oll_client._client.close()
+			except BaseException:
+				pass
+	
+	
+	def _trace_request(self, request: HttpxRequest):
+		"""
+			Associa ad ogni richiesta HTTP inviata il tracciamento degli eventi di connessione
+		"""
+		request.extensions["trace"] = self._trace_connection
+	
+	
+	def _trace_connection(self, event_name: str, info: Dict[str, Any]):
+		"""
+			Registra la durata dell' instaurazione di una nuova connessione (TCP ed eventualmente TLS).
+			Se la richiesta riutilizza una connessione già aperta non viene ricevuto alcun evento
+		"""
+		if event_name == "connection.connect_tcp.started":
+			self._conn_start = time_monotonic()
+		elif event_name in ("connection.connect_tcp.complete", "connection.start_tls.complete"):
+			if self._conn_start is not None:
+				self._conn_time = time_monotonic() - self._conn_start
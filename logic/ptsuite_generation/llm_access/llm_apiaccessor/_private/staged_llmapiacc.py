@@ -0,0 +1,74 @@
+from .. import ILlmApiAccessor
+
+from ...llm_chat import ILlmChat
+from ...llm_hyperparam import ILlmHyperParam
+from ...llm_specimpl import ILlmSpecImpl
+
+from .....utils.pipeline_stage import PipelineStage
+
+
+
+class StagedLlmApiAccessor(ILlmApiAccessor):
+	"""
+		Rappresenta un `ILlmApiAccessor` che esegue le richieste di un altro `ILlmApiAccessor`
+		tramite uno stadio di pipeline (lo stadio "produttore" che interagisce con la piattaforma
+		di inferenza).
+		
+		Ogni operazione diversa da `.prompt(...)` è delegata direttamente all' accessor avvolto
+	"""
+	
+	def __init__(
+			self,
+			wrapped: ILlmApiAccessor,
+			stage: PipelineStage
+	):
+		"""
+			Costruisce un nuovo StagedLlmApiAccessor associandolo all' accessor da avvolgere
+			e allo stadio di pipeline tramite cui eseguirne le richieste
+			
+			Parameters
+			----------
+				wrapped: ILlmApiAccessor
+					Un oggetto `ILlmApiAccessor` rappresentante l' accessor che effettuerà
+					realmente le richieste
+					
+				stage: PipelineStage
+					Un oggetto `PipelineStage` rappresentante lo stadio tramite cui eseguire le richieste
+					
+			Raises
+			------
+				ValueError
+					Si verifica se almeno uno tra `wrapped` e `stage` ha valore `None`
+		"""
+		if (wrapped is None) or (stage is None):
+			raise ValueError()
+		
+		self._wrapped: ILlmApiAccessor = wrapped
+		self._stage: PipelineStage = stage
+	
+	
+	def set_chat(
+			self,
+			chat: ILlmChat,
+			erase_now: bool = True,
+			erase_model: bool = True
+	):
+		self._wrapped.set_chat(chat, erase_now, erase_model)
+	
+	
+	def select_model(self, model: ILlmSpecImpl):
+		self._wrapped.select_model(model)
+	
+	
+	def add_hyperparam(self, hparam: ILlmHyperParam):
+		self._wrapped.add_hyperparam(hparam)
+	
+	
+	def remove_hyperparam(self, hparam: ILlmHyperParam):
+		self._wrapped.remove_hyperparam(hparam)
+	
+	
+	def prompt(self, timeout: int) -> str:
+		return self._stage.execute(
+			lambda: self._wrapped.prompt(timeout)
+		)
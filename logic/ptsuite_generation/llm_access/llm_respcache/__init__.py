@@ -0,0 +1,3 @@
+from ._private.i_llm_respcache import ILlmResponseCache
+
+from ._factory.llm_respcache_f import LlmResponseCacheFactory
\ No newline at end of file
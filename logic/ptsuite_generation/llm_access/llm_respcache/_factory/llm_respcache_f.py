@@ -0,0 +1,60 @@
+from .. import ILlmResponseCache
+
+from .._private.sqlite3_llm_respcache import Sqlite3LlmResponseCache
+
+from ....cache_accessor import ECacheAccessorType
+
+
+
+class LlmResponseCacheFactory:
+	"""
+		Rappresenta una factory per ogni `ILlmResponseCache`
+	"""
+
+
+	@classmethod
+	def create(
+			cls,
+			tech: ECacheAccessorType,
+			cache_path: str,
+			max_size: int
+	) -> ILlmResponseCache:
+		"""
+			Istanzia una nuova cache delle risposte dei LLMs della tecnologia implementativa specificata
+
+			Parameters
+			----------
+				tech: ECacheAccessorType
+					Un valore `ECacheAccessorType` rappresentante la tecnologia richiesta
+					per l' oggetto `ILlmResponseCache`
+
+				cache_path: str
+					Una stringa rappresentante la path del file di caching da utilizzare
+
+				max_size: int
+					Un intero indicante la dimensione massima, in bytes, delle risposte memorizzate
+
+			Returns
+			-------
+				ILlmResponseCache
+					Un oggetto `ILlmResponseCache` della tecnologia implementativa specificata
+
+			Raises
+			------
+				ValueError
+					Si verifica se:
+
+						- Il parametro `cache_path` ha valore `None` o è una stringa vuota
+						- Il parametro `max_size` non è positivo
+		"""
+		obj: ILlmResponseCache
+		match tech:
+			case ECacheAccessorType.SQLITE3:
+				obj = Sqlite3LlmResponseCache(cache_path, max_size)
+
+		return obj
+
+
+	##	============================================================
+	##						PRIVATE METHODS
+	##	============================================================
@@ -0,0 +1,98 @@
+from abc import ABC, abstractmethod
+
+
+
+class ILlmResponseCache(ABC):
+	"""
+		Rappresenta una cache, persistente, delle risposte ottenute dai LLMs indicizzate da una chiave
+		che identifica univocamente la richiesta effettuata (modello, iperparametri e messaggi della chat).
+		
+		La cache ha una dimensione massima: al suo superamento vengono rimosse le risposte
+		utilizzate meno recentemente.
+		
+		La tecnologia implementativa della cache è specificata dai discendenti di questa interfaccia
+	"""
+	
+	
+	@abstractmethod
+	def get_response(self, req_key: str) -> str:
+		"""
+			Restituisce la risposta memorizzata per la richiesta identificata dalla chiave fornita,
+			registrando l' esito della ricerca (hit o miss)
+			
+			Parameters
+			----------
+				req_key: str
+					Una stringa contenente la chiave della richiesta
+					
+			Returns
+			-------
+				str
+					Una stringa contenente la risposta memorizzata, oppure `None` se la richiesta
+					non è presente nella cache
+					
+			Raises
+			------
+				ValueError
+					Si verifica se il parametro `req_key` ha valore `None` o è una stringa vuota
+		"""
+		pass
+	
+	
+	@abstractmethod
+	def put_response(self, req_key: str, response: str):
+		"""
+			Memorizza la risposta ottenuta per la richiesta identificata dalla chiave fornita,
+			sovrascrivendo l' eventuale risposta già presente.
+			Se viene superata la dimensione massima della cache vengono rimosse le risposte
+			utilizzate meno recentemente
+			
+			Parameters
+			----------
+				req_key: str
+					Una stringa contenente la chiave della richiesta
+					
+				response: str
+					Una stringa contenente la risposta da memorizzare
+					
+			Raises
+			------
+				ValueError
+					Si verifica se almeno uno tra `req_key` e `response` ha valore `None`, oppure se
+					`req_key` è una stringa vuota
+		"""
+		pass
+	
+	
+	@abstractmethod
+	def hits(self) -> int:
+		"""
+			Restituisce il numero di richieste trovate nella cache dalla sua apertura
+			
+			Returns
+			-------
+				int
+					Un intero indicante il numero di "hits" della cache
+		"""
+		pass
+	
+	
+	@abstractmethod
+	def misses(self) -> int:
+		"""
+			Restituisce il numero di richieste non trovate nella cache dalla sua apertura
+			
+			Returns
+			-------
+				int
+					Un intero indicante il numero di "misses" della cache
+		"""
+		pass
+	
+	
+	@abstractmethod
+	def close(self):
+		"""
+			Chiude la cache rilasciandone le risorse
+		"""
+		pass
@@ -0,0 +1,182 @@
+from typing import List, Tuple
+from .i_llm_respcache import ILlmResponseCache
+
+from threading import RLock
+from time import time as time_now
+
+# =========== SQLite3 Utilities ============ #
+from sqlite3 import (
+	connect as sql_connect,
+	Connection as SqlConnection,
+	Cursor as SqlConnectionCursor,
+)
+# ========================================== #
+
+
+
+class Sqlite3LlmResponseCache(ILlmResponseCache):
+	"""
+		Rappresenta un `ILlmResponseCache` che utilizza come cache un database locale SQLite3.
+
+		La dimensione della cache è calcolata come la somma delle dimensioni (in bytes, codificate UTF-8)
+		delle risposte memorizzate.
+
+		L' accesso al database è serializzato, in modo che lo stesso Sqlite3LlmResponseCache
+		possa essere utilizzato da più threads contemporaneamente
+	"""
+
+	_TABLE_NAME: str = "llm_responses"
+
+	def __init__(
+			self,
+			cache_path: str,
+			max_size: int
+	):
+		"""
+			Costruisce un nuovo Sqlite3LlmResponseCache associandolo alla path del database
+			SQLite3 da utilizzare (creato se non esistente)
+
+			Parameters
+			----------
+				cache_path: str
+					Una stringa rappresentante la path del database SQLite3 da utilizzare
+
+				max_size: int
+					Un intero indicante la dimensione massima, in bytes, delle risposte memorizzate
+
+			Raises
+			------
+				ValueError
+					Si verifica se:
+
+						- Il parametro `cache_path` ha valore `None` o è una stringa vuota
+						- Il parametro `max_size` non è positivo
+		"""
+		if (cache_path is None) or (cache_path == ""):
+			raise ValueError()
+		if max_size <= 0:
+			raise ValueError()
+
+		self._max_size: int = max_size
+		self._hits: int = 0
+		self._misses: int = 0
+
+		self._db_lock: RLock = RLock()
+		self._conn: SqlConnection = sql_connect(cache_path, check_same_thread=False)
+		self._cursor: SqlConnectionCursor = self._conn.cursor()
+
+		with self._db_lock:
+			self._cursor.execute(f"""
+				CREATE TABLE IF NOT EXISTS `{self._TABLE_NAME}` (
+					`req_key` TEXT NOT NULL PRIMARY KEY,
+					`response` TEXT NOT NULL,
+					`size` INTEGER NOT NULL,
+					`last_used` REAL NOT NULL
+				)
+			""")
+			self._cursor.execute(f"""
+				CREATE INDEX IF NOT EXISTS `{self._TABLE_NAME}_lru`
+				ON `{self._TABLE_NAME}` (`last_used`)
+			""")
+			self._conn.commit()
+
+			self._cursor.execute(f"SELECT COALESCE(SUM(`size`), 0) FROM `{self._TABLE_NAME}`")
+			self._curr_size: int = self._cursor.fetchone()[0]
+
+
+	def get_response(self, req_key: str) -> str:
+		if (req_key is None) or (req_key == ""):
+			raise ValueError()
+
+		with self._db_lock:
+			self._cursor.execute(f"""
+				SELECT `response` FROM `{self._TABLE_NAME}`
+				WHERE `req_key` = ?
+			""", [req_key])
+			row: Tuple[str] = self._cursor.fetchone()
+
+			if row is None:
+				self._misses += 1
+				return None
+
+			self._hits += 1
+			self._cursor.execute(f"""
+				UPDATE `{self._TABLE_NAME}` SET `last_used` = ?
+				WHERE `req_key` = ?
+			""", [time_now(), req_key])
+			self._conn.commit()
+			return row[0]
+
+
+	def put_response(self, req_key: str, response: str):
+		if (req_key is None) or (req_key == "") or (response is None):
+			raise ValueError()
+
+		resp_size: int = len(response.encode("utf-8"))
+		# Una risposta più grande dell' intera cache non viene memorizzata
+		if resp_size > self._max_size:
+			return
+
+		with self._db_lock:
+			self._cursor.execute(f"""
+				SELECT `size` FROM `{self._TABLE_NAME}`
+				WHERE `req_key` = ?
+			""", [req_key])
+			old_row: Tuple[int] = self._cursor.fetchone()
+			if old_row is not None:
+				self._curr_size -= old_row[0]
+
+			self._cursor.execute(f"""
+				INSERT OR REPLACE INTO `{self._TABLE_NAME}` (`req_key`, `response`, `size`, `last_used`)
+				VALUES (?, ?, ?, ?)
+			""", [req_key, response, resp_size, time_now()])
+			self._curr_size += resp_size
+
+			self._evict()
+			self._conn.commit()
+
+
+	def hits(self) -> int:
+		with self._db_lock:
+			return self._hits
+
+
+	def misses(self) -> int:
+		with self._db_lock:
+			return self._misses
+
+
+	def close(self):
+		with self._db_lock:
+			self._cursor.close()
+			self._conn.close()
+
+
+	##	============================================================
+	##						PRIVATE METHODS
+	##	============================================================
+
+
+	def _evict(self):
+		"""
+			Rimuove le risposte utilizzate meno recentemente finchè la dimensione della cache
+			non rientra nella dimensione massima
+		"""
+		while self._curr_size > self._max_size:
+			self._cursor.execute(f"""
+				SELECT `req_key`, `size` FROM `{self._TABLE_NAME}`
+				ORDER BY `last_used` ASC
+				LIMIT 64
+			""")
+			oldest: List[Tuple[str, int]] = self._cursor.fetchall()
+			if len(oldest) == 0:
+				self._curr_size = 0
+				break
+
+			for req_key, size in oldest:
+				if self._curr_size <= self._max_size:
+					break
+				self._cursor.execute(f"""
+					DELETE FROM `{self._TABLE_NAME}` WHERE `req_key` = ?
+				""", [req_key])
+				self._curr_size -= size
@@ -1,4 +1,5 @@
 from . import logger
 from . import prompt_builder
 from . import path_validator
-from . import modelname_hasher
\ No newline at end of file
+from . import modelname_hasher
+from . import pipeline_stage
\ No newline at end of file
@@ -3,6 +3,7 @@ from abc import abstractmethod
 from .. import IFormattableLogger
 
 from string import Formatter as StrFormatter
+from threading import Lock
 
 from ..exceptions import (
 	NotWritableStreamError,
@@ -57,6 +58,9 @@ class _ABaseFormattableLogger(IFormattableLogger):
 		
 		self._sep: str = "\n"
 		self._first_message: bool = True
+		
+		# Lock che evita la sovrapposizione di messaggi registrati da threads differenti
+		self._write_lock: Lock = Lock()
 
 
 	def set_format(
@@ -116,12 +120,13 @@ class _ABaseFormattableLogger(IFormattableLogger):
 			format_vars["message"] = message
 			log_message = str.format_map(self._format, format_vars)
 			
-		if not self._first_message:
-			self._stream.write(self._sep)
-		else:
-			self._first_message = False
-		self._stream.write(log_message)
-		self._stream.flush()
+		with self._write_lock:
+			if not self._first_message:
+				self._stream.write(self._sep)
+			else:
+				self._first_message = False
+			self._stream.write(log_message)
+			self._stream.flush()
 		
 		
 	##	============================================================
@@ -0,0 +1,2 @@
+from . import exceptions
+from ._private.pipeline_stage import PipelineStage
\ No newline at end of file
@@ -0,0 +1,242 @@
+from typing import Dict, List, Callable, Any
+
+# ============ Concurrency Utilities ============ #
+from threading import Thread, Lock
+from queue import Queue
+from concurrent.futures import Future
+# =============================================== #
+from time import monotonic as time_monotonic
+
+from ..exceptions import StageClosedError
+
+
+
+class PipelineStage:
+	"""
+		Rappresenta uno stadio di una pipeline, ovvero un insieme di threads che eseguono i lavori
+		ricevuti tramite una coda limitata.
+
+		Ogni lavoro viene eseguito, per conto del thread che lo ha richiesto, da uno dei threads dello stadio.
+		Se la coda è piena il thread richiedente resta in attesa finchè non si libera un posto (backpressure).
+
+		Lo stadio registra, durante il suo funzionamento, la profondità della coda e il tempo in cui
+		i suoi threads sono rimasti occupati, in modo da poter individuare lo stadio collo di bottiglia
+		della pipeline.
+	"""
+
+	def __init__(
+			self,
+			name: str,
+			workers_num: int = 1,
+			queue_size: int = 0
+	):
+		"""
+			Costruisce un nuovo PipelineStage avviandone i threads
+
+			Parameters
+			----------
+				name: str
+					Una stringa contenente il nome dello stadio (utilizzato anche per i nomi dei suoi threads)
+
+				workers_num: int
+					Opzionale. Default = `1`. Un intero indicante il numero di threads dello stadio,
+					ovvero il numero di lavori eseguibili contemporaneamente
+
+				queue_size: int
+					Opzionale. Default = `0`. Un intero indicante il numero massimo di lavori in attesa
+					nella coda dello stadio. Se viene fornito `0` la dimensione della coda è pari a `workers_num`
+
+			Raises
+			------
+				ValueError
+					Si verifica se:
+
+						- Il parametro `name` ha valore `None` o è una stringa vuota
+						- Il parametro `workers_num` è minore di 1
+						- Il parametro `queue_size` è negativo
+		"""
+		if (name is None) or (name == ""):
+			raise ValueError()
+		if workers_num < 1:
+			raise ValueError()
+		if queue_size < 0:
+			raise ValueError()
+
+		self._name: str = name
+		self._workers_num: int = workers_num
+		self._jobs: Queue = Queue(
+			maxsize=(queue_size if queue_size > 0 else workers_num)
+		)
+
+		# Attributi di monitoraggio dello stadio
+		self._stats_lock: Lock = Lock()
+		self._start_time: float = time_monotonic()
+		self._busy_time: float = 0.0
+		self._jobs_done: int = 0
+		self._max_depth: int = 0
+
+		self._closed: bool = False
+		self._workers: List[Thread] = list()
+		for i in range(workers_num):
+			worker: Thread = Thread(
+				target=self._work,
+				name=f"gtsai_stage_{name}_{i}",
+				daemon=True
+			)
+			worker.start()
+			self._workers.append(worker)
+
+
+	def name(self) -> str:
+		"""
+			Restituisce il nome di questo stadio
+
+			Returns
+			-------
+				str
+					Una stringa contenente il nome dello stadio
+		"""
+		return self._name
+
+
+	def execute(
+			self,
+			job: Callable[[], Any]
+	) -> Any:
+		"""
+			Esegue il lavoro fornito tramite uno dei threads dello stadio, attendendone
+			il termine
+
+			Parameters
+			----------
+				job: Callable[[], Any]
+					Un callable, senza argomenti, rappresentante il lavoro da eseguire
+
+			Returns
+			-------
+				Any
+					Il valore restituito dal lavoro eseguito
+
+			Raises
+			------
+				ValueError
+					Si verifica se il parametro `job` ha valore `None`
+
+				StageClosedError
+					Si verifica se lo stadio è stato già chiuso
+
+				Exception
+					L' eventuale eccezione sollevata dal lavoro eseguito
+		"""
+		if job is None:
+			raise ValueError()
+		if self._closed:
+			raise StageClosedError()
+
+		job_result: Future = Future()
+		self._jobs.put((job, job_result))
+
+		with self._stats_lock:
+			self._max_depth = max(self._max_depth, self._jobs.qsize())
+
+		return job_result.result()
+
+
+	def queue_depth(self) -> int:
+		"""
+			Restituisce il numero di lavori attualmente in attesa nella coda dello stadio
+
+			Returns
+			-------
+				int
+					Un intero indicante la profondità attuale della coda
+		"""
+		return self._jobs.qsize()
+
+
+	def utilisation(self) -> float:
+		"""
+			Restituisce la frazione di tempo, dall' avvio dello stadio, in cui i suoi threads
+			sono rimasti occupati ad eseguire lavori
+
+			Returns
+			-------
+				float
+					Un float, compreso tra 0 e 1, indicante l' utilizzo medio dei threads dello stadio
+		"""
+		elapsed: float = time_monotonic() - self._start_time
+		if elapsed <= 0.0:
+			return 0.0
+
+		with self._stats_lock:
+			busy_time: float = self._busy_time
+		return min(1.0, busy_time / (elapsed * self._workers_num))
+
+
+	def stats(self) -> Dict[str, float]:
+		"""
+			Restituisce le statistiche di funzionamento dello stadio
+
+			Returns
+			-------
+				Dict[str, float]
+					Un dizionario di float, indicizzato da stringhe, contenente:
+
+						- "queue_depth": La profondità attuale della coda
+						- "max_queue_depth": La profondità massima raggiunta dalla coda
+						- "utilisation": L' utilizzo medio dei threads dello stadio (tra 0 e 1)
+						- "jobs_done": Il numero di lavori eseguiti
+						- "busy_time": Il tempo totale, in secondi, speso ad eseguire lavori
+		"""
+		utilisation: float = self.utilisation()
+		with self._stats_lock:
+			return {
+				"queue_depth": self._jobs.qsize(),
+				"max_queue_depth": self._max_depth,
+				"utilisation": utilisation,
+				"jobs_done": self._jobs_done,
+				"busy_time": self._busy_time,
+			}
+
+
+	def close(self):
+		"""
+			Chiude lo stadio attendendo il termine dei lavori ancora in coda.
+
+			Se lo stadio è già chiuso quest' operazione è equivalente ad una no-op
+		"""
+		if self._closed:
+			return
+
+		self._closed = True
+		for _ in self._workers:
+			self._jobs.put(None)
+		for worker in self._workers:
+			worker.join()
+
+
+	##	============================================================
+	##						PRIVATE METHODS
+	##	============================================================
+
+
+	def _work(self):
+		"""
+			Ciclo di esecuzione di ogni thread dello stadio
+		"""
+		while True:
+			queued: Any = self._jobs.get()
+			# Un elemento `None` segnala la chiusura dello stadio
+			if queued is None:
+				break
+
+			job, job_result = queued
+			start: float = time_monotonic()
+			try:
+				job_result.set_result(job())
+			except BaseException as exc:
+				job_result.set_exception(exc)
+			finally:
+				with self._stats_lock:
+					self._busy_time += time_monotonic() - start
+					self._jobs_done += 1
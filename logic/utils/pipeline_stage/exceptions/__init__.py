@@ -0,0 +1 @@
+from ._private.stageclosed_error import StageClosedError
\ No newline at end of file
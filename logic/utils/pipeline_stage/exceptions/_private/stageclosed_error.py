@@ -0,0 +1,6 @@
+class StageClosedError(Exception):
+    """
+        Rappresenta un' eccezione (non-exiting) che si verifica se si richiede l' esecuzione
+        di un lavoro ad uno stadio di pipeline che è stato già chiuso
+    """
+    pass
@@ -1,9 +1,11 @@
-from typing import Dict
+from typing import List, Dict
 
 from regex import (
 	Pattern,
 	compile as create_pattern,
 	escape as reg_escape,
+	split as reg_split,
+	MULTILINE as REG_MULTILINE,
 )
 
 from ..exceptions import (
@@ -28,13 +30,24 @@ class PromptBuilder:
 
 		es.	Placeholder nel template con i delimitatori di default:
 		Place_Holder1	----identificato-con---->	{@Place_Holder1@}
+		
+		Opzionalmente è possibile indicare dei placeholders "di coda" (es. quello dell' entità): le sezioni del
+		template (delimitate dalle intestazioni markdown di primo livello, `# `) che li contengono vengono spostate,
+		mantenendone l' ordine, dopo tutte le altre. In questo modo i full prompts costruiti per entità diverse
+		dello stesso modulo condividono un prefisso identico, riutilizzabile dalla cache (KV-cache)
+		della piattaforma di inferenza.
+		Le sezioni spostate (e le altre sezioni che le citano) non devono quindi riferirsi alle altre sezioni tramite la
+		loro posizione (es. "il codice fornito sotto"), ma tramite la loro intestazione.
 	"""
+	
+	_SECTION_PATT: str = r"^(?=# )"
 
 	def __init__(
 			self,
 			template_prompt: str = None,
 			init_del: str="{@",
-			end_del: str="@}"
+			end_del: str="@}",
+			tail_placehs: List[str] = None
 	):
 		"""
 			Costruisce un nuovo PromptBuilder legandolo ad un particolare template prompt
@@ -53,10 +66,17 @@ class PromptBuilder:
 				end_del: str
 					Opzionale. Default = `{@`. Una stringa contenente il delimitatore finale per riconoscere
 					i placeholders nel template
+					
+				tail_placehs: List[str]
+					Opzionale. Default = `None`. Una lista di stringhe contenente i nomi dei placeholders
+					le cui sezioni del template vanno spostate in coda al full prompt
 		"""
 		self._idel: str = init_del
 		self._edel: str = end_del
-		self._templ: str = template_prompt
+		self._tail_placehs: List[str] = list(tail_placehs) if tail_placehs is not None else []
+		self._templ: str = None
+		if template_prompt is not None:
+			self._templ = self._prefix_layout(template_prompt)
 
 		self._placehs: Dict[str, str] = None
 		if self._templ is not None:
@@ -79,7 +99,7 @@ class PromptBuilder:
 		if (template_prompt is None) or (template_prompt == ""):
 			raise ValueError()
 		
-		self._templ = template_prompt
+		self._templ = self._prefix_layout(template_prompt)
 		
 		if self._placehs is not None:
 			del self._placehs
@@ -88,6 +108,27 @@ class PromptBuilder:
 		)
 
 
+	def template_prompt(self) -> str:
+		"""
+			Restituisce il template prompt impostato, senza alcuna sostituzione dei placeholders
+			(con le sezioni eventualmente già spostate in coda)
+
+			Returns
+			-------
+				str
+					Una stringa contenente il template prompt impostato
+
+			Raises
+			------
+				TemplateNotSetError
+					Si verifica se non è stato ancora impostato alcun template prompt
+		"""
+		if self._templ is None:
+			raise TemplateNotSetError()
+		
+		return self._templ
+
+
 	def does_placeh_exists(
 			self,
 			placeh_name: str
@@ -202,6 +243,50 @@ class PromptBuilder:
 			)
 
 		return full_prompt
+
+
+	def build_partial_prompt(self, unsubstituted: List[str]) -> str:
+		"""
+			Costruisce il prompt risultante dalle sostituzioni scelte nel template, lasciando però invariati
+			i placeholders forniti (anche se già sostituiti).
+			E' richiesto che tutti gli altri placeholders siano stati sostituiti prima di chiamare quest' operazione
+
+			Parameters
+			----------
+				unsubstituted: List[str]
+					Una lista di stringhe contenente i nomi dei placeholders da non sostituire
+
+			Returns
+			-------
+				str
+					Una stringa contenente il prompt derivante dalle sostituzioni degli altri placeholders
+
+			Raises
+			------
+				TemplateNotSetError
+					Si verifica se non è stato ancora impostato alcun template prompt
+			
+				IncompletePrompt
+					Se si esegue quest' operazione senza aver sostituito prima tutti gli altri placeholders
+					nel template prompt
+		"""
+		if self._templ is None:
+			raise TemplateNotSetError()
+		
+		for placeh, value in self._placehs.items():
+			if (value is None) and (placeh not in unsubstituted):
+				raise IncompletePromptError()
+
+		partial_prompt: str = self._templ
+		for placeh, value in self._placehs.items():
+			if placeh in unsubstituted:
+				continue
+			partial_prompt = partial_prompt.replace(
+				f"{self._idel}{placeh}{self._edel}",
+				value
+			)
+
+		return partial_prompt
 	
 	
 	##	============================================================
@@ -209,6 +294,41 @@ class PromptBuilder:
 	##	============================================================
 	
 	
+	def _prefix_layout(self, template_prompt: str) -> str:
+		"""
+			Sposta in coda al template prompt fornito le sezioni che contengono almeno
+			un placeholder "di coda", mantenendo l' ordine relativo delle sezioni.
+			
+			Se nessuna sezione deve essere spostata il template viene restituito invariato
+			
+			Returns
+			-------
+				str
+					Una stringa contenente il template prompt con le sezioni riordinate
+		"""
+		if len(self._tail_placehs) == 0:
+			return template_prompt
+		
+		tail_marks: List[str] = [
+			f"{self._idel}{placeh}{self._edel}"
+			for placeh in self._tail_placehs
+		]
+		head_sects: List[str] = []
+		tail_sects: List[str] = []
+		for templ_sect in reg_split(self._SECTION_PATT, template_prompt, flags=REG_MULTILINE):
+			if templ_sect.strip() == "":
+				continue
+			if any([tail_mark in templ_sect for tail_mark in tail_marks]):
+				tail_sects.append(templ_sect.rstrip("\n"))
+			else:
+				head_sects.append(templ_sect.rstrip("\n"))
+		
+		if len(tail_sects) == 0:
+			return template_prompt
+		
+		return "\n\n".join(head_sects + tail_sects)
+	
+	
 	@classmethod
 	def _init_placehs_dict(
 			cls,
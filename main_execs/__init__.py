@@ -12,4 +12,5 @@ from ._private.config_reading import (
 	read_calccov_config
 )
 from ._private.focal_images_creation import create_focal_images
+from ._private.fenv_pool_creation import create_fenv_pool
 from ._private.getting_contmanager import retrieve_contmanager
\ No newline at end of file
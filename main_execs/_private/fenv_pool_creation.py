@@ -0,0 +1,43 @@
+from typing import Dict, Any
+
+from logic.focalproj_configuration.focal_container import FocalContainerPool
+
+
+
+def create_fenv_pool(
+		environ_config: Dict[str, Any]
+) -> FocalContainerPool:
+	"""
+		Crea l' eventuale pool di containers "caldi" degli ambienti focali, condiviso dalle verifiche
+		di linting e dai calcoli della coverage, a partire dalle impostazioni degli ambienti focali
+
+		Parameters
+		----------
+			environ_config: Dict[str, Any]
+				Un dizionario di valori variegati, indicizzato da stringhe, rappresentante la sezione "environ"
+				del file di configurazione degli ambienti focali. Contiene, opzionalmente, il campo "fenv_pool"
+				con i campi "size", "max_uses" e "keep_alive"
+
+		Returns
+		-------
+			FocalContainerPool
+				Un oggetto `FocalContainerPool` rappresentante il pool di containers creato, oppure `None`
+				se il campo "fenv_pool" non è presente nelle impostazioni fornite
+
+		Raises
+		------
+			ValueError
+				Si verifica se:
+
+					- Il campo "size" è minore di 1
+					- Il campo "max_uses" è negativo
+	"""
+	pool_config: Dict[str, Any] = environ_config.get("fenv_pool", None)
+	if pool_config is None:
+		return None
+	
+	return FocalContainerPool(
+		pool_size=pool_config.get("size", 1),
+		max_uses=pool_config.get("max_uses", 0),
+		keep_alive=pool_config.get("keep_alive", False)
+	)
\ No newline at end of file
@@ -36,7 +36,8 @@ def create_focal_images(
 		covtools_dir: str,
 		path_prefix: str,
 		logger: ATemporalFormattLogger,
-		pref_contman: str = None
+		pref_contman: str = None,
+		astroid_model: bool = False
 ) -> Dict[str, DockerImage]:
 	"""
 		Crea/Ottiene le immagini che corrispondono agli ambienti focali dei progetti focali
@@ -104,6 +105,11 @@ def create_focal_images(
 				manager installato nel sistema operativo. (vedi "Criterio di selezione del Container Manager"
 				nella documentazione completa)
 				
+			astroid_model: bool
+				Opzionale. Default = `False`. Un booleano che indica se pre-calcolare, nelle immagini create,
+				il modello di "astroid" dei moduli di ogni progetto focale. Le immagini esistenti, costruite
+				con una scelta differente, vengono ricostruite
+				
 		Returns
 		-------
 			Dict[str, DockerImage]
@@ -152,6 +158,9 @@ def create_focal_images(
 	focal_root: str
 	tests_root: str
 	
+	proj_image: DockerImage
+	astroid_label: str = "true" if astroid_model else "false"
+	
 	for proj_name, proj_info in projs_config.items():
 		log_format = logger.unset_format()
 		logger.log(f'Progetto focale attuale: "{proj_name}" ... ')
@@ -162,11 +171,21 @@ def create_focal_images(
 		full_root = proj_info["full_root"].rstrip(_PATH_SEPS)
 		
 		try:
-			focal_envs[proj_name] = cont_manager.images.get(
+			proj_image = cont_manager.images.get(
 				f"{image_prefix}_{proj_name}"
 			)
-			logger.log("OTTENUTA!")
 		except ImageNotFound:
+			proj_image = None
+		
+		# Le immagini precedenti al pre-calcolo del modello di "astroid" non ne riportano l' etichetta
+		if (proj_image is not None) and (
+				proj_image.labels.get(V1FocalEnvConfigurator.ASTROID_MODEL_LABEL, "false") == astroid_label
+		):
+			focal_envs[proj_name] = proj_image
+			logger.log("OTTENUTA!")
+		else:
+			if proj_image is not None:
+				logger.log("(modello di \"astroid\" non corrispondente alla configurazione) ...")
 			
 			focal_root = path_join(full_root, proj_info["focal_root"].rstrip(_PATH_SEPS))
 			tests_root = path_join(full_root, proj_info["tests_root"].rstrip(_PATH_SEPS))
@@ -177,7 +196,7 @@ def create_focal_images(
 				focal_root,
 				tests_root
 			)
-			focal_envs[proj_name] = fenv_confgor.build_image(True)
+			focal_envs[proj_name] = fenv_confgor.build_image(True, astroid_model)
 			logger.log("CREATA!")
 			
 		logger.set_messages_sep("\n\t")
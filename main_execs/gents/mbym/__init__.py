@@ -1,3 +1,8 @@
+from ._private.gencorr_pbyp import generate_correct_project
 from ._private.gencorr_mbym import generate_correct_mbym
 from ._private.gencorr_ebye import generate_correct_ebye
-from ._private.calculating_prompt_relpaths import calculate_prompt_relpaths
\ No newline at end of file
+from ._private.calculating_prompt_relpaths import calculate_prompt_relpaths
+from ._private.entity_workers import (
+	EntityWorkersPool,
+	create_entity_workers
+)
\ No newline at end of file
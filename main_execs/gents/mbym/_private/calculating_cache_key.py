@@ -0,0 +1,50 @@
+from typing import List, Dict, Any
+
+# ============ Hashing Utilities ============ #
+from hashlib import sha256
+from json import dumps as json_dumps
+# =========================================== #
+
+
+
+def calculate_cache_key(
+		model: str,
+		hparams: Dict[str, Any],
+		entity_code: str,
+		prompts: List[str]
+) -> str:
+	"""
+		Calcola la chiave, indirizzata dal contenuto, dei tentativi di un' entità nelle caches
+		delle test-suites parziali
+		
+		Parameters
+		----------
+			model: str
+				Una stringa contenente il nome del LLM che produce i tentativi
+				
+			hparams: Dict[str, Any]
+				Un dizionario, indicizzato dagli identificatori degli iperparametri, contenente
+				i valori effettivi degli iperparametri del LLM (`None` se non è noto alcun iperparametro)
+				
+			entity_code: str
+				Una stringa contenente il codice dell' entità (`None` se non è noto)
+				
+			prompts: List[str]
+				Una lista di stringhe contenente i prompts, o i template prompts, da cui dipendono
+				i tentativi dell' entità
+				
+		Returns
+		-------
+			str
+				Una stringa contenente il digest SHA-256 di tutti gli elementi forniti
+	"""
+	key_repr: str = json_dumps(
+		[
+			model,
+			hparams if hparams is not None else dict(),
+			entity_code,
+			prompts
+		],
+		sort_keys=True, ensure_ascii=False, default=str
+	)
+	return sha256(key_repr.encode("utf-8")).hexdigest()
\ No newline at end of file
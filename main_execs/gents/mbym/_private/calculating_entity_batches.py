@@ -0,0 +1,50 @@
+from typing import List, Tuple
+
+
+
+def calculate_entity_batches(
+		entities: List[Tuple[str, str]],
+		max_entity_size: int,
+		max_batch_size: int,
+) -> List[List[str]]:
+	"""
+		Raggruppa le entità "piccole" (il cui codice non supera la dimensione massima fornita) in lotti,
+		rispettando l' ordine in cui sono fornite. Le entità restanti, e i lotti composti da una sola
+		entità, non vengono raggruppati
+		
+		Parameters
+		----------
+			entities: List[Tuple[str, str]]
+				Una lista di tuple contenenti il nome ed il codice di ogni entità da raggruppare
+				
+			max_entity_size: int
+				Un intero indicante la dimensione massima (in caratteri) del codice di un' entità
+				affinchè essa possa essere raggruppata
+				
+			max_batch_size: int
+				Un intero indicante il numero massimo di entità di ogni lotto
+				
+		Returns
+		-------
+			List[List[str]]
+				Una lista di liste di stringhe, contenenti ognuna i nomi delle entità di un lotto
+	"""
+	batches: List[List[str]] = list()
+	curr_batch: List[str] = list()
+	for entity_name, entity_code in entities:
+		if len(entity_code) > max_entity_size:
+			continue
+		
+		# Una stessa entità (es. un metodo ridefinito) non viene raggruppata due volte
+		if any([entity_name in batch for batch in batches]) or (entity_name in curr_batch):
+			continue
+		
+		curr_batch.append(entity_name)
+		if len(curr_batch) == max_batch_size:
+			batches.append(curr_batch)
+			curr_batch = list()
+	
+	if len(curr_batch) > 1:
+		batches.append(curr_batch)
+	
+	return batches
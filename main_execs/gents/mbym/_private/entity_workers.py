@@ -0,0 +1,302 @@
+from typing import List, Tuple, Dict, Any, Callable
+
+# ============ Concurrency Utilities ============ #
+from concurrent.futures import (
+	ThreadPoolExecutor,
+	Future
+)
+from queue import Queue
+# =============================================== #
+
+from logic.ptsuite_generation.llm_access.llm_apiaccessor import (
+	ILlmApiAccessor, LlmApiAccessorFactory
+)
+from logic.ptsuite_generation.llm_access.llm_respcache import ILlmResponseCache
+from logic.ptsuite_generation.llm_access.llm_chat import (
+	ILlmChat, LlmChatFactory, ELlmChatApis
+)
+from logic.ptsuite_generation.core.generation import EntityPtsuiteGenerator
+
+from logic.ptsuite_generation.core.checking.synt_checker import (
+	ISyntacticChecker,
+	SyntacticCheckerFactory, ESyntCheckerTool
+)
+from logic.ptsuite_generation.core.checking.lint_checker import LintingChecker
+from logic.ptsuite_generation.core.correction.synt_corrector import PtsuiteSyntacticCorrector
+from logic.ptsuite_generation.core.correction.lint_corrector import PtsuiteLintingCorrector
+
+from logic.utils.logger import ATemporalFormattLogger
+from logic.utils.pipeline_stage import PipelineStage
+
+from main_execs.gents.ptsuite_gen import inst_apiaccsor
+
+
+# Componenti posseduti da un singolo worker:
+#	(generatore, accessor, chat, correttore sintattico, correttore di linting, verificatore sintattico)
+WorkerComps = Tuple[
+	EntityPtsuiteGenerator, ILlmApiAccessor, ILlmChat,
+	PtsuiteSyntacticCorrector, PtsuiteLintingCorrector,
+	ISyntacticChecker
+]
+
+
+
+class EntityWorkersPool:
+	"""
+		Rappresenta un insieme di workers capaci di portare avanti, in modo concorrente, il processo di
+		"Generazione e Correzione" della test-suite parziale di più entità (anche di moduli differenti).
+
+		Ogni worker possiede i propri componenti di generazione e correzione (e quindi la propria chat
+		e il proprio accessor alla piattaforma di inferenza), mentre il verificatore di linting
+		(e quindi l' ambiente focale) è condiviso tra tutti i workers.
+		
+		Opzionalmente le richieste ai LLMs e le verifiche di correttezza dei workers possono essere eseguite
+		da stadi di pipeline separati (uno "produttore" e uno "consumatore"), in modo che mentre un' entità
+		viene verificata un' altra possa essere in generazione.
+	"""
+
+	def __init__(
+			self,
+			workers_comps: List[WorkerComps],
+			stages: List[PipelineStage] = None
+	):
+		"""
+			Costruisce un nuovo EntityWorkersPool associandolo ai componenti di ogni worker
+
+			Parameters
+			----------
+				workers_comps: List[WorkerComps]
+					Una lista di tuple contenente, per ogni worker, i componenti di generazione e correzione
+					che gli sono assegnati
+					
+				stages: List[PipelineStage]
+					Opzionale. Default = `None`. Una lista di oggetti `PipelineStage` rappresentante gli stadi
+					di pipeline utilizzati dai componenti dei workers, da monitorare e chiudere insieme al pool
+
+			Raises
+			------
+				ValueError
+					Si verifica se il parametro `workers_comps` ha valore `None` o è una lista vuota
+		"""
+		if (workers_comps is None) or (len(workers_comps) == 0):
+			raise ValueError()
+
+		self._workers_comps: List[WorkerComps] = workers_comps
+		self._stages: List[PipelineStage] = stages if stages is not None else list()
+
+		# Componenti dei workers attualmente non occupati da alcuna entità
+		self._free_comps: Queue = Queue()
+		for comps in self._workers_comps:
+			self._free_comps.put(comps)
+
+		self._executor: ThreadPoolExecutor = ThreadPoolExecutor(
+			max_workers=len(self._workers_comps),
+			thread_name_prefix="gtsai_entity_worker"
+		)
+		self._pending: List[Future] = list()
+
+
+	def workers_num(self) -> int:
+		"""
+			Restituisce il numero di workers di questo pool
+
+			Returns
+			-------
+				int
+					Un intero indicante il numero di entità processabili contemporaneamente
+		"""
+		return len(self._workers_comps)
+
+
+	def accessors(self) -> List[ILlmApiAccessor]:
+		"""
+			Restituisce gli accessors alla piattaforma di inferenza posseduti dai workers,
+			in modo da potervi impostare il modello e gli iperparametri da utilizzare
+
+			Returns
+			-------
+				List[ILlmApiAccessor]
+					Una lista di oggetti `ILlmApiAccessor`, uno per ogni worker
+		"""
+		return [comps[1] for comps in self._workers_comps]
+
+
+	def stages_stats(self) -> Dict[str, Dict[str, float]]:
+		"""
+			Restituisce le statistiche di funzionamento di ogni stadio di pipeline
+			utilizzato dai workers
+
+			Returns
+			-------
+				Dict[str, Dict[str, float]]
+					Un dizionario, indicizzato dal nome dello stadio, contenente le statistiche
+					restituite da `PipelineStage.stats()`.
+					Se i workers non utilizzano stadi di pipeline viene restituito un dizionario vuoto
+		"""
+		return {stage.name(): stage.stats() for stage in self._stages}
+
+
+	def submit(
+			self,
+			entity_task: Callable[[WorkerComps], None]
+	):
+		"""
+			Sottomette il processo di "Generazione e Correzione" di un' entità al primo worker libero.
+			L' operazione non è bloccante.
+
+			Parameters
+			----------
+				entity_task: Callable[[WorkerComps], None]
+					Un callable che riceve i componenti del worker a cui è stata assegnata
+					l' entità e ne esegue il processo completo
+
+			Raises
+			------
+				ValueError
+					Si verifica se il parametro `entity_task` ha valore `None`
+		"""
+		if entity_task is None:
+			raise ValueError()
+
+		self._pending.append(
+			self._executor.submit(self._run_entity_task, entity_task)
+		)
+
+
+	def wait_pending(self):
+		"""
+			Attende il termine di ogni entità sottomessa a questo pool.
+
+			Raises
+			------
+				Exception
+					L' eventuale prima eccezione sollevata da una delle entità terminate
+		"""
+		pending: List[Future] = self._pending
+		self._pending = list()
+
+		first_exc: BaseException = None
+		for future in pending:
+			exc: BaseException = future.exception()
+			if (exc is not None) and (first_exc is None):
+				first_exc = exc
+
+		if first_exc is not None:
+			raise first_exc
+
+
+	def shutdown(self):
+		"""
+			Attende il termine di ogni entità sottomessa e libera i threads dei workers
+			e degli eventuali stadi di pipeline
+		"""
+		self._executor.shutdown(wait=True)
+		self._pending = list()
+		
+		for stage in self._stages:
+			stage.close()
+
+
+	##	============================================================
+	##						PRIVATE METHODS
+	##	============================================================
+
+
+	def _run_entity_task(
+			self,
+			entity_task: Callable[[WorkerComps], None]
+	):
+		"""
+			Esegue il processo di un' entità riservando i componenti di un worker libero
+			per tutta la sua durata
+		"""
+		comps: WorkerComps = self._free_comps.get()
+		try:
+			entity_task(comps)
+		finally:
+			# Pulizia della chat del worker prima di renderlo nuovamente disponibile
+			comps[2].clear()
+			self._free_comps.put(comps)
+
+
+
+def create_entity_workers(
+		workers_num: int,
+		platform_name: str,
+		platf_options: Dict[str, Any],
+		max_tries: Tuple[int, int],
+		lint_chker: LintingChecker,
+		resp_format: str = None,
+		logger_factory: Callable[[], ATemporalFormattLogger] = None,
+		stages: Tuple[PipelineStage, PipelineStage] = None,
+		stop_format: str = None,
+		resp_cache: ILlmResponseCache = None,
+		synt_tool: ESyntCheckerTool = ESyntCheckerTool.INMEMORY_COMPILE,
+) -> EntityWorkersPool:
+	"""
+		Crea un `EntityWorkersPool` con `workers_num` workers, ognuno con la propria chat,
+		il proprio accessor alla piattaforma di inferenza e i propri componenti di
+		generazione e correzione. Il verificatore di linting è condiviso tra tutti i workers.
+		
+		Se viene fornito un costruttore di loggers, ogni worker utilizza un proprio logger (l' accessor
+		alla piattaforma di inferenza ne modifica il formato ad ogni richiesta).
+		
+		Se vengono forniti gli stadi di pipeline (produttore, consumatore), le richieste ai LLMs
+		vengono eseguite dal primo e le verifiche sintattiche dal secondo. Il verificatore di linting
+		fornito deve essere già associato allo stadio consumatore.
+		
+		Se viene fornito un formato di terminazione, le risposte dei LLMs vengono interrotte
+		non appena ne contengono una corrispondenza completa.
+		
+		Se viene fornita una cache delle risposte dei LLMs, essa è condivisa tra tutti i workers
+		ed è consultata prima di accodare le richieste allo stadio produttore.
+		
+		Ogni worker possiede il proprio verificatore sintattico, che utilizza il tool di verifica fornito
+	"""
+	if workers_num <= 0:
+		raise ValueError()
+
+	max_gen_tries, max_corr_tries = max_tries
+	llm_stage: PipelineStage = None
+	check_stage: PipelineStage = None
+	if stages is not None:
+		llm_stage, check_stage = stages
+	
+	workers_comps: List[WorkerComps] = list()
+	logger: ATemporalFormattLogger
+	for _ in range(workers_num):
+		logger = logger_factory() if logger_factory is not None else None
+		chat: ILlmChat = LlmChatFactory.create(
+			ELlmChatApis[platform_name.upper()]
+		)
+		platform: ILlmApiAccessor = inst_apiaccsor(platform_name, platf_options, logger, stop_format)
+
+		synt_chker: ISyntacticChecker = SyntacticCheckerFactory.create(synt_tool)
+		if llm_stage is not None:
+			platform = LlmApiAccessorFactory.staged(platform, llm_stage)
+		if resp_cache is not None:
+			platform = LlmApiAccessorFactory.cached(platform, resp_cache)
+		platform.set_chat(chat)
+		if check_stage is not None:
+			synt_chker = SyntacticCheckerFactory.staged(synt_chker, check_stage)
+		workers_comps.append((
+			EntityPtsuiteGenerator(
+				max_gen_tries, platform,
+				resp_format=resp_format, logger=logger
+			),
+			platform, chat,
+			PtsuiteSyntacticCorrector(
+				max_corr_tries, platform, synt_chker,
+				resp_format=resp_format, logger=logger
+			),
+			PtsuiteLintingCorrector(
+				max_corr_tries, platform, lint_chker,
+				resp_format=resp_format, logger=logger
+			),
+			synt_chker
+		))
+
+	return EntityWorkersPool(
+		workers_comps,
+		[stage for stage in (llm_stage, check_stage) if stage is not None]
+	)
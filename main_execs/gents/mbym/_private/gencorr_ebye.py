@@ -1,4 +1,7 @@
-from typing import List, Tuple
+from typing import List, Dict, Tuple, Any
+
+from copy import deepcopy
+from functools import partial
 
 # ============ Path Utilities ============ #
 from os.path import join as path_join
@@ -20,8 +23,11 @@ from logic.ptsuite_generation.cache_accessor import IPtsuiteCacheAccessor
 
 from logic.utils.logger import ATemporalFormattLogger
 
+from .entity_workers import EntityWorkersPool, WorkerComps
 from .calculating_ptsuite_name import calculate_ptsuite_fname
+from .calculating_cache_key import calculate_cache_key
 from .generate import generate_ptsuite
+from .generate_batch import generate_ptsuites_batch
 from .synt_correction import correct_syntactically
 from .lint_correction import correct_lintically
 
@@ -44,10 +50,256 @@ def generate_correct_ebye(
 		caches: Tuple[IPtsuiteCacheAccessor, IPtsuiteCacheAccessor, IPtsuiteCacheAccessor],
 		logger: ATemporalFormattLogger,
 		entityprefix_comps: Tuple[str, str, str] = tuple(),
+		workers: EntityWorkersPool = None,
+		entities_context: Tuple[str, Dict[str, str]] = None,
+		entities_batches: List[List[str]] = None,
+		entities_code: Dict[str, str] = None,
+		hparams: Dict[str, Any] = None,
+		key_excluded: List[str] = None,
 ):
 	entity_gen_pbder, entity_corr_pbder = prompt_builders
-	synt_corr, lint_corr = ptsuite_corrs
-	synt_chker, lint_chker = ptsuite_chkers
+	lint_chker: LintingChecker = ptsuite_chkers[1]
+	
+	# Le entità raggruppate in lotti vengono generate con un' unica richiesta per lotto,
+	# e poi corrette singolarmente
+	batched_names: List[str] = list()
+	batch_context: Tuple[str, Dict[str, str]]
+	for batch in (entities_batches if entities_batches is not None else []):
+		batched_names.extend(batch)
+		batch_code = {
+			entity_name: (entities_code.get(entity_name, None) if entities_code is not None else None)
+			for entity_name in batch
+		}
+		batch_context = None
+		if entities_context is not None:
+			batch_context = (entities_context[0], {
+				entity_name: entities_context[1][entity_name]
+				for entity_name in batch
+			})
+		
+		if workers is None:
+			_generate_correct_batch(
+				project_name, dotted_modname,
+				model,
+				module_dirpath,
+				batch,
+				prompt_builders,
+				entity_placeh, corr_placehs,
+				(ptsuite_gen, None, chat, ptsuite_corrs[0], ptsuite_corrs[1], ptsuite_chkers[0]),
+				lint_chker,
+				max_tries, resp_timeout,
+				skipd_writers, caches,
+				logger,
+				entityprefix_comps,
+				batch_context,
+				batch_code,
+				hparams,
+				key_excluded
+			)
+			chat.clear()
+		else:
+			workers.submit(partial(
+				_generate_correct_batch,
+				project_name, dotted_modname,
+				model,
+				module_dirpath,
+				batch,
+				(deepcopy(entity_gen_pbder), deepcopy(entity_corr_pbder)),
+				entity_placeh, corr_placehs,
+				lint_chker=lint_chker,
+				max_tries=max_tries, resp_timeout=resp_timeout,
+				skipd_writers=skipd_writers, caches=caches,
+				logger=logger,
+				entityprefix_comps=entityprefix_comps,
+				batch_context=batch_context,
+				batch_code=batch_code,
+				hparams=hparams,
+				key_excluded=key_excluded
+			))
+	
+	entity_context: Tuple[str, str]
+	for entity_name in entities_name:
+		if entity_name in batched_names:
+			continue
+		
+		# Se è stato fornito il contesto di ogni entità esso sostituisce, nel prompt di generazione,
+		# il codice dell' intero module-file
+		entity_context = None
+		if entities_context is not None:
+			entity_context = (entities_context[0], entities_context[1][entity_name])
+		
+		# Se non è stato fornito alcun pool di workers le entità
+		# vengono processate una dopo l' altra
+		if workers is None:
+			_generate_correct_entity(
+				project_name, dotted_modname,
+				model,
+				module_dirpath,
+				entity_name,
+				prompt_builders,
+				entity_placeh, corr_placehs,
+				(ptsuite_gen, None, chat, ptsuite_corrs[0], ptsuite_corrs[1], ptsuite_chkers[0]),
+				lint_chker,
+				max_tries, resp_timeout,
+				skipd_writers, caches,
+				logger,
+				entityprefix_comps,
+				entity_context,
+				entities_code.get(entity_name, None) if entities_code is not None else None,
+				hparams,
+				key_excluded
+			)
+			chat.clear()
+		# Sennò ogni entità riceve una copia dei prompt builders (con i placeholders del modulo
+		# già impostati) e viene sottomessa al primo worker libero
+		else:
+			workers.submit(partial(
+				_generate_correct_entity,
+				project_name, dotted_modname,
+				model,
+				module_dirpath,
+				entity_name,
+				(deepcopy(entity_gen_pbder), deepcopy(entity_corr_pbder)),
+				entity_placeh, corr_placehs,
+				lint_chker=lint_chker,
+				max_tries=max_tries, resp_timeout=resp_timeout,
+				skipd_writers=skipd_writers, caches=caches,
+				logger=logger,
+				entityprefix_comps=entityprefix_comps,
+				entity_context=entity_context,
+				entity_code=entities_code.get(entity_name, None) if entities_code is not None else None,
+				hparams=hparams,
+				key_excluded=key_excluded
+			))
+		
+		
+##	============================================================
+##						PRIVATE FUNCTIONS
+##	============================================================
+
+
+def _generate_correct_batch(
+		project_name: str, dotted_modname: str,
+		model: str,
+		module_dirpath: str,
+		entities_name: List[str],
+		prompt_builders: Tuple[PromptBuilder, PromptBuilder],
+		entity_placeh: str,
+		corr_placehs: Tuple[str, str, str],
+		worker_comps: WorkerComps,
+		lint_chker: LintingChecker,
+		max_tries: Tuple[int, int], resp_timeout: int,
+		skipd_writers: Tuple[ISkipWriter, ISkipWriter],
+		caches: Tuple[IPtsuiteCacheAccessor, IPtsuiteCacheAccessor, IPtsuiteCacheAccessor],
+		logger: ATemporalFormattLogger,
+		entityprefix_comps: Tuple[str, str, str] = tuple(),
+		batch_context: Tuple[str, Dict[str, str]] = None,
+		batch_code: Dict[str, str] = None,
+		hparams: Dict[str, Any] = None,
+		key_excluded: List[str] = None,
+):
+	"""
+		Esegue il processo di "Generazione e Correzione" di un lotto di entità: le test-suites parziali
+		vengono generate con un' unica richiesta e registrate nella cache di generazione, dopodichè ogni
+		entità segue singolarmente il normale processo (trovando la propria test-suite parziale nella cache).
+		
+		La chat di ogni entità generata nel lotto viene inizializzata con il prompt del lotto e con la sola
+		test-suite parziale dell' entità, in modo che le eventuali richieste di correzione abbiano un contesto.
+		
+		Ogni entità del lotto è registrata nella cache di generazione con la chiave della sua generazione
+		singola, in modo che il normale processo ve la trovi
+	"""
+	entity_gen_pbder, _ = prompt_builders
+	ptsuite_gen, _, chat, _, _, _ = worker_comps
+	entity_class: str = ""
+	entity_promptsep: str = ""
+	if len(entityprefix_comps) != 0:
+		entity_class, entity_promptsep, _ = entityprefix_comps
+	
+	# Calcolo delle chiavi di generazione delle entità (prima che il prompt contenga il contesto del lotto)
+	cache_keys: Dict[str, str] = {
+		entity_name: calculate_cache_key(
+			model, hparams,
+			batch_code.get(entity_name, None) if batch_code is not None else None,
+			[_entity_key_prompt(
+				entity_gen_pbder, entity_placeh, entity_name,
+				(batch_context[0], batch_context[1][entity_name]) if batch_context is not None else None,
+				key_excluded
+			)]
+		)
+		for entity_name in entities_name
+	}
+	
+	# Con lo "slicing" del contesto il prompt del lotto contiene i contesti di tutte le sue entità
+	if batch_context is not None:
+		entity_gen_pbder.set_placeholder(
+			batch_context[0], "\n\n\n".join(batch_context[1].values())
+		)
+	
+	batch_prompt: str
+	batch_ptsuites: Dict[str, str]
+	batch_prompt, batch_ptsuites = generate_ptsuites_batch(
+		project_name, dotted_modname,
+		model,
+		entities_name, cache_keys,
+		entity_gen_pbder, entity_placeh,
+		ptsuite_gen, chat,
+		resp_timeout,
+		caches[0],
+		logger,
+		cache_entprefix = f"{entity_class}{entity_promptsep}",
+		entity_class = entity_class
+	)
+	chat.clear()
+	
+	for entity_name in entities_name:
+		if entity_name in batch_ptsuites:
+			chat.add_prompt(batch_prompt)
+			chat.add_response(f"```python\n{batch_ptsuites[entity_name]}```")
+		
+		_generate_correct_entity(
+			project_name, dotted_modname,
+			model,
+			module_dirpath,
+			entity_name,
+			prompt_builders,
+			entity_placeh, corr_placehs,
+			worker_comps,
+			lint_chker,
+			max_tries, resp_timeout,
+			skipd_writers, caches,
+			logger,
+			entityprefix_comps,
+			(batch_context[0], batch_context[1][entity_name]) if batch_context is not None else None,
+			batch_code.get(entity_name, None) if batch_code is not None else None,
+			hparams,
+			key_excluded
+		)
+		chat.clear()
+
+
+def _generate_correct_entity(
+		project_name: str, dotted_modname: str,
+		model: str,
+		module_dirpath: str,
+		entity_name: str,
+		prompt_builders: Tuple[PromptBuilder, PromptBuilder],
+		entity_placeh: str,
+		corr_placehs: Tuple[str, str, str],
+		worker_comps: WorkerComps,
+		lint_chker: LintingChecker,
+		max_tries: Tuple[int, int], resp_timeout: int,
+		skipd_writers: Tuple[ISkipWriter, ISkipWriter],
+		caches: Tuple[IPtsuiteCacheAccessor, IPtsuiteCacheAccessor, IPtsuiteCacheAccessor],
+		logger: ATemporalFormattLogger,
+		entityprefix_comps: Tuple[str, str, str] = tuple(),
+		entity_context: Tuple[str, str] = None,
+		entity_code: str = None,
+		hparams: Dict[str, Any] = None,
+		key_excluded: List[str] = None,
+):
+	entity_gen_pbder, entity_corr_pbder = prompt_builders
+	ptsuite_gen, _, chat, synt_corr, lint_corr, synt_chker = worker_comps
 	max_gen_tries, max_corr_tries = max_tries
 	ent_gen_skipw, ent_corr_skipw = skipd_writers
 	gen_cache, corrs_cache, corrl_cache = caches
@@ -57,108 +309,139 @@ def generate_correct_ebye(
 	if len(entityprefix_comps) != 0:
 		entity_class, entity_promptsep, entity_filesep = entityprefix_comps
 	
-	entity_name: str
 	entity_name_fq: str
 	entity_name_topr: str
 	ptsuite_code: str
 	ptsuite_fname: str
 	ptsuite_path: str
+	gen_prompt: str
+	key_prompt: str
+	gen_key: str
+	corr_key: str
 
-	i: int = 0
-	while i < len(entities_name):
-		entity_name = entities_name[i]
-		entity_name_fq = f"{dotted_modname}."
-		if entity_class != "":
-			entity_name_fq += f"{entity_class}{entity_promptsep}"
-		entity_name_fq += entity_name
-		
-		entity_name_topr = (
-			f"{(entity_class+entity_filesep if entity_class != '' else '')}"
-		    f"{entity_name}"
-		)
-		logger.log(f' ', format_=False)
-		logger.log(f'Entità: ==== "{entity_name_topr}" ====')
-		
-		# Calcolo del nome della test-suite parziale
-		ptsuite_fname = calculate_ptsuite_fname(entity_name, f"{entity_class}{entity_filesep}")
-		
-		# ===== Processo di "Generazione della test-suite parziale" =====
-		entity_gen_pbder.set_placeholder(entity_placeh, entity_name)
-		ptsuite_code = generate_ptsuite(
-			project_name, dotted_modname,
-			model,
-			entity_name,
-		    entity_gen_pbder.build_prompt(),
-			ptsuite_gen, chat,
-			max_gen_tries, resp_timeout,
-			gen_cache,
-			logger,
-			cache_entprefix = f"{entity_class}{entity_promptsep}"
-		)
-		# Se la generazione non ha avuto successo
-		if ptsuite_code is None:
-			# si dichiara saltata l' entità
-			ent_gen_skipw.write_skipd_test(entity_name_fq)
-			# e si passa alla prossima entità
-			i += 1
-			chat.clear()
-			continue
-		
-		# ===== Processo di "Correzione Sintattica della test-suite parziale" =====
-		entity_corr_pbder.set_placeholder(entity_placeh, entity_name)
-		ptsuite_code = correct_syntactically(
-			project_name, dotted_modname,
-			model,
-			(entity_name, entity_placeh),
-			ptsuite_code,
-			entity_corr_pbder,
-			corr_placehs,
-			(synt_corr, synt_chker), chat,
-			max_corr_tries, resp_timeout,
-			corrs_cache,
-			logger,
-			cache_entprefix = f"{entity_class}{entity_promptsep}"
-		)
-		# Se la correzione sintattica non ha avuto successo
-		if ptsuite_code is None:
-			# si dichiara saltata l' entità
-			ent_corr_skipw.write_skipd_test(entity_name_fq)
-			# e si passa alla prossima entità
-			i += 1
-			chat.clear()
-			continue
-		
-		# ===== Processo di "Correzione a livello di Linting della test-suite parziale" =====
-		ptsuite_code = correct_lintically(
-			project_name, dotted_modname,
-			model,
-			(entity_name, entity_placeh),
-			ptsuite_code,
-			entity_corr_pbder,
-			corr_placehs,
-			(lint_corr, lint_chker), chat,
-			max_corr_tries, resp_timeout,
-			corrl_cache,
-			logger,
-			cache_entprefix = f"{entity_class}{entity_promptsep}"
-		)
-		# Se la correzione a livello di linting non ha avuto successo
-		if ptsuite_code is None:
-			# si dichiara saltata l' entità
-			ent_corr_skipw.write_skipd_test(entity_name_fq)
-			# e si passa alla prossima entità
-			i += 1
-			chat.clear()
-			continue
-			
-		# Sennò se nessuno dei casi precedenti è avvenuto allora la test-suite parziale
-		# è stata generata e viene dichiarata corretta.
-		# Viene quindi scritta all' interno del suo file che la rappresenta
-		ptsuite_path = path_join(module_dirpath, ptsuite_fname)
-		
-		with open(ptsuite_path, "w") as fptsuite:
-			fptsuite.write(ptsuite_code)
-			fptsuite.flush()
+	entity_name_fq = f"{dotted_modname}."
+	if entity_class != "":
+		entity_name_fq += f"{entity_class}{entity_promptsep}"
+	entity_name_fq += entity_name
+	
+	entity_name_topr = (
+		f"{(entity_class+entity_filesep if entity_class != '' else '')}"
+	    f"{entity_name}"
+	)
+	logger.log(f' ', format_=False)
+	logger.log(f'Entità: ==== "{entity_name_topr}" ====')
+	
+	# Calcolo del nome della test-suite parziale
+	ptsuite_fname = calculate_ptsuite_fname(entity_name, f"{entity_class}{entity_filesep}")
+	
+	# ===== Calcolo delle chiavi, indirizzate dal contenuto, dei tentativi nelle caches =====
+	# (i tentativi di correzione dipendono anche dal prompt di generazione, da cui dipende il codice da correggere)
+	key_prompt = _entity_key_prompt(entity_gen_pbder, entity_placeh, entity_name, entity_context, key_excluded)
+	gen_prompt = entity_gen_pbder.build_prompt()
+	gen_key = calculate_cache_key(model, hparams, entity_code, [key_prompt])
+	corr_key = calculate_cache_key(
+		model, hparams, entity_code,
+		[key_prompt, entity_corr_pbder.template_prompt()]
+	)
+	
+	# ===== Processo di "Generazione della test-suite parziale" =====
+	ptsuite_code = generate_ptsuite(
+		project_name, dotted_modname,
+		model,
+		entity_name, gen_key,
+	    gen_prompt,
+		ptsuite_gen, chat,
+		max_gen_tries, resp_timeout,
+		gen_cache,
+		logger,
+		cache_entprefix = f"{entity_class}{entity_promptsep}"
+	)
+	# Se la generazione non ha avuto successo
+	if ptsuite_code is None:
+		# si dichiara saltata l' entità
+		ent_gen_skipw.write_skipd_test(entity_name_fq)
+		return
+	
+	# ===== Processo di "Correzione Sintattica della test-suite parziale" =====
+	entity_corr_pbder.set_placeholder(entity_placeh, entity_name)
+	ptsuite_code = correct_syntactically(
+		project_name, dotted_modname,
+		model,
+		(entity_name, entity_placeh),
+		corr_key,
+		ptsuite_code,
+		entity_corr_pbder,
+		corr_placehs,
+		(synt_corr, synt_chker), chat,
+		max_corr_tries, resp_timeout,
+		corrs_cache,
+		logger,
+		cache_entprefix = f"{entity_class}{entity_promptsep}"
+	)
+	# Se la correzione sintattica non ha avuto successo
+	if ptsuite_code is None:
+		# si dichiara saltata l' entità
+		ent_corr_skipw.write_skipd_test(entity_name_fq)
+		return
+	
+	# ===== Processo di "Correzione a livello di Linting della test-suite parziale" =====
+	ptsuite_code = correct_lintically(
+		project_name, dotted_modname,
+		model,
+		(entity_name, entity_placeh),
+		corr_key,
+		ptsuite_code,
+		entity_corr_pbder,
+		corr_placehs,
+		(lint_corr, lint_chker), chat,
+		max_corr_tries, resp_timeout,
+		corrl_cache,
+		logger,
+		cache_entprefix = f"{entity_class}{entity_promptsep}"
+	)
+	# Se la correzione a livello di linting non ha avuto successo
+	if ptsuite_code is None:
+		# si dichiara saltata l' entità
+		ent_corr_skipw.write_skipd_test(entity_name_fq)
+		return
 		
-		i += 1
-		chat.clear()
\ No newline at end of file
+	# Sennò se nessuno dei casi precedenti è avvenuto allora la test-suite parziale
+	# è stata generata e viene dichiarata corretta.
+	# Viene quindi scritta all' interno del suo file che la rappresenta
+	ptsuite_path = path_join(module_dirpath, ptsuite_fname)
+	
+	with open(ptsuite_path, "w") as fptsuite:
+		fptsuite.write(ptsuite_code)
+		fptsuite.flush()
+
+
+def _entity_gen_prompt(
+		entity_gen_pbder: PromptBuilder,
+		entity_placeh: str,
+		entity_name: str,
+		entity_context: Tuple[str, str] = None
+) -> str:
+	"""
+		Costruisce il prompt di generazione dell' entità fornita, sostituendone il nome e
+		l' eventuale contesto nel prompt builder di generazione
+	"""
+	entity_gen_pbder.set_placeholder(entity_placeh, entity_name)
+	if entity_context is not None:
+		entity_gen_pbder.set_placeholder(entity_context[0], entity_context[1])
+	return entity_gen_pbder.build_prompt()
+
+
+def _entity_key_prompt(
+		entity_gen_pbder: PromptBuilder,
+		entity_placeh: str,
+		entity_name: str,
+		entity_context: Tuple[str, str] = None,
+		key_excluded: List[str] = None
+) -> str:
+	"""
+		Costruisce il prompt di generazione dell' entità fornita che fa parte delle chiavi dei suoi tentativi
+		nelle caches, lasciando invariati i placeholders esclusi dalle chiavi (es. il codice del modulo, sostituito
+		nella chiave dal codice dell' entità, e il nome del progetto focale)
+	"""
+	_entity_gen_prompt(entity_gen_pbder, entity_placeh, entity_name, entity_context)
+	return entity_gen_pbder.build_partial_prompt(key_excluded if key_excluded is not None else [])
\ No newline at end of file
@@ -1,4 +1,4 @@
-from typing import Dict, Tuple, List
+from typing import Dict, Tuple, List, Any
 
 # ============ Path Utilities ============ #
 from os.path import (
@@ -11,6 +11,8 @@ from pathlib import Path as SystemPath
 # ======================================== #
 
 from main_execs.gents.mbym._private.gencorr_ebye import generate_correct_ebye
+from main_execs.gents.mbym._private.entity_workers import EntityWorkersPool
+from main_execs.gents.mbym._private.calculating_entity_batches import calculate_entity_batches
 
 from logic.ptsuite_generation.cache_accessor import IPtsuiteCacheAccessor
 
@@ -60,6 +62,10 @@ def generate_correct_mbym(
 			str, Tuple[str, str, str, str]
 		],
 		logger: ATemporalFormattLogger,
+		workers: EntityWorkersPool = None,
+		context_slicing: bool = False,
+		entity_batching: Tuple[int, int] = None,
+		hparams: Dict[str, Any] = None,
 ):
 	"""
 		TODO: Contract ||
@@ -102,8 +108,35 @@ def generate_correct_mbym(
 	clss: List[IClassDeclsExtractor] = moddecl_extr.extract_classes()
 	logger.log("Codice focale del modulo estratto!")
 	
+	# Con lo "slicing" del contesto ogni prompt di generazione contiene soltanto il contesto
+	# dell' entità (imports, firme dei nomi referenziati e codice dell' entità) e non l' intero modulo
+	funcs_context: Tuple[str, Dict[str, str]] = None
+	if context_slicing:
+		funcs_context = (placehs["code"], {
+			func_name: moddecl_extr.extract_entity_context(func_name)
+			for func_name in func_names
+		})
+	
+	# Il codice di ogni funzione fa parte delle chiavi dei suoi tentativi nelle caches
+	# (di un' entità ridefinita viene considerata l' ultima definizione)
+	funcs_list: List[Tuple[str, str]] = list(zip(func_names, moddecl_extr.extract_funcs()))
+	funcs_code: Dict[str, str] = dict(funcs_list)
+	
+	# Raggruppamento in lotti delle funzioni "piccole" (una sola richiesta di generazione per lotto)
+	funcs_batches: List[List[str]] = None
+	if entity_batching is not None:
+		funcs_batches = calculate_entity_batches(
+			funcs_list,
+			entity_batching[0], entity_batching[1]
+		)
+	
 	ptsuite_code: str
 	
+	# Il codice del modulo (o il contesto dell' entità) e il nome del progetto focale non fanno parte delle
+	# chiavi dei tentativi nelle caches: un' entità invariata mantiene i propri tentativi anche se il resto
+	# del modulo cambia o il progetto focale viene rinominato
+	key_excluded: List[str] = [placehs["code"], placehs["project"]]
+	
 	# ===== Processo di "Generazione e Correzione delle test-suite parziali delle funzioni" =====
 	func_pbder.set_placeholder(placehs["code"], module_code)
 	logger.log("Inizio generazione delle test-suites parziali delle funzioni ...")
@@ -122,7 +155,13 @@ def generate_correct_mbym(
 		max_tries, resp_timeout,
 		(genf_skipw, corrf_skipw),
 		(genf_cache, corrs_cache, corrl_cache),
-		logger
+		logger,
+		workers=workers,
+		entities_context=funcs_context,
+		entities_batches=funcs_batches,
+		entities_code=funcs_code,
+		hparams=hparams,
+		key_excluded=key_excluded
 	)
 	logger.set_messages_sep("\n\t\t\t")
 	logger.log("Fine generazione delle test-suites parziali delle funzioni")
@@ -131,10 +170,26 @@ def generate_correct_mbym(
 	meth_pbder.set_placeholder(placehs["code"], module_code)
 	logger.log(f"Inizio generazione delle test-suites parziali dei metodi ...")
 	logger.set_messages_sep("\n\t\t\t\t")
+	meths_context: Tuple[str, Dict[str, str]] = None
+	meths_batches: List[List[str]] = None
+	meths_list: List[Tuple[str, str]]
+	meths_code: Dict[str, str]
 	for cls in clss:
 		logger.log(f"Classe: {cls.class_name()}")
 		logger.set_messages_sep("\n\t\t\t\t\t")
 		meth_pbder.set_placeholder(placehs["class_name"], cls.class_name())
+		if context_slicing:
+			meths_context = (placehs["code"], {
+				meth_name: moddecl_extr.extract_entity_context(meth_name, cls.class_name())
+				for meth_name in cls.method_names()
+			})
+		meths_list = list(zip(cls.method_names(), cls.methods()))
+		meths_code = dict(meths_list)
+		if entity_batching is not None:
+			meths_batches = calculate_entity_batches(
+				meths_list,
+				entity_batching[0], entity_batching[1]
+			)
 		generate_correct_ebye(
 			project_name, cache_modname,
 			model,
@@ -150,7 +205,13 @@ def generate_correct_mbym(
 			(genm_skipw, corrm_skipw),
 			(genm_cache, corrs_cache, corrl_cache),
 			logger,
-			entityprefix_comps=(cls.class_name(), ".", "$")
+			entityprefix_comps=(cls.class_name(), ".", "$"),
+			workers=workers,
+			entities_context=meths_context,
+			entities_batches=meths_batches,
+			entities_code=meths_code,
+			hparams=hparams,
+			key_excluded=key_excluded
 		)
 		logger.set_messages_sep("\n\t\t\t\t")
 	logger.set_messages_sep("\n\t\t\t")
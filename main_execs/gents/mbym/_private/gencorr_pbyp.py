@@ -0,0 +1,253 @@
+from typing import Dict, Tuple, List, Any
+
+# ============ Path Utilities ============ #
+from os.path import (
+	sep as path_sep,
+	altsep as path_altsep,
+	normpath as os_normpath,
+	join as path_join,
+	split as path_split,
+	splitext as path_splitext,
+	commonpath as path_intersect,
+	relpath as path_relative
+)
+_PATH_SEPS: str = f"{path_sep}{path_altsep if path_altsep is not None else ''}"
+# ======================================== #
+# ============== OS Utilities ============== #
+from os import makedirs as os_mkdirs
+from os.path import exists as os_fdexists
+from shutil import rmtree as os_dremove
+# ========================================== #
+# ============== Docker SDK Utilities =============== #
+from docker.models.images import Image as DockerImage
+# =================================================== #
+
+from main_execs.gents.mbym._private.gencorr_mbym import generate_correct_mbym
+from main_execs.gents.mbym._private.calculating_prompt_relpaths import calculate_prompt_relpaths
+from main_execs.gents.mbym._private.entity_workers import EntityWorkersPool
+
+from logic.ptsuite_generation.cache_accessor import IPtsuiteCacheAccessor
+
+from logic.decls_extraction.moddecls_extractor import AMutableModuleDeclsExtractor
+from logic.decls_extraction.entities_index import (
+	FocalEntitiesIndex,
+	FocalEntitiesIndexer
+)
+
+from logic.utils.prompt_builder import PromptBuilder
+
+from logic.ptsuite_generation.llm_access.llm_apiaccessor import ILlmApiAccessor
+from logic.ptsuite_generation.llm_access.llm_chat import ILlmChat
+from logic.ptsuite_generation.core.generation import EntityPtsuiteGenerator
+
+from logic.ptsuite_generation.core.checking.synt_checker import ISyntacticChecker
+from logic.ptsuite_generation.core.correction.synt_corrector import PtsuiteSyntacticCorrector
+
+from logic.ptsuite_generation.core.checking.lint_checker import LintingChecker
+from logic.ptsuite_generation.core.correction.lint_corrector import PtsuiteLintingCorrector
+
+from logic.utils.logger import ATemporalFormattLogger
+
+
+
+def generate_correct_project(
+		project_name: str, project_info: Dict[str, Any],
+		model: str, gentest_dirname: str,
+		focal_env: Tuple[DockerImage, str],
+		always_excluded: List[str],
+		moddecl_extr: AMutableModuleDeclsExtractor,
+		gen_comps: Tuple[
+			EntityPtsuiteGenerator,
+			ILlmApiAccessor, ILlmChat
+		],
+		corr_comps: Tuple[PtsuiteSyntacticCorrector, PtsuiteLintingCorrector],
+		chk_comps: Tuple[ISyntacticChecker, LintingChecker],
+		max_tries: Tuple[int, int],
+		resp_timeout: int,
+		prompting: Tuple[
+			Tuple[PromptBuilder, PromptBuilder, PromptBuilder],
+			Dict[str, str]
+		],
+		gen_caches: Tuple[IPtsuiteCacheAccessor, IPtsuiteCacheAccessor],
+		corr_caches: Tuple[IPtsuiteCacheAccessor, IPtsuiteCacheAccessor],
+		skipping: Tuple[
+			str, Tuple[str, str, str, str]
+		],
+		logger: ATemporalFormattLogger,
+		workers: EntityWorkersPool = None,
+		context_slicing: bool = False,
+		entity_batching: Tuple[int, int] = None,
+		entities_index: FocalEntitiesIndex = None,
+		hparams: Dict[str, Any] = None,
+):
+	"""
+		Esegue il processo di "Generazione e Correzione delle test-suites" di un intero progetto focale,
+		modulo per modulo.
+
+		Se viene fornito un pool di workers, i componenti di generazione e correzione (e il verificatore
+		sintattico) possono avere valore `None`, poichè vengono utilizzati quelli dei workers.
+		Il verificatore di linting fornito è invece sempre utilizzato per l' ambiente focale del progetto.
+
+		Se `context_slicing` è `True` i prompts di generazione contengono, al posto dell' intero
+		codice di ogni module-file, soltanto il contesto di ogni entità.
+
+		Se viene fornita la coppia (dimensione massima di un' entità, numero massimo di entità per lotto)
+		`entity_batching`, le entità "piccole" di ogni module-file vengono generate a lotti.
+		
+		Se viene fornito un indice delle entità focali che contiene il progetto focale, i moduli elaborati
+		sono quelli dell' indice (e ne viene registrato l' avanzamento), altrimenti vengono individuati
+		visitando la Focal Project Root Path.
+		
+		I valori effettivi degli iperparametri del LLM `hparams` fanno parte, insieme al codice di ogni entità
+		e ai prompts, delle chiavi dei tentativi nelle caches delle test-suites parziali
+	"""
+	focal_image, path_prefix = focal_env
+	_, _, chat = gen_comps
+	synt_chker, lint_chker = chk_comps
+	prompt_bders, placehs = prompting
+	func_bder, meth_bder, corr_bder = prompt_bders
+	genf_cache, genm_cache = gen_caches
+	corrs_cache, corrl_cache = corr_caches
+
+	logger.log(f'Inizio generazione per il progetto "{project_name}"')
+	logger.set_messages_sep("\n\t\t\t")
+
+	# ===== Ottenimento delle informazioni del progetto focale =====
+	# Ottenimento della Full Project Root Path
+	full_root: str = project_info["full_root"].rstrip(_PATH_SEPS)
+	# Ottenimento della Focal Project Root Path
+	focal_root: str = project_info["focal_root"].rstrip(_PATH_SEPS)
+	focal_root = os_normpath(path_join(full_root, focal_root))
+	# Ottenimento della lista di paths/files esclusi dal codice focale
+	focal_excluded: List[str] = project_info.get("focal_excluded", [])
+
+	# Impostazione dell' immagine dell' ambiente focale nel verificatore di linting
+	lint_chker.set_focal_project(
+		project_name, full_root,
+		focal_image,
+		path_prefix
+	)
+
+	# ===== Creazione degli spazi di memorizzazione per il progetto nelle caches =====
+	genf_cache.create_projspace(project_name)
+	genm_cache.create_projspace(project_name)
+	corrs_cache.create_projspace(project_name)
+	corrl_cache.create_projspace(project_name)
+
+	# Calcolo della Gen-tests Project Root Path relativa al modello corrente
+	gentests_root: str = path_join(
+		path_split(focal_root)[0],
+		gentest_dirname
+	)
+
+	# Azzeramento della Gen-Tests Project Root Path relativa al modello corrente
+	if os_fdexists(gentests_root):
+		os_dremove(gentests_root)
+	os_mkdirs(gentests_root)
+
+	module_name: str
+	tsuite_dirpath: str
+	module_relpath: str
+	tsuite_relpath: str
+	
+	# ===== Ottenimento dei moduli del codice focale (dall' eventuale indice delle entità focali) =====
+	modules_paths: List[str]
+	is_indexed: bool = (entities_index is not None) and (project_name in entities_index.projects())
+	if is_indexed:
+		modules_paths = list()
+		for module_relpath in entities_index.modules(project_name):
+			# I moduli non leggibili, o non corretti sintatticamente, non vengono elaborati
+			if entities_index.module_hash(project_name, module_relpath) is None:
+				logger.log(f'Modulo "{module_relpath}" escluso (non leggibile)')
+			elif entities_index.entities(project_name, module_relpath) is None:
+				logger.log(f'Modulo "{module_relpath}" escluso (non corretto sintatticamente)')
+			else:
+				modules_paths.append(os_normpath(path_join(focal_root, module_relpath)))
+		logger.log(
+			f'Moduli da elaborare: {len(modules_paths)} '
+			f'(entità: {entities_index.entities_count(project_name)})'
+		)
+	else:
+		modules_paths = FocalEntitiesIndexer.focal_modules(
+			focal_root, focal_excluded, always_excluded
+		)
+	
+	# ===== Processo di "Generazione delle Test-suites per progetto focale" =====
+	for module_num, module_path in enumerate(modules_paths, start=1):
+		curr_path, file_name = path_split(module_path)
+		module_name = path_splitext(file_name)[0]
+		
+		if is_indexed:
+			logger.log(f'Modulo {module_num}/{len(modules_paths)}: "{path_relative(module_path, start=focal_root)}"')
+		
+		# Calcolo della directory che conterrà la test-suite del modulo
+		common_path: str = path_intersect([curr_path, focal_root])
+		tsuite_dirpath = path_relative(curr_path, start=common_path)
+		tsuite_dirpath = path_join(
+			path_join(gentests_root, tsuite_dirpath),
+			f"mod__{module_name}"
+		)
+
+		# Creazione/sovrascrittura della directory test-suite
+		if os_fdexists(tsuite_dirpath):
+			os_dremove(tsuite_dirpath)
+		os_mkdirs(tsuite_dirpath)
+
+		# Calcolo delle paths relative (da utilizzare nei prompts)
+		module_relpath, tsuite_relpath  \
+			= calculate_prompt_relpaths(focal_root, tsuite_dirpath, module_path)
+
+		for prompt_bder in prompt_bders:
+			prompt_bder.set_placeholder(placehs["project"], project_name)
+			prompt_bder.set_placeholder(placehs["module"], module_name)
+			prompt_bder.set_placeholder(placehs["module_path"], module_relpath)
+			prompt_bder.set_placeholder(placehs["tsuite_path"], tsuite_relpath)
+
+		# Generazione della test-suite del module-file attuale
+		generate_correct_mbym(
+			project_name, model,
+			focal_root, module_path, tsuite_dirpath,
+			moddecl_extr,
+			gen_comps, corr_comps, chk_comps,
+			max_tries, resp_timeout,
+			prompting,
+			gen_caches, corr_caches,
+			skipping,
+			logger,
+			workers=workers,
+			context_slicing=context_slicing,
+			entity_batching=entity_batching,
+			hparams=hparams
+		)
+
+		# Azzeramento dei prompts
+		func_bder.unset_placeholders()
+		meth_bder.unset_placeholders()
+		corr_bder.unset_placeholders()
+
+		# Pulizia delle risorse utilizzate dai verificatori
+		synt_chker.clear_resources() if synt_chker is not None else None
+		lint_chker.clear_resources()
+
+		# Pulizia della chat
+		chat.clear() if chat is not None else None
+
+	# Attesa del termine delle entità del progetto ancora in lavorazione
+	if workers is not None:
+		workers.wait_pending()
+
+		# Registrazione dell' utilizzo degli stadi di pipeline per il progetto
+		for stage_name, stage_stats in workers.stages_stats().items():
+			logger.log(
+				f'Stadio "{stage_name}": coda attuale {stage_stats["queue_depth"]} '
+				f'(massima {stage_stats["max_queue_depth"]}), '
+				f'utilizzo {stage_stats["utilisation"]*100:.1f}%, '
+				f'lavori eseguiti {stage_stats["jobs_done"]}'
+			)
+
+	# Pulizia delle risorse del verificatore di correttezza a livello di linting
+	# con stop dell' ambiente focale
+	lint_chker.clear_resources(stop_fenv=True)
+
+	logger.set_messages_sep("\n\t\t")
+	logger.log(f'Generazione per il progetto "{project_name}" terminata!')
@@ -12,7 +12,7 @@ from logic.utils.logger import ATemporalFormattLogger
 def generate_ptsuite(
 		project_name: str, cache_modname: str,
 		model: str,
-		entity: str,
+		entity: str, cache_key: str,
 		full_prompt: str,
 		ptsuite_gen: EntityPtsuiteGenerator,
 		chat: ILlmChat,
@@ -28,13 +28,8 @@ def generate_ptsuite(
 	
 	# Ricerca di una test-suite parziale generata senza errori nella richiesta
 	while (try_num >= 1):
-		if gen_cache.does_ptsuite_exists(
-				project_name,
-				cache_modname, f"{cache_entprefix}{entity}", model, try_num
-		):
-			ptsuite_code = gen_cache.get_ptsuite(
-				project_name, cache_modname, f"{cache_entprefix}{entity}", model, try_num
-			)
+		if gen_cache.does_ptsuite_exists(cache_key, try_num):
+			ptsuite_code = gen_cache.get_ptsuite(cache_key, try_num)
 			
 			logger.log(f"Test-suite parziale trovata nella cache "
 			           f"(Tentativo di generazione: {try_num}/{max_tries})")
@@ -69,7 +64,8 @@ def generate_ptsuite(
 		logger.log("Salvataggio nella cache ... ")
 		gen_cache.register_ptsuite(
 			project_name,
-			cache_modname, f"{cache_entprefix}{entity}", model, (try_num+tries_incache),
+			cache_modname, f"{cache_entprefix}{entity}", model,
+			cache_key, (try_num+tries_incache),
 			ptsuite_code
 		)
 		logger.log("Test-suite parziale salvata!")
@@ -0,0 +1,211 @@
+from typing import List, Dict, Tuple
+
+# ============= RegEx Utilities ============ #
+from regex import (
+	finditer as reg_finditer,
+	Match,
+	RegexFlag as RegexFlags,
+)
+# ========================================== #
+
+from logic.utils.prompt_builder import PromptBuilder
+
+from logic.ptsuite_generation.core.generation import EntityPtsuiteGenerator
+from logic.ptsuite_generation.core.exceptions import WrongResponseFormatError
+
+from logic.ptsuite_generation.llm_access.llm_chat import ILlmChat
+
+from logic.ptsuite_generation.cache_accessor import IPtsuiteCacheAccessor
+
+from logic.utils.logger import ATemporalFormattLogger
+
+
+# Intestazione che delimita, nella test-suite di un lotto, i tests di ogni entità
+_ENTITY_MARK: str = "# >>> TESTS FOR: "
+_ENTITY_MARK_PATT: str = r"^[ \t]*# >>> TESTS FOR:[ \t]*(?P<entity>[A-Za-z0-9_]+)[^\n]*$"
+
+# Intestazioni delle sezioni del prompt di generazione (markdown di primo livello) e delimitatori dei blocchi di codice
+_SECTION_HEAD: str = "# "
+_CODE_FENCE: str = "```"
+# Valore temporaneo del placeholder dell' entità, che identifica le sezioni specifiche di una singola entità
+_ENTITY_SENTINEL: str = "<<GTSAI_BATCH_ENTITY>>"
+
+# Sezione, inserita prima dell' ultima sezione del prompt di generazione, che descrive il formato di un lotto
+_BATCH_SECTION: str = """
+# Batch Request:
+This request covers more than one focal entity: the tests must be generated for each of the following entities{owner}, instead of a single one: {entities}.
+Inside the single code block of the answer, write the tests of each entity after a comment line exactly in the form:
+{mark}<entity name>
+Write the imports needed by the tests before the first of these comment lines.
+""".strip("\n")
+# Intestazione della sezione di risposta di un lotto
+_BATCH_ANSWER: str = "# Answer (only for: {entities}):"
+
+
+
+def generate_ptsuites_batch(
+		project_name: str, cache_modname: str,
+		model: str,
+		entities: List[str],
+		cache_keys: Dict[str, str],
+		entity_gen_pbder: PromptBuilder,
+		entity_placeh: str,
+		ptsuite_gen: EntityPtsuiteGenerator,
+		chat: ILlmChat,
+		resp_timeout: int,
+		gen_cache: IPtsuiteCacheAccessor,
+		logger: ATemporalFormattLogger,
+		cache_entprefix: str = "",
+		entity_class: str = None
+) -> Tuple[str, Dict[str, str]]:
+	"""
+		Genera, con un' unica richiesta al LLM, le test-suites parziali di un lotto di entità dello stesso
+		modulo, separandole e registrandole nella cache di generazione come primo tentativo di ogni entità.
+		
+		Ogni entità è cercata, e registrata, nella cache tramite la propria chiave in `cache_keys`
+		(la stessa della sua generazione singola); le entità che hanno già un tentativo di generazione
+		nella cache vengono escluse dal lotto;
+		se ne rimane meno di due non viene effettuata alcuna richiesta.
+		
+		Il prompt del lotto è il prompt di generazione privato delle sezioni specifiche di una singola entità
+		(quelle che contengono il placeholder dell' entità): prima della sua ultima sezione, da cui inizia la
+		risposta, viene inserita la sezione che elenca le entità del lotto (e l' eventuale classe a cui
+		appartengono) e ne descrive il formato. Se l' ultima sezione è specifica di una singola entità
+		viene sostituita da un' intestazione di risposta che elenca le entità del lotto.
+		
+		La generazione ha un unico tentativo: le entità la cui test-suite parziale non viene ottenuta
+		seguono poi il normale processo di generazione
+		
+		Returns
+		-------
+			Tuple[str, Dict[str, str]]
+				Una tupla contenente il prompt di generazione del lotto (`None` se non è stata effettuata
+				alcuna richiesta) e un dizionario delle test-suites parziali ottenute, indicizzato dal
+				nome di ogni entità
+	"""
+	pending: List[str] = [
+		entity for entity in entities
+		if not gen_cache.does_ptsuite_exists(cache_keys[entity], 1)
+	]
+	if len(pending) < 2:
+		return None, dict()
+	
+	logger.log(f"Generazione del lotto di entità: {', '.join(pending)} ...")
+	entity_gen_pbder.set_placeholder(entity_placeh, _ENTITY_SENTINEL)
+	batch_prompt: str = _build_batch_prompt(entity_gen_pbder.build_prompt(), pending, entity_class)
+	
+	batch_code: str
+	chat.add_prompt(batch_prompt)
+	ptsuite_gen.start_new_generation(resp_timeout)
+	try:
+		batch_code = ptsuite_gen.perform_gen_try()
+	except WrongResponseFormatError:
+		batch_code = None
+	if not ptsuite_gen.has_gen_terminated():
+		ptsuite_gen.stop_generation()
+	
+	if (batch_code is None) or (batch_code == ""):
+		logger.log("Il lotto di entità non è stato generato")
+		return batch_prompt, dict()
+	
+	batch_ptsuites: Dict[str, str] = _split_batch_ptsuite(batch_code, pending)
+	for entity, ptsuite_code in batch_ptsuites.items():
+		gen_cache.register_ptsuite(
+			project_name,
+			cache_modname, f"{cache_entprefix}{entity}", model,
+			cache_keys[entity], 1,
+			ptsuite_code
+		)
+	logger.log(f"Lotto di entità generato! (Test-suites parziali ottenute: {len(batch_ptsuites)}/{len(pending)})")
+	
+	return batch_prompt, batch_ptsuites
+	
+	
+##	============================================================
+##						PRIVATE FUNCTIONS
+##	============================================================
+
+
+def _build_batch_prompt(
+		entity_prompt: str,
+		entities: List[str],
+		entity_class: str
+) -> str:
+	"""
+		Costruisce il prompt di un lotto a partire dal prompt di generazione fornito, il cui placeholder
+		dell' entità contiene `_ENTITY_SENTINEL`
+	"""
+	prompt_sects: List[str] = [
+		prompt_sect.rstrip("\n")
+		for prompt_sect in _split_prompt_sections(entity_prompt)
+		if prompt_sect.strip() != ""
+	]
+	quoted_entities: str = ", ".join([f"'{entity}'" for entity in entities])
+	
+	answer_sect: str = prompt_sects[-1]
+	if _ENTITY_SENTINEL in answer_sect:
+		answer_sect = _BATCH_ANSWER.format(entities=quoted_entities)
+	batch_sect: str = _BATCH_SECTION.format(
+		entities=quoted_entities,
+		owner=f' (methods of the focal class "{entity_class}")' if entity_class else "",
+		mark=_ENTITY_MARK
+	)
+	
+	return "\n\n".join(
+		[prompt_sect for prompt_sect in prompt_sects[:-1] if _ENTITY_SENTINEL not in prompt_sect] +
+		[batch_sect, answer_sect]
+	)
+
+
+def _split_prompt_sections(prompt: str) -> List[str]:
+	"""
+		Separa il prompt fornito nelle sue sezioni, delimitate dalle intestazioni markdown di primo livello.
+		Le linee all' interno dei blocchi di codice (es. i commenti del modulo focale) non delimitano sezioni
+	"""
+	prompt_sects: List[str] = []
+	curr_lines: List[str] = []
+	in_code: bool = False
+	for prompt_line in prompt.split("\n"):
+		if prompt_line.lstrip().startswith(_CODE_FENCE):
+			in_code = not in_code
+		elif (not in_code) and prompt_line.startswith(_SECTION_HEAD) and (len(curr_lines) > 0):
+			prompt_sects.append("\n".join(curr_lines))
+			curr_lines = []
+		curr_lines.append(prompt_line)
+	prompt_sects.append("\n".join(curr_lines))
+	
+	return prompt_sects
+
+
+def _split_batch_ptsuite(
+		batch_code: str,
+		entities: List[str]
+) -> Dict[str, str]:
+	"""
+		Separa la test-suite di un lotto nelle test-suites parziali delle entità fornite.
+		Ogni test-suite parziale è composta dagli imports comuni (il codice che precede il primo
+		delimitatore) seguiti dai tests della sua entità.
+		
+		Le entità non fornite, quelle ripetute e quelle senza alcun test vengono ignorate
+	"""
+	marks: List[Match[str]] = list(reg_finditer(_ENTITY_MARK_PATT, batch_code, flags=RegexFlags.MULTILINE))
+	if len(marks) == 0:
+		return dict()
+	
+	common_code: str = batch_code[:marks[0].start()].strip("\n")
+	ptsuites: Dict[str, str] = dict()
+	entity: str
+	entity_tests: str
+	for i, mark in enumerate(marks):
+		entity = mark.group("entity")
+		entity_tests = batch_code[
+			mark.end():(marks[i+1].start() if (i+1) < len(marks) else len(batch_code))
+		].strip("\n")
+		if (entity not in entities) or (entity in ptsuites) or (entity_tests.strip() == ""):
+			continue
+		
+		ptsuites[entity] = (
+			f"{common_code}\n\n\n{entity_tests}\n" if common_code != "" else f"{entity_tests}\n"
+		)
+	
+	return ptsuites
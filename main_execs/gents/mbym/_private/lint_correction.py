@@ -1,4 +1,4 @@
-from typing import Tuple, Dict
+from typing import List, Tuple, Dict
 from .ptsuite_try import PtsuitePromptingTry
 
 from logic.utils.prompt_builder import PromptBuilder
@@ -18,6 +18,7 @@ def correct_lintically(
 		project_name: str, cache_modname: str,
 		model: str,
 		entityname_comps: Tuple[str, str],
+		cache_key: str,
 		wrong_ptsuite_code: str,
 		entity_corr_pbder: PromptBuilder,
 		error_placehs: Tuple[str, str, str],
@@ -33,13 +34,12 @@ def correct_lintically(
 	name_placeh, message_placeh, trynum_placeh = error_placehs
 	lint_corr, lint_chker = lintcorr_comps
 	
-	error: Dict[str, str]
+	errors: List[Dict[str, str]]
 	error_mess: str = "{error_mess} (at line {line} and column {column})"
+	# Formato di ogni errore quando ne vengono riportati più di uno nello stesso prompt
+	multierror_mess: str = "{error_name}: " + error_mess
 	full_prompt: str
 	
-	line: str
-	column: str
-	
 	try_num: int = 1
 	tries_incache: int
 	
@@ -49,32 +49,42 @@ def correct_lintically(
 	
 	ptsuite_code: str
 	
-	# Ricerca di una test-suite parziale corretta a livello di linting nella cache
+	# Ricerca delle test-suites parziali, dei tentativi di correzione, presenti nella cache
+	cached_ptsuites: List[Tuple[int, str]] = list()
 	while (try_num <= max_tries):
-		if corr_cache.does_ptsuite_exists(
-				project_name,
-				cache_modname, f"{cache_entprefix}{entity}", model, try_num
-		):
-			ptsuite_code = corr_cache.get_ptsuite(
-				project_name, cache_modname, f"{cache_entprefix}{entity}", model, try_num
-			)
+		if corr_cache.does_ptsuite_exists(cache_key, try_num):
+			ptsuite_code = corr_cache.get_ptsuite(cache_key, try_num)
 			logger.log(f"Test-suite parziale trovata nella cache "
 			           f"(Tentativo di correzione: {try_num}/{max_tries})")
-			
-			if (ptsuite_code != ""):
-				error = lint_chker.check_lintically(ptsuite_code)
-				# Se la richiesta di quella test-suite parziale non aveva fallito
-				# e la test-suite parziale è corretta
-				if len(error) == 0:
-					logger.log(f"Test-suite parziale corretta a livello di linting ottenuta! "
-				           f"(Tentativo funzionante: {try_num}/{max_tries})")
-					return ptsuite_code
-				
-				ptsuite_code_valid.set_ptsuite(ptsuite_code)
-				ptsuite_code_valid.set_try(try_num)
+			cached_ptsuites.append((try_num, ptsuite_code))
 			try_num += 1
 		else:
 			break
+	
+	# Verifica, in un' unica richiesta, delle test-suites parziali trovate nella cache
+	# (quelle vuote corrispondono a richieste al LLM fallite). Interessa solo la loro correttezza
+	# (e il primo errore dell' ultima), quindi la verifica di ognuna si interrompe al primo errore
+	cached_errors: List[List[Dict[str, str]]] = list()
+	cached_codes: List[str] = [
+		cached_code for _, cached_code in cached_ptsuites
+		if cached_code != ""
+	]
+	if len(cached_codes) > 0:
+		cached_errors = lint_chker.check_lintically_batch(cached_codes, fail_fast=True)
+	
+	# Ricerca di una test-suite parziale corretta a livello di linting tra quelle nella cache
+	errors_idx: int = 0
+	for cached_try, cached_code in cached_ptsuites:
+		if (cached_code != ""):
+			# Se la test-suite parziale è corretta
+			if len(cached_errors[errors_idx]) == 0:
+				logger.log(f"Test-suite parziale corretta a livello di linting ottenuta! "
+				           f"(Tentativo funzionante: {cached_try}/{max_tries})")
+				return cached_code
+			errors_idx += 1
+			
+			ptsuite_code_valid.set_ptsuite(cached_code)
+			ptsuite_code_valid.set_try(cached_try)
 
 	# Se non si è trovata una test-suite parziale corretta nella cache
 	
@@ -99,18 +109,16 @@ Last partial test suite correction result:
 			(try_num <= (max_tries-tries_incache)) and
 			(not is_corr_success)
 	):
-		error = lint_chker.check_lintically(ptsuite_code)
+		errors = lint_chker.check_lintically_errors(ptsuite_code)
 		
 		# Se si sono ci sono errori di correttezza a livello di linting
-		if len(error) > 0:
-			# Impostazione dell' errore nel prompt
-			line, column = error["except_pos"].split(";")
-			entity_corr_pbder.set_placeholder(name_placeh, error["except_name"])
+		if len(errors) > 0:
+			# Impostazione degli errori nel prompt (tutti in un unico tentativo di correzione)
+			entity_corr_pbder.set_placeholder(name_placeh, _errors_names(errors))
 			entity_corr_pbder.set_placeholder(
-				message_placeh, error_mess.format(
-					error_mess=error["except_mess"],
-					line=line,
-					column=column
+				message_placeh, _errors_messages(
+					errors,
+					error_mess if len(errors) == 1 else multierror_mess
 				),
 			)
 			entity_corr_pbder.set_placeholder(trynum_placeh, str(try_num+tries_incache))
@@ -135,7 +143,8 @@ Last partial test suite correction result:
 			logger.log("Salvataggio nella cache ... ")
 			corr_cache.register_ptsuite(
 				project_name,
-				cache_modname, f"{cache_entprefix}{entity}", model, (try_num+tries_incache),
+				cache_modname, f"{cache_entprefix}{entity}", model,
+				cache_key, (try_num+tries_incache),
 				ptsuite_code
 			)
 			logger.log("Test-suite parziale salvata!")
@@ -159,4 +168,33 @@ Last partial test suite correction result:
 		# allora viene restituito il codice della test-suite parziale corretta
 		return ptsuite_code
 	else:
-		return None
\ No newline at end of file
+		return None
+
+
+
+def _errors_names(errors: List[Dict[str, str]]) -> str:
+	"""
+		Restituisce i nomi distinti degli errori di linting forniti, separati da virgole
+	"""
+	names: List[str] = list()
+	for error in errors:
+		if error["except_name"] not in names:
+			names.append(error["except_name"])
+	return ", ".join(names)
+
+
+
+def _errors_messages(errors: List[Dict[str, str]], mess_format: str) -> str:
+	"""
+		Restituisce i messaggi degli errori di linting forniti, uno per riga, nel formato fornito
+	"""
+	messages: List[str] = list()
+	for error in errors:
+		line, column = error["except_pos"].split(";")
+		messages.append(mess_format.format(
+			error_name=error["except_name"],
+			error_mess=error["except_mess"],
+			line=line,
+			column=column
+		))
+	return "\n".join(messages)
\ No newline at end of file
@@ -1,4 +1,4 @@
-from typing import Tuple
+from typing import List, Tuple
 from .ptsuite_try import PtsuitePromptingTry
 
 from logic.utils.prompt_builder import PromptBuilder
@@ -18,6 +18,7 @@ def correct_syntactically(
 		project_name: str, cache_modname: str,
 		model: str,
 		entityname_comps: Tuple[str, str],
+		cache_key: str,
 		wrong_ptsuite_code: str,
 		entity_corr_pbder: PromptBuilder,
 		error_placehs: Tuple[str, str, str],
@@ -34,6 +35,7 @@ def correct_syntactically(
 	synt_corr, synt_chker = syntcorr_comps
 	
 	error: Tuple[str, str]
+	errors: List[Tuple[str, str]]
 	full_prompt: str
 	
 	try_num: int = 1
@@ -47,13 +49,8 @@ def correct_syntactically(
 	
 	# Ricerca di una test-suite parziale corretta sintatticamente nella cache
 	while (try_num <= max_tries):
-		if corr_cache.does_ptsuite_exists(
-				project_name,
-				cache_modname, f"{cache_entprefix}{entity}", model, try_num
-		):
-			ptsuite_code = corr_cache.get_ptsuite(
-				project_name, cache_modname, f"{cache_entprefix}{entity}", model, try_num
-			)
+		if corr_cache.does_ptsuite_exists(cache_key, try_num):
+			ptsuite_code = corr_cache.get_ptsuite(cache_key, try_num)
 			logger.log(f"Test-suite parziale trovata nella cache "
 			           f"(Tentativo di correzione: {try_num}/{max_tries})")
 			
@@ -95,13 +92,13 @@ Last partial test suite correction result:
 	        (try_num <= (max_tries-tries_incache)) and
 			(not is_corr_success)
 	):
-		error = synt_chker.check_synt(ptsuite_code)
+		errors = synt_chker.check_synt_errors(ptsuite_code)
 		
 		# Se si sono ci sono errori di correttezza sintattica
-		if len(error) > 0:
-			# Impostazione dell' errore nel prompt
-			entity_corr_pbder.set_placeholder(name_placeh, error[0])
-			entity_corr_pbder.set_placeholder(message_placeh, error[1])
+		if len(errors) > 0:
+			# Impostazione degli errori nel prompt (tutti in un unico tentativo di correzione)
+			entity_corr_pbder.set_placeholder(name_placeh, _errors_names(errors))
+			entity_corr_pbder.set_placeholder(message_placeh, _errors_messages(errors))
 			entity_corr_pbder.set_placeholder(trynum_placeh, str(try_num+tries_incache))
 			
 			# Calcolo del full prompt
@@ -124,7 +121,8 @@ Last partial test suite correction result:
 			logger.log("Salvataggio nella cache ... ")
 			corr_cache.register_ptsuite(
 				project_name,
-				cache_modname, f"{cache_entprefix}{entity}", model, (try_num+tries_incache),
+				cache_modname, f"{cache_entprefix}{entity}", model,
+				cache_key, (try_num+tries_incache),
 				ptsuite_code
 			)
 			logger.log("Test-suite parziale salvata!")
@@ -148,4 +146,30 @@ Last partial test suite correction result:
 		# allora viene restituito il codice della test-suite parziale corretta
 		return ptsuite_code
 	else:
-		return None
\ No newline at end of file
+		return None
+
+
+
+def _errors_names(errors: List[Tuple[str, str]]) -> str:
+	"""
+		Restituisce i nomi distinti degli errori sintattici forniti, separati da virgole
+	"""
+	names: List[str] = list()
+	for error in errors:
+		if error[0] not in names:
+			names.append(error[0])
+	return ", ".join(names)
+
+
+
+def _errors_messages(errors: List[Tuple[str, str]]) -> str:
+	"""
+		Restituisce i messaggi degli errori sintattici forniti, uno per riga
+		(un singolo errore viene restituito invariato)
+	"""
+	if len(errors) == 1:
+		return errors[0][1]
+	return "\n".join(
+		error[1].rstrip("\n")
+		for error in errors
+	)
\ No newline at end of file
@@ -1,2 +1,2 @@
 from ._private.apiaccsor_creation import inst_apiaccsor
-from ._private.caches_opening import open_ptsuite_caches
\ No newline at end of file
+from ._private.caches_opening import open_ptsuite_caches, open_llmresp_cache, open_lintverd_cache, open_moddecls_cache
\ No newline at end of file
@@ -1,27 +1,54 @@
-from typing import Dict, Any
+from typing import Dict, Tuple, Any
+
+# ============ Concurrency Utilities ============ #
+from threading import Lock
+# =============================================== #
 
 from logic.ptsuite_generation.llm_access.llm_apiaccessor import (
-	ILlmApiAccessor, LlmApiAccessorFactory
+	ILlmApiAccessor, LlmApiAccessorFactory,
+	OllamaEndpointsPool
 )
 
 from logic.utils.logger import ATemporalFormattLogger
 
 
+# Pools di servers Ollama, indicizzati dagli indirizzi che contengono, condivisi da tutti gli accessors
+# creati in modo che le richieste in corso siano considerate globalmente
+_OLLAMA_POOLS: Dict[Tuple[str, ...], OllamaEndpointsPool] = dict()
+_OLLAMA_POOLS_LOCK: Lock = Lock()
+
+
 
 def inst_apiaccsor(
 		platform_name: str,
 		platf_options: Dict[str, Any],
 		logger: ATemporalFormattLogger = None,
+		stop_format: str = None,
 ) -> ILlmApiAccessor:
 	platform: ILlmApiAccessor = None
 	match platform_name:
 		case "ollama":
 			platform = LlmApiAccessorFactory.for_ollama(
-				platf_options["api_url"], platf_options["userpass_pair"],
+				_get_ollama_pool(platf_options["api_url"]), platf_options["userpass_pair"],
 				platf_options["connect_timeout"],
-				logger=logger, log_resp=(True if logger is not None else False)
+				logger=logger, log_resp=(True if logger is not None else False),
+				stop_format=stop_format
 			)
 		case _:
 			raise NotImplementedError("La piattaforma di inferenza richiesta non è implementata")
-	
-	return platform
\ No newline at end of file
+
+	return platform
+
+
+
+def _get_ollama_pool(api_url: Any) -> OllamaEndpointsPool:
+	"""
+		Restituisce il pool di servers Ollama relativo agli indirizzi forniti (una stringa o una
+		lista di stringhe), creandolo se non ancora esistente
+	"""
+	addresses: Tuple[str, ...] = (api_url,) if isinstance(api_url, str) else tuple(api_url)
+
+	with _OLLAMA_POOLS_LOCK:
+		if addresses not in _OLLAMA_POOLS:
+			_OLLAMA_POOLS[addresses] = OllamaEndpointsPool(list(addresses))
+		return _OLLAMA_POOLS[addresses]
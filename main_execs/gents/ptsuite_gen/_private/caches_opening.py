@@ -9,6 +9,18 @@ from logic.ptsuite_generation.cache_accessor import (
 	PtsuiteCacheAccessorFactory,
 	ECacheAccessorType
 )
+from logic.ptsuite_generation.llm_access.llm_respcache import (
+	ILlmResponseCache,
+	LlmResponseCacheFactory
+)
+from logic.ptsuite_generation.core.checking.lint_verdcache import (
+	ILintVerdictCache,
+	LintVerdictCacheFactory
+)
+from logic.decls_extraction.moddecls_cache import (
+	IModuleDeclsCache,
+	ModuleDeclsCacheFactory
+)
 
 from logic.utils.process_logger import ProcessLogger
 
@@ -58,4 +70,57 @@ def open_ptsuite_caches(
 		)
 		
 	logger.process_end() if logger is not None else None
-	return (genf_cache, genm_cache, corrs_cache, corrl_cache)
\ No newline at end of file
+	return (genf_cache, genm_cache, corrs_cache, corrl_cache)
+
+
+def open_llmresp_cache(
+		caches_tech: str,
+		caches_root: str,
+		cache_name: str,
+		max_size_mb: int,
+		logger: ProcessLogger = None
+) -> ILlmResponseCache:
+	logger.process_start('Creazione/Apertura della cache delle risposte dei LLMs ...') if logger is not None else None
+	
+	resp_cache: ILlmResponseCache = LlmResponseCacheFactory.create(
+		ECacheAccessorType[caches_tech.upper()],
+		path_join(caches_root, cache_name),
+		max_size_mb * 1024 * 1024
+	)
+	
+	logger.process_end() if logger is not None else None
+	return resp_cache
+
+
+def open_lintverd_cache(
+		caches_tech: str,
+		caches_root: str,
+		cache_name: str,
+		logger: ProcessLogger = None
+) -> ILintVerdictCache:
+	logger.process_start('Creazione/Apertura della cache dei risultati delle verifiche di linting ...') if logger is not None else None
+	
+	verd_cache: ILintVerdictCache = LintVerdictCacheFactory.create(
+		ECacheAccessorType[caches_tech.upper()],
+		path_join(caches_root, cache_name)
+	)
+	
+	logger.process_end() if logger is not None else None
+	return verd_cache
+
+
+def open_moddecls_cache(
+		caches_tech: str,
+		caches_root: str,
+		cache_name: str,
+		logger: ProcessLogger = None
+) -> IModuleDeclsCache:
+	logger.process_start('Creazione/Apertura della cache delle analisi dei module-files focali ...') if logger is not None else None
+	
+	decls_cache: IModuleDeclsCache = ModuleDeclsCacheFactory.create(
+		ECacheAccessorType[caches_tech.upper()],
+		path_join(caches_root, cache_name)
+	)
+	
+	logger.process_end() if logger is not None else None
+	return decls_cache
\ No newline at end of file